@@ -42,6 +42,9 @@
 
 #include "boost/shared_ptr.hpp"
 
+#include <future>
+#include <vector>
+
 namespace IECore
 {
 
@@ -91,6 +94,20 @@ class IECORE_API CachedReader : public RefCounted
 		/// concurrent threads.
 		ConstObjectPtr read( const std::string &file );
 
+		/// Handle to the result of a call to readAsync().
+		typedef std::shared_future<ConstObjectPtr> Future;
+
+		/// As for read(), but loads the file on a background thread
+		/// and returns immediately. Any exception thrown during loading
+		/// is rethrown by Future::get().
+		/// \threading It is safe to call this method from multiple
+		/// concurrent threads.
+		Future readAsync( const std::string &file );
+		/// Loads the files into the cache on background threads, so that
+		/// subsequent calls to read() needn't wait for them. Errors are
+		/// not reported until the file is read.
+		void prefetch( const std::vector<std::string> &files );
+
 		/// Frees all memory used by the cache.
 		void clear();
 		/// Clears the cache for the given file.
@@ -55,6 +55,8 @@ class IECORE_API FileIndexedIO : public StreamIndexedIO
 
 		/// Open or create an file at the given root location
 		FileIndexedIO(const std::string &path, const IndexedIO::EntryIDList &root, IndexedIO::OpenMode mode);
+		/// As above, but specifying the codecs used when writing a new file. See StreamIndexedIO::Codec.
+		FileIndexedIO(const std::string &path, const IndexedIO::EntryIDList &root, IndexedIO::OpenMode mode, Codec indexCodec, Codec dataCodec);
 
 		~FileIndexedIO() override;
 
@@ -123,7 +123,7 @@ class IECORE_API FileSequence : public RunTimeTyped
 
 		/// Returns a regular expression that matches only valid filenames. Matches 1, 2, and 3 of any
 		/// resulting matches are the prefix, padding and suffix of the matched filename.
-		static boost::regex fileNameValidator();
+		static const boost::regex &fileNameValidator();
 
 		bool operator ==( const FileSequence &other ) const;
 
@@ -39,6 +39,9 @@
 #include "IECore/FileSequence.h"
 #include "IECore/FrameList.h"
 
+#include <ctime>
+#include <vector>
+
 namespace IECore
 {
 
@@ -55,6 +58,21 @@ IECORE_API void findSequences( const std::vector< std::string > &names, std::vec
 /// Generates all sequences with at least minSequenceSize elements residing in given directory in the form of a list of FileSequences.
 IECORE_API void ls( const std::string &path, std::vector< FileSequencePtr > &sequences, size_t minSequenceSize = 2 );
 
+/// The modification times and sizes of the files in a sequence, in the
+/// same order as FileSequence::fileNames().
+struct IECORE_API FileSequenceStats
+{
+	std::vector<std::time_t> modificationTimes;
+	std::vector<uint64_t> sizes;
+};
+
+/// As above, but also searches subdirectories up to `maxDepth` levels below `path`,
+/// scanning the directories in parallel. Symbolic links to directories are listed,
+/// but are only searched further if `followLinks` is true. The names of the returned
+/// sequences are relative to `path`. If `stats` is non-null, it is filled with
+/// information gathered during the scan, with one element per sequence.
+IECORE_API void lsRecursive( const std::string &path, std::vector< FileSequencePtr > &sequences, size_t minSequenceSize = 2, size_t maxDepth = 1000, bool followLinks = false, std::vector<FileSequenceStats> *stats = nullptr );
+
 /// Attempts to find a sequence matching the given sequence template (e.g. with at least one '#' character).
 IECORE_API void ls( const std::string &sequencePath, FileSequencePtr &sequence, size_t minSequenceSize = 2 );
 
@@ -72,6 +72,12 @@ class IECORE_API IndexedIO : public RunTimeTyped
 
 			Shared    = 1L << 3,
 			Exclusive = 1L << 4,
+
+			/// May be combined with Read to request that the file is memory mapped
+			/// rather than read through a stream. This avoids a system call and a
+			/// copy for each read, and allows concurrent reads without locking.
+			/// It is ignored by implementations which don't support it.
+			Mapped    = 1L << 5,
 		} ;
 
 		typedef unsigned OpenMode;
@@ -160,6 +166,12 @@ class IECORE_API IndexedIO : public RunTimeTyped
 		/// Returns the mode with which the interface was created.
 		virtual IndexedIO::OpenMode openMode() const = 0;
 
+		/// Returns an estimate of the memory, in bytes, currently used to hold
+		/// the index of the file. This is shared by all the interfaces to the
+		/// same file, and may grow as more of the index is loaded. The default
+		/// implementation returns 0.
+		virtual size_t memoryUsage() const;
+
 		/// Retrieve the current directory. Returns empty list at the root location.
 		virtual void path( IndexedIO::EntryIDList & ) const = 0;
 
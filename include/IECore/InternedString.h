@@ -38,6 +38,7 @@
 #include "IECore/Export.h"
 
 #include <string>
+#include <vector>
 
 /// May be used to detect the existence of the
 /// InternedString( const char *, size_t length )
@@ -86,6 +87,12 @@ class IECORE_API InternedString
 
 		static size_t numUniqueStrings();
 
+		/// Interns all the strings in `values`, storing the results in `result`,
+		/// which is resized to match. This is significantly faster than constructing
+		/// InternedStrings one at a time, as it takes each lock in the internal table
+		/// only once, and performs the work in parallel.
+		static void intern( const std::vector<std::string> &values, std::vector<InternedString> &result );
+
 	private :
 
 		static const std::string *internedString( const char *value );
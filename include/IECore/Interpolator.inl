@@ -34,6 +34,11 @@
 
 #include "IECore/TypedData.h"
 
+#include "OpenEXR/ImathVec.h"
+
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 namespace IECore
 {
 
@@ -84,6 +89,43 @@ struct LinearInterpolator< std::vector<T> >
 	}
 };
 
+// Partially specialise for vectors of Imath::Vec3, which are typically large
+// (positions, normals, velocities). The components are interpolated as a flat
+// array so the loop is vectorised by the compiler, and large arrays are split
+// across threads.
+template<typename T>
+struct LinearInterpolator< std::vector< Imath::Vec3<T> > >
+{
+	void operator()(const std::vector< Imath::Vec3<T> > &y0,
+			const std::vector< Imath::Vec3<T> > &y1,
+			double x,
+			std::vector< Imath::Vec3<T> > &result) const
+	{
+		size_t size = y0.size();
+		assert(y1.size() == size);
+
+		result.resize( size );
+
+		const T *a = size ? y0[0].getValue() : nullptr;
+		const T *b = size ? y1[0].getValue() : nullptr;
+		T *r = size ? result[0].getValue() : nullptr;
+		const T t = static_cast<T>( x );
+
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, size * 3, 30000 ),
+			[a, b, r, t]( const tbb::blocked_range<size_t> &range )
+			{
+				for( size_t i = range.begin(); i != range.end(); ++i )
+				{
+					r[i] = a[i] + ( b[i] - a[i] ) * t;
+				}
+			}
+		);
+
+		assert(result.size() == size);
+	}
+};
+
 // Partially specialise for std::vector
 template<typename T>
 struct CubicInterpolator< std::vector<T> >
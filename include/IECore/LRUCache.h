@@ -39,6 +39,10 @@
 #include "boost/noncopyable.hpp"
 #include "boost/variant.hpp"
 
+#include "tbb/atomic.h"
+
+#include <vector>
+
 namespace IECore
 {
 
@@ -63,7 +67,8 @@ class Parallel;
 /// A mapping from keys to values, where values are computed from keys using a user
 /// supplied function. Recently computed values are stored in the cache to accelerate
 /// subsequent lookups. Each value has a cost associated with it, and the cache has
-/// a maximum total cost above which it will remove the least recently accessed items.
+/// a maximum total cost above which it will remove items, chosen according to the
+/// EvictionPolicy. By default the least recently accessed items are removed.
 ///
 /// The Value type must be default constructible, copy constructible and assignable.
 /// Note that Values are returned by value, and erased by assigning a default constructed
@@ -86,6 +91,40 @@ class LRUCache : private boost::noncopyable
 		typedef size_t Cost;
 		typedef Key KeyType;
 
+		/// Determines which items are removed when the cache exceeds its maximum cost.
+		enum EvictionPolicy
+		{
+			/// Removes the items which were least recently accessed (or an
+			/// approximation thereof, depending on the Policy). A single pass
+			/// over more items than the cache can hold will flush everything
+			/// else from it.
+			LRU = 0,
+			/// Items accumulate credit each time they are accessed after their
+			/// initial insertion, up to a small limit, and lose it gradually as
+			/// the cache looks for items to remove. Items which have only been
+			/// accessed once are removed first, so the frequently reused working
+			/// set survives a single pass over a large number of items. The keys
+			/// of recently removed items are remembered, and items which are
+			/// recomputed while still remembered are also credited, as they
+			/// would have been a hit had they remained cached.
+			LFU = 1
+		};
+
+		/// Counters describing the performance of the cache.
+		struct Statistics
+		{
+			Statistics();
+
+			/// Number of calls to `get()` which didn't need to compute a value.
+			size_t hits;
+			/// Number of calls to `get()` which had to compute a value.
+			size_t misses;
+			/// Number of items removed to keep within the maximum cost.
+			size_t evictions;
+			Cost currentCost;
+			Cost maxCost;
+		};
+
 		/// The GetterFunction is responsible for computing the value and cost for a cache entry
 		/// when given the key. It should throw a descriptive exception if it can't get the data for
 		/// any reason.
@@ -105,6 +144,13 @@ class LRUCache : private boost::noncopyable
 		/// Throws if the item can not be computed.
 		Value get( const GetterKey &key );
 
+		/// Retrieves an item if it is already cached, marking it as used in
+		/// the same way as get(). Unlike get(), the GetterFunction is never
+		/// called and nothing is inserted if the item isn't cached, in which
+		/// case false is returned. Lookups made this way are not included in
+		/// the statistics.
+		bool find( const Key &key, Value &value );
+
 		/// Adds an item to the cache directly, bypassing the GetterFunction.
 		/// Returns true for success and false on failure - failure can occur
 		/// if the cost exceeds the maximum cost for the cache. Note that even
@@ -136,6 +182,16 @@ class LRUCache : private boost::noncopyable
 		/// Returns the current cost of all cached items.
 		Cost currentCost() const;
 
+		/// Sets the policy used to choose which items are removed when
+		/// the cache exceeds its maximum cost.
+		void setEvictionPolicy( EvictionPolicy evictionPolicy );
+		EvictionPolicy getEvictionPolicy() const;
+
+		/// Returns the counters accumulated since construction or the
+		/// last call to resetStatistics().
+		Statistics statistics() const;
+		void resetStatistics();
+
 	private :
 
 		// Data
@@ -182,6 +238,21 @@ class LRUCache : private boost::noncopyable
 
 		Cost m_maxCost;
 
+		// Statistics. The counters are striped across threads to
+		// avoid contention when the cache is accessed concurrently.
+		struct Counters
+		{
+			Counters();
+			Counters( const Counters &other );
+			tbb::atomic<size_t> hits;
+			tbb::atomic<size_t> misses;
+			tbb::atomic<size_t> evictions;
+			// Keep each set of counters on its own cache line.
+			char padding[64 - 3 * sizeof( tbb::atomic<size_t> )];
+		};
+		std::vector<Counters> m_counters;
+		Counters &counters();
+
 		// Methods
 		// =======
 
@@ -39,6 +39,7 @@
 #include "IECore/Exception.h"
 
 #include "boost/multi_index/hashed_index.hpp"
+#include "boost/multi_index/identity.hpp"
 #include "boost/multi_index/member.hpp"
 #include "boost/multi_index/sequenced_index.hpp"
 #include "boost/multi_index_container.hpp"
@@ -48,8 +49,11 @@
 #include "tbb/spin_rw_mutex.h"
 #include "tbb/tbb_thread.h"
 
+#include <algorithm>
 #include <cassert>
+#include <functional>
 #include <iostream>
+#include <thread>
 #include <tuple>
 #include <vector>
 
@@ -68,6 +72,64 @@ namespace IECore
 namespace LRUCachePolicy
 {
 
+// Items are given a frequency count which is used to implement the
+// LFU eviction policy. It starts at -1 (or 0 for items readmitted from
+// the History below), is incremented each time the item is used up to
+// this limit, and is decremented each time the item is passed over for
+// removal.
+const int g_maxFrequency = 3;
+
+// Records the keys of items recently removed by the LFU policy, in the
+// manner of the "ghost" lists used by ARC. When an item is recomputed
+// while its key is still in the history, it is given the credit it would
+// have earned from a hit, so that a working set which has been partially
+// flushed recovers its protection immediately. Only the keys are stored,
+// and the history is trimmed to never hold more keys than there are
+// items in the cache.
+template<typename Key>
+class History
+{
+
+	public :
+
+		void add( const Key &key, size_t maxSize )
+		{
+			m_keys.push_back( key );
+			while( m_keys.size() > maxSize )
+			{
+				m_keys.pop_front();
+			}
+		}
+
+		// Removes the key, returning true if it was present.
+		bool remove( const Key &key )
+		{
+			typename Keys::template nth_index<1>::type &index = m_keys.template get<1>();
+			typename Keys::template nth_index<1>::type::iterator it = index.find( key );
+			if( it == index.end() )
+			{
+				return false;
+			}
+			index.erase( it );
+			return true;
+		}
+
+	private :
+
+		typedef boost::multi_index::multi_index_container<
+			Key,
+			boost::multi_index::indexed_by<
+				boost::multi_index::sequenced<>,
+				boost::multi_index::hashed_unique<
+					boost::multi_index::identity<Key>
+				>
+			>
+		> Keys;
+
+		Keys m_keys;
+
+};
+
 enum AcquireMode
 {
 	FindReadable,
@@ -98,7 +160,7 @@ class Serial
 		struct Item
 		{
 			Item( const Key &key )
-				:	key( key ), hasHandle( false )
+				:	key( key ), hasHandle( false ), frequency( -1 )
 			{
 			}
 
@@ -110,6 +172,8 @@ class Serial
 			// get non-const access to it.
 			mutable CacheEntry cacheEntry;
 			mutable bool hasHandle;
+			// Used by the LFU eviction policy.
+			mutable int frequency;
 		};
 
 		typedef boost::multi_index_container<
@@ -129,7 +193,7 @@ class Serial
 		typedef typename MapAndList::template nth_index<1>::type List;
 
 		Serial()
-			:	currentCost( 0 )
+			:	currentCost( 0 ), evictionPolicy( LRUCache::LRU )
 		{
 		}
 
@@ -203,6 +267,10 @@ class Serial
 				// Inserting via the map index automatically puts the new item
 				// at the back of the list.
 				std::pair<MapIterator, bool> i = m_mapAndList.insert( Item( key ) );
+				if( i.second && m_history.remove( key ) )
+				{
+					i.first->frequency = 0;
+				}
 				handle.init( i.first );
 				return true;
 			}
@@ -225,11 +293,15 @@ class Serial
 		{
 			List &list = m_mapAndList.template get<1>();
 			list.relocate( list.end(), list.iterator_to( *(handle.m_it) ) );
+			if( handle.m_it->frequency < g_maxFrequency )
+			{
+				handle.m_it->frequency++;
+			}
 		}
 
-		// Pops a copy of the least recently used CacheEntry from the policy,
-		// removing it from the internal storage. Returns true for success
-		// and false for failure.
+		// Pops a copy of the CacheEntry chosen for eviction by the
+		// `evictionPolicy` from the policy, removing it from the internal
+		// storage. Returns true for success and false for failure.
 		bool pop( Key &key, CacheEntry &cacheEntry )
 		{
 			List &list = m_mapAndList.template get<1>();
@@ -241,9 +313,29 @@ class Serial
 			// to `get( someOtherKey )`, and this inner call has
 			// then entered `limitCost()`.
 			typename List::iterator it = list.begin();
-			while( it != list.end() && it->hasHandle )
+			while( it != list.end() )
 			{
-				++it;
+				if( it->hasHandle )
+				{
+					++it;
+				}
+				else if( evictionPolicy == LRUCache::LFU && it->frequency > 0 )
+				{
+					// Item has been used frequently. Give it
+					// another chance by moving it to the back
+					// of the list with reduced credit.
+					it->frequency--;
+					typename List::iterator next = it; ++next;
+					list.relocate( list.end(), it );
+					if( next != list.end() )
+					{
+						it = next;
+					}
+				}
+				else
+				{
+					break;
+				}
 			}
 
 			if( it == list.end() )
@@ -258,14 +350,21 @@ class Serial
 
 			list.erase( it );
 
+			if( evictionPolicy == LRUCache::LFU )
+			{
+				m_history.add( key, m_mapAndList.size() );
+			}
+
 			return true;
 		}
 
 		typename LRUCache::Cost currentCost;
+		typename LRUCache::EvictionPolicy evictionPolicy;
 
 	private :
 
 		MapAndList m_mapAndList;
+		History<Key> m_history;
 
 };
 
@@ -284,16 +383,18 @@ class Parallel
 
 		struct Item
 		{
-			Item() : recentlyUsed() {}
-			Item( const Key &key ) : key( key ), recentlyUsed() {}
-			Item( const Item &other ) : key( other.key ), cacheEntry( other.cacheEntry ), recentlyUsed() {}
+			Item() { frequency = -1; }
+			Item( const Key &key ) : key( key ) { frequency = -1; }
+			Item( const Item &other ) : key( other.key ), cacheEntry( other.cacheEntry ) { frequency = -1; }
 			Key key;
 			mutable CacheEntry cacheEntry;
 			// Mutex to protect cacheEntry.
 			typedef tbb::spin_rw_mutex Mutex;
 			mutable Mutex mutex;
-			// Flag used in second-chance algorithm.
-			mutable tbb::atomic<bool> recentlyUsed;
+			// Count used in second-chance algorithm. Items
+			// with a count greater than zero are considered
+			// to have been used recently.
+			mutable tbb::atomic<int> frequency;
 		};
 
 		// We would love to use one of TBB's concurrent containers as
@@ -328,9 +429,11 @@ class Parallel
 		struct Bin
 		{
 			Bin() {}
-			Bin( const Bin &other ) : map( other.map ) {}
-			Bin &operator = ( const Bin &other ) { map = other.map; return *this; }
+			Bin( const Bin &other ) : map( other.map ), history( other.history ) {}
+			Bin &operator = ( const Bin &other ) { map = other.map; history = other.history; return *this; }
 			Map map;
+			// Keys recently removed from `map` by the LFU policy.
+			History<Key> history;
 			typedef tbb::spin_rw_mutex Mutex;
 			Mutex mutex;
 		};
@@ -343,6 +446,7 @@ class Parallel
 			m_popBinIndex = 0;
 			m_popIterator = m_bins[0].map.begin();
 			currentCost = 0;
+			evictionPolicy = LRUCache::LRU;
 		}
 
 		struct Handle : private boost::noncopyable
@@ -409,6 +513,10 @@ class Parallel
 							}
 							binLock.upgrade_to_writer();
 							std::tie<MapIterator, bool>( it, inserted ) = bin.map.insert( Item( key ) );
+							if( inserted && bin.history.remove( key ) )
+							{
+								it->frequency = 0;
+							}
 						}
 						// Now try to get a lock on the item we want to
 						// acquire. When we've just inserted a new item
@@ -468,8 +576,23 @@ class Parallel
 			// recently. We will then give it a second chance
 			// in pop(), so it will not be evicted immediately.
 			// We don't need the handle to be writable to write
-			// here, because `recentlyUsed` is atomic.
-			handle.m_item->recentlyUsed = true;
+			// here, because `frequency` is atomic.
+			if( evictionPolicy == LRUCache::LRU )
+			{
+				handle.m_item->frequency = 1;
+			}
+			else
+			{
+				// Accumulate credit for each use after the first,
+				// so that items which have only been used once are
+				// evicted first. If we lose a race with another
+				// thread then we simply forego the increment.
+				const int frequency = handle.m_item->frequency;
+				if( frequency < g_maxFrequency )
+				{
+					handle.m_item->frequency.compare_and_swap( frequency + 1, frequency );
+				}
+			}
 		}
 
 		bool pop( Key &key, CacheEntry &cacheEntry )
@@ -511,7 +634,8 @@ class Parallel
 
 				if( itemLock.try_acquire( m_popIterator->mutex ) )
 				{
-					if( !m_popIterator->recentlyUsed )
+					const int frequency = m_popIterator->frequency;
+					if( frequency <= 0 )
 					{
 						// Pop this item.
 						key = m_popIterator->key;
@@ -525,14 +649,18 @@ class Parallel
 						// Bin lock.
 						itemLock.release();
 						m_popIterator = bin->map.erase( m_popIterator );
+						if( evictionPolicy == LRUCache::LFU )
+						{
+							bin->history.add( key, bin->map.size() );
+						}
 						return true;
 					}
 					else
 					{
-						// Item has been used recently. Flag it so we
-						// can pop it next time round, unless another
-						// thread resets the flag.
-						m_popIterator->recentlyUsed = false;
+						// Item has been used recently. Reduce its count
+						// so we can pop it when we next come round with
+						// no intervening use.
+						m_popIterator->frequency.compare_and_swap( frequency - 1, frequency );
 						itemLock.release();
 					}
 				}
@@ -548,6 +676,7 @@ class Parallel
 		}
 
 		AtomicCost currentCost;
+		tbb::atomic<typename LRUCache::EvictionPolicy> evictionPolicy;
 
 	private :
 
@@ -583,24 +712,49 @@ typename LRUCache<Key, Value, Policy, GetterKey>::Status LRUCache<Key, Value, Po
 	return static_cast<Status>( state.which() );
 }
 
+// Statistics
+// =======================================================================
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+LRUCache<Key, Value, Policy, GetterKey>::Statistics::Statistics()
+	:	hits( 0 ), misses( 0 ), evictions( 0 ), currentCost( 0 ), maxCost( 0 )
+{
+}
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+LRUCache<Key, Value, Policy, GetterKey>::Counters::Counters()
+{
+	hits = 0;
+	misses = 0;
+	evictions = 0;
+}
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+LRUCache<Key, Value, Policy, GetterKey>::Counters::Counters( const Counters &other )
+{
+	hits = other.hits;
+	misses = other.misses;
+	evictions = other.evictions;
+}
+
 // LRUCache
 // =======================================================================
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 LRUCache<Key, Value, Policy, GetterKey>::LRUCache( GetterFunction getter )
-	:	m_getter( getter ), m_removalCallback( nullRemovalCallback ), m_maxCost( 500 )
+	:	m_getter( getter ), m_removalCallback( nullRemovalCallback ), m_maxCost( 500 ), m_counters( std::max( 1u, tbb::tbb_thread::hardware_concurrency() ) )
 {
 }
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 LRUCache<Key, Value, Policy, GetterKey>::LRUCache( GetterFunction getter, Cost maxCost )
-	:	m_getter( getter ), m_removalCallback( nullRemovalCallback ), m_maxCost( maxCost )
+	:	m_getter( getter ), m_removalCallback( nullRemovalCallback ), m_maxCost( maxCost ), m_counters( std::max( 1u, tbb::tbb_thread::hardware_concurrency() ) )
 {
 }
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 LRUCache<Key, Value, Policy, GetterKey>::LRUCache( GetterFunction getter, RemovalCallback removalCallback, Cost maxCost )
-	:	m_getter( getter ), m_removalCallback( removalCallback ), m_maxCost( maxCost )
+	:	m_getter( getter ), m_removalCallback( removalCallback ), m_maxCost( maxCost ), m_counters( std::max( 1u, tbb::tbb_thread::hardware_concurrency() ) )
 {
 }
 
@@ -647,6 +801,50 @@ typename LRUCache<Key, Value, Policy, GetterKey>::Cost LRUCache<Key, Value, Poli
 	return m_policy.currentCost;
 }
 
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+void LRUCache<Key, Value, Policy, GetterKey>::setEvictionPolicy( EvictionPolicy evictionPolicy )
+{
+	m_policy.evictionPolicy = evictionPolicy;
+}
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+typename LRUCache<Key, Value, Policy, GetterKey>::EvictionPolicy LRUCache<Key, Value, Policy, GetterKey>::getEvictionPolicy() const
+{
+	return m_policy.evictionPolicy;
+}
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+typename LRUCache<Key, Value, Policy, GetterKey>::Statistics LRUCache<Key, Value, Policy, GetterKey>::statistics() const
+{
+	Statistics result;
+	for( typename std::vector<Counters>::const_iterator it = m_counters.begin(); it != m_counters.end(); ++it )
+	{
+		result.hits += it->hits;
+		result.misses += it->misses;
+		result.evictions += it->evictions;
+	}
+	result.currentCost = currentCost();
+	result.maxCost = getMaxCost();
+	return result;
+}
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+void LRUCache<Key, Value, Policy, GetterKey>::resetStatistics()
+{
+	for( typename std::vector<Counters>::iterator it = m_counters.begin(); it != m_counters.end(); ++it )
+	{
+		it->hits = 0;
+		it->misses = 0;
+		it->evictions = 0;
+	}
+}
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+typename LRUCache<Key, Value, Policy, GetterKey>::Counters &LRUCache<Key, Value, Policy, GetterKey>::counters()
+{
+	return m_counters[std::hash<std::thread::id>()( std::this_thread::get_id() ) % m_counters.size()];
+}
+
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key )
 {
@@ -657,6 +855,8 @@ Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key )
 
 	if( status==Uncached )
 	{
+		counters().misses++;
+
 		Value value = Value();
 		Cost cost = 0;
 		try
@@ -682,15 +882,37 @@ Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key )
 	}
 	else if( status==Cached )
 	{
+		counters().hits++;
 		m_policy.push( handle );
 		return boost::get<Value>( cacheEntry.state );
 	}
 	else
 	{
+		counters().hits++;
 		std::rethrow_exception( boost::get<std::exception_ptr>( cacheEntry.state ) );
 	}
 }
 
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+bool LRUCache<Key, Value, Policy, GetterKey>::find( const Key &key, Value &value )
+{
+	typename Policy<LRUCache>::Handle handle;
+	if( !m_policy.acquire( key, handle, LRUCachePolicy::FindReadable ) )
+	{
+		return false;
+	}
+
+	const CacheEntry &cacheEntry = handle.readable();
+	if( cacheEntry.status() != Cached )
+	{
+		return false;
+	}
+
+	m_policy.push( handle );
+	value = boost::get<Value>( cacheEntry.state );
+	return true;
+}
+
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 bool LRUCache<Key, Value, Policy, GetterKey>::set( const Key &key, const Value &value, Cost cost )
 {
@@ -773,7 +995,10 @@ void LRUCache<Key, Value, Policy, GetterKey>::limitCost( Cost cost )
 			break;
 		}
 
-		eraseInternal( key, cacheEntry );
+		if( eraseInternal( key, cacheEntry ) )
+		{
+			counters().evictions++;
+		}
 	}
 }
 
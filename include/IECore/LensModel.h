@@ -102,6 +102,8 @@ class IECORE_API LensModel : public Parameterised
 		//@{
 		/// Compute should be called to set up the internal values. This method must be called
 		/// before subsequent calls to distort(), undistort() and bounds() or their results are undefined.
+		/// Once validated, distort() and undistort() may be called concurrently from multiple threads,
+		/// so implementations must not modify the model within them.
 		virtual void validate() = 0;
 
 		/// Distorts a point in UV space of the range (0-1) where the lower left corner is 0,0.
@@ -51,6 +51,10 @@ IE_CORE_FORWARDDECLARE( ObjectPool );
 /// <b>IECORE_OBJECTPOOL_MEMORY</b><br>
 /// Used to specify the memory limits for the default ObjectPool. See
 /// ObjectPool::defaultObjectPool() for more information.
+///
+/// <b>IECORE_OBJECTPOOL_EVICTIONPOLICY</b><br>
+/// Used to specify the eviction policy for the default ObjectPool, either
+/// "LRU" or "LFU". See ObjectPool::defaultObjectPool() for more information.
 
 /// The ObjectPool class implements a cache of Object instances indexed by their own hash and limited by the memory consumption.
 /// The function defaultObjectPool() returns a singleton object that should be used by most of the operations,
@@ -81,6 +85,38 @@ class IECORE_API ObjectPool : public RefCounted
 		/// Returns the current memory cost of items held in the pool
 		size_t memoryUsage() const;
 
+		/// Enum used to specify which objects are discarded when the pool exceeds its
+		/// maximum memory usage. See LRUCache::EvictionPolicy for details.
+		enum EvictionPolicy
+		{
+			LRU = 0,
+			LFU
+		};
+
+		void setEvictionPolicy( EvictionPolicy evictionPolicy );
+		EvictionPolicy getEvictionPolicy() const;
+
+		/// Counters describing the effectiveness of the pool.
+		struct Statistics
+		{
+			Statistics();
+
+			/// Number of calls to retrieve() which found the object in the pool, or to
+			/// store() which found an identical object already there.
+			size_t hits;
+			/// Number of calls to retrieve() which didn't find the object in the pool.
+			size_t misses;
+			/// Number of objects discarded to keep within the maximum memory usage.
+			size_t evictions;
+			size_t memoryUsage;
+			size_t maxMemoryUsage;
+		};
+
+		/// Returns the counters accumulated since construction or the
+		/// last call to resetStatistics().
+		Statistics statistics() const;
+		void resetStatistics();
+
 		/// Returns true if the object with the given hash is in the pool.
 		/// Note: this function doesn't garantee that retrieve() will return an object in a multi-threaded application.
 		bool contains( const MurmurHash &hash ) const;
@@ -105,7 +141,8 @@ class IECORE_API ObjectPool : public RefCounted
 		/// wishing to share IECore::Object instances.
 		/// It makes sense to use this wherever possible to conserve memory. This initially
 		/// has a memory limit specified in megabytes by the IECORE_OBJECTPOOL_MEMORY
-		/// environment variable. If it needs changing it's recommended to do
+		/// environment variable, and an eviction policy specified by the
+		/// IECORE_OBJECTPOOL_EVICTIONPOLICY environment variable. If it needs changing it's recommended to do
 		/// that from a config file loaded by the ConfigLoader, to avoid multiple
 		/// clients fighting over the same set of settings.
 		static ObjectPool *defaultObjectPool();
@@ -49,6 +49,8 @@
 namespace IECore
 {
 
+class IndexedIO;
+
 /// The PathMatcher class provides an acceleration structure for matching
 /// paths against a sequence of reference paths. It provides the internal
 /// implementation for the PathFilter.
@@ -95,8 +97,10 @@ class IECORE_API PathMatcher
 		/// were removed, and false if none existed anyway.
 		bool removePaths( const PathMatcher &paths );
 
-		/// Returns a PathMatcher for objects matching both this and the given PathMatcher
-		PathMatcher intersection( const PathMatcher &paths );
+		/// Returns a PathMatcher for objects matching both this and the given PathMatcher.
+		/// Subtrees which are common to both are shared with the result rather than
+		/// copied, so this is fastest when the inputs were derived from one another.
+		PathMatcher intersection( const PathMatcher &paths ) const;
 
 		/// Removes the specified path and all descendant paths.
 		/// Returns true if something was removed, false otherwise.
@@ -124,6 +128,13 @@ class IECORE_API PathMatcher
 		bool operator == ( const PathMatcher &other ) const;
 		bool operator != ( const PathMatcher &other ) const;
 
+		/// Writes the paths into the container, using a compact encoding of
+		/// the tree itself so that load() needn't perform any per-path work.
+		void save( IndexedIO *container ) const;
+		/// Replaces the contents of this matcher with paths previously
+		/// written by save().
+		void load( const IndexedIO *container );
+
 		class RawIterator;
 		class Iterator;
 
@@ -238,6 +249,10 @@ class IECORE_API PathMatcher
 		NodePtr addPathsWalk( Node *node, const Node *srcNode, bool shared, bool &added );
 		NodePtr addPrefixedPathsWalk( Node *node, const Node *srcNode, const NameIterator &start, const NameIterator &end, bool shared, bool &added  );
 		NodePtr removePathsWalk( Node *node, const Node *srcNode, bool shared, bool &removed );
+		static NodePtr intersectionWalk( Node *node, const Node *srcNode );
+
+		static void saveWalk( const Node *node, std::vector<IECore::InternedString> &names, std::vector<unsigned int> &structure );
+		static NodePtr loadWalk( const std::vector<IECore::InternedString> &names, const std::vector<unsigned int> &structure, size_t &nameIndex, size_t &structureIndex );
 
 		void matchWalk( const Node *node, const NameIterator &start, const NameIterator &end, unsigned &result ) const;
 
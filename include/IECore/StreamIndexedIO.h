@@ -53,7 +53,12 @@ namespace IECore
 {
 /// Abstract base class implementation of IndexedIO which operates with a stream file handle.
 /// It handles data instancing transparently for compact file sizes.
-/// Read operations are thread safe on read-only opened files.
+/// Read operations are thread safe on read-only opened files. When writing, different
+/// directories may be written concurrently from different threads, provided each directory
+/// is only modified by one thread at a time. Data is flattened and compressed in parallel,
+/// and only the deduplication and the append to the file are serialised.
+/// The index and optionally the data blocks can be compressed with one of several codecs.
+/// The codecs are recorded in the file, so they don't need to be known in advance when reading.
 /// \ingroup ioGroup
 class IECORE_API StreamIndexedIO : public IndexedIO
 {
@@ -61,10 +66,45 @@ class IECORE_API StreamIndexedIO : public IndexedIO
 
 		IE_CORE_DECLARERUNTIMETYPED( StreamIndexedIO, IndexedIO );
 
+		/// Compression codecs for the index and the data blocks of a file. NoCodec and
+		/// GzipCodec are supported by every build, but LZ4Codec and ZstdCodec are only
+		/// available if the library was built with LZ4 and Zstd. Files written with them
+		/// can't be read by builds without them, or by versions of the library which
+		/// predate them, so they should only be used for files which won't leave a
+		/// pipeline built with both.
+		enum Codec
+		{
+			NoCodec = 0,
+			GzipCodec = 1,
+			LZ4Codec = 2,
+			ZstdCodec = 3
+		};
+
+		/// Returns true if support for the codec was available when the library was built.
+		static bool codecAvailable( Codec codec );
+
+		/// Sets the codecs used for files opened without specifying them explicitly. The
+		/// defaults are GzipCodec for the index and NoCodec for the data blocks, which produce
+		/// files that can also be read by previous versions of the library. A codec which is
+		/// not available is replaced with GzipCodec, and a warning is emitted. The same applies
+		/// to codecs passed explicitly when opening a file.
+		/// \threading This should be called before any files are opened, and not concurrently
+		/// with any other IndexedIO operation.
+		static void setDefaultCodecs( Codec indexCodec, Codec dataCodec );
+		static Codec defaultIndexCodec();
+		static Codec defaultDataCodec();
+
 		~StreamIndexedIO() override;
 
+		/// Returns the codec used to compress the index of the file.
+		Codec indexCodec() const;
+		/// Returns the codec used to compress the data blocks of the file.
+		Codec dataCodec() const;
+
 		IndexedIO::OpenMode openMode() const override;
 
+		size_t memoryUsage() const override;
+
 		void path( IndexedIO::EntryIDList &result ) const override;
 
 		bool hasEntry( const IndexedIO::EntryID &name ) const override;
@@ -182,6 +222,18 @@ class IECORE_API StreamIndexedIO : public IndexedIO
 				// utility function that returns a temporary buffer for io operations (not thread safe).
 				char *ioBuffer( unsigned long size );
 
+				/// Returns a pointer to size bytes at the given position if the file is memory
+				/// mapped, or nullptr otherwise. Mapped data may be accessed concurrently, without
+				/// locking the mutex.
+				const char *mappedData( Imf::Int64 pos, size_t size ) const;
+
+				/// Reads size bytes at the given position without using the shared stream, in the
+				/// manner of pread(). Returns false if this isn't supported, in which case the mutex must
+				/// be locked and seekg() and read() used instead. Positional reads may be performed
+				/// concurrently, without locking the mutex. The default implementation supports memory
+				/// mapped files only.
+				virtual bool readAt( char *buffer, size_t size, Imf::Int64 pos );
+
 				/// called after the main index is saved to disk, ready to close the file.
 				virtual void flush( size_t endPosition );
 
@@ -193,11 +245,17 @@ class IECORE_API StreamIndexedIO : public IndexedIO
 				/// called once after construction. Assigns a stream and tells if the stream is empty.
 				// This function allocates and if in read-mode also reads the Index of the file.
 				void setStream( std::iostream *stream, bool emptyFile );
+				/// May be called by derived classes which have the whole file mapped into memory,
+				/// in addition to setStream(). The memory must remain valid for the lifetime of the StreamFile.
+				void setMappedData( const char *data, size_t size );
 
 				IndexedIO::OpenMode m_openmode;
 				std::iostream *m_stream;
 				Mutex m_mutex;
 
+				const char *m_mappedData;
+				size_t m_mappedSize;
+
 				unsigned long m_ioBufferLen;
 				char *m_ioBuffer;
 		};
@@ -211,6 +269,9 @@ class IECORE_API StreamIndexedIO : public IndexedIO
 
 		/// Opens a file using the given IndexedFile accessor
 		void open( StreamFilePtr file, const IndexedIO::EntryIDList &root );
+		/// As above, but specifying the codecs used if a new file is being written.
+		/// Existing files opened in Read or Append mode always use the codecs they were written with.
+		void open( StreamFilePtr file, const IndexedIO::EntryIDList &root, Codec indexCodec, Codec dataCodec );
 
 		/// Variant of "removeChild" which allows exceptions to be optionally thrown
 		/// if the entry to remove does not exist.
@@ -45,7 +45,9 @@ namespace IECoreImage
 {
 
 /// A base class for operations which modify a selection of
-/// channels on an ImagePrimitive.
+/// channels on an ImagePrimitive. Channels stored as TiledChannelData
+/// are passed to modifyChannels() as contiguous FloatVectorData, and
+/// are converted back into tiled channels afterwards.
 /// \ingroup imageProcessingGroup
 class IECOREIMAGE_API ChannelOp : public IECore::ModifyOp
 {
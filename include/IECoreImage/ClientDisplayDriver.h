@@ -58,6 +58,8 @@ class IECOREIMAGE_API ClientDisplayDriver : public DisplayDriver
 
 		// Constructor.
 		// Expects two StringData parameters: displayHost and displayPort.
+		// An optional BoolData parameter, displayCompression, enables compression
+		// of the image data sent to the server, trading CPU time for bandwidth.
 		ClientDisplayDriver( const Imath::Box2i &displayWindow, const Imath::Box2i &dataWindow, const std::vector<std::string> &channelNames, IECore::ConstCompoundDataPtr parameters );
 
 		~ClientDisplayDriver() override;
@@ -52,7 +52,12 @@ namespace IECoreImage
 /// Server class that receives images from ClientDisplayDriver connections and forwards the data to local display drivers.
 /// The type of the local display drivers is defined by the 'remoteDisplayType' parameter.
 ///
-/// The server object creates a thread to control the socket connection. The thread dies when the object is destroyed.
+/// The server object creates a pool of threads to control the socket connections. The threads die when the object is destroyed.
+/// Each session reads buckets from its socket and queues them, and the queue is passed to the local display driver by another
+/// thread from the pool, so that reading from the network overlaps with the work done by the driver. Adjacent buckets that
+/// are queued together are coalesced into a single call to DisplayDriver::imageData(). The driver for a session is never called
+/// concurrently, but drivers for different sessions may be called concurrently. If the driver falls behind, the session
+/// stops reading from its socket until the queue has been processed, so the memory used by the queue is bounded.
 /// \ingroup renderingGroup
 class IECOREIMAGE_API DisplayDriverServer : public IECore::RunTimeTyped
 {
@@ -63,11 +68,39 @@ class IECOREIMAGE_API DisplayDriverServer : public IECore::RunTimeTyped
 		/// A port number of 0 causes a free port to be chosen
 		/// automatically. Call `portNumber()` after construction
 		/// to retrieve the actual number.
-		DisplayDriverServer( int portNumber = 0 );
+		/// The number of threads used to service the connections is
+		/// given by `numThreads`. With a single thread, reading from the
+		/// sockets doesn't overlap with the work done by the drivers. Pass
+		/// 0 to use one thread per core.
+		DisplayDriverServer( int portNumber = 0, int numThreads = 1 );
 		~DisplayDriverServer() override;
 
 		int portNumber();
 
+		/// Counters describing the throughput of the server.
+		struct Statistics
+		{
+			Statistics();
+
+			/// Number of sessions opened by clients.
+			size_t sessions;
+			/// Number of imageData messages received from clients.
+			size_t bucketsReceived;
+			/// Number of bytes received in imageData messages, as sent over the socket.
+			size_t bytesReceived;
+			/// Number of bytes in imageData messages after decompression.
+			size_t uncompressedBytesReceived;
+			/// Number of calls made to DisplayDriver::imageData(), after coalescing buckets.
+			size_t imageDataCalls;
+			/// Time spent in DisplayDriver::imageData(), in seconds.
+			double imageDataTime;
+		};
+
+		/// Returns the counters accumulated since construction or the
+		/// last call to resetStatistics().
+		Statistics statistics() const;
+		void resetStatistics();
+
 	private:
 
 		// Session class
@@ -43,6 +43,12 @@
 #include "IECoreImage/ImagePrimitive.h"
 #include "IECoreImage/TypeIds.h"
 
+#include "tbb/atomic.h"
+#include "tbb/spin_rw_mutex.h"
+
+#include <memory>
+#include <vector>
+
 namespace IECoreImage
 {
 
@@ -62,11 +68,14 @@ class IECOREIMAGE_API ImageDisplayDriver : public DisplayDriver
 
 		bool scanLineOrderOnly() const override;
 		bool acceptsRepeatedData() const override;
+		/// May be called concurrently from multiple threads, provided that the
+		/// boxes being written do not overlap.
 		void imageData( const Imath::Box2i &box, const float *data, size_t dataSize ) override;
 		void imageClose() override;
 
 		/// Access to the image being created. This should always be valid for reading, even
-		/// before imageClose() has been called.
+		/// before imageClose() has been called. Copies of the image taken before imageClose()
+		/// must not be made concurrently with calls to imageData().
 		ConstImagePrimitivePtr image() const;
 
 		//! @name Image pool
@@ -91,6 +100,30 @@ class IECOREIMAGE_API ImageDisplayDriver : public DisplayDriver
 
 		ImagePrimitivePtr m_image;
 
+		// Tracks whether the image may be shared with a copy, in which case
+		// the channels must be detached before they are written to. Shared
+		// with the image pool, so that storedImage() can flag it too.
+		struct Sharing
+		{
+			Sharing();
+			// Set when the image is handed out by image() or storedImage().
+			tbb::atomic<bool> handedOut;
+			// The number of references to the image held by the driver and the pool.
+			tbb::atomic<int> internalReferences;
+		};
+		typedef std::shared_ptr<Sharing> SharingPtr;
+		SharingPtr m_sharing;
+
+		friend struct PoolEntry;
+
+		// Held for writing while detaching the channels, and for reading
+		// while copying pixels into them.
+		typedef tbb::spin_rw_mutex ChannelsMutex;
+		ChannelsMutex m_channelsMutex;
+		// Pointers to the data of each channel, valid while the channels
+		// are not shared with a copy of the image.
+		std::vector<float *> m_channelData;
+
 };
 
 IE_CORE_DECLAREPTR( ImageDisplayDriver )
@@ -154,6 +154,10 @@ class IECOREIMAGE_API ImagePrimitive : public IECore::BlindDataHolder
 		///		  load the data from file without converting to float - this too may
 		///		  change at some point.
 		///		* Data must contain the same number of elements as there are pixels.
+		///
+		/// Alternatively, a float channel may be stored as TiledChannelData, in which
+		/// case the data window of the TiledChannel must match that of the image.
+		/// Tiled channels are not returned by getChannel().
 		//////////////////////////////////////////////////////////////////////////////
 		//@{
 		/// Returns the number of elements in a valid channel for this image.
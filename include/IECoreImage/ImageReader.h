@@ -38,6 +38,7 @@
 #include "IECoreImage/Export.h"
 #include "IECoreImage/TypeIds.h"
 
+#include "IECore/NumericParameter.h"
 #include "IECore/Reader.h"
 #include "IECore/SimpleTypedParameter.h"
 #include "IECore/VectorTypedParameter.h"
@@ -47,10 +48,22 @@ namespace IECoreImage
 
 IE_CORE_FORWARDDECLARE( ImagePrimitive );
 
+/// \addtogroup environmentGroup
+///
+/// <b>IECOREIMAGE_IMAGEREADER_TILECACHEMEMORY</b><br>
+/// The memory limit in megabytes for the cache shared by all channels read
+/// with the 'tiled' parameter On. Defaults to 500.
+
 /// The ImageReader will return an ImagePrimitive in linear colorspace with all channels
 /// converted to FloatVectorData. If 'rawChannels' is On, then it will return an
 /// ImagePrimitive with channels that are the close as possible to the original data
-/// type stored on the file.
+/// type stored on the file. The dataWindow and mipLevel parameters may be used
+/// to load only a region of the image, or a reduced resolution version of it, in
+/// which case only the tiles or scanlines covering that region are decoded.
+/// If 'tiled' is On, channels are returned as TiledChannelData instead, and
+/// no pixels are decoded until the tiles are accessed. Tiles are read through
+/// a single cache shared by all such channels, which bounds the memory they use
+/// until they are accessed.
 /// \ingroup ioGroup
 class IECOREIMAGE_API ImageReader : public IECore::Reader
 {
@@ -81,6 +94,18 @@ class IECOREIMAGE_API ImageReader : public IECore::Reader
 		/// If true, the values will not be linearized nor converted to float.
 		IECore::BoolParameter *rawChannelsParameter();
 		const IECore::BoolParameter *rawChannelsParameter() const;
+		/// The parameter specifying the region of the image to load. Only
+		/// the intersection of this with the data window is loaded, and an
+		/// empty region (the default) loads the whole data window.
+		IECore::Box2iParameter *dataWindowParameter();
+		const IECore::Box2iParameter *dataWindowParameter() const;
+		/// The parameter specifying the mip level to load.
+		IECore::IntParameter *mipLevelParameter();
+		const IECore::IntParameter *mipLevelParameter() const;
+		/// The parameter specifying if channels should be returned as
+		/// TiledChannelData, with tiles read from the file on demand.
+		IECore::BoolParameter *tiledParameter();
+		const IECore::BoolParameter *tiledParameter() const;
 		//@}
 
 		//! @name Image specific reading functions
@@ -90,22 +115,29 @@ class IECOREIMAGE_API ImageReader : public IECore::Reader
 		void channelNames( std::vector<std::string> &names );
 		/// Returns true if the file contains a valid image.
 		bool isComplete();
-		/// Returns the dataWindow contained in the file.
-		Imath::Box2i dataWindow();
-		/// Returns the displayWindow contained in the file.
-		Imath::Box2i displayWindow();
-		/// Reads the specified channel. This function obeys the dataWindowParameter(), so
-		/// that a subsection of the channel will be loaded if requested.
+		/// Returns the number of mip levels contained in the file. This is
+		/// 1 for files without MIP-maps.
+		int numMipLevels();
+		/// Returns the dataWindow contained in the file for the specified mip level.
+		Imath::Box2i dataWindow( int mipLevel = 0 );
+		/// Returns the displayWindow contained in the file for the specified mip level.
+		Imath::Box2i displayWindow( int mipLevel = 0 );
+		/// Reads the specified channel. This function obeys the dataWindowParameter()
+		/// and mipLevelParameter(), so that a subsection of the channel will be loaded if requested.
 		/// If raw is false it should return a FloatVectorData, otherwise
 		/// it returns the raw data. It must return a vector data type and
 		/// each element corresponds to a pixel. If that does not correspond
 		/// to the native file format, then it should return a FloatVectorData.
 		IECore::DataPtr readChannel( const std::string &name, bool raw = false );
+		/// As above, but reads several channels at once, decoding each tile or
+		/// scanline only once. This is significantly faster than multiple calls
+		/// to readChannel() for files with many channels.
+		void readChannels( const std::vector<std::string> &names, std::vector<IECore::DataPtr> &channels, bool raw = false );
 		//@}
 
 	protected :
 
-		/// Implemented using displayWindow(), dataWindow(), channelNames() and readChannel().
+		/// Implemented using displayWindow(), dataWindow(), channelNames() and readChannels().
 		IECore::ObjectPtr doOperation( const IECore::CompoundObject *operands ) override;
 
 	private :
@@ -118,6 +150,9 @@ class IECOREIMAGE_API ImageReader : public IECore::Reader
 
 		IECore::StringVectorParameterPtr m_channelNamesParameter;
 		IECore::BoolParameterPtr m_rawChannelsParameter;
+		IECore::Box2iParameterPtr m_dataWindowParameter;
+		IECore::IntParameterPtr m_mipLevelParameter;
+		IECore::BoolParameterPtr m_tiledParameter;
 
 		class Implementation;
 		std::unique_ptr<Implementation> m_implementation;
@@ -0,0 +1,89 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef IECOREIMAGE_BUCKETCOALESCING_H
+#define IECOREIMAGE_BUCKETCOALESCING_H
+
+#include "OpenEXR/ImathBox.h"
+
+#include <cstddef>
+
+namespace IECoreImage
+{
+
+namespace Detail
+{
+
+/// Returns the end of the run of buckets starting at `begin` which tile a
+/// rectangle from left to right or from top to bottom, and can therefore be
+/// passed to DisplayDriver::imageData() in a single call. The rectangle is
+/// returned in `runBox`. `Buckets` is a container of elements with `box` and
+/// `size` members, where `size` is the number of floats in the bucket. Only
+/// buckets with the same number of channels as the first are coalesced.
+template<typename Buckets>
+size_t coalescedRunEnd( const Buckets &buckets, size_t begin, Imath::Box2i &runBox )
+{
+	runBox = buckets[begin].box;
+	const size_t area = ( runBox.max.x - runBox.min.x + 1 ) * ( runBox.max.y - runBox.min.y + 1 );
+	if ( !area || buckets[begin].size % area )
+	{
+		return begin + 1;
+	}
+	const size_t numChannels = buckets[begin].size / area;
+
+	size_t end = begin + 1;
+	for ( ; end < buckets.size(); ++end )
+	{
+		const Imath::Box2i &box = buckets[end].box;
+		const bool right = box.min.y == runBox.min.y && box.max.y == runBox.max.y && box.min.x == runBox.max.x + 1;
+		const bool below = box.min.x == runBox.min.x && box.max.x == runBox.max.x && box.min.y == runBox.max.y + 1;
+		if ( !( right || below ) || box.max.x < box.min.x || box.max.y < box.min.y )
+		{
+			break;
+		}
+		if ( buckets[end].size != ( box.max.x - box.min.x + 1 ) * ( box.max.y - box.min.y + 1 ) * numChannels )
+		{
+			break;
+		}
+		runBox.extendBy( box );
+	}
+
+	return end;
+}
+
+} // namespace Detail
+
+} // namespace IECoreImage
+
+#endif // IECOREIMAGE_BUCKETCOALESCING_H
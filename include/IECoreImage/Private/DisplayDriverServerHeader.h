@@ -44,14 +44,17 @@ namespace IECoreImage
 * 7 bytes long:
 * [0] - magic number ( 0x82 )
 * [1] - protocol version ( 1 )
-* [2] - message type ( imageOpen, imageData, imageClose )
+* [2] - message type ( imageOpen, imageData, imageClose, exception, compressedImageData )
 * [3-6] - length of following data block.
 */
 class DisplayDriverServerHeader
 {
 	public:
 
-		enum MessageType { imageOpen = 1, imageData = 2, imageClose = 3, exception = 4 };
+		/// The data block for imageData is the bucket box followed by the pixels. For
+		/// compressedImageData it is the bucket box, the uncompressed size of the pixels
+		/// as a uint32_t, and the pixels compressed with zlib.
+		enum MessageType { imageOpen = 1, imageData = 2, imageClose = 3, exception = 4, compressedImageData = 5 };
 
 		static const unsigned char headerLength = 7;
 		static const unsigned char magicNumber = 0x82;
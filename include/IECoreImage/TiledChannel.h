@@ -0,0 +1,185 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#ifndef IECOREIMAGE_TILEDCHANNEL_H
+#define IECOREIMAGE_TILEDCHANNEL_H
+
+#include "IECoreImage/Export.h"
+
+#include "IECore/Export.h"
+#include "IECore/MurmurHash.h"
+#include "IECore/Object.h"
+#include "IECore/VectorTypedData.h"
+
+IECORE_PUSH_DEFAULT_VISIBILITY
+#include "OpenEXR/ImathBox.h"
+IECORE_POP_DEFAULT_VISIBILITY
+
+#include "tbb/spin_mutex.h"
+
+#include <functional>
+#include <vector>
+
+namespace IECore
+{
+
+class IndexedIO;
+
+} // namespace IECore
+
+namespace IECoreImage
+{
+
+/// A TiledChannel stores the float pixels of a single image channel as
+/// a grid of fixed size tiles, rather than as one contiguous buffer.
+/// Tiles are laid out from the top-left corner of the data window,
+/// so tiles at the right and bottom edges may be smaller than tileSize.
+/// A tile whose pixels all hold the same value is stored as that value
+/// alone, without any pixel storage, and tiles may optionally be computed
+/// on demand the first time they are accessed. This allows large images
+/// to be represented and partially processed without ever holding all
+/// their pixels in memory at once.
+///
+/// TiledChannels are stored in ImagePrimitive channels using TiledChannelData.
+class IECOREIMAGE_API TiledChannel
+{
+
+	public :
+
+		/// The width and height of a tile, in pixels.
+		static const int tileSize = 64;
+
+		/// Function used to compute tiles on demand. It is passed the bound of
+		/// a tile, and must return its pixels in row major order. It may be
+		/// called concurrently for different tiles.
+		typedef std::function<IECore::ConstFloatVectorDataPtr ( const Imath::Box2i &tileBound )> TileFunction;
+
+		/// Constructs a channel with an empty data window.
+		TiledChannel();
+		/// Constructs a channel in which every pixel has the given value.
+		/// No pixel storage is allocated.
+		TiledChannel( const Imath::Box2i &dataWindow, float value = 0.0f );
+		/// Constructs a channel from a row major buffer covering the whole
+		/// data window, as stored by a FloatVectorData channel.
+		TiledChannel( const Imath::Box2i &dataWindow, const std::vector<float> &pixels );
+		/// Constructs a channel whose tiles are computed by tileFunction when
+		/// they are first accessed.
+		TiledChannel( const Imath::Box2i &dataWindow, const TileFunction &tileFunction );
+
+		/// Copies share the pixel storage of the original. Tiles which
+		/// have not yet been computed are computed independently by each copy.
+		TiledChannel( const TiledChannel &other );
+		TiledChannel &operator = ( const TiledChannel &other );
+
+		const Imath::Box2i &dataWindow() const;
+		/// Moves the data window so that its minimum is at origin,
+		/// without modifying any pixel values.
+		void setOrigin( const Imath::V2i &origin );
+
+		//! @name Tile access
+		/// Tiles are indexed by their position in the grid, with (0,0) at the
+		/// minimum of the data window. All these methods are safe to call
+		/// concurrently with each other, with the exception of setTile().
+		////////////////////////////////////////////////////////////////////
+		//@{
+		Imath::V2i numTiles() const;
+		Imath::Box2i tileBound( const Imath::V2i &tileIndex ) const;
+		/// Returns the pixels for a tile, computing them first if necessary.
+		/// Returns nullptr for a tile with a constant value, in which case
+		/// the value is placed in constantValue.
+		IECore::ConstFloatVectorDataPtr tile( const Imath::V2i &tileIndex, float &constantValue ) const;
+		/// Replaces the pixels for a tile. Throws if pixels doesn't match
+		/// the area of the tile.
+		void setTile( const Imath::V2i &tileIndex, IECore::ConstFloatVectorDataPtr pixels );
+		void setTile( const Imath::V2i &tileIndex, float constantValue );
+		/// Returns the number of tiles currently holding pixel storage.
+		size_t numStoredTiles() const;
+		//@}
+
+		//! @name Pixel access
+		////////////////////////////////////////////////////////////////////
+		//@{
+		/// Copies the pixels within region into a row major buffer the size of
+		/// the region. Pixels outside the data window are set to zero.
+		void readPixels( const Imath::Box2i &region, float *pixels ) const;
+		/// Returns all the pixels of the data window in a single buffer,
+		/// suitable for use as a FloatVectorData channel.
+		IECore::FloatVectorDataPtr pixels() const;
+		//@}
+
+		/// Returns a channel with a different data window, containing the
+		/// same pixel values. Pixels outside the current data window are zero.
+		/// Tiles are shared with this channel wherever the tile grids line up,
+		/// and all others are computed on demand.
+		TiledChannel crop( const Imath::Box2i &dataWindow ) const;
+
+		/// Compares pixel values, computing tiles as necessary.
+		bool operator == ( const TiledChannel &other ) const;
+		bool operator != ( const TiledChannel &other ) const;
+
+		void hash( IECore::MurmurHash &h ) const;
+		void memoryUsage( IECore::Object::MemoryAccumulator &accumulator ) const;
+
+		/// Writes all tiles into the container, computing them as necessary.
+		void save( IECore::IndexedIO *container ) const;
+		/// Replaces the contents of this channel with one previously written
+		/// by save().
+		void load( const IECore::IndexedIO *container );
+
+	private :
+
+		struct Tile
+		{
+			Tile( float value = 0.0f, bool computed = true );
+			IECore::ConstFloatVectorDataPtr pixels;
+			float value;
+			bool computed;
+		};
+
+		size_t tileIndex( const Imath::V2i &tileIndex ) const;
+		Tile computeTile( const Imath::V2i &tileIndex ) const;
+		static Tile makeTile( IECore::ConstFloatVectorDataPtr pixels );
+		Tile getTile( const Imath::V2i &tileIndex ) const;
+
+		Imath::Box2i m_dataWindow;
+		TileFunction m_tileFunction;
+		mutable std::vector<Tile> m_tiles;
+		mutable tbb::spin_mutex m_mutex;
+
+};
+
+} // namespace IECoreImage
+
+#endif // IECOREIMAGE_TILEDCHANNEL_H
@@ -65,6 +65,7 @@ enum TypeId
 	DisplayDriverServerTypeId = 104022,
 	ClientDisplayDriverTypeId = 104023,
 	MPlayDisplayDriverTypeId = 104024,
+	TiledChannelDataTypeId = 104025,
 	LastCoreImageTypeId = 104999,
 };
 
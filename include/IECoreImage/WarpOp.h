@@ -81,7 +81,8 @@ class IECOREIMAGE_API WarpOp : public IECore::ModifyOp
 		/// Called once per element (pixel for ImagePrimitives).
 		/// Must be implemented by subclasses to determine where the color will come from.
 		/// The returned coordinate is on pixel space of the input image and the given V2f coordinates are on the
-		/// output image pixel space.
+		/// output image pixel space. Scanlines are processed in parallel, so this may be called concurrently
+		/// from multiple threads.
 		virtual Imath::V2f warp( const Imath::V2f &p ) const = 0;
 		/// Called once per operation, after all calls to transform() have been made. This is
 		/// an opportunity to perform any cleanup necessary.
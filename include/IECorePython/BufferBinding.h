@@ -0,0 +1,111 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#ifndef IECOREPYTHON_BUFFERBINDING_H
+#define IECOREPYTHON_BUFFERBINDING_H
+
+#include "boost/python.hpp"
+
+#include "IECorePython/Export.h"
+
+#include "IECore/Data.h"
+
+#include <vector>
+
+namespace IECorePython
+{
+
+IE_CORE_FORWARDDECLARE( Buffer );
+
+/// Provides zero-copy access to the raw memory held by a Data object,
+/// using the Python buffer protocol. This allows modules such as NumPy
+/// to operate directly on the contents of numeric VectorTypedData, without
+/// converting each element individually. Buffers are created via the
+/// `toBuffer()` method of the VectorTypedData bindings, and are typically
+/// consumed via `memoryview( buffer )` or `numpy.asarray( buffer )`.
+///
+/// A read-only Buffer shares memory with any copies of the Data. A writable
+/// Buffer calls `writable()` on the Data when it is created, so that memory
+/// shared with copies is unshared before it is exposed for modification.
+///
+/// The Buffer keeps the memory alive by holding a copy of the Data which
+/// shares it, so the memory remains valid for as long as the Buffer exists,
+/// even if the Data is modified or destroyed. Because the memory is shared,
+/// modifying the Data via its own methods gives it a new copy of the memory,
+/// and the Buffer no longer reflects its contents.
+///
+/// \note Copies of the Data made while a writable view is held will share
+/// the modifications subsequently made through that view.
+class IECOREPYTHON_API Buffer : public IECore::RefCounted
+{
+
+	public :
+
+		IE_CORE_DECLAREMEMBERPTR( Buffer );
+
+		/// Constructs a view of `numElements` elements, each consisting of
+		/// `elementComponents` values of `itemSize` bytes. The format is
+		/// specified using the character codes of the Python struct module.
+		/// The `storage` must share the memory at `address`, and is held to keep it alive.
+		Buffer( IECore::DataPtr data, IECore::ConstDataPtr storage, void *address, bool writable, const char *format, size_t itemSize, size_t numElements, size_t elementComponents );
+		~Buffer() override;
+
+		/// Returns the Data object whose memory is being viewed.
+		IECore::DataPtr asData() const;
+		bool isWritable() const;
+
+	private :
+
+		friend void bindBuffer();
+
+		// Implementation of the `bf_getbuffer` slot of the buffer protocol.
+		static int getBuffer( PyObject *object, Py_buffer *view, int flags );
+
+		IECore::DataPtr m_data;
+		IECore::ConstDataPtr m_storage;
+		void *m_address;
+		bool m_writable;
+		const char *m_format;
+		Py_ssize_t m_itemSize;
+		std::vector<Py_ssize_t> m_shape;
+		std::vector<Py_ssize_t> m_strides;
+
+};
+
+IECOREPYTHON_API void bindBuffer();
+
+} // namespace IECorePython
+
+#endif // IECOREPYTHON_BUFFERBINDING_H
@@ -225,6 +225,7 @@ class GeometricVectorTypedDataFunctions : ThisBinder
 				.def("__idiv__", &ThisGeometricBinder::idiv, "inplace division (s /= v) : accepts another vector of the same type or a single " Tname) \
 				.def("__cmp__", &ThisBinder::invalidOperator, "Raises an exception. This vector type does not support comparison operators.") \
 				.def("toString", &ThisBinder::toString, "Returns a string with a copy of the bytes in the vector.") \
+				.def("toBuffer", &ThisBinder::toBuffer, ( boost::python::arg( "writable" ) = false ), "Returns an IECore.Buffer providing zero-copy access to the vector via the buffer protocol.") \
 				/* geometric methods */ \
 				.def("__init__", make_constructor(&ThisGeometricBinder::dataListOrSizeConstructorAndInterpretation), \
 					 "Accepts another vector of the same class or a python list containing " Tname \
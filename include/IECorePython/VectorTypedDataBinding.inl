@@ -37,9 +37,13 @@
 
 #include "boost/python.hpp"
 
+#include "IECorePython/BufferBinding.h"
 #include "IECorePython/IECoreBinding.h"
 #include "IECorePython/RunTimeTypedBinding.h"
 
+#include "IECore/ByteOrder.h"
+#include "IECore/HalfTypeTraits.h"
+
 #include "boost/python/suite/indexing/container_utils.hpp"
 
 #include <sstream>
@@ -47,6 +51,90 @@
 namespace IECorePython
 {
 
+namespace Detail
+{
+
+/// Provides the Python struct module format code for the base types of
+/// VectorTypedData. Types without a specialisation can't be
+/// transferred via the buffer protocol.
+template<typename T>
+struct BufferFormat
+{
+	static const bool supported = false;
+	static const char *value() { return nullptr; }
+};
+
+#define IECOREPYTHON_DEFINEBUFFERFORMAT( TYPE, FORMAT ) \
+	template<> \
+	struct BufferFormat<TYPE> \
+	{ \
+		static const bool supported = true; \
+		static const char *value() { return FORMAT; } \
+	};
+
+IECOREPYTHON_DEFINEBUFFERFORMAT( half, "e" )
+IECOREPYTHON_DEFINEBUFFERFORMAT( float, "f" )
+IECOREPYTHON_DEFINEBUFFERFORMAT( double, "d" )
+IECOREPYTHON_DEFINEBUFFERFORMAT( char, "b" )
+IECOREPYTHON_DEFINEBUFFERFORMAT( unsigned char, "B" )
+IECOREPYTHON_DEFINEBUFFERFORMAT( short, "h" )
+IECOREPYTHON_DEFINEBUFFERFORMAT( unsigned short, "H" )
+IECOREPYTHON_DEFINEBUFFERFORMAT( int, "i" )
+IECOREPYTHON_DEFINEBUFFERFORMAT( unsigned int, "I" )
+IECOREPYTHON_DEFINEBUFFERFORMAT( int64_t, "q" )
+IECOREPYTHON_DEFINEBUFFERFORMAT( uint64_t, "Q" )
+
+#undef IECOREPYTHON_DEFINEBUFFERFORMAT
+
+/// Returns 'f' for floating point formats, 'i' for signed integer formats,
+/// 'u' for unsigned integer formats and 0 for anything else. This allows us
+/// to accept buffers from sources which use different codes for types of
+/// the same size - NumPy for instance uses "l" rather than "q" for int64.
+inline char bufferFormatKind( const char *format )
+{
+	if( !format )
+	{
+		return 'u';
+	}
+
+	// Skip native byte order and alignment prefixes.
+	while( *format == '@' || *format == '=' || ( *format == '<' && IECore::littleEndian() ) || ( *format == '>' && IECore::bigEndian() ) )
+	{
+		format++;
+	}
+
+	if( !*format || *(format + 1) )
+	{
+		return 0;
+	}
+
+	switch( *format )
+	{
+		case 'e' :
+		case 'f' :
+		case 'd' :
+			return 'f';
+		case 'b' :
+		case 'h' :
+		case 'i' :
+		case 'l' :
+		case 'q' :
+		case 'n' :
+			return 'i';
+		case 'B' :
+		case 'H' :
+		case 'I' :
+		case 'L' :
+		case 'Q' :
+		case 'N' :
+			return 'u';
+		default :
+			return 0;
+	}
+}
+
+} // namespace Detail
+
 template<typename ThisClass>
 class VectorTypedDataFunctions
 {
@@ -78,6 +166,10 @@ class VectorTypedDataFunctions
 				r->writable().resize( x() );
 				return r;
 			}
+			else if( bufferCompatible( v ) )
+			{
+				return dataBufferConstructor( v, std::integral_constant<bool, Detail::BufferFormat<typename ThisClass::BaseType>::supported>() );
+			}
 			else
 			{
 				ThisClassPtr r = new ThisClass();
@@ -86,6 +178,26 @@ class VectorTypedDataFunctions
 			}
 		}
 
+		/// binding for toBuffer function
+		static BufferPtr toBuffer( ThisClass &x, bool writable )
+		{
+			typedef typename ThisClass::BaseType BaseType;
+			if( writable )
+			{
+				// Unshare the memory before exposing it for modification.
+				x.writable();
+			}
+			// The copy shares the memory of `x`, keeping it alive even if `x`
+			// is subsequently modified or destroyed.
+			typename ThisClass::ConstPtr storage = x.copy();
+			void *address = const_cast<data_type *>( storage->readable().data() );
+			return new Buffer(
+				&x, storage, address, writable,
+				Detail::BufferFormat<BaseType>::value(), sizeof( BaseType ),
+				storage->readable().size(), sizeof( data_type ) / sizeof( BaseType )
+			);
+		}
+
 		//
 		static iterator begin( ThisClass &x )
 		{
@@ -524,6 +636,60 @@ class VectorTypedDataFunctions
 		 * Utility functions
 		 */
 
+		/// returns true if v should be constructed from via the buffer protocol rather than by iteration.
+		static bool bufferCompatible( boost::python::object &v )
+		{
+			if( !Detail::BufferFormat<typename ThisClass::BaseType>::supported )
+			{
+				return false;
+			}
+			// Strings support the buffer protocol, but we have always treated them as sequences.
+			return PyObject_CheckBuffer( v.ptr() ) && !PyString_Check( v.ptr() ) && !PyUnicode_Check( v.ptr() );
+		}
+
+		/// copies the contents of a contiguous buffer into a new instance in a single pass.
+		static ThisClassPtr dataBufferConstructor( boost::python::object &v, std::true_type supported )
+		{
+			typedef typename ThisClass::BaseType BaseType;
+
+			Py_buffer view;
+			if( PyObject_GetBuffer( v.ptr(), &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT ) == -1 )
+			{
+				boost::python::throw_error_already_set();
+			}
+
+			const char *expectedFormat = Detail::BufferFormat<BaseType>::value();
+			const char kind = Detail::bufferFormatKind( view.format );
+			if( view.itemsize != sizeof( BaseType ) || !kind || kind != Detail::bufferFormatKind( expectedFormat ) )
+			{
+				const std::string format = view.format ? view.format : "B";
+				PyBuffer_Release( &view );
+				PyErr_Format( PyExc_TypeError, "Buffer format \"%s\" is incompatible with \"%s\"", format.c_str(), expectedFormat );
+				boost::python::throw_error_already_set();
+			}
+
+			if( view.len % sizeof( data_type ) )
+			{
+				PyBuffer_Release( &view );
+				PyErr_SetString( PyExc_ValueError, "Buffer length is not a multiple of the element size" );
+				boost::python::throw_error_already_set();
+			}
+
+			ThisClassPtr r = new ThisClass();
+			const data_type *begin = static_cast<const data_type *>( view.buf );
+			r->writable().assign( begin, begin + view.len / sizeof( data_type ) );
+			PyBuffer_Release( &view );
+
+			return r;
+		}
+
+		static ThisClassPtr dataBufferConstructor( boost::python::object &v, std::false_type supported )
+		{
+			PyErr_SetString( PyExc_TypeError, "Construction from a buffer is not supported" );
+			boost::python::throw_error_already_set();
+			return nullptr;
+		}
+
 		/// converts from python indexes to non-negative C++ indexes.
 		static index_type convertIndex( ThisClass & container, PyObject *i_, bool acceptExpand = false )
 		{
@@ -722,6 +888,7 @@ std::string str<IECore::TypedData<std::vector<TYPE> > >( IECore::TypedData<std::
 				.def("__imul__", &ThisBinder::imul, "inplace multiplication (s *= v) : accepts another vector of the same type or a single " Tname)		\
 				.def("__cmp__", &ThisBinder::invalidOperator, "Raises an exception. This vector type does not support comparison operators.")		\
 				.def("toString", &ThisBinder::toString, "Returns a string with a copy of the bytes in the vector.")\
+				.def("toBuffer", &ThisBinder::toBuffer, ( boost::python::arg( "writable" ) = false ), "Returns an IECore.Buffer providing zero-copy access to the vector via the buffer protocol.")\
 			;																						\
 		}
 
@@ -740,6 +907,7 @@ std::string str<IECore::TypedData<std::vector<TYPE> > >( IECore::TypedData<std::
 				.def("__idiv__", &ThisBinder::idiv, "inplace division (s /= v) : accepts another vector of the same type or a single " Tname)			\
 				.def("__cmp__", &ThisBinder::invalidOperator, "Raises an exception. This vector type does not support comparison operators.")		\
 				.def("toString", &ThisBinder::toString, "Returns a string with a copy of the bytes in the vector.")\
+				.def("toBuffer", &ThisBinder::toBuffer, ( boost::python::arg( "writable" ) = false ), "Returns an IECore.Buffer providing zero-copy access to the vector via the buffer protocol.")\
 			;																						\
 		}
 
@@ -758,6 +926,7 @@ std::string str<IECore::TypedData<std::vector<TYPE> > >( IECore::TypedData<std::
 				.def("__idiv__", &ThisBinder::idiv, "inplace division (s /= v) : accepts another vector of the same type or a single " Tname)			\
 				.def("__cmp__", &ThisBinder::cmp, "comparison operators (<, >, >=, <=) : The comparison is element-wise, like a string comparison. \n")	\
 				.def("toString", &ThisBinder::toString, "Returns a string with a copy of the bytes in the vector.")\
+				.def("toBuffer", &ThisBinder::toBuffer, ( boost::python::arg( "writable" ) = false ), "Returns an IECore.Buffer providing zero-copy access to the vector via the buffer protocol.")\
 			;																						\
 		}
 
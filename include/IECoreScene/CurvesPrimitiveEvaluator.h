@@ -172,6 +172,9 @@ class IECORESCENE_API CurvesPrimitiveEvaluator : public PrimitiveEvaluator
 		friend struct PrimitiveEvaluator::Description<CurvesPrimitiveEvaluator>;
 		static PrimitiveEvaluator::Description<CurvesPrimitiveEvaluator> g_evaluatorDescription;
 
+		int elementIndex( const PrimitiveEvaluator::Result *result ) const override;
+		bool hasNormals() const override;
+
 	private :
 
 		friend class Result;
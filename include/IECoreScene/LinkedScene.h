@@ -102,6 +102,9 @@ class IECORESCENE_API LinkedScene : public  SampledSceneInterface
 		 */
 
 		std::string fileName() const override;
+		/// Returns the memory used by the main scene. Linked scenes are
+		/// opened via SharedSceneInterfaces, which accounts for them itself.
+		size_t memoryUsage() const override;
 
 		Name name() const override;
 		void path( Path &p ) const override;
@@ -41,6 +41,7 @@
 
 #include "IECore/BoundedKDTree.h"
 
+#include "tbb/atomic.h"
 #include "tbb/mutex.h"
 
 #include <vector>
@@ -48,6 +49,13 @@
 namespace IECoreScene
 {
 
+namespace Detail
+{
+
+class TriangleBVH;
+
+} // namespace Detail
+
 /// An implementation of PrimitiveEvaluator to allow spatial queries to be performed on MeshPrimitive instances
 /// \ingroup geometryProcessingGroup
 class IECORESCENE_API MeshPrimitiveEvaluator : public PrimitiveEvaluator
@@ -106,13 +114,28 @@ class IECORESCENE_API MeshPrimitiveEvaluator : public PrimitiveEvaluator
 
 		static PrimitiveEvaluatorPtr create( ConstPrimitivePtr primitive );
 
-		MeshPrimitiveEvaluator( ConstMeshPrimitivePtr mesh );
+		/// The acceleration structure used to perform closestPoint(),
+		/// signedDistance() and intersection queries.
+		enum AccelerationStructure
+		{
+			/// A BoundedKDTree built serially using median splits. This
+			/// is made available to clients via triangleBoundTree().
+			KDTree,
+			/// A flat bounding volume hierarchy built in parallel using
+			/// the surface area heuristic. This is faster to build and
+			/// to query, but triangleBoundTree() is not available.
+			BVH
+		};
+
+		MeshPrimitiveEvaluator( ConstMeshPrimitivePtr mesh, AccelerationStructure accelerationStructure = KDTree );
 
 		~MeshPrimitiveEvaluator() override;
 
 		ConstPrimitivePtr primitive() const override;
 		MeshPrimitive::ConstPtr mesh() const;
 
+		AccelerationStructure accelerationStructure() const;
+
 		PrimitiveEvaluator::ResultPtr createResult() const override;
 
 		void validateResult( PrimitiveEvaluator::Result *result ) const override;
@@ -158,6 +181,7 @@ class IECORESCENE_API MeshPrimitiveEvaluator : public PrimitiveEvaluator
 		const TriangleBoundVector *triangleBounds() const;
 		/// Returns a pointer to a tree that can be used for performing fast spacial queries.
 		///  The iterators in this tree point to elements in the vector returned by triangleBounds().
+		/// Returns 0 if the evaluator was constructed to use a BVH.
 		const TriangleBoundTree *triangleBoundTree() const;
 
 		/// A type for storing the uv bounding box for a triangle.
@@ -171,27 +195,44 @@ class IECORESCENE_API MeshPrimitiveEvaluator : public PrimitiveEvaluator
 		const UVBoundVector *uvBounds() const;
 		/// Returns a pointer to a tree than can be used for performing fast uv queries. The iterators
 		/// in this tree point to the elements in the vector returned by uvBounds(). Note that
-		/// this function may return 0 in the case of the mesh not having suitable uvs.
+		/// this function may return 0 in the case of the mesh not having suitable uvs. The tree
+		/// is built on first use.
 		const UVBoundTree *uvBoundTree() const;
 		//@}
 
 	protected:
 
+		int elementIndex( const PrimitiveEvaluator::Result *result ) const override;
+
 		ConstMeshPrimitivePtr m_mesh;
 		IECore::ConstV3fVectorDataPtr m_verts;
 		const std::vector<int> *m_meshVertexIds;
 
+		AccelerationStructure m_accelerationStructure;
+
 		TriangleBoundVector m_triangles;
 		TriangleBoundTree *m_tree;
+		Detail::TriangleBVH *m_bvh;
 
 		UVBoundVector m_uvTriangles;
-		UVBoundTree *m_uvTree;
+		typedef tbb::mutex UVTreeMutex;
+		mutable UVTreeMutex m_uvTreeMutex;
+		mutable tbb::atomic<UVBoundTree *> m_uvTree;
 
 		bool pointAtUVWalk( UVBoundTree::NodeIndex nodeIndex, const Imath::V2f &targetUV, Result *result ) const;
 		void closestPointWalk( TriangleBoundTree::NodeIndex nodeIndex, const Imath::V3f &p, float &closestDistanceSqrd, Result *result ) const;
 		bool intersectionPointWalk( TriangleBoundTree::NodeIndex nodeIndex, const Imath::Line3f &ray, float &maxDistSqrd, Result *result, bool &hit ) const;
 		void intersectionPointsWalk( TriangleBoundTree::NodeIndex nodeIndex, const Imath::Line3f &ray, float maxDistSqrd, std::vector<PrimitiveEvaluator::ResultPtr> &results ) const;
 
+		void closestPointBVH( const Imath::V3f &p, Result *result ) const;
+		bool intersectionPointBVH( const Imath::Line3f &ray, float maxDistSqrd, Result *result ) const;
+		void intersectionPointsBVH( const Imath::Line3f &ray, float maxDistSqrd, std::vector<PrimitiveEvaluator::ResultPtr> &results ) const;
+
+		/// Per-triangle tests shared by the KDTree and BVH traversals.
+		void closestPointTriangle( size_t triangleIndex, const Imath::V3f &p, float &closestDistanceSqrd, Result *result ) const;
+		bool intersectionPointTriangle( size_t triangleIndex, const Imath::Line3f &ray, float &maxDistSqrd, Result *result ) const;
+		void intersectionPointsTriangle( size_t triangleIndex, const Imath::Line3f &ray, float maxDistSqrd, std::vector<PrimitiveEvaluator::ResultPtr> &results ) const;
+
 		void calculateMassProperties() const;
 		void calculateAverageNormals() const;
 
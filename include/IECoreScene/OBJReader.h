@@ -40,12 +40,7 @@
 
 #include "IECore/Export.h"
 #include "IECore/Reader.h"
-
-IECORE_PUSH_DEFAULT_VISIBILITY
-#include "OpenEXR/ImathVec.h"
-IECORE_POP_DEFAULT_VISIBILITY
-
-#include <vector>
+#include "IECore/VectorTypedParameter.h"
 
 namespace IECoreScene
 {
@@ -54,6 +49,13 @@ IE_CORE_FORWARDDECLARE(MeshPrimitive);
 
 /// The OBJReader class defines a class for reading OBJ mesh data.
 /// This is a subset of the full setup of objects encodable in OBJ.
+/// Positions, texture coordinates and normals are read, with the latter
+/// two loaded as indexed FaceVarying primitive variables named "uv" and
+/// "N". Groups, materials and other statements are ignored.
+///
+/// The file is memory mapped and split into chunks which are parsed in
+/// parallel, so large files are read quickly. The result doesn't depend
+/// on how the work was scheduled.
 /// \ingroup ioGroup
 class IECORESCENE_API OBJReader : public IECore::Reader
 {
@@ -73,27 +75,8 @@ class IECORESCENE_API OBJReader : public IECore::Reader
 
 		static const ReaderDescription<OBJReader> m_readerDescription;
 
-		// top-level parse method
-		void parseOBJ();
-
-		// statement-level parse methods
-		void parseVertex(const char *, const char *);
-		void parseTextureCoordinate(const char *, const char *);
-		void parseNormal(const char *, const char *);
-
-		// elements
-		void parseFace(const char *, const char *);
-
-		// grouping
-		void parseGroup(const char *, const char *);
-
-		// pointers to mesh data
-		std::vector<int> *m_vpf, *m_vids;
-		std::vector<Imath::V3f> *m_vertices, *m_normals;
-		std::vector<float> *m_sTextureCoordinates, *m_tTextureCoordinates;
+		IECore::StringVectorParameterPtr m_primVarNamesParameter;
 
-		// local data for assembling mesh
-		std::vector<Imath::V3f> m_introducedNormals, m_introducedTextureCoordinates;
 };
 
 IE_CORE_DECLAREPTR(OBJReader);
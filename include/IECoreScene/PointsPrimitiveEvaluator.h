@@ -136,6 +136,10 @@ class IECORESCENE_API PointsPrimitiveEvaluator : public PrimitiveEvaluator
 		friend struct PrimitiveEvaluator::Description<PointsPrimitiveEvaluator>;
 		static PrimitiveEvaluator::Description<PointsPrimitiveEvaluator> g_evaluatorDescription;
 
+		int elementIndex( const PrimitiveEvaluator::Result *result ) const override;
+		bool hasNormals() const override;
+		bool hasUVs() const override;
+
 	private :
 
 
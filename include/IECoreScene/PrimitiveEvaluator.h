@@ -40,6 +40,7 @@
 
 #include "IECore/Export.h"
 #include "IECore/RunTimeTyped.h"
+#include "IECore/VectorTypedData.h"
 
 IECORE_PUSH_DEFAULT_VISIBILITY
 #include "OpenEXR/ImathColor.h"
@@ -164,6 +165,44 @@ class IECORESCENE_API PrimitiveEvaluator : public IECore::RunTimeTyped
 
 		//@}
 
+		/// Struct-of-arrays storage for the results of the batch query functions below.
+		/// Each array holds one element per query. Queries which fail have a `success`
+		/// value of false, and default values in all other arrays. The `normal` and `uv`
+		/// arrays are left zeroed for evaluators which don't provide normals or uvs.
+		struct IECORESCENE_API BatchResults
+		{
+			BatchResults( size_t size = 0 );
+
+			IECore::BoolVectorDataPtr success;
+			IECore::V3fVectorDataPtr point;
+			IECore::V3fVectorDataPtr normal;
+			IECore::V2fVectorDataPtr uv;
+			/// The distance from the query point to the result point, or for
+			/// batchIntersectionPoint(), the distance along the ray. This is
+			/// signed for batchSignedDistance() and zero for batchPointAtUV().
+			IECore::FloatVectorDataPtr distance;
+			/// The index of the element the result point lies on. This is the triangle
+			/// index for meshes, the point index for points and the curve index for curves,
+			/// and -1 for primitives without distinct elements.
+			IECore::IntVectorDataPtr elementIndex;
+		};
+
+		//! @name Batch Query Functions
+		/// Perform many queries in parallel, avoiding the overhead of
+		/// making each query individually.
+		////////////////////////////////////////////////////////////////////////////////////////
+		//@{
+
+		BatchResults batchClosestPoint( const std::vector<Imath::V3f> &points ) const;
+		/// Throws for evaluators which don't provide normals, as the sign can't be determined.
+		BatchResults batchSignedDistance( const std::vector<Imath::V3f> &points ) const;
+		BatchResults batchPointAtUV( const std::vector<Imath::V2f> &uvs ) const;
+		/// Throws if `origins` and `directions` are not the same size.
+		BatchResults batchIntersectionPoint( const std::vector<Imath::V3f> &origins, const std::vector<Imath::V3f> &directions,
+			float maxDistance = Imath::limits<float>::max() ) const;
+
+		//@}
+
 		/// Throws an exception if the passed result type is not compatible with the current evaluator
 		virtual void validateResult( Result *result ) const =0;
 
@@ -178,8 +217,22 @@ class IECORESCENE_API PrimitiveEvaluator : public IECore::RunTimeTyped
 			}
 		};
 
+	protected :
+
+		/// Returns the index of the element the result lies on, for use in
+		/// BatchResults::elementIndex. The default implementation returns -1.
+		virtual int elementIndex( const Result *result ) const;
+		/// Return true if Result::normal() and Result::uv() are implemented,
+		/// so that they may be used to fill BatchResults. The defaults
+		/// return true.
+		virtual bool hasNormals() const;
+		virtual bool hasUVs() const;
+
 	private:
 
+		template<typename Query>
+		BatchResults batchQuery( size_t size, const Query &query ) const;
+
 		static void registerCreator( IECore::TypeId id, CreatorFn f );
 
 		typedef std::map<IECore::TypeId, CreatorFn> CreatorMap;
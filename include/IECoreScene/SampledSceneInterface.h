@@ -38,6 +38,8 @@
 #include "IECoreScene/Export.h"
 #include "IECoreScene/SceneInterface.h"
 
+#include "IECore/ObjectPool.h"
+
 namespace IECoreScene
 {
 
@@ -56,6 +58,13 @@ IE_CORE_FORWARDDECLARE( SampledSceneInterface );
 /// In the case of time falling outside of the sample range, or coinciding
 /// nearly exactly with a single sample, 0 is returned and floorIndex==ceilIndex
 /// will hold.
+///
+/// \addtogroup environmentGroup
+///
+/// <b>IECORESCENE_INTERPOLATIONCACHE_MEMORY</b><br>
+/// Used to specify the memory limit in megabytes for
+/// SampledSceneInterface::interpolationCache(). Defaults to 0, which disables the cache.
+///
 /// \ingroup ioGroup
 class IECORESCENE_API SampledSceneInterface : public SceneInterface
 {
@@ -120,6 +129,24 @@ class IECORESCENE_API SampledSceneInterface : public SceneInterface
 		IECore::ConstObjectPtr readAttribute( const Name &name, double time ) const override;
 		IECore::ConstObjectPtr readObject( double time ) const override;
 
+		/// Interpolation cache
+		/// ===================
+		///
+		/// The interpolated results of readTransform(), readAttribute() and
+		/// readObject() may be memoized, so that repeated reads at the same times
+		/// (as is common for motion blur and playback) don't repeat the interpolation.
+		/// Results are keyed on hash() along with the sample interval and interpolation
+		/// factor, so derived classes must implement hash() to identify the location
+		/// before the cache is enabled. Bounds are not cached, as they are cheaper to
+		/// interpolate than to look up.
+
+		/// Returns the pool holding the cached results. It is disabled while its maximum
+		/// memory usage is 0, which is the default unless IECORESCENE_INTERPOLATIONCACHE_MEMORY
+		/// is set. Use setMaxMemoryUsage() to enable it and statistics() to measure its effectiveness.
+		/// Entries are not invalidated when a file is rewritten, so the pool should be cleared
+		/// after writing to a file that has previously been read.
+		static IECore::ObjectPool *interpolationCache();
+
 };
 
 
@@ -0,0 +1,93 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#ifndef IECORESCENE_SCENEALGO_H
+#define IECORESCENE_SCENEALGO_H
+
+#include "IECoreScene/Export.h"
+#include "IECoreScene/SceneInterface.h"
+
+#include "IECore/PathMatcher.h"
+
+#include <vector>
+
+namespace IECoreScene
+{
+
+namespace SceneAlgo
+{
+
+/// Flags used to specify the data read by parallelReadAll().
+enum ProcessFlags
+{
+	None = 0,
+	Bounds = 1,
+	Transforms = 2,
+	Attributes = 4,
+	Tags = 8,
+	Objects = 16,
+	All = Bounds | Transforms | Attributes | Tags | Objects
+};
+
+/// Traverses the hierarchy below `location` in parallel, calling `f( scene, path )`
+/// for each location matched by `filter`. Paths are absolute, the functor is only
+/// called for locations which are an ExactMatch for the filter, and traversal only
+/// continues below locations which have a DescendantMatch. Passing a null filter
+/// visits every location. Because the functor is called concurrently from many
+/// threads, it must be threadsafe.
+template<typename ThreadableFunctor>
+void parallelTraverse( const SceneInterface *location, ThreadableFunctor &f, const IECore::PathMatcher *filter = nullptr );
+
+/// Reads the data specified by `flags` at each of the specified times, for every
+/// location matched by `filter`. The hierarchy is traversed and read in parallel,
+/// so this is considerably quicker than reading the equivalent locations one by one.
+/// Since SceneCache stores the transforms, attributes and objects it loads
+/// in the ObjectPool, this can be used to prefetch data so that subsequent reads
+/// are served from memory, subject to the memory limit of the pool. Returns the
+/// number of locations read.
+IECORESCENE_API size_t parallelReadAll( const SceneInterface *location, const std::vector<double> &times, unsigned flags = All, const IECore::PathMatcher *filter = nullptr );
+
+/// Returns the locations below `location` which are an ExactMatch for `filter`,
+/// traversing the hierarchy in parallel. This resolves wildcards and ellipses in
+/// the filter against the locations that actually exist in the scene.
+IECORESCENE_API IECore::PathMatcher matchingPaths( const IECore::PathMatcher &filter, const SceneInterface *location );
+
+} // namespace SceneAlgo
+
+} // namespace IECoreScene
+
+#include "IECoreScene/SceneAlgo.inl"
+
+#endif // IECORESCENE_SCENEALGO_H
@@ -0,0 +1,98 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#ifndef IECORESCENE_SCENEALGO_INL
+#define IECORESCENE_SCENEALGO_INL
+
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
+namespace IECoreScene
+{
+
+namespace SceneAlgo
+{
+
+namespace Detail
+{
+
+template<typename ThreadableFunctor>
+void parallelTraverseWalk( const SceneInterface *location, SceneInterface::Path &path, ThreadableFunctor &f, const IECore::PathMatcher *filter )
+{
+	const unsigned match = filter ? filter->match( path ) : (unsigned)IECore::PathMatcher::EveryMatch;
+	if( match & IECore::PathMatcher::ExactMatch )
+	{
+		f( location, path );
+	}
+
+	if( !( match & IECore::PathMatcher::DescendantMatch ) )
+	{
+		return;
+	}
+
+	SceneInterface::NameList childNames;
+	location->childNames( childNames );
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, childNames.size() ),
+		[location, &path, &childNames, &f, filter]( const tbb::blocked_range<size_t> &r )
+		{
+			SceneInterface::Path childPath = path;
+			childPath.push_back( SceneInterface::Name() );
+			for( size_t i = r.begin(); i != r.end(); ++i )
+			{
+				childPath.back() = childNames[i];
+				ConstSceneInterfacePtr child = location->child( childNames[i] );
+				parallelTraverseWalk( child.get(), childPath, f, filter );
+			}
+		}
+	);
+}
+
+} // namespace Detail
+
+template<typename ThreadableFunctor>
+void parallelTraverse( const SceneInterface *location, ThreadableFunctor &f, const IECore::PathMatcher *filter )
+{
+	SceneInterface::Path path;
+	location->path( path );
+	Detail::parallelTraverseWalk( location, path, f, filter );
+}
+
+} // namespace SceneAlgo
+
+} // namespace IECoreScene
+
+#endif // IECORESCENE_SCENEALGO_INL
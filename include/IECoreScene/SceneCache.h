@@ -43,12 +43,27 @@ namespace IECoreScene
 
 IE_CORE_FORWARDDECLARE( SceneCache );
 
+/// \addtogroup environmentGroup
+///
+/// <b>IECORESCENE_SCENECACHE_DEDUPLICATESAMPLES</b><br>
+/// When set to 1, SceneCache files created for writing store samples
+/// identical to one already saved as references to it, instead of
+/// serializing them again. Such files can't be fully read by earlier
+/// versions of Cortex. Defaults to 0.
+
 /// A simple means of saving and loading hierarchical descriptions of animated scene, with
 /// the ability to traverse the scene and perform partial loading on demand.
 /// When saving, it's important to keep the initial root SceneCache object alive until the very end.
 /// The destruction of the root scene will trigger the recursive computation of the bounding boxes for all the
 /// locations that no bounds were written. It will also store (without duplication) all the
 /// sample times used by objects, transforms, bounds and attributes.
+/// Samples identical to one already saved may optionally be written as references to it - see
+/// the IECORESCENE_SCENECACHE_DEDUPLICATESAMPLES environment variable.
+/// \threading When saving, different locations may be written concurrently from different threads,
+/// provided that each location is only written by one thread at a time. Samples are serialised and
+/// compressed in parallel. If the file was written from more than one thread, the final computation of the
+/// bounding boxes also processes sibling locations in parallel. Otherwise it is serial, so that files written
+/// from a single thread are reproducible.
 /// \ingroup ioGroup
 class IECORESCENE_API SceneCache : public SampledSceneInterface
 {
@@ -82,6 +97,7 @@ class IECORESCENE_API SceneCache : public SampledSceneInterface
 		 */
 
 		std::string fileName() const override;
+		size_t memoryUsage() const override;
 
 		Name name() const override;
 		void path( Path &p ) const override;
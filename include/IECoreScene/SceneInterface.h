@@ -143,6 +143,11 @@ class IECORESCENE_API SceneInterface : public IECore::RunTimeTyped
 		/// Returns the file that this scene is mapped to. Throws exception if there's no file.
 		virtual std::string fileName() const = 0;
 
+		/// Returns an estimate of the memory, in bytes, used to hold data shared by all
+		/// the locations in the scene, such as the index of the file. Default implementation
+		/// returns 0.
+		virtual size_t memoryUsage() const;
+
 		/// Returns the name of the scene location which this instance is referring to. The root path returns "/".
 		virtual Name name() const = 0;
 		/// Returns the path scene this instance is referring to.
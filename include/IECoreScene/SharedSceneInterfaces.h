@@ -38,9 +38,17 @@
 #include "IECoreScene/Export.h"
 #include "IECoreScene/SceneInterface.h"
 
+#include <vector>
+
 namespace IECoreScene
 {
 
+/// \addtogroup environmentGroup
+///
+/// <b>IECORESCENE_SHAREDSCENEINTERFACES_MEMORY</b><br>
+/// Used to specify the memory limit, in megabytes, for the cache
+/// used by SharedSceneInterfaces. Defaults to 2048.
+
 class IECORESCENE_API SharedSceneInterfaces
 {
 	public :
@@ -54,6 +62,46 @@ class IECORESCENE_API SharedSceneInterfaces
 		/// Clear the entire cache
 		static void clear();
 
+		/// Opens the files concurrently and adds them to the cache, so
+		/// that subsequent calls to get() needn't wait for them. Errors
+		/// are not reported until get() is called.
+		static void prefetch( const std::vector<std::string> &fileNames );
+
+		/// Keeps the file open until unpin() is called, regardless of
+		/// the memory limit. Pinned files are not included in memoryUsage().
+		static void pin( const std::string &fileName );
+		static void unpin( const std::string &fileName );
+
+		//! @name Memory limits
+		/// The memory used by each file is measured by SceneInterface::memoryUsage()
+		/// when it is opened, with a minimum of 10 megabytes per file so that the
+		/// number of open files is also limited. Files which use more than the limit
+		/// are not cached, so each call to get() opens them again - pin() them to
+		/// avoid this.
+		//@{
+		static void setMaxMemoryUsage( size_t bytes );
+		static size_t getMaxMemoryUsage();
+		static size_t memoryUsage();
+		//@}
+
+		/// Counters describing the effectiveness of the cache.
+		struct Statistics
+		{
+			Statistics();
+
+			size_t hits;
+			size_t misses;
+			size_t evictions;
+			size_t memoryUsage;
+			size_t maxMemoryUsage;
+			size_t pinned;
+		};
+
+		/// Returns the counters accumulated since startup or the
+		/// last call to resetStatistics().
+		static Statistics statistics();
+		static void resetStatistics();
+
 };
 
 } // namespace IECoreScene
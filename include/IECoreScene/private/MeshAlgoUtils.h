@@ -0,0 +1,99 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#ifndef IECORESCENE_MESHALGOUTILS_H
+#define IECORESCENE_MESHALGOUTILS_H
+
+#include "IECoreScene/MeshPrimitive.h"
+#include "IECoreScene/PolygonIterator.h"
+
+#include <vector>
+
+namespace IECoreScene
+{
+namespace Detail
+{
+
+/// Provides random access to the faces of a mesh, so that ranges of faces
+/// may be processed in parallel. Construction is linear in the number of faces.
+class FaceOffsets
+{
+
+	public :
+
+		FaceOffsets( const MeshPrimitive *mesh )
+			:	m_verticesPerFace( mesh->verticesPerFace()->readable() ), m_vertexIds( mesh->vertexIds()->readable() )
+		{
+			m_offsets.reserve( m_verticesPerFace.size() + 1 );
+			int offset = 0;
+			for( std::vector<int>::const_iterator it = m_verticesPerFace.begin(); it != m_verticesPerFace.end(); ++it )
+			{
+				m_offsets.push_back( offset );
+				offset += *it;
+			}
+			m_offsets.push_back( offset );
+		}
+
+		size_t numFaces() const
+		{
+			return m_verticesPerFace.size();
+		}
+
+		/// Returns the index of the first face-varying value for the face.
+		/// The face index may be numFaces(), returning the total number of
+		/// face-varying values.
+		int offset( size_t faceIndex ) const
+		{
+			return m_offsets[faceIndex];
+		}
+
+		/// Returns an iterator positioned at the specified face.
+		PolygonIterator faceBegin( size_t faceIndex ) const
+		{
+			return PolygonIterator( m_verticesPerFace.begin() + faceIndex, m_vertexIds.begin() + m_offsets[faceIndex], m_offsets[faceIndex] );
+		}
+
+	private :
+
+		const std::vector<int> &m_verticesPerFace;
+		const std::vector<int> &m_vertexIds;
+		std::vector<int> m_offsets;
+
+};
+
+} // namespace Detail
+} // namespace IECoreScene
+
+#endif // IECORESCENE_MESHALGOUTILS_H
@@ -0,0 +1,119 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#ifndef IECORESCENE_TRIANGLEBVH_H
+#define IECORESCENE_TRIANGLEBVH_H
+
+#include "IECore/Export.h"
+
+IECORE_PUSH_DEFAULT_VISIBILITY
+#include "OpenEXR/ImathBox.h"
+#include "OpenEXR/ImathVec.h"
+IECORE_POP_DEFAULT_VISIBILITY
+
+#include <cstdint>
+#include <vector>
+
+namespace IECoreScene
+{
+namespace Detail
+{
+
+/// A bounding volume hierarchy over a set of triangle bounds, built using
+/// the surface area heuristic. Nodes are stored in a single flat array in
+/// depth first order, so that the first child of an interior node immediately
+/// follows its parent. Construction is parallelised using TBB.
+class TriangleBVH
+{
+
+	public :
+
+		TriangleBVH( const std::vector<Imath::Box3f> &triangleBounds, size_t maxLeafSize = 4 );
+
+		/// The maximum depth of the hierarchy, allowing traversals
+		/// to use a fixed size stack.
+		static const size_t maxDepth = 64;
+
+		struct Node
+		{
+			Imath::Box3f bound;
+			/// For leaf nodes, the index of the first entry in triangleIndices().
+			/// For interior nodes, the index of the second child.
+			uint32_t offset;
+			/// The number of triangles in a leaf, or 0 for interior nodes.
+			uint32_t count;
+
+			bool isLeaf() const
+			{
+				return count;
+			}
+		};
+
+		typedef std::vector<Node> NodeVector;
+
+		/// The root is the first node. This is empty if there
+		/// are no triangles.
+		const NodeVector &nodes() const
+		{
+			return m_nodes;
+		}
+
+		/// Triangle indices referenced by the leaf nodes.
+		const std::vector<uint32_t> &triangleIndices() const
+		{
+			return m_triangleIndices;
+		}
+
+		/// Returns true if the ray intersects the box at a distance of no
+		/// more than `maxDistance`, setting `distance` to the entry distance.
+		/// `inverseDirection` is the reciprocal of the normalised ray direction.
+		static bool rayIntersects( const Imath::Box3f &box, const Imath::V3f &origin, const Imath::V3f &inverseDirection, float maxDistance, float &distance );
+
+	private :
+
+		struct BuildNode;
+		class Builder;
+
+		void flatten( const BuildNode *buildNode );
+
+		NodeVector m_nodes;
+		std::vector<uint32_t> m_triangleIndices;
+
+};
+
+} // namespace Detail
+} // namespace IECoreScene
+
+#endif // IECORESCENE_TRIANGLEBVH_H
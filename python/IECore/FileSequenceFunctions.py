@@ -35,44 +35,99 @@
 import re
 import os
 import re
+import sys
 import glob
 import shutil
 import os.path
+import threading
 import _IECore as IECore
 
 # This is here because we can't yet create a to_python converter for boost::regex
 IECore.FileSequence.fileNameValidator = staticmethod( lambda : re.compile( "^([^#]*)(#+)([^#]*)$" ) )
 
+## Calls f( item ) for each item, using up to numThreads threads so that
+# slow filesystem operations may overlap. At most numThreads items are in
+# flight at once. If progress is specified, it is called as progress( done, total )
+# as each item completes. If any calls fail, no further items are started, and
+# the exception from the earliest failing item is raised once all running calls
+# have finished, so errors are reported in the same order as they would be by a
+# serial loop.
+## \ingroup python
+def forEachParallel( f, items, numThreads = 1, progress = None ) :
+
+	items = list( items )
+	if numThreads <= 1 or len( items ) <= 1 :
+		for i, item in enumerate( items ) :
+			f( item )
+			if progress is not None :
+				progress( i + 1, len( items ) )
+		return
+
+	lock = threading.Lock()
+	state = { "next" : 0, "done" : 0, "firstError" : len( items ) }
+	errors = {}
+
+	def worker() :
+
+		while True :
+
+			with lock :
+				i = state["next"]
+				if i >= state["firstError"] :
+					return
+				state["next"] += 1
+
+			try :
+				f( items[i] )
+			except :
+				with lock :
+					errors[i] = sys.exc_info()
+					state["firstError"] = min( state["firstError"], i )
+				continue
+
+			with lock :
+				state["done"] += 1
+				if progress is not None :
+					progress( state["done"], len( items ) )
+
+	threads = [ threading.Thread( target = worker ) for i in range( 0, min( numThreads, len( items ) ) ) ]
+	for t in threads :
+		t.start()
+	for t in threads :
+		t.join()
+
+	if errors :
+		error = errors[min( errors.keys() )]
+		raise error[0], error[1], error[2]
+
 ## Moves the set of files specified by sequence1 to the set of files
 # specified by sequence2, where sequence1 and sequence2 are
 # FileSequence objects of equal length. This function is safe even if the
-# files specified by each sequence overlap.
+# files specified by each sequence overlap. The files are moved using
+# up to numThreads threads.
 ## \ingroup python
-def mv( sequence1, sequence2 ) :
+def mv( sequence1, sequence2, numThreads = 1 ) :
 
+	move = lambda x : shutil.move( x[0], x[1] )
 	if __sequencesClash( sequence1, sequence2 ) :
 		sTmp = sequence1.copy()
 		sTmp.setPrefix( os.path.join( os.path.dirname( sTmp.getPrefix() ), __tmpPrefix() ) )
-		for src, dst in sequence1.mapTo( sTmp, True ) :
-			shutil.move( src, dst )
-		for src, dst in sTmp.mapTo( sequence2, True ) :
-			shutil.move( src, dst )
+		forEachParallel( move, sequence1.mapTo( sTmp, True ), numThreads )
+		forEachParallel( move, sTmp.mapTo( sequence2, True ), numThreads )
 	else :
-		for src, dst in sequence1.mapTo( sequence2, True ) :
-			shutil.move( src, dst )
+		forEachParallel( move, sequence1.mapTo( sequence2, True ), numThreads )
 
 ## Copies the set of files specified by sequence1 to the set of files
 # specified by sequence2, where sequence1 and sequence2 are
-# FileSequence objects of equal length. This function is safe even if the
-# files specified by each sequence overlap.
+# FileSequence objects of equal length. The files are copied using up
+# to numThreads threads.
 ## \ingroup python
-def cp( sequence1, sequence2 ) :
+def cp( sequence1, sequence2, numThreads = 1 ) :
 
 	if __sequencesClash( sequence1, sequence2 ) :
 		raise RuntimeError( "Attempt to copy sequences with common filenames." )
 
-	for src, dst in sequence1.mapTo( sequence2, True ) :
-		shutil.copy( src, dst )
+	forEachParallel( lambda x : shutil.copy( x[0], x[1] ), sequence1.mapTo( sequence2, True ), numThreads )
 
 ## Removes all the files specified by the sequence.
 ## \ingroup python
@@ -120,4 +175,4 @@ def __tmpPrefix() :
 	h.update( str( time.time() ) )
 	return "ieSequenceTmp" + h.hexdigest() + "."
 
-__all__ = [ "mv", "cp", "rm", "cat" ]
+__all__ = [ "mv", "cp", "rm", "cat", "forEachParallel" ]
@@ -76,7 +76,14 @@ class SequenceConvertOp( IECore.Op ) :
 					allowEmptyString = False,
 					extensions = IECore.Writer.supportedExtensions(),
 					minSequenceSize = 1,
-				)
+				),
+				IECore.IntParameter(
+					name = "numThreads",
+					description = "The number of files to convert concurrently. Using more than one thread can "
+						"significantly speed up operations on high-latency filesystems.",
+					defaultValue = 1,
+					minValue = 1,
+				),
 			]
 		)
 
@@ -93,13 +100,32 @@ class SequenceConvertOp( IECore.Op ) :
 			cpOp = IECore.SequenceCpOp()
 			cpOp['src'] = operands["src"]
 			cpOp['dst'] = operands["dst"]
+			cpOp['numThreads'] = operands["numThreads"]
 			cpOp()
 		else:
-			# if extensions don't match, read and write
-			for (sf, df) in zip(src.fileNames(), dst.fileNames()):
-				img = IECore.Reader.create(sf).read()
-				IECore.Writer.create(img, df).write()
+			# if extensions don't match, read and write. Reading and writing
+			# release the GIL, so when using several threads the reads of some
+			# frames overlap with the writes of others. Each thread holds only
+			# a single frame at a time, so memory usage is bounded by numThreads.
+			def convert( files ) :
+				img = IECore.Reader.create( files[0] ).read()
+				IECore.Writer.create( img, files[1] ).write()
+
+			IECore.forEachParallel(
+				convert,
+				zip( src.fileNames(), dst.fileNames() ),
+				operands["numThreads"].value,
+				self.__progress
+			)
 
 		return IECore.StringData(str(dst))
 
+	@staticmethod
+	def __progress( done, total ) :
+
+		# report roughly every 10%, to avoid flooding the output
+		# for long sequences.
+		if done == total or done * 10 // total != ( done - 1 ) * 10 // total :
+			IECore.msg( IECore.Msg.Level.Info, "SequenceConvertOp", "Converted %d of %d files" % ( done, total ) )
+
 IECore.registerRunTimeTyped( SequenceConvertOp )
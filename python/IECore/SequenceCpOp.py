@@ -65,7 +65,14 @@ class SequenceCpOp( IECore.Op ) :
 					check = IECore.FileSequenceParameter.CheckType.MustNotExist,
 					allowEmptyString = False,
 					minSequenceSize = 1,
-				)
+				),
+				IECore.IntParameter(
+					name = "numThreads",
+					description = "The number of files to copy concurrently. Using more than one thread can "
+						"significantly speed up operations on high-latency filesystems.",
+					defaultValue = 1,
+					minValue = 1,
+				),
 			]
 		)
 
@@ -77,7 +84,7 @@ class SequenceCpOp( IECore.Op ) :
 		if isinstance( dst.frameList, IECore.EmptyFrameList ):
 			dst.frameList = src.frameList
 
-		IECore.cp(	src, dst )
+		IECore.cp( src, dst, operands["numThreads"].value )
 
 		return IECore.StringData( str(dst) )
 
@@ -179,37 +179,6 @@ class SequenceLsOp( IECore.Op ) :
 			]
 		)
 
-	@staticmethod
-	def __walk(top, topdown=True, followlinks=False):
-
-		from os.path import join, isdir, islink
-		from os import listdir, error
-
-		try:
-			names = listdir(top)
-		except error :
-		        return
-
-		dirs, nondirs = [], []
-		for name in names:
-			if isdir(join(top, name)):
-				dirs.append(name)
-			else:
-				nondirs.append(name)
-
-		if topdown:
-			yield top, dirs, nondirs
-
-		for name in dirs:
-			path = join(top, name)
-			if followlinks or not islink(path):
-				for x in IECore.SequenceLsOp.__walk(path, topdown, followlinks):
-					yield x
-
-		if not topdown:
-			yield top, dirs, nondirs
-
-
 	def doOperation( self, operands ) :
 
 		# recursively find sequences
@@ -217,39 +186,32 @@ class SequenceLsOp( IECore.Op ) :
 		if baseDirectory != "/" and baseDirectory[-1] == '/' :
 			baseDirectory = baseDirectory[:-1]
 
-		sequences = IECore.ls( baseDirectory, operands["minSequenceSize"].value )
+		# we only need the modification times if we're going to filter on them, so
+		# avoid the cost of gathering them otherwise.
+		withStats = operands["advanced"]["modificationTime"]["enabled"].value
+
+		sequences = IECore.lsRecursive(
+			baseDirectory,
+			minSequenceSize = operands["minSequenceSize"].value,
+			maxDepth = operands["maxDepth"].value if operands["recurse"].value else 0,
+			followLinks = operands["followLinks"].value,
+			withStats = withStats,
+		)
+
+		modificationTimes = {}
+		if withStats :
+			modificationTimes = dict( ( s[0].fileName, s[1] ) for s in sequences )
+			sequences = [ s[0] for s in sequences ]
 
 		# If we've passed in a directory which isn't the current one it is convenient to get that included in the returned sequence names
 		relDir = os.path.normpath( baseDirectory ) != "."
 
 		if relDir :
 			for s in sequences :
+				if withStats :
+					modificationTimes[os.path.join( baseDirectory, s.fileName )] = modificationTimes.pop( s.fileName )
 				s.fileName = os.path.join( baseDirectory, s.fileName )
 
-		if operands["recurse"].value :
-			# \todo Can safely use os.walk here after Python 2.6, which introduced the followlinks parameter
-			for root, dirs, files in IECore.SequenceLsOp.__walk( baseDirectory, topdown = True, followlinks = operands["followLinks"].value ) :
-				relRoot = root[len(baseDirectory)+1:]
-				if relRoot!="" :
-					depth = len( relRoot.split( "/" ) )
-				else :
-					depth = 0
-
-				if depth>=operands["maxDepth"].value :
-					dirs[:] = []
-
-				for d in dirs :
-					ss = IECore.ls( os.path.join( root, d ), operands["minSequenceSize"].value )
-					if ss :
-						for s in ss :
-
-							if relDir :
-								s.fileName = os.path.join( baseDirectory, relRoot, d, s.fileName )
-							else :
-								s.fileName = os.path.join( relRoot, d, s.fileName )
-							sequences.append( s )
-
-
 		# \todo This Op would benefit considerably from dynamic parameters
 		# NB. Ordering of filters could have considerable impact on execution time. The most expensive filters should be specified last.
 		filters = []
@@ -319,10 +281,9 @@ class SequenceLsOp( IECore.Op ) :
 			def matchModificationTime( sequence ) :
 
 				# If any file in the sequence matches, we have a match.
-				for sequenceFile in sequence.fileNames() :
+				for t in modificationTimes[sequence.fileName] :
 
-					st = os.stat( sequenceFile )
-					modifiedTime = datetime.datetime.fromtimestamp( st.st_mtime )
+					modifiedTime = datetime.datetime.fromtimestamp( t )
 					if matchFn( modifiedTime ) :
 						return True
 
@@ -66,7 +66,14 @@ class SequenceMvOp( IECore.Op ) :
 					check = IECore.FileSequenceParameter.CheckType.MustNotExist,
 					allowEmptyString = False,
 					minSequenceSize = 1,
-				)
+				),
+				IECore.IntParameter(
+					name = "numThreads",
+					description = "The number of files to move concurrently. Using more than one thread can "
+						"significantly speed up operations on high-latency filesystems.",
+					defaultValue = 1,
+					minValue = 1,
+				),
 			]
 		)
 
@@ -78,7 +85,7 @@ class SequenceMvOp( IECore.Op ) :
 		if isinstance( dst.frameList, IECore.EmptyFrameList ):
 			dst.frameList = src.frameList
 
-		IECore.mv( src, dst )
+		IECore.mv( src, dst, operands["numThreads"].value )
 
 		return IECore.StringData( str(dst) )
 
@@ -44,6 +44,7 @@
 
 #include "tbb/concurrent_hash_map.h"
 #include "tbb/mutex.h"
+#include "tbb/task.h"
 
 using namespace IECore;
 using namespace boost;
@@ -172,6 +173,56 @@ struct CachedReader::MemberData
 		}
 };
 
+//////////////////////////////////////////////////////////////////////////
+// ReadTask
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Task used to call CachedReader::read() on a background
+// thread, passing the result to a promise.
+class ReadTask : public tbb::task
+{
+
+	public :
+
+		ReadTask( CachedReaderPtr reader, const std::string &file, std::promise<ConstObjectPtr> &&promise )
+			:	m_reader( reader ), m_file( file ), m_promise( std::move( promise ) )
+		{
+		}
+
+		tbb::task *execute() override
+		{
+			try
+			{
+				m_promise.set_value( m_reader->read( m_file ) );
+			}
+			catch( ... )
+			{
+				m_promise.set_exception( std::current_exception() );
+			}
+			return nullptr;
+		}
+
+		static void enqueue( CachedReaderPtr reader, const std::string &file, std::promise<ConstObjectPtr> &&promise )
+		{
+			// We use enqueue() rather than spawn() because it guarantees
+			// that the task will be run even if the calling thread never
+			// waits for it.
+			tbb::task::enqueue( *new( tbb::task::allocate_root() ) ReadTask( reader, file, std::move( promise ) ) );
+		}
+
+	private :
+
+		CachedReaderPtr m_reader;
+		std::string m_file;
+		std::promise<ConstObjectPtr> m_promise;
+
+};
+
+} // namespace
+
 //////////////////////////////////////////////////////////////////////////
 // CachedReader
 //////////////////////////////////////////////////////////////////////////
@@ -191,6 +242,24 @@ ConstObjectPtr CachedReader::read( const std::string &file )
 	return m_data->m_cache.get( PARAM(file) );
 }
 
+CachedReader::Future CachedReader::readAsync( const std::string &file )
+{
+	std::promise<ConstObjectPtr> promise;
+	Future result = promise.get_future().share();
+	ReadTask::enqueue( this, file, std::move( promise ) );
+	return result;
+}
+
+void CachedReader::prefetch( const std::vector<std::string> &files )
+{
+	for( std::vector<std::string>::const_iterator it = files.begin(); it != files.end(); ++it )
+	{
+		// Nobody is waiting on the result, and any error is
+		// recorded in m_fileErrors to be reported by read().
+		ReadTask::enqueue( this, *it, std::promise<ConstObjectPtr>() );
+	}
+}
+
 void CachedReader::insert( const std::string &file, ConstObjectPtr obj )
 {
 	m_data->m_fileErrors.erase( file );
@@ -37,10 +37,20 @@
 #include "IECore/MessageHandler.h"
 
 #include "boost/filesystem/operations.hpp"
+#include "boost/iostreams/device/array.hpp"
+#include "boost/iostreams/device/mapped_file.hpp"
+#include "boost/iostreams/stream.hpp"
+
+#include <cerrno>
+#include <cstring>
+
+#include <fcntl.h>
+#include <unistd.h>
 
 using namespace IECore;
 
 namespace fs = boost::filesystem;
+namespace io = boost::iostreams;
 
 IE_CORE_DEFINERUNTIMETYPEDDESCRIPTION( FileIndexedIO )
 
@@ -67,9 +77,21 @@ class FileIndexedIO::StreamFile : public StreamIndexedIO::StreamFile
 
 		void flush( size_t endPosition ) override;
 
+		bool readAt( char *buffer, size_t size, Imf::Int64 pos ) override;
+
+	private :
+
+		/// Used in Mapped mode.
+		io::mapped_file_source m_mappedFile;
+
+		/// Used for positional reads in Read mode.
+		int m_fileDescriptor;
+
+		void closeFileDescriptor();
+
 };
 
-FileIndexedIO::StreamFile::StreamFile( const std::string &filename, IndexedIO::OpenMode mode ) : StreamIndexedIO::StreamFile(mode), m_filename( filename ), m_endPosition(0)
+FileIndexedIO::StreamFile::StreamFile( const std::string &filename, IndexedIO::OpenMode mode ) : StreamIndexedIO::StreamFile(mode), m_filename( filename ), m_endPosition(0), m_fileDescriptor(-1)
 {
 	if (mode & IndexedIO::Write)
 	{
@@ -120,6 +142,37 @@ FileIndexedIO::StreamFile::StreamFile( const std::string &filename, IndexedIO::O
 
 		}
 	}
+	else if (mode & IndexedIO::Mapped)
+	{
+		assert( mode & IndexedIO::Read );
+		try
+		{
+			m_mappedFile.open( filename );
+		}
+		catch ( std::exception &e )
+		{
+			throw IOException( "FileIndexedIO: Cannot map file '" + filename + "' for read : " + e.what() );
+		}
+
+		// We still provide a stream for reading the index, but data reads will
+		// go straight to the mapped memory.
+		io::stream<io::array> *f = new io::stream<io::array>( const_cast<char *>( m_mappedFile.data() ), m_mappedFile.size() );
+		setMappedData( m_mappedFile.data(), m_mappedFile.size() );
+
+		try
+		{
+			setStream( f, false );
+		}
+		catch ( Exception &e )
+		{
+			e.prepend( "Opening file \"" + filename + "\" : " );
+			throw;
+		}
+		catch (...)
+		{
+			throw IOException( "FileIndexedIO: Caught error reading file '" + filename + "'" );
+		}
+	}
 	else
 	{
 		assert( mode & IndexedIO::Read );
@@ -130,17 +183,26 @@ FileIndexedIO::StreamFile::StreamFile( const std::string &filename, IndexedIO::O
 			throw IOException( "FileIndexedIO: Cannot open file '" + filename + "' for read" );
 		}
 
+		// A separate descriptor allows data to be read with pread(), so concurrent reads
+		// don't have to share the seek position of the stream. If it can't be opened for any
+		// reason, we just fall back to reading through the stream.
+		m_fileDescriptor = ::open( filename.c_str(), O_RDONLY | O_CLOEXEC );
+
+		// The destructor isn't called if we throw from here, so the descriptor
+		// must be closed before rethrowing.
 		try
 		{
 			setStream( f, false );
 		}
 		catch ( Exception &e )
 		{
+			closeFileDescriptor();
 			e.prepend( "Opening file \"" + filename + "\" : " );
 			throw;
 		}
 		catch (...)
 		{
+			closeFileDescriptor();
 			throw IOException( "FileIndexedIO: Caught error reading file '" + filename + "'" );
 		}
 
@@ -152,8 +214,48 @@ void FileIndexedIO::StreamFile::flush( size_t endPosition )
 	m_endPosition = endPosition;
 }
 
+bool FileIndexedIO::StreamFile::readAt( char *buffer, size_t size, Imf::Int64 pos )
+{
+	if ( m_fileDescriptor < 0 )
+	{
+		return StreamIndexedIO::StreamFile::readAt( buffer, size, pos );
+	}
+
+	while ( size )
+	{
+		const ssize_t n = ::pread( m_fileDescriptor, buffer, size, pos );
+		if ( n < 0 )
+		{
+			if ( errno == EINTR )
+			{
+				continue;
+			}
+			throw IOException( "FileIndexedIO: Error reading file '" + m_filename + "' : " + strerror( errno ) );
+		}
+		else if ( n == 0 )
+		{
+			throw IOException( "FileIndexedIO: Unexpected end of file '" + m_filename + "'" );
+		}
+		buffer += n;
+		size -= n;
+		pos += n;
+	}
+	return true;
+}
+
+void FileIndexedIO::StreamFile::closeFileDescriptor()
+{
+	if ( m_fileDescriptor >= 0 )
+	{
+		::close( m_fileDescriptor );
+		m_fileDescriptor = -1;
+	}
+}
+
 FileIndexedIO::StreamFile::~StreamFile()
 {
+	closeFileDescriptor();
+
 	if ( m_openmode == IndexedIO::Write || m_openmode == IndexedIO::Append )
 	{
 		std::fstream *f = static_cast< std::fstream * >( m_stream );
@@ -226,6 +328,18 @@ FileIndexedIO::FileIndexedIO(const std::string &path, const IndexedIO::EntryIDLi
 	open( new StreamFile( filename, mode ), root );
 }
 
+FileIndexedIO::FileIndexedIO(const std::string &path, const IndexedIO::EntryIDList &root, IndexedIO::OpenMode mode, Codec indexCodec, Codec dataCodec)
+{
+	const fs::path p = fs::path(path);
+	const std::string filename = p.string();
+
+	if (! fs::exists(filename) && (mode & IndexedIO::Read))
+	{
+		throw FileNotFoundIOException(filename);
+	}
+	open( new StreamFile( filename, mode ), root, indexCodec, dataCodec );
+}
+
 FileIndexedIO::FileIndexedIO( StreamIndexedIO::Node &rootNode ) : StreamIndexedIO( rootNode )
 {
 }
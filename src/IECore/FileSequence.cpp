@@ -312,9 +312,10 @@ void FileSequence::mapTo( const FileSequence *other, std::map< std::string, std:
 	}
 }
 
-boost::regex FileSequence::fileNameValidator()
+const boost::regex &FileSequence::fileNameValidator()
 {
-	return boost::regex( "^([^#]*)(#+)([^#]*)$" );
+	static const boost::regex g_validator( "^([^#]*)(#+)([^#]*)$" );
+	return g_validator;
 }
 
 bool FileSequence::operator ==( const FileSequence &other ) const
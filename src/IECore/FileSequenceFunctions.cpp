@@ -50,8 +50,12 @@
 #include "boost/regex.hpp"
 #include "boost/version.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 #include <algorithm>
 #include <cassert>
+#include <unordered_map>
 
 #include <math.h>
 
@@ -83,17 +87,107 @@
 
 using namespace IECore;
 
+namespace
+{
+
+inline bool isDigit( char c )
+{
+	return c >= '0' && c <= '9';
+}
+
+inline bool isAlpha( char c )
+{
+	return ( c >= 'a' && c <= 'z' ) || ( c >= 'A' && c <= 'Z' );
+}
+
+// Returns the start of the run of digits ending at `end`, including
+// any preceding minus sign.
+inline size_t frameBegin( const std::string &name, size_t end )
+{
+	size_t begin = end;
+	while( begin > 0 && isDigit( name[begin-1] ) )
+	{
+		--begin;
+	}
+	if( begin > 0 && name[begin-1] == '-' )
+	{
+		--begin;
+	}
+	return begin;
+}
+
+// Returns the end of the last run of digits before `end`,
+// or 0 if there is none.
+inline size_t lastDigitsEnd( const std::string &name, size_t end )
+{
+	while( end > 0 && !isDigit( name[end-1] ) )
+	{
+		--end;
+	}
+	return end;
+}
+
+/// Splits names of the form $prefix$frameNumber$suffix, returning false
+/// if the name doesn't contain a frame number. Both $prefix and $suffix
+/// may be empty and $frameNumber may be preceded by a minus sign. The
+/// frame number is the last run of digits in the name, except that file
+/// extensions of 3 or 4 characters ending in a digit (for example CR2,
+/// MP3) are treated as part of the suffix when another frame number
+/// precedes them. This is equivalent to matching against the regex
+/// "^([^#]*?)(-?[0-9]+)([^0-9#]*|[^0-9#]*\.[a-zA-Z]{2,3}[0-9])$",
+/// but is considerably quicker.
+bool tokenize( const std::string &name, size_t &begin, size_t &end )
+{
+	if( name.find( '#' ) != std::string::npos )
+	{
+		return false;
+	}
+
+	const size_t size = name.size();
+	if( size >= 4 && isDigit( name[size-1] ) )
+	{
+		for( size_t numLetters = 2; numLetters <= 3 && numLetters + 2 <= size; ++numLetters )
+		{
+			const size_t dot = size - numLetters - 2;
+			if( name[dot] != '.' )
+			{
+				continue;
+			}
+
+			bool letters = true;
+			for( size_t i = dot + 1; i < size - 1; ++i )
+			{
+				letters = letters && isAlpha( name[i] );
+			}
+
+			if( letters )
+			{
+				end = lastDigitsEnd( name, dot );
+				if( end )
+				{
+					begin = frameBegin( name, end );
+					return true;
+				}
+				break;
+			}
+		}
+	}
+
+	end = lastDigitsEnd( name, size );
+	if( !end )
+	{
+		return false;
+	}
+	begin = frameBegin( name, end );
+	return true;
+}
+
+} // namespace
+
 void IECore::findSequences( const std::vector< std::string > &names, std::vector< FileSequencePtr > &sequences, size_t minSequenceSize )
 {
 	sequences.clear();
 
-	/// this matches names of the form $prefix$frameNumber$suffix
-	/// placing each of those in a group of the resulting match.
-	/// both $prefix and $suffix may be the empty string and $frameNumber
-	/// may be preceded by a minus sign.
-	/// It also matches file extensions with 3 or 4 characters that contain numbers (for example: CR2, MP3 )
-	boost::regex matchExpression( std::string( "^([^#]*?)(-?[0-9]+)([^0-9#]*|[^0-9#]*\\.[a-zA-Z]{2,3}[0-9])$" ) );
-
 	/// build a mapping from ($prefix, $suffix) to a list of $frameNumbers
 	typedef std::vector< std::string > Frames;
 	typedef std::map< std::pair< std::string, std::string >, Frames > SequenceMap;
@@ -102,15 +196,15 @@ void IECore::findSequences( const std::vector< std::string > &names, std::vector
 
 	for ( std::vector< std::string >::const_iterator it = names.begin(); it != names.end(); ++it )
 	{
-		boost::smatch matches;
-		if ( boost::regex_match( *it, matches, matchExpression ) )
+		size_t begin, end;
+		if ( tokenize( *it, begin, end ) )
 		{
 			sequenceMap[
 				SequenceMap::key_type(
-					std::string( matches[1].first, matches[1].second ),
-					std::string( matches[3].first, matches[3].second )
+					it->substr( 0, begin ),
+					it->substr( end )
 				)
-			].push_back( std::string( matches[2].first, matches[2].second ) );
+			].push_back( it->substr( begin, end - begin ) );
 		}
 	}
 
@@ -188,6 +282,193 @@ void IECore::findSequences( const std::vector< std::string > &names, std::vector
 	findSequences( names, sequences, 2 );
 }
 
+namespace
+{
+
+struct DirectoryEntry
+{
+	DirectoryEntry( const std::string &name )
+		:	name( name ), isDirectory( false ), isSymlink( false ), modificationTime( 0 ), size( 0 )
+	{
+	}
+
+	std::string name;
+	bool isDirectory;
+	bool isSymlink;
+	std::time_t modificationTime;
+	uint64_t size;
+};
+
+typedef std::vector<DirectoryEntry> DirectoryEntries;
+
+// Lists a directory, ignoring any errors. Types are only queried
+// if `types` is true, because although they are typically free on
+// local filesystems, they can require a stat() per entry elsewhere.
+// Stats always require a stat() per entry, so we parallelise them
+// to hide the latency of network filesystems.
+void scanDirectory( const boost::filesystem::path &path, bool types, bool stats, DirectoryEntries &entries )
+{
+	boost::system::error_code error;
+	boost::filesystem::directory_iterator it( path, error ), end;
+	for( ; !error && it != end; it.increment( error ) )
+	{
+		entries.push_back( DirectoryEntry( it->path().PATH_TO_STRING ) );
+		if( types )
+		{
+			boost::system::error_code statusError;
+			entries.back().isDirectory = boost::filesystem::is_directory( it->status( statusError ) );
+			entries.back().isSymlink = boost::filesystem::is_symlink( it->symlink_status( statusError ) );
+		}
+	}
+
+	if( !stats )
+	{
+		return;
+	}
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, entries.size(), 64 ),
+		[&path, &entries]( const tbb::blocked_range<size_t> &range ) {
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				const boost::filesystem::path entryPath = path / entries[i].name;
+				boost::system::error_code error;
+				const std::time_t modificationTime = boost::filesystem::last_write_time( entryPath, error );
+				if( !error )
+				{
+					entries[i].modificationTime = modificationTime;
+				}
+				const boost::uintmax_t size = boost::filesystem::file_size( entryPath, error );
+				if( !error )
+				{
+					entries[i].size = size;
+				}
+			}
+		}
+	);
+}
+
+void sequenceStats( const DirectoryEntries &entries, const std::vector< FileSequencePtr > &sequences, std::vector<FileSequenceStats> &stats )
+{
+	std::unordered_map<std::string, size_t> indices;
+	for( size_t i = 0, e = entries.size(); i < e; ++i )
+	{
+		indices[entries[i].name] = i;
+	}
+
+	std::vector<std::string> fileNames;
+	for( std::vector< FileSequencePtr >::const_iterator it = sequences.begin(); it != sequences.end(); ++it )
+	{
+		stats.push_back( FileSequenceStats() );
+		FileSequenceStats &sequenceStats = stats.back();
+
+		fileNames.clear();
+		(*it)->fileNames( fileNames );
+		for( std::vector<std::string>::const_iterator fIt = fileNames.begin(); fIt != fileNames.end(); ++fIt )
+		{
+			std::unordered_map<std::string, size_t>::const_iterator iIt = indices.find( *fIt );
+			const DirectoryEntry *entry = iIt != indices.end() ? &entries[iIt->second] : nullptr;
+			sequenceStats.modificationTimes.push_back( entry ? entry->modificationTime : 0 );
+			sequenceStats.sizes.push_back( entry ? entry->size : 0 );
+		}
+	}
+}
+
+struct DirectoryResult
+{
+	std::vector< FileSequencePtr > sequences;
+	std::vector< FileSequenceStats > stats;
+	std::vector< DirectoryResult > children;
+};
+
+struct RecursiveLs
+{
+
+	RecursiveLs( size_t minSequenceSize, size_t maxDepth, bool followLinks, bool stats )
+		:	minSequenceSize( minSequenceSize ), maxDepth( maxDepth ), followLinks( followLinks ), stats( stats )
+	{
+	}
+
+	void walk( const boost::filesystem::path &path, const std::string &relativePath, size_t depth, bool descend, DirectoryResult &result ) const
+	{
+		descend = descend && depth < maxDepth;
+
+		DirectoryEntries entries;
+		scanDirectory( path, descend, stats, entries );
+
+		std::vector<std::string> names;
+		names.reserve( entries.size() );
+		std::vector<size_t> subdirectories;
+		for( size_t i = 0, e = entries.size(); i < e; ++i )
+		{
+			names.push_back( entries[i].name );
+			if( descend && entries[i].isDirectory )
+			{
+				subdirectories.push_back( i );
+			}
+		}
+
+		findSequences( names, result.sequences, minSequenceSize );
+		if( stats )
+		{
+			sequenceStats( entries, result.sequences, result.stats );
+		}
+
+		if( !relativePath.empty() )
+		{
+			for( std::vector< FileSequencePtr >::const_iterator it = result.sequences.begin(); it != result.sequences.end(); ++it )
+			{
+				(*it)->setFileName( relativePath + "/" + (*it)->getFileName() );
+			}
+		}
+
+		// Sort so that our results are in a predictable order.
+		std::sort(
+			subdirectories.begin(), subdirectories.end(),
+			[&entries]( size_t a, size_t b ) { return entries[a].name < entries[b].name; }
+		);
+
+		result.children.resize( subdirectories.size() );
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, subdirectories.size() ),
+			[this, &path, &relativePath, depth, &entries, &subdirectories, &result]( const tbb::blocked_range<size_t> &range ) {
+				for( size_t i = range.begin(); i != range.end(); ++i )
+				{
+					const DirectoryEntry &entry = entries[subdirectories[i]];
+					walk(
+						path / entry.name,
+						relativePath.empty() ? entry.name : relativePath + "/" + entry.name,
+						depth + 1,
+						followLinks || !entry.isSymlink,
+						result.children[i]
+					);
+				}
+			}
+		);
+	}
+
+	void flatten( DirectoryResult &result, std::vector< FileSequencePtr > &sequences, std::vector<FileSequenceStats> *stats ) const
+	{
+		sequences.insert( sequences.end(), result.sequences.begin(), result.sequences.end() );
+		if( stats )
+		{
+			stats->insert( stats->end(), result.stats.begin(), result.stats.end() );
+		}
+		for( std::vector<DirectoryResult>::iterator it = result.children.begin(); it != result.children.end(); ++it )
+		{
+			flatten( *it, sequences, stats );
+		}
+	}
+
+	const size_t minSequenceSize;
+	const size_t maxDepth;
+	const bool followLinks;
+	const bool stats;
+
+};
+
+} // namespace
+
 void IECore::ls( const std::string &path, std::vector< FileSequencePtr > &sequences, size_t minSequenceSize )
 {
 	sequences.clear();
@@ -205,6 +486,25 @@ void IECore::ls( const std::string &path, std::vector< FileSequencePtr > &sequen
 	}
 }
 
+void IECore::lsRecursive( const std::string &path, std::vector< FileSequencePtr > &sequences, size_t minSequenceSize, size_t maxDepth, bool followLinks, std::vector<FileSequenceStats> *stats )
+{
+	sequences.clear();
+	if( stats )
+	{
+		stats->clear();
+	}
+
+	if( !boost::filesystem::is_directory( path ) )
+	{
+		return;
+	}
+
+	const RecursiveLs recursiveLs( minSequenceSize, maxDepth, followLinks, stats != nullptr );
+	DirectoryResult result;
+	recursiveLs.walk( path, "", 0, true, result );
+	recursiveLs.flatten( result, sequences, stats );
+}
+
 void IECore::ls( const std::string &sequencePath, FileSequencePtr &sequence, size_t minSequenceSize )
 {
 	sequence = nullptr;
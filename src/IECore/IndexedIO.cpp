@@ -110,6 +110,11 @@ IndexedIO::~IndexedIO()
 {
 }
 
+size_t IndexedIO::memoryUsage() const
+{
+	return 0;
+}
+
 void IndexedIO::readable(const IndexedIO::EntryID &name) const
 {
 }
@@ -126,7 +131,7 @@ void IndexedIO::validateOpenMode(IndexedIO::OpenMode &mode)
 {
 	// Clear 'other' bits
 	mode &= IndexedIO::Read | IndexedIO::Write | IndexedIO::Append
-			| IndexedIO::Shared | IndexedIO::Exclusive;
+			| IndexedIO::Shared | IndexedIO::Exclusive | IndexedIO::Mapped;
 
 	// Check for mutual exclusivity
 	if ((mode & IndexedIO::Shared)
@@ -141,6 +146,12 @@ void IndexedIO::validateOpenMode(IndexedIO::OpenMode &mode)
 		throw InvalidArgumentException("Incorrect IndexedIO open mode specified");
 	}
 
+	if ((mode & IndexedIO::Mapped)
+		&& (mode & (IndexedIO::Write | IndexedIO::Append)))
+	{
+		throw InvalidArgumentException("Incorrect IndexedIO open mode specified");
+	}
+
 	// Set up default as 'read'
 	if (!(mode & IndexedIO::Read
 		|| mode & IndexedIO::Write
@@ -38,9 +38,12 @@
 #include "boost/multi_index/hashed_index.hpp"
 #include "boost/multi_index_container.hpp"
 
+#include "tbb/blocked_range.h"
 #include "tbb/concurrent_hash_map.h"
+#include "tbb/parallel_for.h"
 #include "tbb/spin_rw_mutex.h"
 
+#include <stdint.h>
 #include <string.h>
 
 namespace IECore
@@ -53,40 +56,80 @@ namespace Detail
 // represent non-null-terminated strings.
 typedef std::pair<const char *, const char *> CharRange;
 
-// Hash for strings of various types.
-// By overloading it for multiple types, we are able to do
-// lookups into HashSet using any type as a key, and without
-// needing to construct a temporary std::string when the type
-// is a raw c string.
-struct Hash
+// A range of characters with a precomputed hash. We use the hash
+// to choose a shard before searching it, so this allows us to avoid
+// hashing twice.
+struct HashedCharRange
 {
+	HashedCharRange( const char *begin, const char *end );
+	HashedCharRange( const char *begin, const char *end, size_t hash );
+	CharRange range;
+	size_t hash;
+};
+
+// MurmurHash64A, by Austin Appleby. This consumes 8 characters
+// at a time, so it is considerably faster than a bytewise hash
+// for all but the shortest strings.
+inline uint64_t hash( const char *s, size_t length )
+{
+	const uint64_t m = 0xc6a4a7935bd1e995ULL;
+	const int r = 47;
+
+	uint64_t h = 0x9747b28c ^ ( length * m );
 
-	// Dan Bernstein's original string hash
-	size_t operator()( const char *s ) const
+	const char *end = s + ( length & ~size_t( 7 ) );
+	for( ; s != end; s += 8 )
 	{
-		size_t hash = 5381;
-		while( *s )
+		uint64_t k;
+		memcpy( &k, s, 8 );
+		k *= m;
+		k ^= k >> r;
+		k *= m;
+		h ^= k;
+		h *= m;
+	}
+
+	if( const size_t remainder = length & 7 )
+	{
+		for( size_t i = 0; i < remainder; ++i )
 		{
-			hash = ( ( hash << 5 ) + hash ) + *s++;
+			h ^= uint64_t( (unsigned char)s[i] ) << ( 8 * i );
 		}
-
-		return hash;
+		h *= m;
 	}
 
+	h ^= h >> r;
+	h *= m;
+	h ^= h >> r;
+
+	return h;
+}
+
+HashedCharRange::HashedCharRange( const char *begin, const char *end )
+	:	range( begin, end ), hash( Detail::hash( begin, end - begin ) )
+{
+}
+
+HashedCharRange::HashedCharRange( const char *begin, const char *end, size_t hash )
+	:	range( begin, end ), hash( hash )
+{
+}
+
+// Hash for strings of various types.
+// By overloading it for multiple types, we are able to do
+// lookups into HashSet using any type as a key, and without
+// needing to construct a temporary std::string.
+struct Hash
+{
+
 	size_t operator()( const std::string &s ) const
 	{
-		return (*this)( s.c_str() );
+		return hash( s.c_str(), s.size() );
 	}
 
-	size_t operator()( const CharRange &range ) const
+	size_t operator()( const HashedCharRange &r ) const
 	{
-		size_t hash = 5381;
-		for( const char *s = range.first; s != range.second; ++s )
-		{
-			hash = ( ( hash << 5 ) + hash ) + *s;
-		}
-
-		return hash;
+		return r.hash;
 	}
 
 };
@@ -103,24 +146,14 @@ struct Equal
 		return s1 == s2;
 	}
 
-	bool operator()( const char *c, const std::string &s ) const
+	bool operator()( const HashedCharRange &c, const std::string &s ) const
 	{
-		return strcmp( c, s.c_str() )==0;
+		return s.compare( 0, std::string::npos, c.range.first, c.range.second - c.range.first )==0;
 	}
 
-	bool operator()( const std::string &s, const char *c ) const
+	bool operator()( const std::string &s, const HashedCharRange &c ) const
 	{
-		return strcmp( c, s.c_str() )==0;
-	}
-
-	bool operator()( const CharRange &c, const std::string &s ) const
-	{
-		return s.compare( 0, std::string::npos, c.first, c.second - c.first )==0;
-	}
-
-	bool operator()( const std::string &s, const CharRange &c ) const
-	{
-		return s.compare( 0, std::string::npos, c.first, c.second - c.first )==0;
+		return (*this)( c, s );
 	}
 
 };
@@ -136,63 +169,142 @@ typedef boost::multi_index::multi_index_container<
 	>
 > HashSet;
 
-typedef HashSet::nth_index<0>::type Index;
-typedef HashSet::nth_index_const_iterator<0>::type ConstIterator;
 typedef tbb::spin_rw_mutex Mutex;
 
-static HashSet *hashSet()
+// Rather than a single table behind a single mutex, we use
+// many independent tables, selected using the high bits of the
+// hash. Threads interning different strings will then rarely
+// contend for the same lock.
+struct alignas( 64 ) Shard
 {
-	static HashSet g_hashSet;
-	return &g_hashSet;
-}
+	HashSet hashSet;
+	Mutex mutex;
+};
 
-static Mutex *mutex()
+static const size_t g_numShardBits = 6;
+static const size_t g_numShards = 1 << g_numShardBits;
+
+inline size_t shardIndex( size_t hash )
 {
-	static Detail::Mutex g_mutex;
-	return &g_mutex;
+	return hash >> ( sizeof( size_t ) * 8 - g_numShardBits );
 }
 
-} // namespace Detail
+static Shard *shards()
+{
+	static Shard g_shards[g_numShards];
+	return g_shards;
+}
 
-const std::string *InternedString::internedString( const char *value )
+const std::string *internedString( const HashedCharRange &value )
 {
-	Detail::HashSet *hashSet = Detail::hashSet();
-	Detail::Index &hashIndex = hashSet->get<0>();
-	Detail::Mutex::scoped_lock lock( *Detail::mutex(), false ); // read-only lock
-	Detail::HashSet::const_iterator it = hashIndex.find( value );
-	if( it!=hashIndex.end() )
+	Shard &shard = shards()[shardIndex( value.hash )];
+	Mutex::scoped_lock lock( shard.mutex, false ); // read-only lock
+	HashSet::const_iterator it = shard.hashSet.find( value );
+	if( it!=shard.hashSet.end() )
 	{
 		return &(*it);
 	}
 	else
 	{
 		lock.upgrade_to_writer();
-		return &(*(hashSet->insert( std::string( value ) ).first ) );
+		return &(*(shard.hashSet.insert( std::string( value.range.first, value.range.second ) ).first ) );
 	}
 }
 
+} // namespace Detail
+
+const std::string *InternedString::internedString( const char *value )
+{
+	return Detail::internedString( Detail::HashedCharRange( value, value + strlen( value ) ) );
+}
+
 const std::string *InternedString::internedString( const char *value, size_t length )
 {
-	Detail::HashSet *hashSet = Detail::hashSet();
-	Detail::Index &hashIndex = hashSet->get<0>();
-	Detail::Mutex::scoped_lock lock( *Detail::mutex(), false ); // read-only lock
-	Detail::HashSet::const_iterator it = hashIndex.find( Detail::CharRange( value, value + length ) );
-	if( it!=hashIndex.end() )
-	{
-		return &(*it);
-	}
-	else
+	return Detail::internedString( Detail::HashedCharRange( value, value + length ) );
+}
+
+void InternedString::intern( const std::vector<std::string> &values, std::vector<InternedString> &result )
+{
+	result.resize( values.size() );
+
+	// Sort the strings into the shards they belong to, so that
+	// each shard need only be locked once.
+
+	std::vector<size_t> hashes( values.size() );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, values.size(), 1000 ),
+		[&values, &hashes]( const tbb::blocked_range<size_t> &range ) {
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				hashes[i] = Detail::hash( values[i].c_str(), values[i].size() );
+			}
+		}
+	);
+
+	std::vector<size_t> shardIndices[Detail::g_numShards];
+	for( size_t i = 0, e = values.size(); i < e; ++i )
 	{
-		lock.upgrade_to_writer();
-		return &(*(hashSet->insert( std::string( value, length ) ).first ) );
+		shardIndices[Detail::shardIndex( hashes[i] )].push_back( i );
 	}
+
+	// Then process the shards in parallel.
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, Detail::g_numShards ),
+		[&values, &hashes, &shardIndices, &result]( const tbb::blocked_range<size_t> &range ) {
+			std::vector<size_t> misses;
+			for( size_t s = range.begin(); s != range.end(); ++s )
+			{
+				const std::vector<size_t> &indices = shardIndices[s];
+				if( indices.empty() )
+				{
+					continue;
+				}
+
+				Detail::Shard &shard = Detail::shards()[s];
+				Detail::Mutex::scoped_lock lock( shard.mutex, false ); // read-only lock
+
+				misses.clear();
+				for( std::vector<size_t>::const_iterator it = indices.begin(), eIt = indices.end(); it != eIt; ++it )
+				{
+					const std::string &value = values[*it];
+					const Detail::HashedCharRange key( value.c_str(), value.c_str() + value.size(), hashes[*it] );
+					Detail::HashSet::const_iterator hIt = shard.hashSet.find( key );
+					if( hIt != shard.hashSet.end() )
+					{
+						result[*it].m_value = &(*hIt);
+					}
+					else
+					{
+						misses.push_back( *it );
+					}
+				}
+
+				if( misses.empty() )
+				{
+					continue;
+				}
+
+				lock.upgrade_to_writer();
+				for( std::vector<size_t>::const_iterator it = misses.begin(), eIt = misses.end(); it != eIt; ++it )
+				{
+					result[*it].m_value = &(*( shard.hashSet.insert( values[*it] ).first ) );
+				}
+			}
+		}
+	);
 }
 
 size_t InternedString::numUniqueStrings()
 {
-	Detail::Mutex::scoped_lock lock( *Detail::mutex(), false ); // read-only lock
-	Detail::HashSet *hashSet = Detail::hashSet();
-	return hashSet->size();
+	size_t result = 0;
+	Detail::Shard *shards = Detail::shards();
+	for( size_t i = 0; i < Detail::g_numShards; ++i )
+	{
+		Detail::Mutex::scoped_lock lock( shards[i].mutex, false ); // read-only lock
+		result += shards[i].hashSet.size();
+	}
+	return result;
 }
 
 static InternedString g_emptyString("");
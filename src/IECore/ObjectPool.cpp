@@ -38,6 +38,10 @@
 
 #include "boost/lexical_cast.hpp"
 
+#include "tbb/atomic.h"
+
+#include <cstring>
+
 using namespace IECore;
 
 ////////////////////////////////////////////////////////////////////////
@@ -49,9 +53,17 @@ struct ObjectPool::MemberData
 
 	MemberData( size_t maxMemory ) : cache( getter, maxMemory )
 	{
+		hits = 0;
+		misses = 0;
 	}
 
-	LRUCache< MurmurHash, ConstObjectPtr > cache;
+	typedef LRUCache< MurmurHash, ConstObjectPtr > Cache;
+	Cache cache;
+
+	// We look objects up with `cache.find()`, which doesn't
+	// update the cache statistics, so we keep our own counts.
+	tbb::atomic<size_t> hits;
+	tbb::atomic<size_t> misses;
 
 	/// our getter always returns NULL
 	static ConstObjectPtr getter( const MurmurHash &h, size_t &cost )
@@ -74,9 +86,26 @@ ObjectPool::~ObjectPool()
 {
 }
 
+ObjectPool::Statistics::Statistics()
+	:	hits( 0 ), misses( 0 ), evictions( 0 ), memoryUsage( 0 ), maxMemoryUsage( 0 )
+{
+}
+
 ConstObjectPtr ObjectPool::retrieve( const MurmurHash &hash ) const
 {
-	return m_data->cache.get(hash);
+	// We don't use `cache.get()`, because that would insert a null
+	// entry for a missing object, and the subsequent store() would
+	// then credit the new object with an extra use.
+	ConstObjectPtr result;
+	if( m_data->cache.find( hash, result ) )
+	{
+		m_data->hits++;
+	}
+	else
+	{
+		m_data->misses++;
+	}
+	return result;
 }
 
 ConstObjectPtr ObjectPool::store( const Object *obj, StoreMode mode )
@@ -84,9 +113,12 @@ ConstObjectPtr ObjectPool::store( const Object *obj, StoreMode mode )
 	MurmurHash h = obj->hash();
 
 	// first tries to see if the object is already in the cache and return that one quickly.
-	ConstObjectPtr cachedObj = m_data->cache.get(h);
-	if ( cachedObj )
+	// A new object is not counted as a miss, because clients typically call retrieve() before
+	// store(), and the miss has already been counted there.
+	ConstObjectPtr cachedObj;
+	if ( m_data->cache.find( h, cachedObj ) )
 	{
+		m_data->hits++;
 		return cachedObj;
 	}
 
@@ -137,6 +169,36 @@ size_t ObjectPool::memoryUsage() const
 	return m_data->cache.currentCost();
 }
 
+void ObjectPool::setEvictionPolicy( EvictionPolicy evictionPolicy )
+{
+	m_data->cache.setEvictionPolicy( static_cast<MemberData::Cache::EvictionPolicy>( evictionPolicy ) );
+}
+
+ObjectPool::EvictionPolicy ObjectPool::getEvictionPolicy() const
+{
+	return static_cast<EvictionPolicy>( m_data->cache.getEvictionPolicy() );
+}
+
+ObjectPool::Statistics ObjectPool::statistics() const
+{
+	const MemberData::Cache::Statistics cacheStatistics = m_data->cache.statistics();
+
+	Statistics result;
+	result.hits = m_data->hits;
+	result.misses = m_data->misses;
+	result.evictions = cacheStatistics.evictions;
+	result.memoryUsage = cacheStatistics.currentCost;
+	result.maxMemoryUsage = cacheStatistics.maxCost;
+	return result;
+}
+
+void ObjectPool::resetStatistics()
+{
+	m_data->hits = 0;
+	m_data->misses = 0;
+	m_data->cache.resetStatistics();
+}
+
 ObjectPool *ObjectPool::defaultObjectPool()
 {
 	static ObjectPoolPtr c = nullptr;
@@ -145,6 +207,11 @@ ObjectPool *ObjectPool::defaultObjectPool()
 		const char *m = getenv( "IECORE_OBJECTPOOL_MEMORY" );
 		size_t mi = m ? boost::lexical_cast<size_t>( m ) : 500;
 		c = new ObjectPool(1024 * 1024 * mi);
+		const char *e = getenv( "IECORE_OBJECTPOOL_EVICTIONPOLICY" );
+		if( e && !strcmp( e, "LFU" ) )
+		{
+			c->setEvictionPolicy( LFU );
+		}
 	}
 	return c.get();
 }
@@ -37,6 +37,8 @@
 
 #include "IECore/PathMatcher.h"
 
+#include "IECore/Exception.h"
+#include "IECore/IndexedIO.h"
 #include "IECore/StringAlgo.h"
 
 using namespace std;
@@ -211,6 +213,41 @@ void PathMatcher::paths( std::vector<std::string> &paths ) const
 	}
 }
 
+void PathMatcher::save( IndexedIO *container ) const
+{
+	// We store the tree depth first. For each node we store a
+	// single value containing the number of children and the
+	// terminator flag, and for each node other than the root,
+	// we store its name.
+	std::vector<IECore::InternedString> names;
+	std::vector<unsigned int> structure;
+	saveWalk( m_root.get(), names, structure );
+
+	container->write( "names", names.data(), names.size() );
+	container->write( "structure", structure.data(), structure.size() );
+}
+
+void PathMatcher::load( const IndexedIO *container )
+{
+	std::vector<IECore::InternedString> names( container->entry( "names" ).arrayLength() );
+	IECore::InternedString *namesPtr = names.data();
+	container->read( "names", namesPtr, names.size() );
+
+	std::vector<unsigned int> structure( container->entry( "structure" ).arrayLength() );
+	unsigned int *structurePtr = structure.data();
+	container->read( "structure", structurePtr, structure.size() );
+
+	size_t nameIndex = 0;
+	size_t structureIndex = 0;
+	NodePtr root = loadWalk( names, structure, nameIndex, structureIndex );
+	if( nameIndex != names.size() || structureIndex != structure.size() )
+	{
+		throw IOException( "PathMatcher::load : Unexpected data" );
+	}
+
+	m_root = root;
+}
+
 bool PathMatcher::operator == ( const PathMatcher &other ) const
 {
 	return *m_root == *other.m_root;
@@ -431,22 +468,10 @@ bool PathMatcher::removePaths( const PathMatcher &paths )
 	return result;
 }
 
-PathMatcher PathMatcher::intersection( const PathMatcher &paths )
+PathMatcher PathMatcher::intersection( const PathMatcher &paths ) const
 {
-	PathMatcher result = PathMatcher();
-	for( Iterator it = (*this).begin(); it != (*this).end(); ++it )
-	{
-		RawIterator rit = paths.find( *it );
-		if( rit == paths.end() )
-		{
-			it.prune();
-		}
-		else if( rit.exactMatch() )
-		{
-			result.addPath( *it );
-		}
-	}
-	return result;
+	NodePtr newRoot = intersectionWalk( m_root.get(), paths.m_root.get() );
+	return PathMatcher( newRoot ? newRoot : new Node );
 }
 
 bool PathMatcher::prune( const std::string &path )
@@ -731,6 +756,16 @@ PathMatcher::NodePtr PathMatcher::removePathsWalk( Node *node, const Node *srcNo
 		if( childIt != node->children.end() )
 		{
 			Node *child = childIt->second.get();
+			if( child == it->second.get() )
+			{
+				// Shared subtree, so we know that every path
+				// within it is removed, without needing to visit
+				// them individually.
+				writable( node, result, shared )->children.erase( childIt->first );
+				removed = true;
+				continue;
+			}
+
 			NodePtr newChild = removePathsWalk( child, it->second.get(), shared, removed );
 
 			if( newChild && !newChild->isEmpty() )
@@ -746,3 +781,85 @@ PathMatcher::NodePtr PathMatcher::removePathsWalk( Node *node, const Node *srcNo
 
 	return result;
 }
+
+PathMatcher::NodePtr PathMatcher::intersectionWalk( Node *node, const Node *srcNode )
+{
+	if( node == srcNode )
+	{
+		// The subtree is shared by both matchers, so
+		// we can share it with the result too.
+		return node;
+	}
+
+	NodePtr result;
+	const Node *smaller = node->children.size() <= srcNode->children.size() ? node : srcNode;
+	const Node *larger = smaller == node ? srcNode : node;
+	for( Node::ConstChildMapIterator it = smaller->children.begin(), eIt = smaller->children.end(); it != eIt; ++it )
+	{
+		Node::ConstChildMapIterator lIt = larger->children.find( it->first );
+		if( lIt == larger->children.end() )
+		{
+			continue;
+		}
+
+		NodePtr newChild = intersectionWalk( it->second.get(), lIt->second.get() );
+		if( newChild && !newChild->isEmpty() )
+		{
+			if( !result )
+			{
+				result = new Node;
+			}
+			result->children.insert( Node::ChildMapValue( it->first, newChild ) );
+		}
+	}
+
+	if( node->terminator && srcNode->terminator )
+	{
+		if( !result )
+		{
+			return Node::leaf();
+		}
+		result->terminator = true;
+	}
+
+	return result;
+}
+
+void PathMatcher::saveWalk( const Node *node, std::vector<IECore::InternedString> &names, std::vector<unsigned int> &structure )
+{
+	structure.push_back( ( node->children.size() << 1 ) | ( node->terminator ? 1 : 0 ) );
+	for( Node::ConstChildMapIterator it = node->children.begin(), eIt = node->children.end(); it != eIt; ++it )
+	{
+		names.push_back( it->first.name );
+		saveWalk( it->second.get(), names, structure );
+	}
+}
+
+PathMatcher::NodePtr PathMatcher::loadWalk( const std::vector<IECore::InternedString> &names, const std::vector<unsigned int> &structure, size_t &nameIndex, size_t &structureIndex )
+{
+	if( structureIndex >= structure.size() )
+	{
+		throw IOException( "PathMatcher::load : Unexpected end of data" );
+	}
+
+	const unsigned int s = structure[structureIndex++];
+	const bool terminator = s & 1;
+	const size_t numChildren = s >> 1;
+	if( !numChildren && terminator )
+	{
+		return Node::leaf();
+	}
+
+	NodePtr result = new Node( terminator );
+	for( size_t i = 0; i < numChildren; ++i )
+	{
+		if( nameIndex >= names.size() )
+		{
+			throw IOException( "PathMatcher::load : Unexpected end of data" );
+		}
+		const Name name( names[nameIndex++] );
+		result->children.insert( Node::ChildMapValue( name, loadWalk( names, structure, nameIndex, structureIndex ) ) );
+	}
+
+	return result;
+}
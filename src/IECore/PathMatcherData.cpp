@@ -82,7 +82,7 @@ void popHashNodes( HashStack &stack, size_t size, IECore::MurmurHash &h )
 	}
 }
 
-static const unsigned int g_ioVersion = 0;
+static const unsigned int g_ioVersion = 1;
 
 } // namespace
 
@@ -96,24 +96,7 @@ void PathMatcherData::save( SaveContext *context ) const
 {
 	Data::save( context );
 	IndexedIOPtr container = context->container( staticTypeName(), g_ioVersion );
-
-	std::vector<InternedString> strings;
-	std::vector<unsigned int> pathLengths;
-	std::vector<unsigned char> exactMatches;
-
-	for( PathMatcher::RawIterator it = readable().begin(), eIt = readable().end(); it != eIt; ++it )
-	{
-		pathLengths.push_back( it->size() );
-		if( it->size() )
-		{
-			strings.push_back( it->back() );
-		}
-		exactMatches.push_back( it.exactMatch() );
-	}
-
-	container->write( "strings", strings.data(), strings.size() );
-	container->write( "pathLengths", pathLengths.data(), pathLengths.size() );
-	container->write( "exactMatches", exactMatches.data(), exactMatches.size() );
+	readable().save( container.get() );
 }
 
 template<>
@@ -123,6 +106,15 @@ void PathMatcherData::load( LoadContextPtr context )
 	unsigned int v = g_ioVersion;
 	ConstIndexedIOPtr container = context->container( staticTypeName(), v );
 
+	if( v > 0 )
+	{
+		writable().load( container.get() );
+		return;
+	}
+
+	// Version 0 stored every path in the matcher, requiring us to
+	// rebuild the tree path by path.
+
 	const IndexedIO::Entry stringsEntry = container->entry( "strings" );
 	std::vector<InternedString> strings;
 	strings.resize( stringsEntry.arrayLength() );
@@ -42,6 +42,7 @@
 #include "IECore/VectorTypedData.h"
 
 #include "boost/format.hpp"
+#include "boost/iostreams/device/back_inserter.hpp"
 #include "boost/iostreams/device/file.hpp"
 #include "boost/iostreams/filter/gzip.hpp"
 #include "boost/iostreams/filtering_stream.hpp"
@@ -50,11 +51,22 @@
 #include "boost/optional.hpp"
 #include "boost/tokenizer.hpp"
 
+#include "tbb/enumerable_thread_specific.h"
 #include "tbb/spin_rw_mutex.h"
 
+#ifdef IECORE_WITH_LZ4
+#include "lz4.h"
+#endif
+
+#ifdef IECORE_WITH_ZSTD
+#include "zstd.h"
+#endif
+
 #include <algorithm>
 #include <cassert>
+#include <cstring>
 #include <iostream>
+#include <limits>
 #include <list>
 #include <map>
 #include <set>
@@ -72,18 +84,32 @@ static const Imf::Int64 g_versionedMagicNumber = 0xB00B1E50;
 /// Version 5: introduced subindex as zipped data blocks (to reduce size of the main index).
 ///            Hard links are represented as regular data nodes, that points to same data on file (no removal of data ever).
 ///            Removed the linkCount field on the data nodes.
+/// Version 6: introduced configurable codecs for the index, subindexes and data blocks.
+///            Files using the default codecs (gzip for the index, no compression for the data) are
+///            still written as version 5, so they remain readable by previous versions of the library.
 /// \todo Store SubIndexSize and NodeCount as unsigned 64bit integers
-static const Imf::Int64 g_currentVersion = 5;
+static const Imf::Int64 g_currentVersion = 6;
+static const Imf::Int64 g_gzipIndexVersion = 5;
 
-/// FileFormat ::= Data Index IndexOffset Version MagicNumber
+/// FileFormat ::= Data Index IndexOffset Version MagicNumber ( Version <= 5 )
+///                Data Index IndexOffset Codecs Version MagicNumber ( Version >= 6 )
 /// Data ::= DataEntry*
-/// Index ::= zip(StringCache NodeTree FreePages)
+/// Index ::= zip(StringCache NodeTree FreePages) ( Version <= 5 )
+///           Block<int64>(StringCache NodeTree FreePages) ( Version >= 6, compressed with the index codec )
 
 /// DataEntry ::= Stores data from nodes:
 ///                [Data nodes] binary data indexed by DataOffset/DataSize and
 ///                [Subindex]   SubIndexSize zip(NodeCount NodeTree*) indexed by SubIndexOffset.
+///                When a data codec is used, data nodes are stored as Block<uint32>(data)
+///                ( Version >= 6 ) subindexes are stored as SubIndexSize Block<uint32>(NodeCount NodeTree*),
+///                compressed with the index codec.
 /// SubIndexSize :: = uint32 - number of bytes in the zipped subindex that follows
 
+/// Block<T> ::= RawSize Payload
+/// RawSize ::= T ( number of bytes in the uncompressed data )
+/// Payload ::= char* ( the uncompressed data if its size matches RawSize, otherwise the compressed data )
+/// Codecs ::= int64 ( index codec in the lowest byte, data codec in the next byte )
+
 /// StringCache ::= NumStrings String*
 /// NumStrings ::= int64
 /// String ::= StringLength char*
@@ -143,6 +169,214 @@ void readLittleEndian( F &f, T &n )
 	}
 }
 
+//// Compression codecs //////
+
+static StreamIndexedIO::Codec g_defaultIndexCodec = StreamIndexedIO::GzipCodec;
+static StreamIndexedIO::Codec g_defaultDataCodec = StreamIndexedIO::NoCodec;
+
+static const int g_zstdCompressionLevel = 3;
+
+/// The largest read buffer retained by each thread between reads.
+static const size_t g_maxRetainedReadBufferSize = 8 * 1024 * 1024;
+
+/// Resizes a per-thread read buffer, first releasing any memory held over from
+/// an unusually large previous read, so that each thread doesn't keep hold of
+/// the largest block it has ever read.
+static char *resizeReadBuffer( std::vector<char> &buffer, size_t size )
+{
+	if ( buffer.capacity() > g_maxRetainedReadBufferSize && size <= g_maxRetainedReadBufferSize )
+	{
+		std::vector<char>().swap( buffer );
+	}
+	buffer.resize( size );
+	return buffer.data();
+}
+
+static const char *codecName( StreamIndexedIO::Codec codec )
+{
+	switch( codec )
+	{
+		case StreamIndexedIO::NoCodec :
+			return "None";
+		case StreamIndexedIO::GzipCodec :
+			return "Gzip";
+		case StreamIndexedIO::LZ4Codec :
+			return "LZ4";
+		case StreamIndexedIO::ZstdCodec :
+			return "Zstd";
+	}
+	return "Unknown";
+}
+
+/// Returns the codec if this build supports it, and otherwise warns and
+/// returns GzipCodec, which every build supports.
+static StreamIndexedIO::Codec supportedCodec( StreamIndexedIO::Codec codec, const char *context )
+{
+	if( StreamIndexedIO::codecAvailable( codec ) )
+	{
+		return codec;
+	}
+
+	msg(
+		Msg::Warning, context,
+		boost::format( "%s compression is not supported by this build. Using Gzip compression instead." ) % codecName( codec )
+	);
+	return StreamIndexedIO::GzipCodec;
+}
+
+/// Appends the compressed data to result, returning false if the codec
+/// couldn't make it any smaller, in which case result is left untouched.
+static bool compressBlock( StreamIndexedIO::Codec codec, const char *data, size_t size, std::vector<char> &result )
+{
+	const size_t offset = result.size();
+
+	switch( codec )
+	{
+		case StreamIndexedIO::NoCodec :
+			return false;
+		case StreamIndexedIO::GzipCodec :
+			{
+				io::filtering_ostream compressingStream;
+				compressingStream.push( io::gzip_compressor() );
+				compressingStream.push( io::back_inserter( result ) );
+				compressingStream.write( data, size );
+				compressingStream.pop();
+				compressingStream.pop();
+				break;
+			}
+#ifdef IECORE_WITH_LZ4
+		case StreamIndexedIO::LZ4Codec :
+			{
+				if( size > LZ4_MAX_INPUT_SIZE )
+				{
+					return false;
+				}
+				const int bound = LZ4_compressBound( size );
+				result.resize( offset + bound );
+				const int compressedSize = LZ4_compress_default( data, &result[offset], size, bound );
+				if( compressedSize <= 0 )
+				{
+					result.resize( offset );
+					return false;
+				}
+				result.resize( offset + compressedSize );
+				break;
+			}
+#endif
+#ifdef IECORE_WITH_ZSTD
+		case StreamIndexedIO::ZstdCodec :
+			{
+				const size_t bound = ZSTD_compressBound( size );
+				result.resize( offset + bound );
+				const size_t compressedSize = ZSTD_compress( &result[offset], bound, data, size, g_zstdCompressionLevel );
+				if( ZSTD_isError( compressedSize ) )
+				{
+					result.resize( offset );
+					return false;
+				}
+				result.resize( offset + compressedSize );
+				break;
+			}
+#endif
+		default :
+			throw IOException( boost::str( boost::format( "StreamIndexedIO: %s compression is not supported by this build." ) % codecName( codec ) ) );
+	}
+
+	if( result.size() - offset >= size )
+	{
+		result.resize( offset );
+		return false;
+	}
+	return true;
+}
+
+/// Decompresses data into result, which must hold exactly rawSize bytes.
+static void decompressBlock( StreamIndexedIO::Codec codec, const char *data, size_t size, char *result, size_t rawSize )
+{
+	bool success = false;
+	switch( codec )
+	{
+		case StreamIndexedIO::GzipCodec :
+			{
+				io::filtering_istream decompressingStream;
+				MemoryStreamSource source( const_cast<char *>( data ), size, false );
+				decompressingStream.push( io::gzip_decompressor() );
+				decompressingStream.push( source );
+				decompressingStream.read( result, rawSize );
+				success = decompressingStream.gcount() == (std::streamsize)rawSize;
+				break;
+			}
+#ifdef IECORE_WITH_LZ4
+		case StreamIndexedIO::LZ4Codec :
+			success = LZ4_decompress_safe( data, result, size, rawSize ) == (int)rawSize;
+			break;
+#endif
+#ifdef IECORE_WITH_ZSTD
+		case StreamIndexedIO::ZstdCodec :
+			success = ZSTD_decompress( result, rawSize, data, size ) == rawSize;
+			break;
+#endif
+		case StreamIndexedIO::NoCodec :
+			break;
+		default :
+			throw IOException( boost::str( boost::format( "StreamIndexedIO: %s compression is not supported by this build." ) % codecName( codec ) ) );
+	}
+
+	if( !success )
+	{
+		throw IOException( boost::str( boost::format( "StreamIndexedIO: Failed to decompress %s block." ) % codecName( codec ) ) );
+	}
+}
+
+/// Encodes data as a Block<T>, as described in the file format above.
+template<typename T>
+void encodeBlock( StreamIndexedIO::Codec codec, const char *data, size_t size, std::vector<char> &result )
+{
+	if( size > std::numeric_limits<T>::max() )
+	{
+		throw IOException( "StreamIndexedIO: Data size too long!" );
+	}
+
+	const T rawSize = asLittleEndian<T>( size );
+	result.resize( sizeof( T ) );
+	memcpy( &result[0], &rawSize, sizeof( T ) );
+
+	if( !compressBlock( codec, data, size, result ) )
+	{
+		result.insert( result.end(), data, data + size );
+	}
+}
+
+/// Returns the size of the data stored in a Block<T>.
+template<typename T>
+size_t blockRawSize( const char *block, size_t blockSize )
+{
+	if( blockSize < sizeof( T ) )
+	{
+		throw IOException( "StreamIndexedIO: Corrupt data block." );
+	}
+
+	T rawSize;
+	memcpy( &rawSize, block, sizeof( T ) );
+	return asLittleEndian<T>( rawSize );
+}
+
+/// Decodes a Block<T> into result, which must hold blockRawSize() bytes.
+template<typename T>
+void decodeBlock( StreamIndexedIO::Codec codec, const char *block, size_t blockSize, char *result, size_t rawSize )
+{
+	const char *payload = block + sizeof( T );
+	const size_t payloadSize = blockSize - sizeof( T );
+	if( payloadSize == rawSize )
+	{
+		memcpy( result, payload, rawSize );
+	}
+	else
+	{
+		decompressBlock( codec, payload, payloadSize, result, rawSize );
+	}
+}
+
 class StreamIndexedIO::StringCache
 {
 	public:
@@ -160,21 +394,30 @@ class StreamIndexedIO::StringCache
 
 			m_idToStringMap.reserve(sz + 100);
 
+			std::vector<std::string> strings( sz );
+			std::vector<Imf::Int64> ids( sz );
 			for (Imf::Int64 i = 0; i < sz; ++i)
 			{
-				const char *s = read(f);
+				strings[i] = read(f);
+				readLittleEndian( f,ids[i] );
+			}
 
-				Imf::Int64 id;
-				readLittleEndian( f,id );
+			// Interning in bulk is much quicker than
+			// interning each string individually.
+			std::vector<IndexedIO::EntryID> entryIDs;
+			InternedString::intern( strings, entryIDs );
 
+			for (Imf::Int64 i = 0; i < sz; ++i)
+			{
+				const Imf::Int64 id = ids[i];
 				m_prevId = std::max( id, m_prevId );
 
-				m_stringToIdMap[s] = id;
+				m_stringToIdMap[entryIDs[i]] = id;
 				if ( id >= m_idToStringMap.size() )
 				{
 					m_idToStringMap.resize(id+1, (const char *)"");
 				}
-				m_idToStringMap[id] = s;
+				m_idToStringMap[id] = entryIDs[i];
 			}
 		}
 
@@ -250,6 +493,18 @@ class StreamIndexedIO::StringCache
 			return m_stringToIdMap.size();
 		}
 
+		size_t memoryUsage() const
+		{
+			// The strings themselves are owned by the InternedString table, so
+			// we only count our maps. Each std::map node also holds three pointers
+			// and a colour, which we round up to four pointers.
+			return
+				sizeof( StringCache ) +
+				m_stringToIdMap.size() * ( sizeof( StringToIdMap::value_type ) + 4 * sizeof( void * ) ) +
+				m_idToStringMap.capacity() * sizeof( IndexedIO::EntryID ) +
+				m_ioBufferLen;
+		}
+
 	protected:
 
 		template < typename F >
@@ -600,8 +855,9 @@ class StreamIndexedIO::Index : public RefCounted
 
 		friend class Node;
 
-		/// Construct an index from reading a file stream.
-		Index( StreamIndexedIO::StreamFilePtr stream );
+		/// Construct an index from reading a file stream. The codecs are only
+		/// used for new files, existing files use the codecs they were written with.
+		Index( StreamIndexedIO::StreamFilePtr stream, Codec indexCodec, Codec dataCodec );
 		~Index() override;
 
 		/// function called right after construction
@@ -619,8 +875,14 @@ class StreamIndexedIO::Index : public RefCounted
 		/// Queries the string cache
 		StringCache &stringCache();
 
+		/// Returns an estimate of the memory used by the nodes loaded so far and the string cache.
+		size_t memoryUsage() const;
+
 		StreamIndexedIO::StreamFile &streamFile() const;
 
+		Codec indexCodec() const;
+		Codec dataCodec() const;
+
 		/// flushes index to the file
 		void flush();
 
@@ -628,6 +890,25 @@ class StreamIndexedIO::Index : public RefCounted
 		/// \param prefixSize If true than it will prepend to the block, the size of it
 		Imf::Int64 writeUniqueData( const char *data, size_t size, bool prefixSize = false );
 
+		/// Variant of writeUniqueData() used for the data nodes, which compresses the data with the data codec.
+		/// The size of the block as stored in the file is returned in storedSize. May be called concurrently :
+		/// the hashing and compression happen on the calling thread, and the StreamFile mutex is only held
+		/// while deduplicating and appending the block to the file.
+		Imf::Int64 writeData( const char *data, size_t size, Imf::Int64 &storedSize );
+
+		/// Returns a buffer of at least the requested size, owned by the calling thread, which can be used
+		/// to flatten data before passing it to writeData(). It remains valid until the next call from the same thread.
+		char *writeBuffer( size_t size );
+
+		/// Reads a block written by writeData(), returning a pointer to the uncompressed data. The pointer refers
+		/// either to a memory mapped file or to a buffer owned by the calling thread, and remains valid until the
+		/// next call to readData() from the same thread. May be called concurrently, and uses the StreamFile mutex
+		/// internally only when the StreamFile doesn't support memory mapped or positional reads.
+		const char *readData( Imf::Int64 offset, Imf::Int64 size, Imf::Int64 &rawSize );
+
+		/// As above, but uncompressing into a buffer provided by the caller, which must hold rawSize bytes.
+		void readData( Imf::Int64 offset, Imf::Int64 size, char *buffer, Imf::Int64 rawSize );
+
 		/// flushes the children of the given directory node to a subindex in the file
 		void commitNodeToSubIndex( DirectoryNode *n );
 
@@ -654,6 +935,9 @@ class StreamIndexedIO::Index : public RefCounted
 
 		Imf::Int64 m_version;
 
+		Codec m_indexCodec;
+		Codec m_dataCodec;
+
 		bool m_hasChanged;
 
 		Imf::Int64 m_offset;
@@ -666,6 +950,36 @@ class StreamIndexedIO::Index : public RefCounted
 		typedef std::map< std::pair<MurmurHash,unsigned int>, Imf::Int64 > HashToDataMap;
 		HashToDataMap m_hashToDataMap;
 
+		/// maps the hash of the uncompressed data to the offset and size of the compressed block,
+		/// so we don't need to compress data before finding out it has already been written.
+		typedef std::map< std::pair<MurmurHash,unsigned int>, std::pair<Imf::Int64, Imf::Int64> > HashToCompressedDataMap;
+		HashToCompressedDataMap m_hashToCompressedDataMap;
+
+		/// temporary buffers used for compression.
+		std::vector<char> m_compressionBuffer;
+		/// guarded by the StreamFile mutex.
+		std::vector<char> m_decompressionBuffer;
+
+		/// per-thread buffers used by readData(), so that concurrent reads don't contend on the StreamFile::ioBuffer().
+		/// They are only shrunk to g_maxRetainedReadBufferSize on the next read, because readData() returns a pointer into them.
+		struct ReadBuffers
+		{
+			std::vector<char> block;
+			std::vector<char> data;
+		};
+		typedef tbb::enumerable_thread_specific<ReadBuffers> ReadBuffersPerThread;
+		ReadBuffersPerThread m_readBuffers;
+
+		/// per-thread buffers used by writeData() and writeBuffer(), so that concurrent writes only contend
+		/// while appending to the file.
+		struct WriteBuffers
+		{
+			std::vector<char> data;
+			std::vector<char> compression;
+		};
+		typedef tbb::enumerable_thread_specific<WriteBuffers> WriteBuffersPerThread;
+		WriteBuffersPerThread m_writeBuffers;
+
 		StringCache m_stringCache;
 
 		StreamIndexedIO::StreamFilePtr m_stream;
@@ -693,6 +1007,12 @@ class StreamIndexedIO::Index : public RefCounted
 
 		void deallocateWalk( NodeBase* n );
 
+		size_t memoryUsageWalk( const DirectoryNode *n ) const;
+
+		/// Returns a block from the file, either directly from memory mapped files or
+		/// read into the given buffer.
+		const char *readBlock( Imf::Int64 offset, Imf::Int64 size, std::vector<char> &buffer );
+
 		/// Write the index to the file stream
 		Imf::Int64 write();
 
@@ -953,6 +1273,9 @@ DirectoryNode* StreamIndexedIO::Node::addChild( const IndexedIO::EntryID &childN
 		throw Exception( "Cannot modify the file at current location! It was already committed to the file." );
 	}
 
+	// guards the directory, the string cache and the index state against concurrent writers
+	StreamFile::MutexLock lock( m_idx->m_stream->mutex() );
+
 	if ( hasChild(childName) )
 	{
 		return nullptr;
@@ -979,6 +1302,8 @@ void StreamIndexedIO::Node::addDataChild( const IndexedIO::EntryID &childName, I
 		throw Exception( "Cannot modify the file at current location! It was already committed to the file." );
 	}
 
+	StreamFile::MutexLock lock( m_idx->m_stream->mutex() );
+
 	if ( hasChild(childName) )
 	{
 		throw IOException( "StreamIndexedIO: Could not insert node '" + childName.value() + "' into index" );
@@ -1049,6 +1374,8 @@ void StreamIndexedIO::Node::childNames( IndexedIO::EntryIDList &names, IndexedIO
 
 void StreamIndexedIO::Node::removeChild( const IndexedIO::EntryID &childName, bool throwException )
 {
+	StreamFile::MutexLock lock( m_idx->m_stream->mutex() );
+
 	DirectoryNode::ChildMap::iterator it = m_node->findChild( childName );
 	if ( it == m_node->children().end() )
 	{
@@ -1078,9 +1405,14 @@ void StreamIndexedIO::Node::removeChild( const IndexedIO::EntryID &childName, bo
 //
 ///////////////////////////////////////////////
 
-StreamIndexedIO::Index::Index( StreamIndexedIO::StreamFilePtr stream ) : m_root(nullptr), m_version(g_currentVersion), m_hasChanged(false), m_offset(0), m_next(0), m_stream(stream)
+StreamIndexedIO::Index::Index( StreamIndexedIO::StreamFilePtr stream, Codec indexCodec, Codec dataCodec ) : m_root(nullptr), m_version(g_currentVersion), m_indexCodec(indexCodec), m_dataCodec(dataCodec), m_hasChanged(false), m_offset(0), m_next(0), m_stream(stream)
 {
 	m_stringCache.add(IndexedIO::rootName);
+
+	if ( m_indexCodec == GzipCodec && m_dataCodec == NoCodec )
+	{
+		m_version = g_gzipIndexVersion;
+	}
 }
 
 StreamIndexedIO::Index::~Index()
@@ -1131,12 +1463,41 @@ void StreamIndexedIO::Index::openStream()
 		Imf::Int64 magicNumber = 0;
 		readLittleEndian( f,magicNumber );
 
+		m_indexCodec = GzipCodec;
+		m_dataCodec = NoCodec;
+
 		if ( magicNumber == g_versionedMagicNumber )
 		{
-			end -= 3*sizeof(Imf::Int64);
-			f.seekg( end, std::ios::beg );
-			readLittleEndian( f,m_offset );
+			f.seekg( end-2*sizeof(Imf::Int64), std::ios::beg );
 			readLittleEndian( f,m_version );
+
+			if ( m_version >= 6 )
+			{
+				end -= 4*sizeof(Imf::Int64);
+				f.seekg( end, std::ios::beg );
+				readLittleEndian( f,m_offset );
+
+				Imf::Int64 codecs = 0;
+				readLittleEndian( f,codecs );
+				m_indexCodec = static_cast<Codec>( codecs & 0xff );
+				m_dataCodec = static_cast<Codec>( ( codecs >> 8 ) & 0xff );
+
+				if ( !codecAvailable( m_indexCodec ) || !codecAvailable( m_dataCodec ) )
+				{
+					throw IOException(
+						boost::str(
+							boost::format( "File uses %s index compression and %s data compression, which are not supported by this build" ) %
+							codecName( m_indexCodec ) % codecName( m_dataCodec )
+						)
+					);
+				}
+			}
+			else
+			{
+				end -= 3*sizeof(Imf::Int64);
+				f.seekg( end, std::ios::beg );
+				readLittleEndian( f,m_offset );
+			}
 		}
 		else if (magicNumber == g_unversionedMagicNumber )
 		{
@@ -1152,7 +1513,23 @@ void StreamIndexedIO::Index::openStream()
 
 		f.seekg( m_offset, std::ios::beg );
 
-		if (m_version >= 2 )
+		if ( m_version >= 6 )
+		{
+			std::vector<char> block( end - m_offset );
+			f.read( &block[0], block.size() );
+
+			size_t rawSize = blockRawSize<Imf::Int64>( &block[0], block.size() );
+			char *index = new char[ rawSize ];
+			MemoryStreamSource source( index, rawSize, true );
+			decodeBlock<Imf::Int64>( m_indexCodec, &block[0], block.size(), index, rawSize );
+
+			io::filtering_istream indexStream;
+			indexStream.push( source );
+			assert( indexStream.is_complete() );
+
+			read( indexStream );
+		}
+		else if (m_version >= 2 )
 		{
 			io::filtering_istream decompressingStream;
 			char *compressedIndex = new char[ end - m_offset ];
@@ -1187,11 +1564,70 @@ StreamIndexedIO::StringCache &StreamIndexedIO::Index::stringCache()
 	return m_stringCache;
 }
 
+size_t StreamIndexedIO::Index::memoryUsage() const
+{
+	return sizeof( Index ) + m_stringCache.memoryUsage() + memoryUsageWalk( m_root );
+}
+
+size_t StreamIndexedIO::Index::memoryUsageWalk( const DirectoryNode *n ) const
+{
+	DirectoryNode *dn = const_cast<DirectoryNode *>( n );
+	size_t result = sizeof( DirectoryNode );
+	std::vector<const DirectoryNode *> childDirectories;
+
+	{
+		// Subindexes may be loaded concurrently by readers, replacing
+		// SubIndexNodes with DirectoryNodes, so we must lock the directory.
+		// We don't visit the child directories until the lock is released,
+		// because they may share the same mutex.
+		MutexLock lock;
+		lockDirectory( lock, n );
+
+		result += dn->children().capacity() * sizeof( NodeBase * );
+		for( DirectoryNode::ChildMap::const_iterator it = dn->children().begin(); it != dn->children().end(); ++it )
+		{
+			switch( (*it)->nodeType() )
+			{
+				case NodeBase::Directory :
+					childDirectories.push_back( static_cast<const DirectoryNode *>( *it ) );
+					break;
+				case NodeBase::Data :
+					result += sizeof( DataNode );
+					break;
+				case NodeBase::SmallData :
+					result += sizeof( SmallDataNode );
+					break;
+				case NodeBase::SubIndex :
+					result += sizeof( SubIndexNode );
+					break;
+				default :
+					break;
+			}
+		}
+	}
+
+	for( std::vector<const DirectoryNode *>::const_iterator it = childDirectories.begin(); it != childDirectories.end(); ++it )
+	{
+		result += memoryUsageWalk( *it );
+	}
+	return result;
+}
+
 StreamIndexedIO::StreamFile &StreamIndexedIO::Index::streamFile() const
 {
 	return *m_stream;
 }
 
+StreamIndexedIO::Codec StreamIndexedIO::Index::indexCodec() const
+{
+	return m_indexCodec;
+}
+
+StreamIndexedIO::Codec StreamIndexedIO::Index::dataCodec() const
+{
+	return m_dataCodec;
+}
+
 template < typename F >
 NodeBase *StreamIndexedIO::Index::readNodeV4( F &f )
 {
@@ -1597,7 +2033,10 @@ Imf::Int64 StreamIndexedIO::Index::write()
 
 	MemoryStreamSink sink;
 	io::filtering_ostream compressingStream;
-	compressingStream.push( io::gzip_compressor() );
+	if ( m_version < 6 )
+	{
+		compressingStream.push( io::gzip_compressor() );
+	}
 	compressingStream.push( sink );
 	assert( compressingStream.is_complete() );
 
@@ -1619,8 +2058,7 @@ Imf::Int64 StreamIndexedIO::Index::write()
 	}
 
 	/// To synchronize/close, etc.
-	compressingStream.pop();
-	compressingStream.pop();
+	compressingStream.reset();
 
 	char *data=nullptr;
 	std::streamsize sz;
@@ -1628,10 +2066,23 @@ Imf::Int64 StreamIndexedIO::Index::write()
 	assert( data );
 	assert( sz > 0 );
 
-	f.write( data, sz );
+	if ( m_version >= 6 )
+	{
+		encodeBlock<Imf::Int64>( m_indexCodec, data, sz, m_compressionBuffer );
+		f.write( &m_compressionBuffer[0], m_compressionBuffer.size() );
+
+		Imf::Int64 codecs = m_indexCodec | ( m_dataCodec << 8 );
+		writeLittleEndian( f, m_offset );
+		writeLittleEndian( f, codecs );
+		writeLittleEndian( f, g_currentVersion );
+	}
+	else
+	{
+		f.write( data, sz );
 
-	writeLittleEndian( f, m_offset );
-	writeLittleEndian( f, g_currentVersion );
+		writeLittleEndian( f, m_offset );
+		writeLittleEndian( f, g_gzipIndexVersion );
+	}
 	writeLittleEndian( f, g_versionedMagicNumber );
 
 	m_hasChanged = false;
@@ -1835,6 +2286,8 @@ void StreamIndexedIO::Index::addFreePage(  Imf::Int64 offset, Imf::Int64 sz )
 
 Imf::Int64 StreamIndexedIO::Index::writeUniqueData( const char *data, size_t size, bool prefixSize )
 {
+	StreamFile::MutexLock lock( m_stream->mutex() );
+
 	m_hasChanged = true;
 
 	/// Find next writable location
@@ -1882,6 +2335,116 @@ Imf::Int64 StreamIndexedIO::Index::writeUniqueData( const char *data, size_t siz
 	return loc;
 }
 
+Imf::Int64 StreamIndexedIO::Index::writeData( const char *data, size_t size, Imf::Int64 &storedSize )
+{
+	if ( m_dataCodec == NoCodec )
+	{
+		storedSize = size;
+		return writeUniqueData( data, size );
+	}
+
+	MurmurHash hash;
+	hash.append( data, size );
+	const HashToCompressedDataMap::key_type key( hash, size );
+
+	{
+		StreamFile::MutexLock lock( m_stream->mutex() );
+		HashToCompressedDataMap::const_iterator it = m_hashToCompressedDataMap.find( key );
+		if ( it != m_hashToCompressedDataMap.end() )
+		{
+			storedSize = it->second.second;
+			return it->second.first;
+		}
+	}
+
+	// compress outside the lock, so that concurrent writers only serialise on the append.
+	std::vector<char> &compressionBuffer = m_writeBuffers.local().compression;
+	encodeBlock<uint32_t>( m_dataCodec, data, size, compressionBuffer );
+
+	StreamFile::MutexLock lock( m_stream->mutex() );
+	std::pair< HashToCompressedDataMap::iterator,bool > ret = m_hashToCompressedDataMap.insert(
+		HashToCompressedDataMap::value_type( key, std::pair<Imf::Int64, Imf::Int64>( 0, 0 ) )
+	);
+	if ( ret.second )
+	{
+		// another thread may have written the same data while we were compressing it
+		ret.first->second.first = writeUniqueData( &compressionBuffer[0], compressionBuffer.size() );
+		ret.first->second.second = compressionBuffer.size();
+	}
+
+	storedSize = ret.first->second.second;
+	return ret.first->second.first;
+}
+
+char *StreamIndexedIO::Index::writeBuffer( size_t size )
+{
+	std::vector<char> &buffer = m_writeBuffers.local().data;
+	if ( buffer.size() < size )
+	{
+		buffer.resize( size );
+	}
+	return buffer.data();
+}
+
+const char *StreamIndexedIO::Index::readBlock( Imf::Int64 offset, Imf::Int64 size, std::vector<char> &buffer )
+{
+	if ( const char *mapped = m_stream->mappedData( offset, size ) )
+	{
+		return mapped;
+	}
+
+	char *data = resizeReadBuffer( buffer, size );
+	if ( !m_stream->readAt( data, size, offset ) )
+	{
+		StreamFile::MutexLock lock( m_stream->mutex() );
+		m_stream->seekg( offset, std::ios::beg );
+		m_stream->read( data, size );
+	}
+	return data;
+}
+
+const char *StreamIndexedIO::Index::readData( Imf::Int64 offset, Imf::Int64 size, Imf::Int64 &rawSize )
+{
+	ReadBuffers &buffers = m_readBuffers.local();
+	const char *block = readBlock( offset, size, buffers.block );
+
+	if ( m_dataCodec == NoCodec )
+	{
+		rawSize = size;
+		return block;
+	}
+
+	rawSize = blockRawSize<uint32_t>( block, size );
+	char *data = resizeReadBuffer( buffers.data, rawSize );
+	decodeBlock<uint32_t>( m_dataCodec, block, size, data, rawSize );
+	return data;
+}
+
+void StreamIndexedIO::Index::readData( Imf::Int64 offset, Imf::Int64 size, char *buffer, Imf::Int64 rawSize )
+{
+	if ( m_dataCodec == NoCodec )
+	{
+		if ( const char *mapped = m_stream->mappedData( offset, size ) )
+		{
+			memcpy( buffer, mapped, size );
+		}
+		else if ( !m_stream->readAt( buffer, size, offset ) )
+		{
+			StreamFile::MutexLock lock( m_stream->mutex() );
+			m_stream->seekg( offset, std::ios::beg );
+			m_stream->read( buffer, size );
+		}
+		return;
+	}
+
+	const char *block = readBlock( offset, size, m_readBuffers.local().block );
+	if ( blockRawSize<uint32_t>( block, size ) != (size_t)rawSize )
+	{
+		throw IOException( "StreamIndexedIO: Unexpected size for compressed data block." );
+	}
+	decodeBlock<uint32_t>( m_dataCodec, block, size, buffer, rawSize );
+}
+
 void StreamIndexedIO::Index::deallocateWalk( NodeBase* n )
 {
 	assert(n);
@@ -1915,22 +2478,34 @@ void StreamIndexedIO::Index::commitNodeToSubIndex( DirectoryNode *n )
 		return;
 	}
 
+	StreamFile::MutexLock lock( m_stream->mutex() );
+
 	if ( n->subindex() == DirectoryNode::NoSubIndex )
 	{
 		MemoryStreamSink sink;
 		io::filtering_ostream compressingStream;
-		compressingStream.push( io::gzip_compressor() );
+		if ( m_version < 6 )
+		{
+			compressingStream.push( io::gzip_compressor() );
+		}
 		compressingStream.push( sink );
 		assert( compressingStream.is_complete() );
 
 		writeNodeChildren( n, compressingStream );
 
-		compressingStream.pop();
-		compressingStream.pop();
+		compressingStream.reset();
 
 		char *data=nullptr;
 		std::streamsize sz;
 		sink.get( data, sz );
+
+		if ( m_version >= 6 )
+		{
+			encodeBlock<uint32_t>( m_indexCodec, data, sz, m_compressionBuffer );
+			data = &m_compressionBuffer[0];
+			sz = m_compressionBuffer.size();
+		}
+
 		uint32_t subindexSize = sz;
 
 		// tell the Directory node that it's contents have been written as a subindex
@@ -1956,9 +2531,21 @@ void StreamIndexedIO::Index::readNodeFromSubIndex( DirectoryNode *n )
 	char *data = m_stream->ioBuffer(subindexSize);
 	m_stream->read( data, subindexSize );
 
+	if ( m_version >= 6 )
+	{
+		size_t rawSize = blockRawSize<uint32_t>( data, subindexSize );
+		m_decompressionBuffer.resize( rawSize );
+		decodeBlock<uint32_t>( m_indexCodec, data, subindexSize, &m_decompressionBuffer[0], rawSize );
+		data = &m_decompressionBuffer[0];
+		subindexSize = rawSize;
+	}
+
 	io::filtering_istream decompressingStream;
 	MemoryStreamSource source( data, subindexSize, false );
-	decompressingStream.push( io::gzip_decompressor() );
+	if ( m_version < 6 )
+	{
+		decompressingStream.push( io::gzip_decompressor() );
+	}
 	decompressingStream.push( source );
 	assert( decompressingStream.is_complete() );
 
@@ -2003,7 +2590,7 @@ void StreamIndexedIO::Index::lockDirectory( MutexLock &lock, const DirectoryNode
 //
 ///////////////////////////////////////////////
 
-StreamIndexedIO::StreamFile::StreamFile( IndexedIO::OpenMode mode ) : m_openmode(mode), m_stream(nullptr), m_ioBufferLen(0), m_ioBuffer(nullptr)
+StreamIndexedIO::StreamFile::StreamFile( IndexedIO::OpenMode mode ) : m_openmode(mode), m_stream(nullptr), m_mappedData(nullptr), m_mappedSize(0), m_ioBufferLen(0), m_ioBuffer(nullptr)
 {
 	IndexedIO::validateOpenMode(m_openmode);
 }
@@ -2050,6 +2637,37 @@ char *StreamIndexedIO::StreamFile::ioBuffer( unsigned long size )
 	return m_ioBuffer;
 }
 
+void StreamIndexedIO::StreamFile::setMappedData( const char *data, size_t size )
+{
+	m_mappedData = data;
+	m_mappedSize = size;
+}
+
+const char *StreamIndexedIO::StreamFile::mappedData( Imf::Int64 pos, size_t size ) const
+{
+	if ( !m_mappedData )
+	{
+		return nullptr;
+	}
+
+	if ( pos + size > m_mappedSize )
+	{
+		throw IOException( "StreamIndexedIO: Attempt to read beyond the end of the file." );
+	}
+
+	return m_mappedData + pos;
+}
+
+bool StreamIndexedIO::StreamFile::readAt( char *buffer, size_t size, Imf::Int64 pos )
+{
+	if ( const char *mapped = mappedData( pos, size ) )
+	{
+		memcpy( buffer, mapped, size );
+		return true;
+	}
+	return false;
+}
+
 StreamIndexedIO::StreamFile::Mutex & StreamIndexedIO::StreamFile::mutex()
 {
 	return m_mutex;
@@ -2137,9 +2755,63 @@ StreamIndexedIO::StreamIndexedIO( StreamIndexedIO::Node &node )
 	m_node = &node;
 }
 
+bool StreamIndexedIO::codecAvailable( Codec codec )
+{
+	switch( codec )
+	{
+		case NoCodec :
+		case GzipCodec :
+			return true;
+		case LZ4Codec :
+#ifdef IECORE_WITH_LZ4
+			return true;
+#else
+			return false;
+#endif
+		case ZstdCodec :
+#ifdef IECORE_WITH_ZSTD
+			return true;
+#else
+			return false;
+#endif
+	}
+	return false;
+}
+
+void StreamIndexedIO::setDefaultCodecs( Codec indexCodec, Codec dataCodec )
+{
+	g_defaultIndexCodec = supportedCodec( indexCodec, "StreamIndexedIO::setDefaultCodecs" );
+	g_defaultDataCodec = supportedCodec( dataCodec, "StreamIndexedIO::setDefaultCodecs" );
+}
+
+StreamIndexedIO::Codec StreamIndexedIO::defaultIndexCodec()
+{
+	return g_defaultIndexCodec;
+}
+
+StreamIndexedIO::Codec StreamIndexedIO::defaultDataCodec()
+{
+	return g_defaultDataCodec;
+}
+
+StreamIndexedIO::Codec StreamIndexedIO::indexCodec() const
+{
+	return m_node->m_idx->indexCodec();
+}
+
+StreamIndexedIO::Codec StreamIndexedIO::dataCodec() const
+{
+	return m_node->m_idx->dataCodec();
+}
+
 void StreamIndexedIO::open( StreamFilePtr file, const IndexedIO::EntryIDList &root )
 {
-	IndexPtr newIndex = new Index( file );
+	open( file, root, g_defaultIndexCodec, g_defaultDataCodec );
+}
+
+void StreamIndexedIO::open( StreamFilePtr file, const IndexedIO::EntryIDList &root, Codec indexCodec, Codec dataCodec )
+{
+	IndexPtr newIndex = new Index( file, supportedCodec( indexCodec, "StreamIndexedIO::open" ), supportedCodec( dataCodec, "StreamIndexedIO::open" ) );
 	newIndex->openStream();
 	m_node = new StreamIndexedIO::Node( newIndex.get(), newIndex->root() );
 	setRoot( root );
@@ -2215,6 +2887,11 @@ IndexedIO::OpenMode StreamIndexedIO::openMode() const
 	return streamFile().openMode();
 }
 
+size_t StreamIndexedIO::memoryUsage() const
+{
+	return m_node->m_idx->memoryUsage();
+}
+
 const IndexedIO::EntryID &StreamIndexedIO::currentEntryId() const
 {
 	return m_node->name();
@@ -2462,23 +3139,27 @@ void StreamIndexedIO::write(const IndexedIO::EntryID &name, const InternedString
 	unsigned long size = IndexedIO::DataSizeTraits<Imf::Int64 *>::size(constIds, arrayLength);
 	IndexedIO::DataType dataType = IndexedIO::InternedStringArray;
 
-	char *data = streamFile().ioBuffer(size);
-	assert(data);
-
 	Index *index = m_node->m_idx.get();
 
+	char *data = index->writeBuffer(size);
+	assert(data);
+
 	StringCache &stringCache = index->stringCache();
 
-	for ( unsigned long i = 0; i < arrayLength; i++ )
 	{
-		ids[i] = stringCache.find( x[i], false /* create entry if missing */ );
+		StreamFile::MutexLock lock( streamFile().mutex() );
+		for ( unsigned long i = 0; i < arrayLength; i++ )
+		{
+			ids[i] = stringCache.find( x[i], false /* create entry if missing */ );
+		}
 	}
 
 	IndexedIO::DataFlattenTraits<Imf::Int64*>::flatten(constIds, arrayLength, data);
 
-	size_t offset = index->writeUniqueData( data, size );
+	Imf::Int64 storedSize = 0;
+	size_t offset = index->writeData( data, size, storedSize );
 
-	m_node->addDataChild( name, dataType, arrayLength, offset, size );
+	m_node->addDataChild( name, dataType, arrayLength, offset, storedSize );
 
 	delete [] ids;
 }
@@ -2497,19 +3178,12 @@ void StreamIndexedIO::read(const IndexedIO::EntryID &name, InternedString *&x, u
 
 	Imf::Int64 *ids = new Imf::Int64[arrayLength];
 
-	StreamIndexedIO::StreamFile &f = streamFile();
-	{
-		StreamFile::MutexLock lock( f.mutex() );
-		f.seekg( dataOffset, std::ios::beg );
-
 #ifdef IE_CORE_LITTLE_ENDIAN
-		// raw read
-		f.read( (char*)ids, dataSize );
-	}
+	// raw read
+	m_node->m_idx->readData( dataOffset, dataSize, (char*)ids, arrayLength * sizeof( Imf::Int64 ) );
 #else
-		char *data = f.ioBuffer(dataSize);
-		f.read( data, dataSize );
-	}
+	Imf::Int64 rawSize = 0;
+	const char *data = m_node->m_idx->readData( dataOffset, dataSize, rawSize );
 	IndexedIO::DataFlattenTraits<Imf::Int64*>::unflatten( data, ids, arrayLength );
 #endif
 
@@ -2535,13 +3209,14 @@ void StreamIndexedIO::write(const IndexedIO::EntryID &name, const T *x, unsigned
 	unsigned long size = IndexedIO::DataSizeTraits<T*>::size(x, arrayLength);
 	IndexedIO::DataType dataType = IndexedIO::DataTypeTraits<T*>::type();
 
-	char *data = streamFile().ioBuffer(size);
+	char *data = m_node->m_idx->writeBuffer(size);
 	assert(data);
 	IndexedIO::DataFlattenTraits<T*>::flatten(x, arrayLength, data);
 
-	Imf::Int64 offset = m_node->m_idx->writeUniqueData( data, size );
+	Imf::Int64 storedSize = 0;
+	Imf::Int64 offset = m_node->m_idx->writeData( data, size, storedSize );
 
-	m_node->addDataChild( name, dataType, arrayLength, offset, size );
+	m_node->addDataChild( name, dataType, arrayLength, offset, storedSize );
 }
 
 template<typename T>
@@ -2553,9 +3228,10 @@ void StreamIndexedIO::rawWrite(const IndexedIO::EntryID &name, const T *x, unsig
 	unsigned long size = IndexedIO::DataSizeTraits<T*>::size(x, arrayLength);
 	IndexedIO::DataType dataType = IndexedIO::DataTypeTraits<T*>::type();
 
-	Imf::Int64 offset =  m_node->m_idx->writeUniqueData( (char*)x, size );
+	Imf::Int64 storedSize = 0;
+	Imf::Int64 offset =  m_node->m_idx->writeData( (char*)x, size, storedSize );
 
-	m_node->addDataChild( name, dataType, arrayLength, offset, size );
+	m_node->addDataChild( name, dataType, arrayLength, offset, storedSize );
 }
 
 template<typename T>
@@ -2567,13 +3243,14 @@ void StreamIndexedIO::write(const IndexedIO::EntryID &name, const T &x)
 	unsigned long size = IndexedIO::DataSizeTraits<T>::size(x);
 	IndexedIO::DataType dataType = IndexedIO::DataTypeTraits<T>::type();
 
-	char *data = streamFile().ioBuffer(size);
+	char *data = m_node->m_idx->writeBuffer(size);
 	assert(data);
 	IndexedIO::DataFlattenTraits<T>::flatten(x, data);
 
-	Imf::Int64 offset =  m_node->m_idx->writeUniqueData( data, size );
+	Imf::Int64 storedSize = 0;
+	Imf::Int64 offset =  m_node->m_idx->writeData( data, size, storedSize );
 
-	m_node->addDataChild( name, dataType, 0, offset, size );
+	m_node->addDataChild( name, dataType, 0, offset, storedSize );
 }
 
 template<typename T>
@@ -2585,9 +3262,10 @@ void StreamIndexedIO::rawWrite(const IndexedIO::EntryID &name, const T &x)
 	unsigned long size = IndexedIO::DataSizeTraits<T>::size(x);
 	IndexedIO::DataType dataType = IndexedIO::DataTypeTraits<T>::type();
 
-	Imf::Int64 offset = m_node->m_idx->writeUniqueData( (char*)&x, size );
+	Imf::Int64 storedSize = 0;
+	Imf::Int64 offset = m_node->m_idx->writeData( (char*)&x, size, storedSize );
 
-	m_node->addDataChild( name, dataType, 0, offset, size );
+	m_node->addDataChild( name, dataType, 0, offset, storedSize );
 }
 
 template<typename T>
@@ -2603,14 +3281,9 @@ void StreamIndexedIO::read(const IndexedIO::EntryID &name, T *&x, unsigned long
 		throw IOException( "StreamIndexedIO::read: Data entry not found '" + name.value() + "'" );
 	}
 
-	StreamIndexedIO::StreamFile &f = streamFile();
-	{
-		StreamFile::MutexLock lock( f.mutex() );
-		char *data = f.ioBuffer(dataSize);
-		f.seekg( dataOffset, std::ios::beg );
-		f.read( data, dataSize );
-		IndexedIO::DataFlattenTraits<T*>::unflatten( data, x, arrayLength );
-	}
+	Imf::Int64 rawSize = 0;
+	const char *data = m_node->m_idx->readData( dataOffset, dataSize, rawSize );
+	IndexedIO::DataFlattenTraits<T*>::unflatten( data, x, arrayLength );
 }
 
 template<typename T>
@@ -2631,12 +3304,7 @@ void StreamIndexedIO::rawRead(const IndexedIO::EntryID &name, T *&x, unsigned lo
 		x = new T[arrayLength];
 	}
 
-	StreamIndexedIO::StreamFile &f = streamFile();
-	{
-		StreamFile::MutexLock lock( f.mutex() );
-		f.seekg( dataOffset, std::ios::beg );
-		f.read( (char*)x, dataSize );
-	}
+	m_node->m_idx->readData( dataOffset, dataSize, (char*)x, arrayLength * sizeof( T ) );
 }
 
 template<typename T>
@@ -2652,14 +3320,9 @@ void StreamIndexedIO::read(const IndexedIO::EntryID &name, T &x) const
 		throw IOException( "StreamIndexedIO::read Data entry not found '" + name.value() + "'" );
 	}
 
-	StreamIndexedIO::StreamFile &f = streamFile();
-	{
-		StreamFile::MutexLock lock( f.mutex() );
-		char *data = f.ioBuffer(dataSize);
-		f.seekg( dataOffset, std::ios::beg );
-		f.read( data, dataSize );
-		IndexedIO::DataFlattenTraits<T>::unflatten( data, x );
-	}
+	Imf::Int64 rawSize = 0;
+	const char *data = m_node->m_idx->readData( dataOffset, dataSize, rawSize );
+	IndexedIO::DataFlattenTraits<T>::unflatten( data, x );
 }
 
 template<typename T>
@@ -2675,12 +3338,7 @@ void StreamIndexedIO::rawRead(const IndexedIO::EntryID &name, T &x) const
 		throw IOException( "StreamIndexedIO::rawRead: Data entry not found '" + name.value() + "'" );
 	}
 
-	StreamIndexedIO::StreamFile &f = streamFile();
-	{
-		StreamFile::MutexLock lock( f.mutex() );
-		f.seekg( dataOffset, std::ios::beg );
-		f.read( (char*)&x, dataSize );
-	}
+	m_node->m_idx->readData( dataOffset, dataSize, (char*)&x, sizeof( T ) );
 }
 
 #ifdef IE_CORE_LITTLE_ENDIAN
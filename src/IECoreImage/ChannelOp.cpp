@@ -36,6 +36,7 @@
 
 #include "IECoreImage/ImagePrimitive.h"
 #include "IECoreImage/ImagePrimitiveParameter.h"
+#include "IECoreImage/TiledChannelData.h"
 
 #include "IECore/CompoundParameter.h"
 #include "IECore/DespatchTypedData.h"
@@ -92,6 +93,7 @@ void ChannelOp::modify( Object * primitive, const CompoundObject * operands )
 	}
 
 	ChannelVector channels;
+	vector<size_t> tiledChannels;
 
 	const vector<string> &channelNames = channelNamesParameter()->getTypedValue();
 	for( const auto &name : channelNames )
@@ -102,6 +104,15 @@ void ChannelOp::modify( Object * primitive, const CompoundObject * operands )
 			throw Exception( str( format( "Channel \"%s\" is invalid: " ) % name ) + reason );
 		}
 
+		// Derived classes expect contiguous pixels, so tiled
+		// channels are expanded here and retiled afterwards.
+		if( const TiledChannelData *tiledData = runTimeCast<const TiledChannelData>( image->channels[name].get() ) )
+		{
+			channels.push_back( tiledData->readable().pixels() );
+			tiledChannels.push_back( channels.size() - 1 );
+			continue;
+		}
+
 		if( !image->channels[name]->isInstanceOf( FloatVectorData::staticTypeId() ) )
 		{
 			throw Exception( str( format( "Channel \"%s\" is invalid: not a float vector." ) % name ) );
@@ -111,5 +122,10 @@ void ChannelOp::modify( Object * primitive, const CompoundObject * operands )
 	}
 
 	modifyChannels( image->getDisplayWindow(), image->getDataWindow(), channels );
+
+	for( const auto &i : tiledChannels )
+	{
+		image->channels[channelNames[i]] = new TiledChannelData( TiledChannel( image->getDataWindow(), channels[i]->readable() ) );
+	}
 	/// \todo Consider cases where the derived class invalidates the channel data (by changing its length)
 }
@@ -36,6 +36,9 @@
 
 #include "IECore/CompoundParameter.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace std;
 using namespace IECore;
 using namespace IECoreImage;
@@ -169,10 +172,17 @@ void ClampOp::modifyChannels( const Imath::Box2i &displayWindow, const Imath::Bo
 	for( unsigned i=0; i<channels.size(); i++ )
 	{
 		vector<float> &channel = channels[i]->writable();
-		for( vector<float>::iterator it = channel.begin(), eIt = channel.end(); it != eIt; it++ )
-		{
-			*it = *it < minValue ? minTo : ( *it > maxValue ? maxTo : *it );
-		}
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, channel.size(), 4096 ),
+			[&channel, minValue, maxValue, minTo, maxTo]( const tbb::blocked_range<size_t> &range )
+			{
+				for( size_t j = range.begin(); j != range.end(); ++j )
+				{
+					float &v = channel[j];
+					v = v < minValue ? minTo : ( v > maxValue ? maxTo : v );
+				}
+			}
+		);
 	}
 }
 
@@ -44,6 +44,8 @@
 #include "boost/asio.hpp"
 #include "boost/bind.hpp"
 
+#include "zlib.h"
+
 using namespace std;
 using boost::asio::ip::tcp;
 using namespace boost;
@@ -55,7 +57,7 @@ class ClientDisplayDriver::PrivateData : public RefCounted
 {
 	public :
 		PrivateData() :
-		m_service(), m_host(""), m_port(""), m_scanLineOrderOnly(false), m_acceptsRepeatedData(false), m_socket( m_service )
+		m_service(), m_host(""), m_port(""), m_scanLineOrderOnly(false), m_acceptsRepeatedData(false), m_compression(false), m_socket( m_service )
 		{
 		}
 
@@ -69,6 +71,8 @@ class ClientDisplayDriver::PrivateData : public RefCounted
 		std::string m_port;
 		bool m_scanLineOrderOnly;
 		bool m_acceptsRepeatedData;
+		bool m_compression;
+		std::vector<char> m_compressionBuffer;
 		boost::asio::ip::tcp::socket m_socket;
 };
 
@@ -87,6 +91,11 @@ ClientDisplayDriver::ClientDisplayDriver( const Imath::Box2i &displayWindow, con
 	m_data->m_host = displayHostData->readable();
 	m_data->m_port = displayPortData->readable();
 
+	if( const BoolData *compressionData = parameters->member<BoolData>( "displayCompression" ) )
+	{
+		m_data->m_compression = compressionData->readable();
+	}
+
 	tcp::resolver resolver(m_data->m_service);
 	tcp::resolver::query query(m_data->m_host, m_data->m_port);
 
@@ -198,6 +207,27 @@ size_t ClientDisplayDriver::receiveHeader( int msg )
 
 void ClientDisplayDriver::imageData( const Box2i &box, const float *data, size_t dataSize )
 {
+	if( m_data->m_compression )
+	{
+		const uint32_t rawSize = dataSize * sizeof( float );
+		uLongf compressedSize = compressBound( rawSize );
+		m_data->m_compressionBuffer.resize( compressedSize );
+		if( compress2( reinterpret_cast<Bytef *>( &m_data->m_compressionBuffer[0] ), &compressedSize, reinterpret_cast<const Bytef *>( data ), rawSize, Z_BEST_SPEED ) != Z_OK )
+		{
+			throw Exception( "Failed to compress image data." );
+		}
+
+		sendHeader( DisplayDriverServerHeader::compressedImageData, sizeof( box ) + sizeof( rawSize ) + compressedSize );
+
+		boost::array<boost::asio::const_buffer, 3> buffers = { {
+			boost::asio::buffer( &box, sizeof( box ) ),
+			boost::asio::buffer( &rawSize, sizeof( rawSize ) ),
+			boost::asio::buffer( &m_data->m_compressionBuffer[0], compressedSize )
+		} };
+		boost::asio::write( m_data->m_socket, buffers );
+		return;
+	}
+
 	sendHeader( DisplayDriverServerHeader::imageData, sizeof( box ) + dataSize * sizeof( float ) );
 
 	boost::array<boost::asio::const_buffer, 2> buffers = { {
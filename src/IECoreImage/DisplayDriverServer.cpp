@@ -34,6 +34,7 @@
 
 #include "IECoreImage/DisplayDriverServer.h"
 
+#include "IECoreImage/Private/BucketCoalescing.h"
 #include "IECoreImage/Private/DisplayDriverServerHeader.h"
 
 #include "IECore/MemoryIndexedIO.h"
@@ -43,7 +44,14 @@
 #include "boost/asio.hpp"
 #include "boost/bind.hpp"
 
-#include "tbb/tbb_thread.h"
+#include "tbb/spin_mutex.h"
+#include "tbb/tick_count.h"
+
+#include "zlib.h"
+
+#include <algorithm>
+#include <cstdint>
+#include <thread>
 
 #include <fcntl.h>
 #ifndef _MSC_VER
@@ -57,30 +65,15 @@ using namespace IECoreImage;
 
 IE_CORE_DEFINERUNTIMETYPED( DisplayDriverServer );
 
-class DisplayDriverServer::Session : public RefCounted
+namespace
 {
-	public:
-
-		Session( boost::asio::io_service& io_service );
-		~Session() override;
-
-		boost::asio::ip::tcp::socket& socket();
-		void start();
-
-	private:
 
-		void handleReadHeader( const boost::system::error_code& error );
-		void handleReadOpenParameters( const boost::system::error_code& error );
-		void handleReadDataParameters( const boost::system::error_code& error );
-		void sendResult( DisplayDriverServerHeader::MessageType msg, size_t dataSize );
-		void sendException( const char *message );
+// Once this many bytes are queued for a session, we stop reading from
+// its socket until the queue has been taken for processing, so that
+// a fast client can't make us buffer an unbounded amount of data.
+const size_t g_maxQueuedBytes = 64 * 1024 * 1024;
 
-	private:
-		boost::asio::ip::tcp::socket m_socket;
-		DisplayDriverPtr m_displayDriver;
-		DisplayDriverServerHeader m_header;
-		CharVectorDataPtr m_buffer;
-};
+} // namespace
 
 class DisplayDriverServer::PrivateData : public RefCounted
 {
@@ -91,14 +84,17 @@ class DisplayDriverServer::PrivateData : public RefCounted
 		boost::asio::ip::tcp::endpoint m_endpoint;
 		boost::asio::io_service m_service;
 		boost::asio::ip::tcp::acceptor m_acceptor;
-		tbb::tbb_thread m_thread;
+		std::vector<std::thread> m_threads;
+
+		typedef tbb::spin_mutex StatisticsMutex;
+		StatisticsMutex m_statisticsMutex;
+		Statistics m_statistics;
 
 		PrivateData( int portNumber ) :
 			m_success(false),
 			m_endpoint(tcp::v4(), portNumber),
 			m_service(),
-			m_acceptor( m_service ),
-			m_thread()
+			m_acceptor( m_service )
 		{
 			m_acceptor.open(  m_endpoint.protocol() );
 			m_acceptor.set_option( boost::asio::ip::tcp::acceptor::reuse_address(true));
@@ -113,12 +109,84 @@ class DisplayDriverServer::PrivateData : public RefCounted
 			{
 				m_acceptor.cancel();
 				m_acceptor.close();
-				m_thread.join();
+				for( std::vector<std::thread>::iterator it = m_threads.begin(); it != m_threads.end(); ++it )
+				{
+					it->join();
+				}
 			}
 		}
 
 };
 
+class DisplayDriverServer::Session : public RefCounted
+{
+	public:
+
+		Session( boost::asio::io_service& io_service, PrivateData *serverData );
+		~Session() override;
+
+		boost::asio::ip::tcp::socket& socket();
+		void start();
+
+	private:
+
+		// A bucket as received from the client, with the
+		// message type specifying whether it is compressed.
+		struct Bucket
+		{
+			Bucket( DisplayDriverServerHeader::MessageType type, ConstCharVectorDataPtr data ) : type( type ), data( data ) {}
+			DisplayDriverServerHeader::MessageType type;
+			ConstCharVectorDataPtr data;
+		};
+
+		// A bucket ready to be passed to the display driver. The pixels point
+		// either into the received data or into the storage.
+		struct DecodedBucket
+		{
+			Imath::Box2i box;
+			const float *pixels;
+			size_t size;
+			std::vector<float> storage;
+		};
+
+		void handleReadHeader( const boost::system::error_code& error );
+		void handleReadOpenParameters( const boost::system::error_code& error );
+		void handleReadDataParameters( const boost::system::error_code& error );
+		void readHeader();
+		void sendResult( DisplayDriverServerHeader::MessageType msg, size_t dataSize );
+		void sendException( const char *message );
+
+		// Passes the queued buckets to the display driver until the queue
+		// is empty, and closes the image when requested by the client.
+		// Only one call is active at a time.
+		void processBuckets();
+		void imageData( const std::vector<Bucket> &buckets );
+		void imageClose( const std::string &error );
+
+		// `numChannels` is used to validate the size of compressed data
+		// before it is decompressed.
+		static void decodeBucket( const Bucket &bucket, size_t numChannels, DecodedBucket &result );
+
+	private:
+		boost::asio::ip::tcp::socket m_socket;
+		DisplayDriverPtr m_displayDriver;
+		DisplayDriverServerHeader m_header;
+		CharVectorDataPtr m_buffer;
+		PrivateData *m_serverData;
+
+		typedef tbb::spin_mutex QueueMutex;
+		// guards the members below.
+		QueueMutex m_queueMutex;
+		std::vector<Bucket> m_queue;
+		size_t m_queuedBytes;
+		// set when reading has stopped because the queue is full.
+		bool m_readPaused;
+		bool m_processing;
+		bool m_closeRequested;
+		// set when the display driver fails, after which buckets are discarded.
+		std::string m_error;
+};
+
 /* Set the FD_CLOEXEC flag for the given socket descriptor, so that it will not exist on child processes.*/
 static void fixSocketFlags( int socketDesc )
 {
@@ -131,18 +199,30 @@ static void fixSocketFlags( int socketDesc )
 #endif
 }
 
-DisplayDriverServer::DisplayDriverServer( int portNumber ) :
+DisplayDriverServer::Statistics::Statistics()
+	:	sessions( 0 ), bucketsReceived( 0 ), bytesReceived( 0 ), uncompressedBytesReceived( 0 ), imageDataCalls( 0 ), imageDataTime( 0 )
+{
+}
+
+DisplayDriverServer::DisplayDriverServer( int portNumber, int numThreads ) :
 		m_data( nullptr )
 {
 	m_data = new DisplayDriverServer::PrivateData( portNumber );
 
-	DisplayDriverServer::SessionPtr newSession( new DisplayDriverServer::Session( m_data->m_service ) );
+	DisplayDriverServer::SessionPtr newSession( new DisplayDriverServer::Session( m_data->m_service, m_data.get() ) );
 	m_data->m_acceptor.async_accept( newSession->socket(),
 			boost::bind( &DisplayDriverServer::handleAccept, this, newSession,
 			boost::asio::placeholders::error));
 	fixSocketFlags( m_data->m_acceptor.native() );
-	tbb::tbb_thread newThread( boost::bind(&DisplayDriverServer::serverThread, this) );
-	m_data->m_thread.swap( newThread );
+
+	if( numThreads <= 0 )
+	{
+		numThreads = std::max( 1u, std::thread::hardware_concurrency() );
+	}
+	for( int i = 0; i < numThreads; ++i )
+	{
+		m_data->m_threads.push_back( std::thread( boost::bind( &DisplayDriverServer::serverThread, this ) ) );
+	}
 }
 
 DisplayDriverServer::~DisplayDriverServer()
@@ -154,6 +234,18 @@ int DisplayDriverServer::portNumber()
 	return m_data->m_acceptor.local_endpoint().port();
 }
 
+DisplayDriverServer::Statistics DisplayDriverServer::statistics() const
+{
+	PrivateData::StatisticsMutex::scoped_lock lock( m_data->m_statisticsMutex );
+	return m_data->m_statistics;
+}
+
+void DisplayDriverServer::resetStatistics()
+{
+	PrivateData::StatisticsMutex::scoped_lock lock( m_data->m_statisticsMutex );
+	m_data->m_statistics = Statistics();
+}
+
 void DisplayDriverServer::serverThread()
 {
 	try
@@ -170,10 +262,16 @@ void DisplayDriverServer::handleAccept( DisplayDriverServer::SessionPtr session,
 {
 	if (!error)
 	{
-		DisplayDriverServer::SessionPtr newSession( new DisplayDriverServer::Session( m_data->m_service ) );
+		DisplayDriverServer::SessionPtr newSession( new DisplayDriverServer::Session( m_data->m_service, m_data.get() ) );
 		m_data->m_acceptor.async_accept( newSession->socket(),
 				boost::bind( &DisplayDriverServer::handleAccept,  this, newSession,
 				boost::asio::placeholders::error));
+
+		{
+			PrivateData::StatisticsMutex::scoped_lock lock( m_data->m_statisticsMutex );
+			m_data->m_statistics.sessions++;
+		}
+
 		session->start();
 	}
 }
@@ -182,8 +280,9 @@ void DisplayDriverServer::handleAccept( DisplayDriverServer::SessionPtr session,
  * DisplayDriverServer::Session functions
  */
 
-DisplayDriverServer::Session::Session( boost::asio::io_service& io_service ) :
-	m_socket( io_service ), m_displayDriver(nullptr), m_buffer( new CharVectorData( ) )
+DisplayDriverServer::Session::Session( boost::asio::io_service& io_service, PrivateData *serverData ) :
+	m_socket( io_service ), m_displayDriver(nullptr), m_buffer( new CharVectorData( ) ), m_serverData( serverData ),
+	m_queuedBytes( 0 ), m_readPaused( false ), m_processing( false ), m_closeRequested( false )
 {
 }
 
@@ -225,9 +324,26 @@ void DisplayDriverServer::Session::handleReadHeader( const boost::system::error_
 		return;
 	}
 
+	if ( m_header.messageType() != DisplayDriverServerHeader::imageClose )
+	{
+		// the display driver failed while processing previous buckets, and the
+		// error has already been reported. Closing the socket causes the client
+		// to fail too.
+		QueueMutex::scoped_lock lock( m_queueMutex );
+		if ( !m_error.empty() )
+		{
+			lock.release();
+			m_socket.close();
+			return;
+		}
+	}
+
 	// get number of bytes ahead (unsigned int value)
 	size_t bytesAhead = m_header.getDataSize();
 
+	// we use a new buffer for each message, as the buffers
+	// for imageData messages are queued for processing.
+	m_buffer = new CharVectorData();
 	CharVectorData::ValueType &data = m_buffer->writable();
 	data.resize( bytesAhead );
 
@@ -242,6 +358,7 @@ void DisplayDriverServer::Session::handleReadHeader( const boost::system::error_
 		break;
 
 	case DisplayDriverServerHeader::imageData:
+	case DisplayDriverServerHeader::compressedImageData:
 		boost::asio::async_read( m_socket,
 				boost::asio::buffer( &data[0], bytesAhead ),
 				boost::bind(&DisplayDriverServer::Session::handleReadDataParameters, SessionPtr(this),
@@ -251,26 +368,18 @@ void DisplayDriverServer::Session::handleReadHeader( const boost::system::error_
 	case DisplayDriverServerHeader::imageClose:
 		if ( m_displayDriver )
 		{
-			try
-			{
-				m_displayDriver->imageClose();
-			}
-			catch ( std::exception &e )
-			{
-				msg( Msg::Error, "DisplayDriverServer::Session::handleReadHeader", e.what() );
-				sendException( e.what() );
-				m_socket.close();
-				return;
-			}
-			try
+			// the image is closed once all the queued buckets have been processed.
+			bool startProcessing = false;
 			{
-				sendResult( DisplayDriverServerHeader::imageClose, 0 );
+				QueueMutex::scoped_lock lock( m_queueMutex );
+				m_closeRequested = true;
+				startProcessing = !m_processing;
+				m_processing = true;
 			}
-			catch( std::exception &e )
+			if ( startProcessing )
 			{
-				msg( Msg::Error, "DisplayDriverServer::Session::handleReadHeader", e.what() );
+				processBuckets();
 			}
-			m_socket.close();
 		}
 		else
 		{
@@ -285,7 +394,6 @@ void DisplayDriverServer::Session::handleReadHeader( const boost::system::error_
 		break;
 	}
 }
-
 void DisplayDriverServer::Session::handleReadOpenParameters( const boost::system::error_code& error )
 {
 	if (error)
@@ -353,6 +461,7 @@ void DisplayDriverServer::Session::handleReadOpenParameters( const boost::system
 
 }
 
+
 void DisplayDriverServer::Session::handleReadDataParameters( const boost::system::error_code& error )
 {
 	if (error)
@@ -370,19 +479,45 @@ void DisplayDriverServer::Session::handleReadDataParameters( const boost::system
 		return;
 	}
 
-	try
+	const size_t bytesReceived = m_buffer->readable().size();
+
+	// queue the bucket, and start processing the queue on another
+	// thread if necessary, so we can carry on reading from the socket
+	// while the display driver does its work.
+	bool startProcessing = false;
+	bool pauseReading = false;
+	{
+		QueueMutex::scoped_lock lock( m_queueMutex );
+		m_queue.push_back( Bucket( m_header.messageType(), m_buffer ) );
+		m_queuedBytes += bytesReceived;
+		startProcessing = !m_processing;
+		m_processing = true;
+		// processBuckets() resumes reading when it takes the queue.
+		pauseReading = m_readPaused = m_queuedBytes >= g_maxQueuedBytes;
+	}
+	m_buffer = nullptr;
+
 	{
-		/// \todo Swap byte order if the sending host has a different order to us.
-		/// We used to send the data via MemoryIndexedIO which would take care of this
-		/// for us, but the overhead of this significantly affected interactive render
-		/// speeds.
-		const Imath::Box2i box = *reinterpret_cast<const Imath::Box2i *>( &m_buffer->readable()[0] );
-		const float *data = reinterpret_cast<const float *>( &m_buffer->readable()[0] + sizeof( box ) );
-		const size_t dataSize = ( m_buffer->readable().size() - sizeof( box ) ) / sizeof( float );
+		PrivateData::StatisticsMutex::scoped_lock lock( m_serverData->m_statisticsMutex );
+		m_serverData->m_statistics.bucketsReceived++;
+		m_serverData->m_statistics.bytesReceived += bytesReceived;
+	}
 
-		// call imageData passing the data
-		m_displayDriver->imageData( box, data, dataSize );
+	if ( startProcessing )
+	{
+		m_serverData->m_service.post( boost::bind( &DisplayDriverServer::Session::processBuckets, SessionPtr(this) ) );
+	}
 
+	if ( !pauseReading )
+	{
+		readHeader();
+	}
+}
+
+void DisplayDriverServer::Session::readHeader()
+{
+	try
+	{
 		// prepare for getting more imageData packages or a imageClose.
 		boost::asio::async_read( m_socket,
 			boost::asio::buffer( m_header.buffer(), m_header.headerLength),
@@ -394,10 +529,209 @@ void DisplayDriverServer::Session::handleReadDataParameters( const boost::system
 	}
 	catch( std::exception &e )
 	{
-		msg( Msg::Error, "DisplayDriverServer::Session::handleReadDataParameters", e.what() );
+		msg( Msg::Error, "DisplayDriverServer::Session::readHeader", e.what() );
 		m_socket.close();
+	}
+}
+
+void DisplayDriverServer::Session::processBuckets()
+{
+	while( true )
+	{
+		std::vector<Bucket> buckets;
+		bool close = false;
+		bool resumeReading = false;
+		{
+			QueueMutex::scoped_lock lock( m_queueMutex );
+			if ( m_queue.empty() )
+			{
+				if ( !m_closeRequested )
+				{
+					m_processing = false;
+					return;
+				}
+				close = true;
+			}
+			buckets.swap( m_queue );
+			m_queuedBytes = 0;
+			resumeReading = m_readPaused;
+			m_readPaused = false;
+		}
+
+		if ( resumeReading )
+		{
+			readHeader();
+		}
+
+		// m_error is only written by this function, which is never
+		// called concurrently, so we can read it without the lock.
+		if ( close )
+		{
+			imageClose( m_error );
+			return;
+		}
+
+		if ( !m_error.empty() )
+		{
+			continue;
+		}
+
+		try
+		{
+			imageData( buckets );
+		}
+		catch( std::exception &e )
+		{
+			msg( Msg::Error, "DisplayDriverServer::Session::processBuckets", e.what() );
+			QueueMutex::scoped_lock lock( m_queueMutex );
+			m_error = e.what();
+		}
+	}
+}
+
+void DisplayDriverServer::Session::imageData( const std::vector<Bucket> &buckets )
+{
+	std::vector<DecodedBucket> decoded( buckets.size() );
+	const size_t numChannels = m_displayDriver->channelNames().size();
+	size_t uncompressedBytes = 0;
+	for ( size_t i = 0; i < buckets.size(); ++i )
+	{
+		decodeBucket( buckets[i], numChannels, decoded[i] );
+		uncompressedBytes += sizeof( Imath::Box2i ) + decoded[i].size * sizeof( float );
+	}
+
+	size_t calls = 0;
+	double time = 0;
+	DecodedBucket merged;
+	for ( size_t i = 0; i < decoded.size(); )
+	{
+		Imath::Box2i runBox;
+		const size_t end = Detail::coalescedRunEnd( decoded, i, runBox );
+		const DecodedBucket *bucket = &decoded[i];
+		if ( end > i + 1 )
+		{
+			// copy the rows of each bucket into their place in the merged bucket
+			const size_t runWidth = runBox.max.x - runBox.min.x + 1;
+			const size_t numChannels = decoded[i].size / ( ( decoded[i].box.max.x - decoded[i].box.min.x + 1 ) * ( decoded[i].box.max.y - decoded[i].box.min.y + 1 ) );
+			merged.box = runBox;
+			merged.storage.resize( runWidth * ( runBox.max.y - runBox.min.y + 1 ) * numChannels );
+			merged.pixels = merged.storage.data();
+			merged.size = merged.storage.size();
+			for ( size_t j = i; j < end; ++j )
+			{
+				const Imath::Box2i &box = decoded[j].box;
+				const size_t rowSize = ( box.max.x - box.min.x + 1 ) * numChannels;
+				const float *source = decoded[j].pixels;
+				for ( int y = box.min.y; y <= box.max.y; ++y, source += rowSize )
+				{
+					float *target = &merged.storage[ ( ( y - runBox.min.y ) * runWidth + ( box.min.x - runBox.min.x ) ) * numChannels ];
+					memcpy( target, source, rowSize * sizeof( float ) );
+				}
+			}
+			bucket = &merged;
+		}
+
+		const tbb::tick_count t0 = tbb::tick_count::now();
+		m_displayDriver->imageData( bucket->box, bucket->pixels, bucket->size );
+		time += ( tbb::tick_count::now() - t0 ).seconds();
+		calls++;
+		i = end;
+	}
+
+	PrivateData::StatisticsMutex::scoped_lock lock( m_serverData->m_statisticsMutex );
+	m_serverData->m_statistics.uncompressedBytesReceived += uncompressedBytes;
+	m_serverData->m_statistics.imageDataCalls += calls;
+	m_serverData->m_statistics.imageDataTime += time;
+}
+
+void DisplayDriverServer::Session::imageClose( const std::string &error )
+{
+	std::string message = error;
+	if ( message.empty() )
+	{
+		try
+		{
+			m_displayDriver->imageClose();
+		}
+		catch ( std::exception &e )
+		{
+			msg( Msg::Error, "DisplayDriverServer::Session::imageClose", e.what() );
+			message = e.what();
+		}
+	}
+
+	try
+	{
+		if ( message.empty() )
+		{
+			sendResult( DisplayDriverServerHeader::imageClose, 0 );
+		}
+		else
+		{
+			sendException( message.c_str() );
+		}
+	}
+	catch( std::exception &e )
+	{
+		msg( Msg::Error, "DisplayDriverServer::Session::imageClose", e.what() );
+	}
+	m_socket.close();
+}
+
+void DisplayDriverServer::Session::decodeBucket( const Bucket &bucket, size_t numChannels, DecodedBucket &result )
+{
+	/// \todo Swap byte order if the sending host has a different order to us.
+	/// We used to send the data via MemoryIndexedIO which would take care of this
+	/// for us, but the overhead of this significantly affected interactive render
+	/// speeds.
+	const std::vector<char> &data = bucket.data->readable();
+	if ( data.size() < sizeof( result.box ) )
+	{
+		throw Exception( "Invalid imageData message." );
+	}
+	result.box = *reinterpret_cast<const Imath::Box2i *>( &data[0] );
+	const char *pixels = &data[0] + sizeof( result.box );
+	size_t pixelsSize = data.size() - sizeof( result.box );
+
+	if ( bucket.type != DisplayDriverServerHeader::compressedImageData )
+	{
+		result.pixels = reinterpret_cast<const float *>( pixels );
+		result.size = pixelsSize / sizeof( float );
 		return;
 	}
+
+	uint32_t rawSize = 0;
+	if ( pixelsSize < sizeof( rawSize ) )
+	{
+		throw Exception( "Invalid compressed imageData message." );
+	}
+	memcpy( &rawSize, pixels, sizeof( rawSize ) );
+	pixels += sizeof( rawSize );
+	pixelsSize -= sizeof( rawSize );
+
+	// rawSize comes straight from the client, so we check it against
+	// the box before allocating anything.
+	if ( result.box.max.x < result.box.min.x || result.box.max.y < result.box.min.y )
+	{
+		throw Exception( "Invalid compressed imageData message." );
+	}
+	const uint64_t expectedSize = uint64_t( result.box.max.x - result.box.min.x + 1 ) * uint64_t( result.box.max.y - result.box.min.y + 1 ) * numChannels * sizeof( float );
+	if ( rawSize % sizeof( float ) || rawSize != expectedSize )
+	{
+		throw Exception( "Invalid compressed imageData message." );
+	}
+
+	result.storage.resize( rawSize / sizeof( float ) );
+	uLongf uncompressedSize = result.storage.size() * sizeof( float );
+	if (
+		uncompress( reinterpret_cast<Bytef *>( result.storage.data() ), &uncompressedSize, reinterpret_cast<const Bytef *>( pixels ), pixelsSize ) != Z_OK ||
+		uncompressedSize != rawSize
+	)
+	{
+		throw Exception( "Failed to decompress imageData message." );
+	}
+	result.pixels = result.storage.data();
+	result.size = result.storage.size();
 }
 
 void DisplayDriverServer::Session::sendResult( DisplayDriverServerHeader::MessageType msg, size_t dataSize )
@@ -72,7 +72,8 @@ bool DisplayDriverServerHeader::valid()
 		( m_header[orderMessageType] != imageOpen &&
 			m_header[orderMessageType] != imageData &&
 			m_header[orderMessageType] != imageClose &&
-			m_header[orderMessageType] != exception ) )
+			m_header[orderMessageType] != exception &&
+			m_header[orderMessageType] != compressedImageData ) )
 	{
 		return false;
 	}
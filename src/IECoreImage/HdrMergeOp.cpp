@@ -43,6 +43,9 @@
 
 #include "boost/format.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 #include <cassert>
 
 using namespace std;
@@ -191,23 +194,26 @@ inline void merge( bool firstImage, size_t &pixelCount,
 	float *ptrOutB = &(outB->writable()[0]);
 	float *ptrOutA = &(outA->writable()[0]);
 
-	for ( size_t i = 0; i < pixelCount; i++ )
-	{
-		float intensity = (*ptrInR + *ptrInG + *ptrInB) / 3.0;
-		float weight = smoothstep( windowing.min[0], windowing.min[1], intensity );
-		if ( !firstImage )
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, pixelCount, 4096 ),
+		[=, &windowing]( const tbb::blocked_range<size_t> &range )
 		{
-			weight *= 1.0f - smoothstep( windowing.max[0], windowing.max[1], intensity );
+			for ( size_t i = range.begin(); i != range.end(); i++ )
+			{
+				float intensity = (ptrInR[i] + ptrInG[i] + ptrInB[i]) / 3.0;
+				float weight = smoothstep( windowing.min[0], windowing.min[1], intensity );
+				if ( !firstImage )
+				{
+					weight *= 1.0f - smoothstep( windowing.max[0], windowing.max[1], intensity );
+				}
+				float m = weight * intensityMultiplier;
+				ptrOutR[i] += ptrInR[i] * m;
+				ptrOutG[i] += ptrInG[i] * m;
+				ptrOutB[i] += ptrInB[i] * m;
+				ptrOutA[i] += weight;
+			}
 		}
-		float m = weight * intensityMultiplier;
-		*ptrOutR += *ptrInR * m;
-		*ptrOutG += *ptrInG * m;
-		*ptrOutB += *ptrInB * m;
-		*ptrOutA += weight;
-
-		ptrInR++; ptrInG++; ptrInB++;
-		ptrOutR++; ptrOutG++; ptrOutB++; ptrOutA++;
-	}
+	);
 }
 
 ObjectPtr HdrMergeOp::doOperation( const CompoundObject * operands )
@@ -286,16 +292,22 @@ ObjectPtr HdrMergeOp::doOperation( const CompoundObject * operands )
 	float *ptrOutB = &(outB->writable()[0]);
 	float *ptrOutA = &(outA->writable()[0]);
 
-	for ( size_t i = 0; i < pixelCount; i++ )
-	{
-		float w = adjustment * ptrOutA[i];
-		if ( w > 0 )
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, pixelCount, 4096 ),
+		[=]( const tbb::blocked_range<size_t> &range )
 		{
-			ptrOutR[i] /= w;
-			ptrOutG[i] /= w;
-			ptrOutB[i] /= w;
+			for ( size_t i = range.begin(); i != range.end(); i++ )
+			{
+				float w = adjustment * ptrOutA[i];
+				if ( w > 0 )
+				{
+					ptrOutR[i] /= w;
+					ptrOutG[i] /= w;
+					ptrOutB[i] /= w;
+				}
+			}
 		}
-	}
+	);
 
 	return outImg;
 }
@@ -36,6 +36,7 @@
 
 #include "IECoreImage/ImagePrimitive.h"
 #include "IECoreImage/ImagePrimitiveParameter.h"
+#include "IECoreImage/TiledChannelData.h"
 
 #include "IECore/BoxOps.h"
 #include "IECore/CompoundObject.h"
@@ -272,10 +273,19 @@ void ImageCropOp::modify( Object *object, const CompoundObject *operands )
 
 	for( auto &channel : image->channels )
 	{
-		ImageCropFn fn( dataWindow, croppedDataWindow, newDataWindow );
 		DataPtr data = channel.second;
 		assert( data );
 
+		if( const TiledChannelData *tiledData = runTimeCast<const TiledChannelData>( data.get() ) )
+		{
+			// Tiled channels share their unchanged tiles with the
+			// original, and compute any others on demand.
+			channel.second = new TiledChannelData( tiledData->readable().crop( newDataWindow ) );
+			continue;
+		}
+
+		ImageCropFn fn( dataWindow, croppedDataWindow, newDataWindow );
+
 		channel.second = despatchTypedData< ImageCropFn, TypeTraits::IsNumericVectorTypedData >( data.get(), fn );
 		assert( channel.second );
 	}
@@ -292,6 +302,14 @@ void ImageCropOp::modify( Object *object, const CompoundObject *operands )
 		newDisplayWindow.min = Imath::V2i( 0, 0 );
 		assert( newDisplayWindowSize == newDisplayWindow.size() );
 		assert( newDataWindowSize == newDataWindow.size() );
+
+		for( auto &channel : image->channels )
+		{
+			if( TiledChannelData *tiledData = runTimeCast<TiledChannelData>( channel.second.get() ) )
+			{
+				tiledData->writable().setOrigin( newDataWindow.min );
+			}
+		}
 	}
 	image->setDataWindow( newDataWindow );
 	image->setDisplayWindow( newDisplayWindow );
@@ -42,7 +42,6 @@
 #include "IECore/DataConvert.h"
 #include "IECore/DespatchTypedData.h"
 #include "IECore/Exception.h"
-#include "IECore/MeanSquaredError.h"
 #include "IECore/MessageHandler.h"
 #include "IECore/Object.h"
 #include "IECore/ObjectParameter.h"
@@ -52,6 +51,9 @@
 
 #include "boost/format.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 #include <cassert>
 #include <iostream>
 
@@ -62,6 +64,52 @@ using namespace IECoreImage;
 
 IE_CORE_DEFINERUNTIMETYPED( ImageDiffOp );
 
+namespace
+{
+
+// Computes the mean squared error in parallel. The errors are accumulated
+// in fixed size blocks which are then summed in order, so that the result
+// doesn't depend on the number of threads used.
+float meanSquaredError( const std::vector<float> &a, const std::vector<float> &b )
+{
+	assert( a.size() == b.size() );
+
+	const size_t blockSize = 16384;
+	const size_t numBlocks = ( a.size() + blockSize - 1 ) / blockSize;
+	if( !numBlocks )
+	{
+		return 0;
+	}
+
+	std::vector<double> blockErrors( numBlocks );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, numBlocks ),
+		[&a, &b, &blockErrors, blockSize]( const tbb::blocked_range<size_t> &range )
+		{
+			for( size_t block = range.begin(); block != range.end(); ++block )
+			{
+				double e = 0;
+				for( size_t i = block * blockSize, end = std::min( a.size(), i + blockSize ); i < end; ++i )
+				{
+					const double d = a[i] - b[i];
+					e += d * d;
+				}
+				blockErrors[block] = e;
+			}
+		}
+	);
+
+	double e = 0;
+	for( const auto &blockError : blockErrors )
+	{
+		e += blockError;
+	}
+
+	return e / a.size();
+}
+
+} // namespace
+
 ImageDiffOp::ImageDiffOp()
 		:	Op(
 			"Evaluates the root-mean-squared error between two images and returns true if it "
@@ -277,6 +325,20 @@ ObjectPtr ImageDiffOp::doOperation( const CompoundObject * operands )
 		}
 	}
 
+	// Gather the channels to be compared, and compute their errors in parallel.
+	// The results are then examined in order below, so that we return and issue
+	// warnings exactly as we would if the channels were processed serially.
+
+	struct ChannelComparison
+	{
+		std::string name;
+		DataPtr aData;
+		DataPtr bData;
+		bool converted;
+		float rms;
+	};
+
+	std::vector<ChannelComparison> comparisons;
 	for( const auto &name : channelsA )
 	{
 		const auto aIt = imageA->channels.find( name );
@@ -289,44 +351,65 @@ ObjectPtr ImageDiffOp::doOperation( const CompoundObject * operands )
 			continue;
 		}
 
-		DataPtr aData = aIt->second;
-		DataPtr bData = bIt->second;
+		comparisons.push_back( { name, aIt->second, bIt->second, false, 0.0f } );
+	}
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, comparisons.size(), 1 ),
+		[&comparisons]( const tbb::blocked_range<size_t> &range )
+		{
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				ChannelComparison &c = comparisons[i];
+				if( c.aData == c.bData || !c.aData || !c.bData )
+				{
+					continue;
+				}
+
+				FloatVectorDataPtr aFloatData = nullptr;
+				FloatVectorDataPtr bFloatData = nullptr;
+
+				try
+				{
+					aFloatData = despatchTypedData< FloatConverter, TypeTraits::IsNumericVectorTypedData > ( c.aData.get() );
+					bFloatData = despatchTypedData< FloatConverter, TypeTraits::IsNumericVectorTypedData > ( c.bData.get() );
+				}
+				catch ( Exception &e )
+				{
+					continue;
+				}
+
+				assert( aFloatData );
+				assert( bFloatData );
+				assert( aFloatData->readable().size() == bFloatData->readable().size() );
+
+				c.rms = sqrt( meanSquaredError( aFloatData->readable(), bFloatData->readable() ) );
+				c.converted = true;
+			}
+		}
+	);
 
-		if ( aData == bData )
+	for( const auto &c : comparisons )
+	{
+		if ( c.aData == c.bData )
 		{
 			msg( Msg::Warning, "ImageDiffOp", "Exact same data found in two different input images.");
 			continue;
 		}
 
-		if ( !aData || !bData )
+		if ( !c.aData || !c.bData )
 		{
 			msg( Msg::Warning, "ImageDiffOp", "Null data present in input image.");
 			return new BoolData( true );
 		}
 
-		assert( aData );
-		assert( bData );
-
-		FloatVectorDataPtr aFloatData = nullptr;
-		FloatVectorDataPtr bFloatData = nullptr;
-
-		try
-		{
-			aFloatData = despatchTypedData< FloatConverter, TypeTraits::IsNumericVectorTypedData > ( aData.get() );
-			bFloatData = despatchTypedData< FloatConverter, TypeTraits::IsNumericVectorTypedData > ( bData.get() );
-		}
-		catch ( Exception &e )
+		if( !c.converted )
 		{
-			msg( Msg::Warning, "ImageDiffOp", boost::format( "Could not convert data for image channel '%s' to floating point" ) % name );
+			msg( Msg::Warning, "ImageDiffOp", boost::format( "Could not convert data for image channel '%s' to floating point" ) % c.name );
 			return new BoolData( true );
 		}
 
-		assert( aFloatData );
-		assert( bFloatData );
-		assert( aFloatData->readable().size() == bFloatData->readable().size() );
-
-		float rms = sqrt( MeanSquaredError<FloatVectorData>()( aFloatData, bFloatData ) );
-		if ( rms > maxError )
+		if ( c.rms > maxError )
 		{
 			return new BoolData( true );
 		}
@@ -38,6 +38,8 @@
 
 #include "tbb/mutex.h"
 
+#include <cstring>
+
 using namespace std;
 using namespace boost;
 using namespace Imath;
@@ -48,17 +50,87 @@ IE_CORE_DEFINERUNTIMETYPED( ImageDisplayDriver );
 
 const DisplayDriver::DisplayDriverDescription<ImageDisplayDriver> ImageDisplayDriver::g_description;
 
-typedef std::map<std::string, ConstImagePrimitivePtr> ImagePool;
+namespace IECoreImage
+{
+
+struct PoolEntry
+{
+	ConstImagePrimitivePtr image;
+	ImageDisplayDriver::SharingPtr sharing;
+};
+
+} // namespace IECoreImage
+
+typedef std::map<std::string, PoolEntry> ImagePool;
 static ImagePool g_pool;
 static tbb::mutex g_poolMutex;
 
+namespace
+{
+
+// Copies a row of interleaved pixels into separate channel rows. The
+// channel count is a template parameter for the common cases, so that
+// the inner loop has a constant stride and can be vectorised by the
+// compiler.
+template<int NumChannels>
+void deinterleaveRow( const float * __restrict source, float * const *targets, int width )
+{
+	for( int c = 0; c < NumChannels; ++c )
+	{
+		float * __restrict target = targets[c];
+		const float * __restrict channelSource = source + c;
+		for( int x = 0; x < width; ++x )
+		{
+			target[x] = channelSource[x * NumChannels];
+		}
+	}
+}
+
+void deinterleaveRow( const float * __restrict source, float * const *targets, int numChannels, int width )
+{
+	switch( numChannels )
+	{
+		case 1 :
+			memcpy( targets[0], source, width * sizeof( float ) );
+			return;
+		case 2 :
+			deinterleaveRow<2>( source, targets, width );
+			return;
+		case 3 :
+			deinterleaveRow<3>( source, targets, width );
+			return;
+		case 4 :
+			deinterleaveRow<4>( source, targets, width );
+			return;
+		default :
+			for( int c = 0; c < numChannels; ++c )
+			{
+				float * __restrict target = targets[c];
+				const float * __restrict channelSource = source + c;
+				for( int x = 0; x < width; ++x )
+				{
+					target[x] = channelSource[x * numChannels];
+				}
+			}
+	}
+}
+
+} // namespace
+
+ImageDisplayDriver::Sharing::Sharing()
+{
+	handedOut = false;
+	internalReferences = 1;
+}
+
 ImageDisplayDriver::ImageDisplayDriver( const Box2i &displayWindow, const Box2i &dataWindow, const vector<string> &channelNames, ConstCompoundDataPtr parameters ) :
 		DisplayDriver( displayWindow, dataWindow, channelNames, parameters ),
-		m_image( new ImagePrimitive( dataWindow, displayWindow ) )
+		m_image( new ImagePrimitive( dataWindow, displayWindow ) ),
+		m_sharing( new Sharing )
 {
 	for ( vector<string>::const_iterator it = channelNames.begin(); it != channelNames.end(); it++ )
 	{
-		m_image->createChannel<float>( *it );
+		m_channelData.push_back( m_image->createChannel<float>( *it )->writable().data() );
 	}
 	if( parameters )
 	{
@@ -78,8 +150,15 @@ ImageDisplayDriver::ImageDisplayDriver( const Box2i &displayWindow, const Box2i
 		ConstStringDataPtr handle = parameters->member<StringData>( "handle" );
 		if( handle )
 		{
+			m_sharing->internalReferences++;
 			tbb::mutex::scoped_lock lock( g_poolMutex );
-			g_pool[handle->readable()] = m_image;
+			PoolEntry &entry = g_pool[handle->readable()];
+			if( entry.sharing )
+			{
+				entry.sharing->internalReferences--;
+			}
+			entry.image = m_image;
+			entry.sharing = m_sharing;
 		}
 	}
 }
@@ -108,39 +187,70 @@ void ImageDisplayDriver::imageData( const Box2i &box, const float *data, size_t
 		throw Exception("The box is outside image data window.");
 	}
 
-	int pixelSize = channelNames().size();
-	if ( dataSize != (box.max.x - box.min.x + 1) * (box.max.y - box.min.y + 1) * channelNames().size() )
+	const int numChannels = channelNames().size();
+	const int sourceWidth = box.max.x - box.min.x + 1;
+	const int sourceHeight = box.max.y - box.min.y + 1;
+	if( dataSize != (size_t)sourceWidth * sourceHeight * numChannels )
 	{
 		throw Exception("Invalid dataSize value.");
 	}
 
-	int channelId, targetX, targetY, sourceWidth, sourceHeight, targetWidth;
-	sourceWidth = box.max.x - box.min.x + 1;
-	sourceHeight = box.max.y - box.min.y + 1;
-	targetWidth = dataWindow.max.x - dataWindow.min.x + 1;
-	channelId = 0;
-	targetX = box.min.x - dataWindow.min.x;
-	targetY = box.min.y - dataWindow.min.y;
+	const int targetWidth = dataWindow.max.x - dataWindow.min.x + 1;
+	const size_t targetOffset = (size_t)targetWidth * ( box.min.y - dataWindow.min.y ) + ( box.min.x - dataWindow.min.x );
 
-	for( const auto &name : channelNames() )
+	ChannelsMutex::scoped_lock lock( m_channelsMutex, false ); // read-only lock
+	if( m_sharing->handedOut )
 	{
-		vector< float > &target = boost::static_pointer_cast< FloatVectorData >( m_image->channels[name] )->writable();
-		vector< float >::iterator targetIt;
-		const float *sourceIt = data+channelId;
-		targetIt = target.begin()+targetWidth*targetY+targetX;
-
-		for ( int y = 0; y < sourceHeight; y++ )
+		// The image has been handed out, so its channels may have been shared
+		// with a copy. writable() will detach them if so, and we must have
+		// exclusive access while calling it, otherwise pixels being copied
+		// concurrently into the old buffers would be lost.
+		lock.upgrade_to_writer();
+		if( m_sharing->handedOut )
 		{
-			for ( int x = 0; x < sourceWidth; x++ )
+			// Clear the flag before checking the reference count, so that a
+			// concurrent storedImage() either sees the flag cleared and sets
+			// it again, or is accounted for in the reference count.
+			m_sharing->handedOut = false;
+			for( int i = 0; i < numChannels; ++i )
 			{
-				*targetIt = *sourceIt;
-				sourceIt += pixelSize;
-				targetIt++;
+				m_channelData[i] = boost::static_pointer_cast<FloatVectorData>( m_image->channels[channelNames()[i]] )->writable().data();
+			}
+			if( m_image->refCount() > m_sharing->internalReferences )
+			{
+				// Still referenced elsewhere, so it may be copied again.
+				m_sharing->handedOut = true;
 			}
-			targetIt += targetWidth - sourceWidth;
 		}
+		lock.downgrade_to_reader();
+	}
 
-		++channelId;
+	// In the steady state we hold only the read lock, so that other buckets may
+	// be copied concurrently.
+	vector<float *> targets;
+	targets.reserve( numChannels );
+	for( auto target : m_channelData )
+	{
+		targets.push_back( target + targetOffset );
+	}
+
+	if( numChannels == 1 && sourceWidth == targetWidth )
+	{
+		memcpy( targets[0], data, dataSize * sizeof( float ) );
+		return;
+	}
+
+	// Buckets which don't overlap write to disjoint parts of the channels,
+	// so they may be copied concurrently under the read lock.
+	const size_t sourceRowSize = (size_t)sourceWidth * numChannels;
+	for( int y = 0; y < sourceHeight; ++y )
+	{
+		deinterleaveRow( data, targets.data(), numChannels, sourceWidth );
+		data += sourceRowSize;
+		for( auto &target : targets )
+		{
+			target += targetWidth;
+		}
 	}
 }
 
@@ -150,7 +260,9 @@ void ImageDisplayDriver::imageClose()
 
 ConstImagePrimitivePtr ImageDisplayDriver::image() const
 {
-	return m_image;
+	ConstImagePrimitivePtr result = m_image;
+	m_sharing->handedOut = true;
+	return result;
 }
 
 ConstImagePrimitivePtr ImageDisplayDriver::storedImage( const std::string &handle )
@@ -159,7 +271,9 @@ ConstImagePrimitivePtr ImageDisplayDriver::storedImage( const std::string &handl
 	ImagePool::const_iterator it = g_pool.find( handle );
 	if( it != g_pool.end() )
 	{
-		return it->second;
+		ConstImagePrimitivePtr result = it->second.image;
+		it->second.sharing->handedOut = true;
+		return result;
 	}
 	return nullptr;
 }
@@ -171,7 +285,9 @@ ConstImagePrimitivePtr ImageDisplayDriver::removeStoredImage( const std::string
 	ImagePool::iterator it = g_pool.find( handle );
 	if( it != g_pool.end() )
 	{
-		result = it->second;
+		result = it->second.image;
+		it->second.sharing->handedOut = true;
+		it->second.sharing->internalReferences--;
 		g_pool.erase( it );
 	}
 	return result;
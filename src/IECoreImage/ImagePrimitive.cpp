@@ -34,6 +34,8 @@
 
 #include "IECoreImage/ImagePrimitive.h"
 
+#include "IECoreImage/TiledChannelData.h"
+
 #include "IECore/DespatchTypedData.h"
 #include "IECore/MessageHandler.h"
 #include "IECore/MurmurHash.h"
@@ -391,6 +393,24 @@ bool ImagePrimitive::channelValid( const IECore::Data *data, std::string *reason
 		return false;
 	}
 
+	if( const TiledChannelData *tiledData = runTimeCast<const TiledChannelData>( data ) )
+	{
+		const Box2i &tiledWindow = tiledData->readable().dataWindow();
+		if( tiledWindow != m_dataWindow )
+		{
+			if( reason )
+			{
+				*reason = str(
+					format( "Tiled channel has wrong data window (%d %d - %d %d but should be %d %d - %d %d)." ) %
+						tiledWindow.min.x % tiledWindow.min.y % tiledWindow.max.x % tiledWindow.max.y %
+						m_dataWindow.min.x % m_dataWindow.min.y % m_dataWindow.max.x % m_dataWindow.max.y
+				);
+			}
+			return false;
+		}
+		return true;
+	}
+
 	if( !despatchTraitsTest<TypeTraits::IsNumericVectorTypedData>( data ) )
 	{
 		if( reason )
@@ -37,6 +37,7 @@
 #include "IECoreImage/ColorAlgo.h"
 #include "IECoreImage/ImagePrimitive.h"
 #include "IECoreImage/OpenImageIOAlgo.h"
+#include "IECoreImage/TiledChannelData.h"
 
 #include "IECore/BoxOps.h"
 #include "IECore/CompoundParameter.h"
@@ -47,6 +48,7 @@
 #include "OpenImageIO/imagecache.h"
 #include "OpenImageIO/imageio.h"
 
+#include "boost/lexical_cast.hpp"
 #include "boost/tokenizer.hpp"
 
 OIIO_NAMESPACE_USING
@@ -59,6 +61,25 @@ using namespace IECoreImage;
 
 IE_CORE_DEFINERUNTIMETYPED( ImageReader );
 
+namespace
+{
+
+// The ImageCache that the tiles of all lazily read channels are read from.
+// Sharing a single cache bounds the memory used by the file handles and
+// tiles of outstanding channels, no matter how many images they come from.
+ImageCache *tileCache()
+{
+	static ImageCache *g_cache = [] {
+		ImageCache *result = ImageCache::create( /* shared */ false );
+		const char *m = getenv( "IECOREIMAGE_IMAGEREADER_TILECACHEMEMORY" );
+		result->attribute( "max_memory_MB", m ? boost::lexical_cast<float>( m ) : 500.0f );
+		return result;
+	}();
+	return g_cache;
+}
+
+} // namespace
+
 ////////////////////////////////////////////////////////////////////////////////
 // ImageReader::Implementation
 ////////////////////////////////////////////////////////////////////////////////
@@ -146,11 +167,24 @@ class ImageReader::Implementation
 			return spec->deep;
 		}
 
-		Imath::Box2i dataWindow()
+		int numMipLevels()
 		{
 			open( /* throwOnFailure */ true );
 
-			const ImageSpec *spec = m_cache->imagespec( m_inputFileName );
+			int result = 1;
+			m_cache->get_image_info(
+				m_inputFileName,
+				0, 0, // subimage, miplevel
+				ustring( "miplevels" ),
+				TypeDesc::TypeInt, &result
+			);
+
+			return result;
+		}
+
+		Imath::Box2i dataWindow( int mipLevel )
+		{
+			const ImageSpec *spec = mipSpec( mipLevel );
 
 			return Imath::Box2i(
 				Imath::V2i( spec->x, spec->y ),
@@ -158,11 +192,9 @@ class ImageReader::Implementation
 			);
 		}
 
-		Imath::Box2i displayWindow()
+		Imath::Box2i displayWindow( int mipLevel )
 		{
-			open( /* throwOnFailure */ true );
-
-			const ImageSpec *spec = m_cache->imagespec( m_inputFileName );
+			const ImageSpec *spec = mipSpec( mipLevel );
 
 			return Imath::Box2i(
 				Imath::V2i( spec->full_x, spec->full_y ),
@@ -170,6 +202,20 @@ class ImageReader::Implementation
 			);
 		}
 
+		// Returns the region that will actually be read for the requested window,
+		// which is the requested window clipped to the data window, or the whole
+		// data window if the requested window is empty.
+		Imath::Box2i readWindow( const Imath::Box2i &window, int mipLevel )
+		{
+			const Box2i fileDataWindow = dataWindow( mipLevel );
+			if( window.isEmpty() )
+			{
+				return fileDataWindow;
+			}
+
+			return boxIntersection( window, fileDataWindow );
+		}
+
 		void updateHeader( CompoundObject *header )
 		{
 			open( /* throwOnFailure */ true );
@@ -196,23 +242,32 @@ class ImageReader::Implementation
 				}
 			}
 
-			members["displayWindow"] = new Box2iData( displayWindow() );
-			members["dataWindow"] = new Box2iData( dataWindow() );
+			members["displayWindow"] = new Box2iData( displayWindow( 0 ) );
+			members["dataWindow"] = new Box2iData( dataWindow( 0 ) );
 		}
 
-		DataPtr readChannel( const std::string &name, bool raw )
+		// Reads the named channels with a call to the ImageCache for each
+		// contiguous run of them. The cache holds all the channels of a tile
+		// or scanline together, so each is only decoded once, regardless of
+		// how many channels are requested.
+		void readChannels( const std::vector<std::string> &names, bool raw, const Imath::Box2i &window, int mipLevel, std::vector<DataPtr> &channels )
 		{
-			open( /* throwOnFailure */ true );
+			const ImageSpec *spec = mipSpec( mipLevel );
 
-			const ImageSpec *spec = m_cache->imagespec( m_inputFileName );
+			std::vector<int> channelIndices;
+			channelIndices.reserve( names.size() );
+			for( const auto &name : names )
+			{
+				channelIndices.push_back( channelIndex( spec, name ) );
+			}
 
-			const auto channelIt = find( spec->channelnames.begin(), spec->channelnames.end(), name );
-			if( channelIt == spec->channelnames.end() )
+			channels.clear();
+			if( channelIndices.empty() )
 			{
-				throw InvalidArgumentException( "Image Reader : Non-existent image channel \"" + name + "\" requested." );
+				return;
 			}
 
-			size_t channelIndex = channelIt - spec->channelnames.begin();
+			const Box2i region = readWindow( window, mipLevel );
 
 			if( raw )
 			{
@@ -220,39 +275,48 @@ class ImageReader::Implementation
 				{
 					case TypeDesc::UCHAR :
 					{
-						return readTypedChannel<unsigned char>( channelIndex, spec->format );
+						readTypedChannels<unsigned char>( channelIndices, spec->format, region, mipLevel, channels );
+						break;
 					}
 					case TypeDesc::CHAR :
 					{
-						return readTypedChannel<char>( channelIndex, spec->format );
+						readTypedChannels<char>( channelIndices, spec->format, region, mipLevel, channels );
+						break;
 					}
 					case TypeDesc::USHORT :
 					{
-						return readTypedChannel<unsigned short>( channelIndex, spec->format );
+						readTypedChannels<unsigned short>( channelIndices, spec->format, region, mipLevel, channels );
+						break;
 					}
 					case TypeDesc::SHORT :
 					{
-						return readTypedChannel<short>( channelIndex, spec->format );
+						readTypedChannels<short>( channelIndices, spec->format, region, mipLevel, channels );
+						break;
 					}
 					case TypeDesc::UINT :
 					{
-						return readTypedChannel<unsigned int>( channelIndex, spec->format );
+						readTypedChannels<unsigned int>( channelIndices, spec->format, region, mipLevel, channels );
+						break;
 					}
 					case TypeDesc::INT :
 					{
-						return readTypedChannel<int>( channelIndex, spec->format );
+						readTypedChannels<int>( channelIndices, spec->format, region, mipLevel, channels );
+						break;
 					}
 					case TypeDesc::HALF :
 					{
-						return readTypedChannel<half>( channelIndex, spec->format );
+						readTypedChannels<half>( channelIndices, spec->format, region, mipLevel, channels );
+						break;
 					}
 					case TypeDesc::FLOAT :
 					{
-						return readTypedChannel<float>( channelIndex, spec->format );
+						readTypedChannels<float>( channelIndices, spec->format, region, mipLevel, channels );
+						break;
 					}
 					case TypeDesc::DOUBLE :
 					{
-						return readTypedChannel<double>( channelIndex, spec->format );
+						readTypedChannels<double>( channelIndices, spec->format, region, mipLevel, channels );
+						break;
 					}
 					default :
 					{
@@ -262,57 +326,230 @@ class ImageReader::Implementation
 			}
 			else
 			{
-				DataPtr data = readTypedChannel<float>( channelIndex, TypeDesc::FLOAT );
-				if( (int)channelIndex != spec->alpha_channel && (int)channelIndex != spec->z_channel )
+				readTypedChannels<float>( channelIndices, TypeDesc::FLOAT, region, mipLevel, channels );
+
+				std::string linearColorSpace;
+				std::string currentColorSpace;
+				for( size_t i = 0, e = channelIndices.size(); i < e; ++i )
 				{
-					const char *fileFormat = nullptr;
-					m_cache->get_image_info(
-						m_inputFileName,
-						0, 0, // subimage, miplevel
-						ustring( "fileformat" ),
-						TypeDesc::TypeString, &fileFormat
-					);
+					if( channelIndices[i] == spec->alpha_channel || channelIndices[i] == spec->z_channel )
+					{
+						continue;
+					}
 
-					std::string linearColorSpace = OpenImageIOAlgo::colorSpace( "", *spec );
-					std::string currentColorSpace = OpenImageIOAlgo::colorSpace( fileFormat, *spec );
-					ColorAlgo::transformChannel( data.get(), currentColorSpace, linearColorSpace );
+					if( linearColorSpace.empty() )
+					{
+						colorSpaces( spec, currentColorSpace, linearColorSpace );
+					}
+
+					ColorAlgo::transformChannel( channels[i].get(), currentColorSpace, linearColorSpace );
 				}
+			}
+		}
+
+		// Returns a TiledChannelData for each of the named channels. No pixels
+		// are read up front - instead each tile is read from the tileCache() and
+		// linearised when it is first accessed. The channels don't refer to this
+		// reader, so they remain valid even if it is destroyed or moved to another
+		// file.
+		void readTiledChannels( const std::vector<std::string> &names, const Imath::Box2i &window, int mipLevel, std::vector<DataPtr> &channels )
+		{
+			const ImageSpec *spec = mipSpec( mipLevel );
+			const Box2i region = readWindow( window, mipLevel );
+
+			std::string linearColorSpace;
+			std::string currentColorSpace;
+			colorSpaces( spec, currentColorSpace, linearColorSpace );
+
+			channels.clear();
+			for( const auto &name : names )
+			{
+				const int index = channelIndex( spec, name );
+				const bool linearise = index != spec->alpha_channel && index != spec->z_channel && currentColorSpace != linearColorSpace;
+
+				const ustring fileName = m_inputFileName;
+				TiledChannel::TileFunction tileFunction = [fileName, mipLevel, index, name, linearise, currentColorSpace, linearColorSpace]( const Box2i &tileBound ) {
+
+					ImageCache *cache = tileCache();
+
+					FloatVectorDataPtr result = new FloatVectorData;
+					result->writable().resize( ( tileBound.size().x + 1 ) * ( tileBound.size().y + 1 ) );
+
+					bool status = cache->get_pixels(
+						fileName,
+						0, mipLevel, // subimage, miplevel
+						tileBound.min.x, tileBound.max.x + 1,
+						tileBound.min.y, tileBound.max.y + 1,
+						0, 1, // z begin, z end
+						index, index + 1,
+						/* format */ TypeDesc::FLOAT,
+						/* data */ result->writable().data()
+					);
+
+					if( !status )
+					{
+						throw IOException( string( "ImageReader : Failed to read channel \"" ) + name + "\". " + cache->geterror() );
+					}
 
-				return data;
+					if( linearise )
+					{
+						ColorAlgo::transformChannel( result.get(), currentColorSpace, linearColorSpace );
+					}
+
+					return result;
+				};
+
+				channels.push_back( new TiledChannelData( TiledChannel( region, tileFunction ) ) );
 			}
 		}
 
 	private :
 
+		int channelIndex( const ImageSpec *spec, const std::string &name )
+		{
+			const auto channelIt = find( spec->channelnames.begin(), spec->channelnames.end(), name );
+			if( channelIt == spec->channelnames.end() )
+			{
+				throw InvalidArgumentException( "Image Reader : Non-existent image channel \"" + name + "\" requested." );
+			}
+			return channelIt - spec->channelnames.begin();
+		}
+
+		void colorSpaces( const ImageSpec *spec, std::string &currentColorSpace, std::string &linearColorSpace )
+		{
+			const char *fileFormat = nullptr;
+			m_cache->get_image_info(
+				m_inputFileName,
+				0, 0, // subimage, miplevel
+				ustring( "fileformat" ),
+				TypeDesc::TypeString, &fileFormat
+			);
+
+			linearColorSpace = OpenImageIOAlgo::colorSpace( "", *spec );
+			currentColorSpace = OpenImageIOAlgo::colorSpace( fileFormat, *spec );
+		}
+
+		// Returns the spec for the specified mip level, throwing if it doesn't exist.
+		const ImageSpec *mipSpec( int mipLevel )
+		{
+			open( /* throwOnFailure */ true );
+
+			const ImageSpec *spec = m_cache->imagespec( m_inputFileName, 0, mipLevel );
+			if( !spec )
+			{
+				throw InvalidArgumentException( ( boost::format( "ImageReader : Mip level %d does not exist in file \"%s\"." ) % mipLevel % m_inputFileName ).str() );
+			}
+
+			return spec;
+		}
+
 		template<class T>
-		DataPtr readTypedChannel( size_t channelIndex, TypeDesc dataType )
+		void readTypedChannels( const std::vector<int> &channelIndices, TypeDesc dataType, const Imath::Box2i &region, int mipLevel, std::vector<DataPtr> &channels )
 		{
 			typedef TypedData<vector<T> > DataType;
-			typename DataType::Ptr data = new DataType;
 
-			bool status;
+			const size_t numPixels = region.isEmpty() ? 0 : ( region.size().x + 1 ) * ( region.size().y + 1 );
 
-			const ImageSpec *spec = m_cache->imagespec( m_inputFileName );
+			std::vector<typename DataType::Ptr> data;
+			for( size_t i = 0; i < channelIndices.size(); ++i )
+			{
+				data.push_back( new DataType );
+				data.back()->writable().resize( numPixels );
+				channels.push_back( data.back() );
+			}
 
-			data->writable().resize( spec->width * spec->height );
+			if( !numPixels )
+			{
+				return;
+			}
 
-			status = m_cache->get_pixels(
-				m_inputFileName,
-				0, 0, // subimage, miplevel
-				spec->x, spec->width + spec->x,
-				spec->y, spec->height + spec->y,
-				0, 1, // z begin, z end
-				channelIndex, channelIndex + 1,
-				/* format */ dataType,
-				/* data */ &( data->writable()[0] )
-			);
+			// Repeated requests for the same channel are read once, into the
+			// first request, and copied at the end.
+			std::vector<size_t> firstRequest( channelIndices.size() );
+			for( size_t i = 0; i < channelIndices.size(); ++i )
+			{
+				firstRequest[i] = std::find( channelIndices.begin(), channelIndices.end(), channelIndices[i] ) - channelIndices.begin();
+			}
 
-			if( !status )
+			std::vector<int> sortedIndices( channelIndices );
+			std::sort( sortedIndices.begin(), sortedIndices.end() );
+			sortedIndices.erase( std::unique( sortedIndices.begin(), sortedIndices.end() ), sortedIndices.end() );
+
+			// We read each contiguous run of the requested channels with a single
+			// call, so that channels in between them are never read. When a run
+			// is a single channel we can read directly into the result, otherwise
+			// we read interleaved pixels and then split them out.
+			std::vector<T> interleaved;
+			for( auto runBegin = sortedIndices.begin(); runBegin != sortedIndices.end(); )
 			{
-				throw IOException( string( "ImageReader : Failed to read channel \"" ) + spec->channelnames[channelIndex] + "\". " + m_cache->geterror() );
+				auto runEnd = runBegin + 1;
+				while( runEnd != sortedIndices.end() && *runEnd == *( runEnd - 1 ) + 1 )
+				{
+					++runEnd;
+				}
+
+				const int channelBegin = *runBegin;
+				const int channelEnd = *( runEnd - 1 ) + 1;
+				const size_t numChannels = channelEnd - channelBegin;
+				runBegin = runEnd;
+
+				T *buffer = nullptr;
+				if( numChannels == 1 )
+				{
+					const size_t i = std::find( channelIndices.begin(), channelIndices.end(), channelBegin ) - channelIndices.begin();
+					buffer = &( data[i]->writable()[0] );
+				}
+				else
+				{
+					interleaved.resize( numPixels * numChannels );
+					buffer = &interleaved[0];
+				}
+
+				bool status = m_cache->get_pixels(
+					m_inputFileName,
+					0, mipLevel, // subimage, miplevel
+					region.min.x, region.max.x + 1,
+					region.min.y, region.max.y + 1,
+					0, 1, // z begin, z end
+					channelBegin, channelEnd,
+					/* format */ dataType,
+					/* data */ buffer
+				);
+
+				if( !status )
+				{
+					const ImageSpec *spec = m_cache->imagespec( m_inputFileName, 0, mipLevel );
+					throw IOException( string( "ImageReader : Failed to read channel \"" ) + spec->channelnames[channelBegin] + "\". " + m_cache->geterror() );
+				}
+
+				if( numChannels == 1 )
+				{
+					continue;
+				}
+
+				for( size_t i = 0; i < channelIndices.size(); ++i )
+				{
+					if( firstRequest[i] != i || channelIndices[i] < channelBegin || channelIndices[i] >= channelEnd )
+					{
+						continue;
+					}
+
+					const T *source = &interleaved[channelIndices[i] - channelBegin];
+					T *dest = &( data[i]->writable()[0] );
+					for( size_t p = 0; p < numPixels; ++p, source += numChannels )
+					{
+						dest[p] = *source;
+					}
+				}
 			}
 
-			return data;
+			for( size_t i = 0; i < channelIndices.size(); ++i )
+			{
+				if( firstRequest[i] != i )
+				{
+					data[i]->writable() = data[firstRequest[i]]->readable();
+				}
+			}
 		}
 
 		void addMetadata( const std::string &name, DataPtr data, CompoundData *metadata )
@@ -353,6 +590,9 @@ class ImageReader::Implementation
 			if( m_cache->imagespec( ustring( m_reader->fileName() ) ) )
 			{
 				m_inputFileName = m_reader->fileName();
+				// Make sure any tiled channels we return see the file as
+				// it is now, and not as it was when previously read.
+				tileCache()->invalidate( m_inputFileName );
 				return true;
 			}
 
@@ -401,8 +641,33 @@ ImageReader::ImageReader() :
 		false
 	);
 
+	m_dataWindowParameter = new Box2iParameter(
+		"dataWindow",
+		"The region of the image to load, specified in the pixel space of the chosen mip level. "
+		"Only the intersection of this region with the data window of the file is loaded. "
+		"If the region is empty (the default value) then the whole data window is loaded."
+	);
+
+	m_tiledParameter = new BoolParameter(
+		"tiled",
+		"When on, channels are returned as TiledChannelData, and their pixels are only read from "
+		"the file as each tile is accessed. This cannot be combined with rawChannels.",
+		false
+	);
+
+	m_mipLevelParameter = new IntParameter(
+		"mipLevel",
+		"The mip level to load. Level 0 is the full resolution image, and further levels "
+		"are only available for files which contain MIP-maps.",
+		0,
+		0
+	);
+
 	parameters()->addParameter( m_channelNamesParameter );
 	parameters()->addParameter( m_rawChannelsParameter );
+	parameters()->addParameter( m_dataWindowParameter );
+	parameters()->addParameter( m_mipLevelParameter );
+	parameters()->addParameter( m_tiledParameter );
 }
 
 ImageReader::ImageReader( const string &fileName ) : ImageReader()
@@ -429,30 +694,56 @@ bool ImageReader::isComplete()
 	return m_implementation->isComplete();
 }
 
-Imath::Box2i ImageReader::dataWindow()
+int ImageReader::numMipLevels()
 {
-	return m_implementation->dataWindow();
+	return m_implementation->numMipLevels();
 }
 
-Imath::Box2i ImageReader::displayWindow()
+Imath::Box2i ImageReader::dataWindow( int mipLevel )
 {
-	return m_implementation->displayWindow();
+	return m_implementation->dataWindow( mipLevel );
+}
+
+Imath::Box2i ImageReader::displayWindow( int mipLevel )
+{
+	return m_implementation->displayWindow( mipLevel );
 }
 
 ObjectPtr ImageReader::doOperation( const CompoundObject *operands )
 {
 	bool rawChannels = operands->member< BoolData >( "rawChannels" )->readable();
+	const Box2i &window = operands->member<Box2iData>( "dataWindow" )->readable();
+	int mipLevel = operands->member<IntData>( "mipLevel" )->readable();
+	bool tiled = operands->member<BoolData>( "tiled" )->readable();
+
+	if( tiled && rawChannels )
+	{
+		throw InvalidArgumentException( "ImageReader : The tiled and rawChannels parameters cannot both be on." );
+	}
 
-	ImagePrimitivePtr image = new ImagePrimitive( dataWindow(), displayWindow() );
+	ImagePrimitivePtr image = new ImagePrimitive(
+		m_implementation->readWindow( window, mipLevel ),
+		displayWindow( mipLevel )
+	);
 
 	vector<string> channelNames;
 	channelsToRead( channelNames );
 
+	vector<DataPtr> channels;
+	if( tiled )
+	{
+		m_implementation->readTiledChannels( channelNames, window, mipLevel, channels );
+	}
+	else
+	{
+		m_implementation->readChannels( channelNames, rawChannels, window, mipLevel, channels );
+	}
+
 	for( size_t ci = 0, cend = channelNames.size(); ci != cend; ++ci )
 	{
-		DataPtr d = m_implementation->readChannel( channelNames[ci], rawChannels );
+		const DataPtr &d = channels[ci];
 		assert( d  );
-		assert( rawChannels || d->typeId()==FloatVectorDataTypeId );
+		assert( rawChannels || tiled || d->typeId()==FloatVectorDataTypeId );
 
 		assert( image->channelValid( d.get() ) );
 
@@ -466,7 +757,19 @@ ObjectPtr ImageReader::doOperation( const CompoundObject *operands )
 
 DataPtr ImageReader::readChannel( const std::string &name, bool raw )
 {
-	return m_implementation->readChannel( name, raw );
+	vector<DataPtr> channels;
+	readChannels( vector<string>( 1, name ), channels, raw );
+	return channels[0];
+}
+
+void ImageReader::readChannels( const std::vector<std::string> &names, std::vector<IECore::DataPtr> &channels, bool raw )
+{
+	m_implementation->readChannels(
+		names, raw,
+		m_dataWindowParameter->getTypedValue(),
+		m_mipLevelParameter->getNumericValue(),
+		channels
+	);
 }
 
 void ImageReader::channelsToRead( vector<string> &names )
@@ -516,6 +819,36 @@ const BoolParameter *ImageReader::rawChannelsParameter() const
 	return m_rawChannelsParameter.get();
 }
 
+Box2iParameter *ImageReader::dataWindowParameter()
+{
+	return m_dataWindowParameter.get();
+}
+
+const Box2iParameter *ImageReader::dataWindowParameter() const
+{
+	return m_dataWindowParameter.get();
+}
+
+IntParameter *ImageReader::mipLevelParameter()
+{
+	return m_mipLevelParameter.get();
+}
+
+const IntParameter *ImageReader::mipLevelParameter() const
+{
+	return m_mipLevelParameter.get();
+}
+
+BoolParameter *ImageReader::tiledParameter()
+{
+	return m_tiledParameter.get();
+}
+
+const BoolParameter *ImageReader::tiledParameter() const
+{
+	return m_tiledParameter.get();
+}
+
 CompoundObjectPtr ImageReader::readHeader()
 {
 	std::vector<std::string> cn;
@@ -38,7 +38,9 @@
 #include "IECore/DespatchTypedData.h"
 #include "IECore/TypeTraits.h"
 
-#include "boost/multi_array.hpp"
+#include "tbb/atomic.h"
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
 
 using namespace std;
 using namespace Imath;
@@ -86,6 +88,60 @@ static unsigned char g_delete[512] = {
 
 };
 
+namespace
+{
+
+// The thresholded image, with pixels outside the image reading as 0.
+struct Mask
+{
+
+	Mask( const V2i &size )
+		:	size( size ), pixels( size.x * size.y )
+	{
+	}
+
+	inline int operator()( int y, int x ) const
+	{
+		if( x < 0 || y < 0 || x >= size.x || y >= size.y )
+		{
+			return 0;
+		}
+		return pixels[y*size.x + x];
+	}
+
+	V2i size;
+	std::vector<unsigned char> pixels;
+
+};
+
+// Scans row y of the source image for pixels to be deleted, starting with neighbourhood
+// map p. Deletions are made in the destination image, so that rows may be processed
+// in parallel. Returns the number of pixels deleted, and updates p with the final
+// neighbourhood map for the row.
+//
+// This is the graphics gems algorithm, but with the neighbourhood maps of the previous
+// scanline read directly from the source image rather than from a scanline buffer.
+// Because the original only ever deleted pixels after they had been read, this
+// produces identical results.
+size_t scanRow( const Mask &source, int y, int m, int &p, Mask &destination )
+{
+	size_t count = 0;
+	unsigned char *row = &destination.pixels[y*source.size.x];
+	for( int x = 0; x < source.size.x; x++ )
+	{
+		p = ((p<<1)&0666) | (source( y - 1, x + 1 ) << 6) |
+			(source( y, x + 1 ) << 3) | source( y + 1, x + 1 );
+		if( ((p&m) == 0) && g_delete[p] && row[x] )
+		{
+			count++;
+			row[x] = 0;
+		}
+	}
+	return count;
+}
+
+} // namespace
+
 ImageThinner::ImageThinner()
 	:	ChannelOp( "Performs thinning of binary images." )
 {
@@ -128,22 +184,24 @@ void ImageThinner::modifyChannels( const Imath::Box2i &displayWindow, const Imat
 		std::vector<float> &channel = floatData->writable();
 
 		// threshold the image first
-		for( std::vector<float>::iterator it=channel.begin(); it!=channel.end(); it++ )
-		{
-			*it = *it < threshold ? 0.0f : 1.0f;
-		}
+		Mask source( size );
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, channel.size() ),
+			[&channel, &source, threshold]( const tbb::blocked_range<size_t> &range )
+			{
+				for( size_t j = range.begin(); j != range.end(); ++j )
+				{
+					source.pixels[j] = channel[j] < threshold ? 0 : 1;
+				}
+			}
+		);
 
 		// then apply the graphics gems magic that i don't understand in the slightest
 		//////////////////////////////////////////////////////////////////////////////
 
-		boost::multi_array_ref<float, 2> image( &channel[0], boost::extents[size.y][size.x] );
+		Mask destination( source );
 
-		int	p, q; // Neighborhood maps of adjacent cells
-		std::vector<unsigned char> qb; // Neighborhood maps of previous scanline
-		qb.resize( size.x );
-		qb[qb.size()-1] = 0; // Used for lower-right pixel
-
-		int count = 1; // Deleted pixel count
+		size_t count = 1; // Deleted pixel count
 		while( count )
 		{
 			count = 0;
@@ -153,60 +211,55 @@ void ImageThinner::modifyChannels( const Imath::Box2i &displayWindow, const Imat
 
 				int m = g_masks[i];
 
-				// Build initial previous scan buffer
-
-				p = image[0][0] > 0.5f;
-				for( int x = 0; x < size.x-1; x++ )
-				{
-					qb[x] = p = ((p<<1)&0006) | (image[0][x+1] > 0.5f);
-				}
-
-				// Scan image for pixel deletion candidates
-
-				for( int y = 0; y < size.y-1; y++ )
-				{
-
-					q = qb[0];
-					p = ((q<<3)&0110) | (image[y+1][0] > 0.5f);
+				// Scan all but the last row in parallel, keeping the neighbourhood map
+				// of the right edge of the penultimate row for use in the bottom scan line.
 
-					for( int x = 0; x < size.x-1; x++ )
+				tbb::atomic<size_t> rowsCount;
+				rowsCount = 0;
+				int bottomP = 0;
+				tbb::parallel_for(
+					tbb::blocked_range<int>( 0, size.y - 1 ),
+					[&source, &destination, &rowsCount, &bottomP, m]( const tbb::blocked_range<int> &range )
 					{
-						q = qb[x];
-						p = ((p<<1)&0666) | ((q<<3)&0110) |
-							(image[y+1][x+1] > 0.5f);
-						qb[x] = p;
-						if( ((p&m) == 0) && g_delete[p] )
+						for( int y = range.begin(); y != range.end(); ++y )
 						{
-							count++;
-							image[y][x] = 0.f;
+							int p = (source( y - 1, 1 ) << 6) | (source( y, 1 ) << 3) | source( y + 1, 0 );
+							rowsCount += scanRow( source, y, m, p, destination );
+							if( y == source.size.y - 2 )
+							{
+								bottomP = p;
+							}
 						}
 					}
+				);
+				count += rowsCount;
 
-					// Process right edge pixel
+				// Process bottom scan line
 
-					p = (p<<1)&0666;
-					if( (p&m) == 0 && g_delete[p] )
+				if( size.y == 1 )
+				{
+					bottomP = source( 0, 0 );
+					for( int x = 0; x < size.x - 1; x++ )
 					{
-						count++;
-						image[y][size.x-1] = 0.f;
+						bottomP = ((bottomP<<1)&0006) | source( 0, x + 1 );
 					}
-
 				}
+				count += scanRow( source, size.y - 1, m, bottomP, destination );
 
-				// Process bottom scan line
+				source.pixels = destination.pixels;
+			}
+		}
 
-				for( int x = 0 ; x < size.x ; x++ )
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, channel.size() ),
+			[&channel, &source]( const tbb::blocked_range<size_t> &range )
+			{
+				for( size_t j = range.begin(); j != range.end(); ++j )
 				{
-					q = qb[x];
-					p = ((p<<1)&0666) | ((q<<3)&0110);
-					if( (p&m) == 0 && g_delete[p] )
-					{
-						count++;
-						image[size.y-1][x] = 0.f;
-					}
+					channel[j] = source.pixels[j];
 				}
 			}
-		}
+		);
 	}
 }
 
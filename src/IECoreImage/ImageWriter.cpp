@@ -37,6 +37,7 @@
 #include "IECoreImage/ColorAlgo.h"
 #include "IECoreImage/ImagePrimitive.h"
 #include "IECoreImage/OpenImageIOAlgo.h"
+#include "IECoreImage/TiledChannelData.h"
 
 #include "IECore/CompoundParameter.h"
 #include "IECore/DataInterleaveOp.h"
@@ -75,6 +76,36 @@ IE_CORE_DEFINERUNTIMETYPED( ImageWriter )
 namespace
 {
 
+// Tiled channels are written as the float data they represent.
+IECore::TypeId channelType( const Data *channel )
+{
+	if( channel->isInstanceOf( TiledChannelData::staticTypeId() ) )
+	{
+		return FloatVectorDataTypeId;
+	}
+	return channel->typeId();
+}
+
+// Returns a copy of the image in which all TiledChannelData has been
+// replaced with the equivalent FloatVectorData, or nullptr if the image
+// has no tiled channels.
+ImagePrimitivePtr expandTiledChannels( const ImagePrimitive *image )
+{
+	ImagePrimitivePtr result = nullptr;
+	for( const auto &channel : image->channels )
+	{
+		if( const TiledChannelData *tiledData = runTimeCast<const TiledChannelData>( channel.second.get() ) )
+		{
+			if( !result )
+			{
+				result = image->copy();
+			}
+			result->channels[channel.first] = tiledData->readable().pixels();
+		}
+	}
+	return result;
+}
+
 void channelsToWrite( const ImagePrimitive *image, const ImageOutput *out, const CompoundObject *operands, std::vector<std::string> &channels )
 {
 	channels.clear();
@@ -406,10 +437,13 @@ bool ImageWriter::canWrite( ConstObjectPtr object, const string &fileName )
 
 	const Data *firstChannelData = image->channels.begin()->second.get();
 
-	const OpenImageIOAlgo::DataView dataView( firstChannelData );
-	if( dataView.type == TypeDesc::UNKNOWN )
+	if( !firstChannelData->isInstanceOf( TiledChannelData::staticTypeId() ) )
 	{
-		return false;
+		const OpenImageIOAlgo::DataView dataView( firstChannelData );
+		if( dataView.type == TypeDesc::UNKNOWN )
+		{
+			return false;
+		}
 	}
 
 	for( const auto &channel : image->channels )
@@ -417,7 +451,7 @@ bool ImageWriter::canWrite( ConstObjectPtr object, const string &fileName )
 		// OpenImageIO claims to handle non-matching types (if the format supports it)
 		// but when it comes time to write the scanlines, we must pass a single buffer
 		// of interleaved pixels, so we only support a single type for now.
-		if( channel.second->typeId() != firstChannelData->typeId() )
+		if( channelType( channel.second.get() ) != channelType( firstChannelData ) )
 		{
 			return false;
 		}
@@ -455,6 +489,14 @@ void ImageWriter::doWrite( const CompoundObject *operands )
 		throw InvalidArgumentException( "ImageWriter: Invalid channels on image" );
 	}
 
+	// The scanlines are written from a single interleaved buffer, so
+	// tiled channels must be expanded into contiguous ones first.
+	ConstImagePrimitivePtr expandedImage = expandTiledChannels( image );
+	if( expandedImage )
+	{
+		image = expandedImage.get();
+	}
+
 	const Box2i &dataWindow = image->getDataWindow();
 	const Box2i &displayWindow = image->getDisplayWindow();
 
@@ -46,6 +46,9 @@
 #include "IECore/ObjectParameter.h"
 #include "IECore/TypeTraits.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 #include <cassert>
 
 using namespace boost;
@@ -143,26 +146,35 @@ void LensDistortOp::begin( const CompoundObject * operands )
 	std::vector<float> &cache( cachePtr->writable() );
 	cache.resize( ( m_distortedDataWindow.size().x + 1 ) * ( m_distortedDataWindow.size().y + 1 ) * 2 ); // We interleave the X and Y vector components within the cache.
 
-	for( int y = distortedWindow.max.y, pixelIndex = 0; y >= distortedWindow.min.y; --y )
-	{
-		for( int x = distortedWindow.min.x; x <= distortedWindow.max.x; ++x )
+	const int cacheWidth = distortedWindow.size().x + 1;
+	tbb::parallel_for(
+		tbb::blocked_range<int>( distortedWindow.min.y, distortedWindow.max.y + 1 ),
+		[this, &cache, &distortedWindow, &displayWH, &displayOrigin, cacheWidth]( const tbb::blocked_range<int> &range )
 		{
-			// Convert to UV space with the origin in the bottom left.
-			Imath::V2f p( Imath::V2f( x, y ) );
-			Imath::V2d uv( p[0] / displayWH[0], p[1] / displayWH[1] );
-
-			// Get the distorted uv coordinate.
-			Imath::V2d duv( m_mode == kDistort ? m_lensModel->distort( uv ) : m_lensModel->undistort( uv ) );
-
-			// Transform it to image space.
-			p = Imath::V2f(
-				duv[0] * displayWH[0] + displayOrigin[0], ( ( displayWH[1] - 1. ) - ( duv[1] * displayWH[1] ) ) + displayOrigin[1]
-			);
-
-			cache[pixelIndex++] = p[0];
-			cache[pixelIndex++] = p[1];
+			for( int y = range.begin(); y != range.end(); ++y )
+			{
+				// Rows are stored from the top of the image downwards.
+				int pixelIndex = ( distortedWindow.max.y - y ) * cacheWidth * 2;
+				for( int x = distortedWindow.min.x; x <= distortedWindow.max.x; ++x )
+				{
+					// Convert to UV space with the origin in the bottom left.
+					Imath::V2f p( Imath::V2f( x, y ) );
+					Imath::V2d uv( p[0] / displayWH[0], p[1] / displayWH[1] );
+
+					// Get the distorted uv coordinate.
+					Imath::V2d duv( m_mode == kDistort ? m_lensModel->distort( uv ) : m_lensModel->undistort( uv ) );
+
+					// Transform it to image space.
+					p = Imath::V2f(
+						duv[0] * displayWH[0] + displayOrigin[0], ( ( displayWH[1] - 1. ) - ( duv[1] * displayWH[1] ) ) + displayOrigin[1]
+					);
+
+					cache[pixelIndex++] = p[0];
+					cache[pixelIndex++] = p[1];
+				}
+			}
 		}
-	}
+	);
 
 	m_cachePtr = cachePtr;
 }
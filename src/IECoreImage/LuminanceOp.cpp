@@ -44,6 +44,9 @@
 
 #include "boost/format.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace boost;
 using namespace Imath;
 using namespace IECore;
@@ -192,14 +195,25 @@ const BoolParameter * LuminanceOp::removeColorChannelsParameter() const
 template<typename T>
 void LuminanceOp::calculate( const T *r, const T *g, const T *b, int steps[3], int size, T *y )
 {
-	Color3f weights = m_weightsParameter->getTypedValue();
-	for( int i=0; i<size; i++ )
-	{
-		*y++ = weights[0] * *r + weights[1] * *g + weights[2] * *b;
-		r += steps[0];
-		g += steps[1];
-		b += steps[2];
-	}
+	const Color3f weights = m_weightsParameter->getTypedValue();
+	const int rStep = steps[0], gStep = steps[1], bStep = steps[2];
+	tbb::parallel_for(
+		tbb::blocked_range<int>( 0, size, 4096 ),
+		[r, g, b, y, rStep, gStep, bStep, &weights]( const tbb::blocked_range<int> &range )
+		{
+			const T *rr = r + range.begin() * rStep;
+			const T *gg = g + range.begin() * gStep;
+			const T *bb = b + range.begin() * bStep;
+			T *yy = y + range.begin();
+			for( int i = range.begin(); i != range.end(); ++i )
+			{
+				*yy++ = weights[0] * *rr + weights[1] * *gg + weights[2] * *bb;
+				rr += rStep;
+				gg += gStep;
+				bb += bStep;
+			}
+		}
+	);
 }
 
 void LuminanceOp::modify( Object *object, const CompoundObject *operands )
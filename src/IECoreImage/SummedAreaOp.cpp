@@ -37,6 +37,9 @@
 #include "IECore/DespatchTypedData.h"
 #include "IECore/TypeTraits.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace std;
 using namespace Imath;
 using namespace IECore;
@@ -69,27 +72,48 @@ struct SummedAreaOp::SumArea
 		typedef typename Container::value_type V;
 
 		Container &buffer = data->writable();
+		V *pixels = &buffer[0];
 
-		// deal with first row alone, as it doesn't have values above it
-		unsigned pixelIndex=0;
-		V rowSum = 0;
-		for( int x=m_dataWindow.min.x; x<=m_dataWindow.max.x; x++, pixelIndex++ )
-		{
-			rowSum += buffer[pixelIndex];
-			buffer[pixelIndex] = rowSum;
-		}
-		// now do the other rows
-		unsigned upperPixelIndex = 0;
-		pixelIndex = m_dataWindow.size().x + 1;
-		for( int y=m_dataWindow.min.y + 1; y<=m_dataWindow.max.y; y++ )
-		{
-			rowSum = 0;
-			for( int x=m_dataWindow.min.x; x<=m_dataWindow.max.x; x++ )
+		const size_t width = m_dataWindow.size().x + 1;
+		const size_t height = m_dataWindow.size().y + 1;
+
+		// First compute the running sum along each row. Rows are
+		// independent so we can do them in parallel.
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, height ),
+			[pixels, width]( const tbb::blocked_range<size_t> &range )
 			{
-				rowSum += buffer[pixelIndex];
-				buffer[pixelIndex++] = rowSum + buffer[upperPixelIndex++];
+				for( size_t y = range.begin(); y != range.end(); ++y )
+				{
+					V *row = pixels + y * width;
+					V rowSum = 0;
+					for( size_t x = 0; x < width; ++x )
+					{
+						rowSum += row[x];
+						row[x] = rowSum;
+					}
+				}
 			}
-		}
+		);
+
+		// Then accumulate down the columns, processing bands of columns in
+		// parallel. The additions are performed in exactly the same order
+		// as a serial implementation would use, so the results are identical.
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, width, 64 ),
+			[pixels, width, height]( const tbb::blocked_range<size_t> &range )
+			{
+				for( size_t y = 1; y < height; ++y )
+				{
+					V *row = pixels + y * width;
+					const V *upperRow = row - width;
+					for( size_t x = range.begin(); x != range.end(); ++x )
+					{
+						row[x] += upperRow[x];
+					}
+				}
+			}
+		);
 	}
 
 	private :
@@ -100,10 +124,16 @@ struct SummedAreaOp::SumArea
 
 void SummedAreaOp::modifyChannels( const Imath::Box2i &displayWindow, const Imath::Box2i &dataWindow, ChannelVector &channels )
 {
-	SumArea summer( dataWindow );
-	for( unsigned i=0; i<channels.size(); i++ )
-	{
-		despatchTypedData<SumArea, TypeTraits::IsNumericVectorTypedData>( channels[i].get(), summer );
-	}
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, channels.size(), 1 ),
+		[&channels, &dataWindow]( const tbb::blocked_range<size_t> &range )
+		{
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				SumArea summer( dataWindow );
+				despatchTypedData<SumArea, TypeTraits::IsNumericVectorTypedData>( channels[i].get(), summer );
+			}
+		}
+	);
 }
 
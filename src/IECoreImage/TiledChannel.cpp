@@ -0,0 +1,626 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#include "IECoreImage/TiledChannel.h"
+
+#include "IECore/Exception.h"
+#include "IECore/IndexedIO.h"
+
+#include "boost/format.hpp"
+
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
+#include <algorithm>
+#include <memory>
+
+using namespace std;
+using namespace Imath;
+using namespace IECore;
+using namespace IECoreImage;
+
+namespace
+{
+
+size_t area( const Box2i &box )
+{
+	if( box.isEmpty() )
+	{
+		return 0;
+	}
+	return (size_t)( box.max.x - box.min.x + 1 ) * (size_t)( box.max.y - box.min.y + 1 );
+}
+
+bool isConstant( const vector<float> &pixels, float &value )
+{
+	if( pixels.empty() )
+	{
+		return false;
+	}
+	value = pixels[0];
+	for( const auto &p : pixels )
+	{
+		if( p != value )
+		{
+			return false;
+		}
+	}
+	return true;
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// Tile
+//////////////////////////////////////////////////////////////////////////
+
+TiledChannel::Tile::Tile( float value, bool computed )
+	:	value( value ), computed( computed )
+{
+}
+
+//////////////////////////////////////////////////////////////////////////
+// TiledChannel
+//////////////////////////////////////////////////////////////////////////
+
+const int TiledChannel::tileSize;
+
+TiledChannel::TiledChannel()
+{
+}
+
+TiledChannel::TiledChannel( const Imath::Box2i &dataWindow, float value )
+	:	m_dataWindow( dataWindow )
+{
+	const V2i n = numTiles();
+	m_tiles.resize( n.x * n.y, Tile( value ) );
+}
+
+TiledChannel::TiledChannel( const Imath::Box2i &dataWindow, const std::vector<float> &pixels )
+	:	m_dataWindow( dataWindow )
+{
+	if( pixels.size() != area( m_dataWindow ) )
+	{
+		throw InvalidArgumentException( boost::str( boost::format( "TiledChannel : Wrong number of pixels (%d but should be %d)" ) % pixels.size() % area( m_dataWindow ) ) );
+	}
+
+	const V2i n = numTiles();
+	m_tiles.resize( n.x * n.y );
+
+	const int width = m_dataWindow.max.x - m_dataWindow.min.x + 1;
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, m_tiles.size() ),
+		[this, &pixels, width, n]( const tbb::blocked_range<size_t> &range )
+		{
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				const V2i index( i % n.x, i / n.x );
+				const Box2i bound = tileBound( index );
+				FloatVectorDataPtr tilePixels = new FloatVectorData;
+				vector<float> &tileVector = tilePixels->writable();
+				tileVector.reserve( area( bound ) );
+				for( int y = bound.min.y; y <= bound.max.y; ++y )
+				{
+					const float *row = pixels.data() + (size_t)( y - m_dataWindow.min.y ) * width + ( bound.min.x - m_dataWindow.min.x );
+					tileVector.insert( tileVector.end(), row, row + ( bound.max.x - bound.min.x + 1 ) );
+				}
+				m_tiles[i] = makeTile( tilePixels );
+			}
+		}
+	);
+}
+
+TiledChannel::TiledChannel( const Imath::Box2i &dataWindow, const TileFunction &tileFunction )
+	:	m_dataWindow( dataWindow ), m_tileFunction( tileFunction )
+{
+	const V2i n = numTiles();
+	m_tiles.resize( n.x * n.y, Tile( 0.0f, false ) );
+}
+
+TiledChannel::TiledChannel( const TiledChannel &other )
+{
+	*this = other;
+}
+
+TiledChannel &TiledChannel::operator = ( const TiledChannel &other )
+{
+	if( &other == this )
+	{
+		return *this;
+	}
+
+	std::vector<Tile> tiles;
+	{
+		tbb::spin_mutex::scoped_lock lock( other.m_mutex );
+		tiles = other.m_tiles;
+	}
+
+	tbb::spin_mutex::scoped_lock lock( m_mutex );
+	m_dataWindow = other.m_dataWindow;
+	m_tileFunction = other.m_tileFunction;
+	m_tiles.swap( tiles );
+	return *this;
+}
+
+const Imath::Box2i &TiledChannel::dataWindow() const
+{
+	return m_dataWindow;
+}
+
+void TiledChannel::setOrigin( const Imath::V2i &origin )
+{
+	if( m_dataWindow.isEmpty() )
+	{
+		return;
+	}
+
+	const V2i offset = origin - m_dataWindow.min;
+	if( offset == V2i( 0 ) )
+	{
+		return;
+	}
+
+	m_dataWindow.min += offset;
+	m_dataWindow.max += offset;
+
+	if( m_tileFunction )
+	{
+		// The function computes tiles in terms of the old
+		// data window, so we must translate back into it.
+		TileFunction f = m_tileFunction;
+		m_tileFunction = [f, offset]( const Box2i &tileBound ) {
+			return f( Box2i( tileBound.min - offset, tileBound.max - offset ) );
+		};
+	}
+}
+
+Imath::V2i TiledChannel::numTiles() const
+{
+	if( m_dataWindow.isEmpty() )
+	{
+		return V2i( 0 );
+	}
+
+	const V2i size = m_dataWindow.size() + V2i( 1 );
+	return V2i(
+		( size.x + tileSize - 1 ) / tileSize,
+		( size.y + tileSize - 1 ) / tileSize
+	);
+}
+
+Imath::Box2i TiledChannel::tileBound( const Imath::V2i &tileIndex ) const
+{
+	const V2i min = m_dataWindow.min + tileIndex * tileSize;
+	return Box2i(
+		min,
+		V2i(
+			std::min( min.x + tileSize - 1, m_dataWindow.max.x ),
+			std::min( min.y + tileSize - 1, m_dataWindow.max.y )
+		)
+	);
+}
+
+IECore::ConstFloatVectorDataPtr TiledChannel::tile( const Imath::V2i &tileIndex, float &constantValue ) const
+{
+	const Tile t = getTile( tileIndex );
+	constantValue = t.value;
+	return t.pixels;
+}
+
+void TiledChannel::setTile( const Imath::V2i &tileIndex, IECore::ConstFloatVectorDataPtr pixels )
+{
+	const size_t i = this->tileIndex( tileIndex );
+	if( !pixels || pixels->readable().size() != area( tileBound( tileIndex ) ) )
+	{
+		throw InvalidArgumentException( "TiledChannel::setTile : Pixels do not match tile size" );
+	}
+
+	const Tile t = makeTile( pixels );
+	tbb::spin_mutex::scoped_lock lock( m_mutex );
+	m_tiles[i] = t;
+}
+
+void TiledChannel::setTile( const Imath::V2i &tileIndex, float constantValue )
+{
+	const size_t i = this->tileIndex( tileIndex );
+	tbb::spin_mutex::scoped_lock lock( m_mutex );
+	m_tiles[i] = Tile( constantValue );
+}
+
+size_t TiledChannel::numStoredTiles() const
+{
+	tbb::spin_mutex::scoped_lock lock( m_mutex );
+	size_t result = 0;
+	for( const auto &t : m_tiles )
+	{
+		if( t.pixels )
+		{
+			result++;
+		}
+	}
+	return result;
+}
+
+void TiledChannel::readPixels( const Imath::Box2i &region, float *pixels ) const
+{
+	if( region.isEmpty() )
+	{
+		return;
+	}
+
+	const int regionWidth = region.max.x - region.min.x + 1;
+	std::fill( pixels, pixels + area( region ), 0.0f );
+
+	Box2i window = region;
+	window.min.x = std::max( window.min.x, m_dataWindow.min.x );
+	window.min.y = std::max( window.min.y, m_dataWindow.min.y );
+	window.max.x = std::min( window.max.x, m_dataWindow.max.x );
+	window.max.y = std::min( window.max.y, m_dataWindow.max.y );
+	if( window.isEmpty() )
+	{
+		return;
+	}
+
+	const V2i minTile = ( window.min - m_dataWindow.min ) / tileSize;
+	const V2i maxTile = ( window.max - m_dataWindow.min ) / tileSize;
+	for( int ty = minTile.y; ty <= maxTile.y; ++ty )
+	{
+		for( int tx = minTile.x; tx <= maxTile.x; ++tx )
+		{
+			const V2i index( tx, ty );
+			const Box2i bound = tileBound( index );
+			const Tile t = getTile( index );
+
+			const int x0 = std::max( bound.min.x, window.min.x );
+			const int x1 = std::min( bound.max.x, window.max.x );
+			const int y0 = std::max( bound.min.y, window.min.y );
+			const int y1 = std::min( bound.max.y, window.max.y );
+			const int tileWidth = bound.max.x - bound.min.x + 1;
+
+			for( int y = y0; y <= y1; ++y )
+			{
+				float *out = pixels + (size_t)( y - region.min.y ) * regionWidth + ( x0 - region.min.x );
+				if( t.pixels )
+				{
+					const float *in = t.pixels->readable().data() + (size_t)( y - bound.min.y ) * tileWidth + ( x0 - bound.min.x );
+					std::copy( in, in + ( x1 - x0 + 1 ), out );
+				}
+				else
+				{
+					std::fill( out, out + ( x1 - x0 + 1 ), t.value );
+				}
+			}
+		}
+	}
+}
+
+IECore::FloatVectorDataPtr TiledChannel::pixels() const
+{
+	FloatVectorDataPtr result = new FloatVectorData;
+	result->writable().resize( area( m_dataWindow ) );
+	if( m_dataWindow.isEmpty() )
+	{
+		return result;
+	}
+
+	// Each tile row is read separately, so that tiles
+	// requiring computation are computed in parallel.
+	float *data = result->writable().data();
+	const int width = m_dataWindow.max.x - m_dataWindow.min.x + 1;
+	tbb::parallel_for(
+		tbb::blocked_range<int>( 0, numTiles().y ),
+		[this, data, width]( const tbb::blocked_range<int> &range )
+		{
+			for( int ty = range.begin(); ty != range.end(); ++ty )
+			{
+				Box2i band = tileBound( V2i( 0, ty ) );
+				band.max.x = m_dataWindow.max.x;
+				readPixels( band, data + (size_t)( band.min.y - m_dataWindow.min.y ) * width );
+			}
+		}
+	);
+
+	return result;
+}
+
+TiledChannel TiledChannel::crop( const Imath::Box2i &dataWindow ) const
+{
+	std::shared_ptr<const TiledChannel> source( new TiledChannel( *this ) );
+	TiledChannel result(
+		dataWindow,
+		[source]( const Box2i &tileBound ) {
+			FloatVectorDataPtr pixels = new FloatVectorData;
+			pixels->writable().resize( area( tileBound ) );
+			source->readPixels( tileBound, pixels->writable().data() );
+			return pixels;
+		}
+	);
+
+	// Where the tile grids line up, tiles lying inside both data windows
+	// are identical and can be shared rather than recomputed.
+
+	const V2i offset = dataWindow.min - m_dataWindow.min;
+	if( offset.x % tileSize || offset.y % tileSize )
+	{
+		return result;
+	}
+
+	const V2i tileOffset = offset / tileSize;
+	const V2i resultTiles = result.numTiles();
+	const V2i sourceTiles = numTiles();
+
+	tbb::spin_mutex::scoped_lock lock( m_mutex );
+	for( int ty = 0; ty < resultTiles.y; ++ty )
+	{
+		for( int tx = 0; tx < resultTiles.x; ++tx )
+		{
+			const V2i sourceIndex = V2i( tx, ty ) + tileOffset;
+			if(
+				sourceIndex.x < 0 || sourceIndex.y < 0 ||
+				sourceIndex.x >= sourceTiles.x || sourceIndex.y >= sourceTiles.y
+			)
+			{
+				continue;
+			}
+			const Tile &t = m_tiles[sourceIndex.y * sourceTiles.x + sourceIndex.x];
+			if( t.computed && tileBound( sourceIndex ) == result.tileBound( V2i( tx, ty ) ) )
+			{
+				result.m_tiles[ty * resultTiles.x + tx] = t;
+			}
+		}
+	}
+
+	return result;
+}
+
+bool TiledChannel::operator == ( const TiledChannel &other ) const
+{
+	if( m_dataWindow != other.m_dataWindow )
+	{
+		return false;
+	}
+
+	const V2i n = numTiles();
+	for( int ty = 0; ty < n.y; ++ty )
+	{
+		for( int tx = 0; tx < n.x; ++tx )
+		{
+			const Tile t = getTile( V2i( tx, ty ) );
+			const Tile o = other.getTile( V2i( tx, ty ) );
+			if( t.pixels && o.pixels )
+			{
+				if( t.pixels != o.pixels && t.pixels->readable() != o.pixels->readable() )
+				{
+					return false;
+				}
+			}
+			else if( t.pixels || o.pixels || t.value != o.value )
+			{
+				// Constant tiles are never stored as pixels,
+				// so a mix of the two is always a difference.
+				return false;
+			}
+		}
+	}
+
+	return true;
+}
+
+bool TiledChannel::operator != ( const TiledChannel &other ) const
+{
+	return !( *this == other );
+}
+
+void TiledChannel::hash( IECore::MurmurHash &h ) const
+{
+	h.append( m_dataWindow );
+	const V2i n = numTiles();
+	for( int ty = 0; ty < n.y; ++ty )
+	{
+		for( int tx = 0; tx < n.x; ++tx )
+		{
+			const Tile t = getTile( V2i( tx, ty ) );
+			if( t.pixels )
+			{
+				t.pixels->hash( h );
+			}
+			else
+			{
+				h.append( t.value );
+			}
+		}
+	}
+}
+
+void TiledChannel::memoryUsage( IECore::Object::MemoryAccumulator &accumulator ) const
+{
+	tbb::spin_mutex::scoped_lock lock( m_mutex );
+	accumulator.accumulate( m_tiles.capacity() * sizeof( Tile ) );
+	for( const auto &t : m_tiles )
+	{
+		if( t.pixels )
+		{
+			accumulator.accumulate( t.pixels.get() );
+		}
+	}
+}
+
+void TiledChannel::save( IECore::IndexedIO *container ) const
+{
+	const int dataWindow[4] = { m_dataWindow.min.x, m_dataWindow.min.y, m_dataWindow.max.x, m_dataWindow.max.y };
+	container->write( "dataWindow", dataWindow, 4 );
+
+	// We store one value per tile, with a flag to say whether
+	// or not it is constant, followed by the pixels of all the
+	// non-constant tiles concatenated together.
+
+	const V2i n = numTiles();
+	vector<float> values( m_tiles.size(), 0.0f );
+	vector<unsigned char> stored( m_tiles.size(), 0 );
+	vector<float> pixels;
+	for( int ty = 0; ty < n.y; ++ty )
+	{
+		for( int tx = 0; tx < n.x; ++tx )
+		{
+			const size_t i = ty * n.x + tx;
+			const Tile t = getTile( V2i( tx, ty ) );
+			if( t.pixels )
+			{
+				stored[i] = 1;
+				pixels.insert( pixels.end(), t.pixels->readable().begin(), t.pixels->readable().end() );
+			}
+			else
+			{
+				values[i] = t.value;
+			}
+		}
+	}
+
+	if( !values.empty() )
+	{
+		container->write( "values", values.data(), values.size() );
+		container->write( "stored", stored.data(), stored.size() );
+	}
+	if( !pixels.empty() )
+	{
+		container->write( "pixels", pixels.data(), pixels.size() );
+	}
+}
+
+void TiledChannel::load( const IECore::IndexedIO *container )
+{
+	int dataWindow[4];
+	int *dataWindowPtr = dataWindow;
+	container->read( "dataWindow", dataWindowPtr, 4 );
+
+	TiledChannel result( Box2i( V2i( dataWindow[0], dataWindow[1] ), V2i( dataWindow[2], dataWindow[3] ) ) );
+	if( !result.m_tiles.empty() )
+	{
+		vector<float> values( result.m_tiles.size() );
+		float *valuesPtr = values.data();
+		container->read( "values", valuesPtr, values.size() );
+
+		vector<unsigned char> stored( result.m_tiles.size() );
+		unsigned char *storedPtr = stored.data();
+		container->read( "stored", storedPtr, stored.size() );
+
+		vector<float> pixels;
+		if( container->hasEntry( "pixels" ) )
+		{
+			pixels.resize( container->entry( "pixels" ).arrayLength() );
+			float *pixelsPtr = pixels.data();
+			container->read( "pixels", pixelsPtr, pixels.size() );
+		}
+
+		const V2i n = result.numTiles();
+		size_t offset = 0;
+		for( size_t i = 0; i < result.m_tiles.size(); ++i )
+		{
+			if( !stored[i] )
+			{
+				result.m_tiles[i] = Tile( values[i] );
+				continue;
+			}
+
+			const size_t tileArea = area( result.tileBound( V2i( i % n.x, i / n.x ) ) );
+			if( offset + tileArea > pixels.size() )
+			{
+				throw IOException( "TiledChannel::load : Unexpected end of data" );
+			}
+			FloatVectorDataPtr tilePixels = new FloatVectorData;
+			tilePixels->writable().assign( pixels.begin() + offset, pixels.begin() + offset + tileArea );
+			result.m_tiles[i].pixels = tilePixels;
+			offset += tileArea;
+		}
+
+		if( offset != pixels.size() )
+		{
+			throw IOException( "TiledChannel::load : Unexpected data" );
+		}
+	}
+
+	*this = result;
+}
+
+size_t TiledChannel::tileIndex( const Imath::V2i &tileIndex ) const
+{
+	const V2i n = numTiles();
+	if( tileIndex.x < 0 || tileIndex.y < 0 || tileIndex.x >= n.x || tileIndex.y >= n.y )
+	{
+		throw InvalidArgumentException( boost::str( boost::format( "TiledChannel : Tile index (%d, %d) out of range" ) % tileIndex.x % tileIndex.y ) );
+	}
+	return tileIndex.y * n.x + tileIndex.x;
+}
+
+TiledChannel::Tile TiledChannel::computeTile( const Imath::V2i &tileIndex ) const
+{
+	ConstFloatVectorDataPtr pixels = m_tileFunction( tileBound( tileIndex ) );
+	if( !pixels || pixels->readable().size() != area( tileBound( tileIndex ) ) )
+	{
+		throw Exception( "TiledChannel : Tile function returned the wrong number of pixels" );
+	}
+	return makeTile( pixels );
+}
+
+TiledChannel::Tile TiledChannel::makeTile( IECore::ConstFloatVectorDataPtr pixels )
+{
+	Tile result;
+	if( !isConstant( pixels->readable(), result.value ) )
+	{
+		result.pixels = pixels;
+	}
+	return result;
+}
+
+TiledChannel::Tile TiledChannel::getTile( const Imath::V2i &tileIndex ) const
+{
+	const size_t i = this->tileIndex( tileIndex );
+	{
+		tbb::spin_mutex::scoped_lock lock( m_mutex );
+		if( m_tiles[i].computed )
+		{
+			return m_tiles[i];
+		}
+	}
+
+	// Compute outside the lock so that other tiles can be
+	// computed concurrently. If another thread computes the
+	// same tile at the same time, we'll simply store identical
+	// results twice.
+	const Tile t = computeTile( tileIndex );
+	tbb::spin_mutex::scoped_lock lock( m_mutex );
+	m_tiles[i] = t;
+	return t;
+}
@@ -0,0 +1,89 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#include "IECoreImage/TiledChannelData.h"
+
+#include "IECore/TypedData.inl"
+
+using namespace IECore;
+
+namespace
+{
+
+static const unsigned int g_ioVersion = 0;
+
+} // namespace
+
+namespace IECore
+{
+
+IECORE_RUNTIMETYPED_DEFINETEMPLATESPECIALISATION( TiledChannelData, IECoreImage::TiledChannelDataTypeId )
+
+template<>
+void TiledChannelData::save( SaveContext *context ) const
+{
+	Data::save( context );
+	IndexedIOPtr container = context->container( staticTypeName(), g_ioVersion );
+	readable().save( container.get() );
+}
+
+template<>
+void TiledChannelData::load( LoadContextPtr context )
+{
+	Data::load( context );
+	unsigned int v = g_ioVersion;
+	ConstIndexedIOPtr container = context->container( staticTypeName(), v );
+	writable().load( container.get() );
+}
+
+template<>
+void TiledChannelData::memoryUsage( Object::MemoryAccumulator &accumulator ) const
+{
+	Data::memoryUsage( accumulator );
+	accumulator.accumulate( &readable(), sizeof( IECoreImage::TiledChannel ) );
+	readable().memoryUsage( accumulator );
+}
+
+template<>
+MurmurHash SharedDataHolder<IECoreImage::TiledChannel>::hash() const
+{
+	MurmurHash result;
+	readable().hash( result );
+	return result;
+}
+
+template class TypedData<IECoreImage::TiledChannel>;
+
+} // namespace IECore
@@ -42,6 +42,9 @@
 #include "IECore/Interpolator.h"
 #include "IECore/TypeTraits.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace boost;
 using namespace Imath;
 using namespace IECore;
@@ -107,7 +110,7 @@ struct WarpOp::Warp
 	{
 	}
 
-	inline void computePixelCoordinates( float x, float y, int &x1, int &y1, int &x2, int &y2, float &ratioX, float &ratioY )
+	inline void computePixelCoordinates( float x, float y, int &x1, int &y1, int &x2, int &y2, float &ratioX, float &ratioY ) const
 	{
 		Imath::V2f inPos = m_warpOp->warp( Imath::V2f( x, y ) );
 		x1 = int(inPos.x);
@@ -164,50 +167,60 @@ struct WarpOp::Warp
 		typedef typename Container::value_type V;
 		typename T::Ptr inData = data->copy();
 		const Container &inBuffer = inData->readable();
-		unsigned int outputWidth = m_outputDataWindow.size().x + 1;
-		unsigned int inputWidth = m_inputDataWindow.size().x + 1;
-		unsigned int inputHeight = m_inputDataWindow.size().y + 1;
+		const int outputWidth = m_outputDataWindow.size().x + 1;
+		const int inputWidth = m_inputDataWindow.size().x + 1;
+		const int inputHeight = m_inputDataWindow.size().y + 1;
 		Container &outBuffer = data->writable();
 		outBuffer.resize( outputWidth * (m_outputDataWindow.size().y + 1) );
-		int x1, x2, y1, y2;
-		float ratioX, ratioY;
-		unsigned pixelIndex=0;
-		double r1, r2, r;
 
-		switch( m_filter )
+		if( m_filter != WarpOp::None && m_filter != WarpOp::Bilinear )
 		{
-		case WarpOp::None:
-			for( int y=m_outputDataWindow.min.y; y<=m_outputDataWindow.max.y; y++ )
-			{
-				for( int x=m_outputDataWindow.min.x; x<=m_outputDataWindow.max.x; x++, pixelIndex++ )
-				{
-					Imath::V2f inPos = m_warpOp->warp( Imath::V2f( x, y ) );
-					x1 = int(inPos.x) - m_inputDataWindow.min.x;
-					y1 = int(inPos.y) - m_inputDataWindow.min.y;
-					outBuffer[pixelIndex] = clampXY<V>( inBuffer, x1, y1, inputWidth, inputHeight);
-				}
-			}
-			break;
+			throw Exception("Invalid filter type!");
+		}
 
-		case WarpOp::Bilinear:
-			for( int y=m_outputDataWindow.min.y; y<=m_outputDataWindow.max.y; y++ )
+		// Each output pixel depends only on the input buffer, so we can process
+		// scanlines in parallel and still get exactly the same result as a serial
+		// loop.
+		tbb::parallel_for(
+			tbb::blocked_range<int>( m_outputDataWindow.min.y, m_outputDataWindow.max.y + 1 ),
+			[this, &inBuffer, &outBuffer, outputWidth, inputWidth, inputHeight]( const tbb::blocked_range<int> &range )
 			{
-				for( int x=m_outputDataWindow.min.x; x<=m_outputDataWindow.max.x; x++, pixelIndex++ )
+				int x1, x2, y1, y2;
+				float ratioX, ratioY;
+				double r1, r2, r;
+
+				for( int y = range.begin(); y != range.end(); ++y )
 				{
-					computePixelCoordinates( x, y, x1, y1, x2, y2, ratioX, ratioY );
-					LinearInterpolator<double>()( (double)clampXY<V>( inBuffer, x1, y1, inputWidth, inputHeight ),
-												  (double)clampXY<V>( inBuffer, x2, y1, inputWidth, inputHeight ), ratioX, r1 );
-					LinearInterpolator<double>()( (double)clampXY<V>( inBuffer, x1, y2, inputWidth, inputHeight ),
-												  (double)clampXY<V>( inBuffer, x2, y2, inputWidth, inputHeight ), ratioX, r2 );
-					LinearInterpolator<double>()( r1, r2, ratioY, r );
-					outBuffer[pixelIndex] = (V)r;
+					size_t pixelIndex = ( y - m_outputDataWindow.min.y ) * outputWidth;
+
+					switch( m_filter )
+					{
+					case WarpOp::None:
+						for( int x=m_outputDataWindow.min.x; x<=m_outputDataWindow.max.x; x++, pixelIndex++ )
+						{
+							Imath::V2f inPos = m_warpOp->warp( Imath::V2f( x, y ) );
+							x1 = int(inPos.x) - m_inputDataWindow.min.x;
+							y1 = int(inPos.y) - m_inputDataWindow.min.y;
+							outBuffer[pixelIndex] = clampXY<V>( inBuffer, x1, y1, inputWidth, inputHeight);
+						}
+						break;
+
+					case WarpOp::Bilinear:
+						for( int x=m_outputDataWindow.min.x; x<=m_outputDataWindow.max.x; x++, pixelIndex++ )
+						{
+							computePixelCoordinates( x, y, x1, y1, x2, y2, ratioX, ratioY );
+							LinearInterpolator<double>()( (double)clampXY<V>( inBuffer, x1, y1, inputWidth, inputHeight ),
+														  (double)clampXY<V>( inBuffer, x2, y1, inputWidth, inputHeight ), ratioX, r1 );
+							LinearInterpolator<double>()( (double)clampXY<V>( inBuffer, x1, y2, inputWidth, inputHeight ),
+														  (double)clampXY<V>( inBuffer, x2, y2, inputWidth, inputHeight ), ratioX, r2 );
+							LinearInterpolator<double>()( r1, r2, ratioY, r );
+							outBuffer[pixelIndex] = (V)r;
+						}
+						break;
+					}
 				}
 			}
-			break;
-
-		default:
-			throw Exception("Invalid filter type!");
-		}
+		);
 	}
 
 	private :
@@ -227,15 +240,28 @@ void WarpOp::modify( Object *object, const CompoundObject *operands )
 	begin( operands );
 	Imath::Box2i newDataWindow = warpedDataWindow( originalDataWindow );
 	std::string error;
-	Warp w( this, (FilterType)m_filterParameter->getNumericValue(), (BoundMode)m_boundModeParameter->getNumericValue(), newDataWindow, originalDataWindow );
+	std::vector<Data *> channels;
 	for( const auto &channel : image->channels )
 	{
 		if ( !image->channelValid( channel.second.get(), &error ) )
 		{
 			throw Exception( error );
 		}
-		despatchTypedData<Warp, TypeTraits::IsNumericVectorTypedData>( channel.second.get(), w );
+		channels.push_back( channel.second.get() );
 	}
+
+	Warp w( this, (FilterType)m_filterParameter->getNumericValue(), (BoundMode)m_boundModeParameter->getNumericValue(), newDataWindow, originalDataWindow );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, channels.size(), 1 ),
+		[&channels, &w]( const tbb::blocked_range<size_t> &range )
+		{
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				Warp channelWarp( w );
+				despatchTypedData<Warp, TypeTraits::IsNumericVectorTypedData>( channels[i], channelWarp );
+			}
+		}
+	);
 	end();
 	image->setDataWindow( newDataWindow );
 }
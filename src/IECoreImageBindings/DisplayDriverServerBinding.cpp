@@ -38,14 +38,53 @@
 #include "IECorePython/RunTimeTypedBinding.h"
 
 #include "IECoreImage/DisplayDriverServer.h"
+#include "IECoreImage/Private/BucketCoalescing.h"
 #include "IECoreImageBindings/DisplayDriverServerBinding.h"
 
+#include <vector>
+
 using namespace boost;
 using namespace boost::python;
 using namespace IECore;
 using namespace IECorePython;
 using namespace IECoreImage;
 
+namespace
+{
+
+struct TestBucket
+{
+	Imath::Box2i box;
+	size_t size;
+};
+
+// Returns the boxes of the runs the buckets are coalesced into
+// by DisplayDriverServer, given the box and the number of
+// channels of each bucket.
+list testDisplayDriverServerCoalescing( object boxes, object numChannels )
+{
+	std::vector<TestBucket> buckets;
+	for( size_t i = 0, e = len( boxes ); i < e; ++i )
+	{
+		TestBucket bucket;
+		bucket.box = extract<Imath::Box2i>( boxes[i] );
+		const size_t area = ( bucket.box.max.x - bucket.box.min.x + 1 ) * ( bucket.box.max.y - bucket.box.min.y + 1 );
+		bucket.size = area * extract<size_t>( numChannels[i] );
+		buckets.push_back( bucket );
+	}
+
+	list result;
+	for( size_t i = 0; i < buckets.size(); )
+	{
+		Imath::Box2i runBox;
+		i = IECoreImage::Detail::coalescedRunEnd( buckets, i, runBox );
+		result.append( runBox );
+	}
+	return result;
+}
+
+} // namespace
+
 namespace IECoreImageBindings
 {
 
@@ -53,9 +92,28 @@ void bindDisplayDriverServer()
 {
 	using boost::python::arg;
 
-	RunTimeTypedClass<DisplayDriverServer>()
-		.def( init< int >( ( arg( "portNumber" ) = 0 ) ) )
+	def( "testDisplayDriverServerCoalescing", &testDisplayDriverServerCoalescing );
+
+	RunTimeTypedClass<DisplayDriverServer> displayDriverServerClass;
+
+	{
+		scope s( displayDriverServerClass );
+
+		class_<DisplayDriverServer::Statistics>( "Statistics" )
+			.def_readonly( "sessions", &DisplayDriverServer::Statistics::sessions )
+			.def_readonly( "bucketsReceived", &DisplayDriverServer::Statistics::bucketsReceived )
+			.def_readonly( "bytesReceived", &DisplayDriverServer::Statistics::bytesReceived )
+			.def_readonly( "uncompressedBytesReceived", &DisplayDriverServer::Statistics::uncompressedBytesReceived )
+			.def_readonly( "imageDataCalls", &DisplayDriverServer::Statistics::imageDataCalls )
+			.def_readonly( "imageDataTime", &DisplayDriverServer::Statistics::imageDataTime )
+		;
+	}
+
+	displayDriverServerClass
+		.def( init< int, int >( ( arg( "portNumber" ) = 0, arg( "numThreads" ) = 1 ) ) )
 		.def( "portNumber", &DisplayDriverServer::portNumber )
+		.def( "statistics", &DisplayDriverServer::statistics )
+		.def( "resetStatistics", &DisplayDriverServer::resetStatistics )
 	;
 
 }
@@ -33,9 +33,11 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "boost/python.hpp"
+#include "boost/python/suite/indexing/container_utils.hpp"
 
 #include "IECore/VectorTypedData.h"
 #include "IECorePython/ReaderBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
 
 #include "IECoreImage/ImageReader.h"
 #include "IECoreImageBindings/ImageReaderBinding.h"
@@ -57,6 +59,25 @@ static StringVectorDataPtr channelNames( ImageReader &that )
 	return result;
 }
 
+static list readChannels( ImageReader &that, object pythonNames, bool raw )
+{
+	std::vector<std::string> names;
+	boost::python::container_utils::extend_container( names, pythonNames );
+
+	std::vector<DataPtr> channels;
+	{
+		ScopedGILRelease gilRelease;
+		that.readChannels( names, channels, raw );
+	}
+
+	list result;
+	for( const auto &channel : channels )
+	{
+		result.append( channel );
+	}
+	return result;
+}
+
 } // namespace
 
 namespace IECoreImageBindings
@@ -71,9 +92,11 @@ void bindImageReader()
 		.def( "canRead", &ImageReader::canRead ).staticmethod( "canRead" )
 		.def( "isComplete", &ImageReader::isComplete )
 		.def( "channelNames", &channelNames )
-		.def( "dataWindow", &ImageReader::dataWindow )
-		.def( "displayWindow", &ImageReader::displayWindow )
+		.def( "numMipLevels", &ImageReader::numMipLevels )
+		.def( "dataWindow", &ImageReader::dataWindow, ( arg_( "mipLevel" ) = 0 ) )
+		.def( "displayWindow", &ImageReader::displayWindow, ( arg_( "mipLevel" ) = 0 ) )
 		.def( "readChannel", (DataPtr (ImageReader::*)( const std::string &, bool ))&ImageReader::readChannel, ( arg_("name"), arg_( "raw" ) = false ) )
+		.def( "readChannels", &readChannels, ( arg_( "names" ), arg_( "raw" ) = false ) )
 	;
 
 }
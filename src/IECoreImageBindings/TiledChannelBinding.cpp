@@ -0,0 +1,150 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#include "boost/python.hpp"
+#include "boost/python/make_constructor.hpp"
+
+#include "IECoreImage/TiledChannel.h"
+#include "IECoreImage/TiledChannelData.h"
+
+#include "IECorePython/RunTimeTypedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
+
+#include "IECoreImageBindings/TiledChannelBinding.h"
+
+using namespace boost::python;
+using namespace Imath;
+using namespace IECore;
+using namespace IECorePython;
+using namespace IECoreImage;
+
+namespace
+{
+
+TiledChannel *constructFromPixels( const Box2i &dataWindow, const FloatVectorData *pixels )
+{
+	return new TiledChannel( dataWindow, pixels->readable() );
+}
+
+object tile( const TiledChannel &c, const V2i &tileIndex )
+{
+	float value;
+	ConstFloatVectorDataPtr pixels;
+	{
+		ScopedGILRelease gilRelease;
+		pixels = c.tile( tileIndex, value );
+	}
+
+	if( pixels )
+	{
+		return object( FloatVectorDataPtr( pixels->copy() ) );
+	}
+	return object( value );
+}
+
+void setTilePixels( TiledChannel &c, const V2i &tileIndex, const FloatVectorData *pixels )
+{
+	c.setTile( tileIndex, pixels->copy() );
+}
+
+void setTileValue( TiledChannel &c, const V2i &tileIndex, float value )
+{
+	c.setTile( tileIndex, value );
+}
+
+FloatVectorDataPtr readPixels( const TiledChannel &c, const Box2i &region )
+{
+	FloatVectorDataPtr result = new FloatVectorData;
+	if( !region.isEmpty() )
+	{
+		result->writable().resize( ( region.size().x + 1 ) * ( region.size().y + 1 ) );
+		ScopedGILRelease gilRelease;
+		c.readPixels( region, result->writable().data() );
+	}
+	return result;
+}
+
+FloatVectorDataPtr pixels( const TiledChannel &c )
+{
+	ScopedGILRelease gilRelease;
+	return c.pixels();
+}
+
+TiledChannel crop( const TiledChannel &c, const Box2i &dataWindow )
+{
+	ScopedGILRelease gilRelease;
+	return c.crop( dataWindow );
+}
+
+} // namespace
+
+namespace IECoreImageBindings
+{
+
+void bindTiledChannel()
+{
+
+	scope s = class_<TiledChannel>( "TiledChannel" )
+		.def( init<>() )
+		.def( init<const Box2i &, float>( ( arg_( "dataWindow" ), arg_( "value" ) = 0.0f ) ) )
+		.def( "__init__", make_constructor( &constructFromPixels ) )
+		.def( init<const TiledChannel &>() )
+		.def( "dataWindow", &TiledChannel::dataWindow, return_value_policy<copy_const_reference>() )
+		.def( "setOrigin", &TiledChannel::setOrigin )
+		.def( "numTiles", &TiledChannel::numTiles )
+		.def( "tileBound", &TiledChannel::tileBound )
+		.def( "tile", &tile )
+		.def( "setTile", &setTilePixels )
+		.def( "setTile", &setTileValue )
+		.def( "numStoredTiles", &TiledChannel::numStoredTiles )
+		.def( "readPixels", &readPixels )
+		.def( "pixels", &pixels )
+		.def( "crop", &crop )
+		.def( self == self )
+		.def( self != self )
+	;
+
+	s.attr( "tileSize" ) = TiledChannel::tileSize;
+
+	RunTimeTypedClass<TiledChannelData>()
+		.def( init<>() )
+		.def( init<const TiledChannel &>() )
+		.add_property( "value", make_function( &TiledChannelData::writable, return_internal_reference<1>() ) )
+		.def( "hasBase", &TiledChannelData::hasBase ).staticmethod( "hasBase" )
+	;
+
+}
+
+} // namespace IECoreImageBindings
@@ -57,6 +57,7 @@
 #include "IECoreImageBindings/MPlayDisplayDriverBinding.h"
 #include "IECoreImageBindings/SplineToImageBinding.h"
 #include "IECoreImageBindings/SummedAreaOpBinding.h"
+#include "IECoreImageBindings/TiledChannelBinding.h"
 #include "IECoreImageBindings/WarpOpBinding.h"
 
 using namespace boost::python;
@@ -88,5 +89,6 @@ BOOST_PYTHON_MODULE( _IECoreImage )
 	bindClientDisplayDriver();
 	bindImageDisplayDriver();
 	bindMPlayDisplayDriver();
+	bindTiledChannel();
 
 }
@@ -0,0 +1,143 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+// This include needs to be the very first to prevent problems with warnings
+// regarding redefinition of _POSIX_C_SOURCE
+#include "boost/python.hpp"
+
+#include "IECorePython/BufferBinding.h"
+
+#include "IECorePython/RefCountedBinding.h"
+
+using namespace boost::python;
+using namespace IECore;
+
+namespace IECorePython
+{
+
+Buffer::Buffer( IECore::DataPtr data, IECore::ConstDataPtr storage, void *address, bool writable, const char *format, size_t itemSize, size_t numElements, size_t elementComponents )
+	:	m_data( data ), m_storage( storage ), m_address( address ), m_writable( writable ), m_format( format ), m_itemSize( itemSize )
+{
+	m_shape.push_back( numElements );
+	m_strides.push_back( itemSize * elementComponents );
+	if( elementComponents > 1 )
+	{
+		m_shape.push_back( elementComponents );
+		m_strides.push_back( itemSize );
+	}
+}
+
+Buffer::~Buffer()
+{
+}
+
+IECore::DataPtr Buffer::asData() const
+{
+	return m_data;
+}
+
+bool Buffer::isWritable() const
+{
+	return m_writable;
+}
+
+int Buffer::getBuffer( PyObject *object, Py_buffer *view, int flags )
+{
+	view->obj = nullptr;
+
+	extract<Buffer &> e( object );
+	if( !e.check() )
+	{
+		PyErr_SetString( PyExc_BufferError, "Object is not an IECore.Buffer" );
+		return -1;
+	}
+
+	const Buffer &buffer = e();
+	if( ( flags & PyBUF_WRITABLE ) == PyBUF_WRITABLE && !buffer.m_writable )
+	{
+		PyErr_SetString( PyExc_BufferError, "Buffer is not writable" );
+		return -1;
+	}
+
+	Py_ssize_t length = buffer.m_itemSize;
+	for( std::vector<Py_ssize_t>::const_iterator it = buffer.m_shape.begin(), eIt = buffer.m_shape.end(); it != eIt; ++it )
+	{
+		length *= *it;
+	}
+
+	view->buf = buffer.m_address;
+	view->len = length;
+	view->readonly = !buffer.m_writable;
+	view->itemsize = buffer.m_itemSize;
+	view->format = ( flags & PyBUF_FORMAT ) == PyBUF_FORMAT ? const_cast<char *>( buffer.m_format ) : nullptr;
+	if( ( flags & PyBUF_ND ) == PyBUF_ND )
+	{
+		view->ndim = buffer.m_shape.size();
+		view->shape = const_cast<Py_ssize_t *>( &buffer.m_shape[0] );
+	}
+	else
+	{
+		// Consumer can only deal with a flat array of bytes.
+		view->ndim = 1;
+		view->shape = nullptr;
+	}
+	view->strides = ( flags & PyBUF_STRIDES ) == PyBUF_STRIDES ? const_cast<Py_ssize_t *>( &buffer.m_strides[0] ) : nullptr;
+	view->suboffsets = nullptr;
+	view->internal = nullptr;
+
+	view->obj = object;
+	Py_INCREF( object );
+
+	return 0;
+}
+
+void bindBuffer()
+{
+	RefCountedClass<Buffer, RefCounted> bufferClass( "Buffer" );
+	bufferClass
+		.def( "asData", &Buffer::asData )
+		.def( "isWritable", &Buffer::isWritable )
+	;
+
+	// Boost.Python doesn't provide a means of implementing the buffer
+	// protocol, so we must fill in the slot on the type object ourselves.
+	PyTypeObject *type = reinterpret_cast<PyTypeObject *>( bufferClass.ptr() );
+	type->tp_as_buffer->bf_getbuffer = &Buffer::getBuffer;
+#if PY_MAJOR_VERSION < 3
+	type->tp_flags |= Py_TPFLAGS_HAVE_NEWBUFFER;
+#endif
+}
+
+} // namespace IECorePython
@@ -45,6 +45,8 @@
 #include "IECore/ModifyOp.h"
 #include "IECore/Object.h"
 
+#include <chrono>
+
 using namespace boost::python;
 using namespace IECore;
 
@@ -65,12 +67,51 @@ static ObjectPtr read( CachedReader &r, const std::string &f )
 	}
 }
 
+static void prefetch( CachedReader &r, const list &files )
+{
+	std::vector<std::string> f;
+	for( long i = 0, e = len( files ); i < e; ++i )
+	{
+		f.push_back( extract<std::string>( files[i] ) );
+	}
+
+	ScopedGILRelease gilRelease;
+	r.prefetch( f );
+}
+
+static bool futureDone( const CachedReader::Future &f )
+{
+	return f.wait_for( std::chrono::seconds( 0 ) ) == std::future_status::ready;
+}
+
+static void futureWait( const CachedReader::Future &f )
+{
+	ScopedGILRelease gilRelease;
+	f.wait();
+}
+
+static ObjectPtr futureGet( const CachedReader::Future &f )
+{
+	ScopedGILRelease gilRelease;
+	ConstObjectPtr o = f.get();
+	if( o )
+	{
+		return o->copy();
+	}
+	else
+	{
+		return nullptr;
+	}
+}
+
 void bindCachedReader()
 {
-	RefCountedClass<CachedReader, RefCounted>( "CachedReader" )
+	scope s = RefCountedClass<CachedReader, RefCounted>( "CachedReader" )
 		.def( init<const SearchPath &, optional<ObjectPoolPtr> >() )
 		.def( init<const SearchPath &, ConstModifyOpPtr, optional<ObjectPoolPtr> >() )
 		.def( "read", &read )
+		.def( "readAsync", &CachedReader::readAsync )
+		.def( "prefetch", &prefetch )
 		.def( "clear", (void (CachedReader::*)( const std::string &) )&CachedReader::clear )
 		.def( "clear", (void (CachedReader::*)( void ) )&CachedReader::clear )
 		.def( "insert", &CachedReader::insert )
@@ -79,6 +120,12 @@ void bindCachedReader()
 		.def( "defaultCachedReader", &CachedReader::defaultCachedReader, return_value_policy<CastToIntrusivePtr>() ).staticmethod( "defaultCachedReader" )
 		.def( "objectPool", &CachedReader::objectPool, return_value_policy<CastToIntrusivePtr>() )
 	;
+
+	class_<CachedReader::Future>( "Future", no_init )
+		.def( "done", &futureDone )
+		.def( "wait", &futureWait )
+		.def( "get", &futureGet )
+	;
 }
 
 }
@@ -37,10 +37,12 @@
 #include "IECorePython/FileSequenceFunctionsBinding.h"
 
 #include "IECorePython/IECoreBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
 
 #include "IECore/Exception.h"
 #include "IECore/FileSequence.h"
 #include "IECore/FileSequenceFunctions.h"
+#include "IECore/VectorTypedData.h"
 
 #include "boost/filesystem/operations.hpp"
 #include "boost/filesystem/path.hpp"
@@ -108,6 +110,34 @@ struct FileSequenceFunctionsHelper
 		return object();
 	}
 
+	static list lsRecursive( const std::string &path, size_t minSequenceSize, size_t maxDepth, bool followLinks, bool withStats )
+	{
+		std::vector< FileSequencePtr > sequences;
+		std::vector< FileSequenceStats > stats;
+		{
+			IECorePython::ScopedGILRelease gilRelease;
+			IECore::lsRecursive( path, sequences, minSequenceSize, maxDepth, followLinks, withStats ? &stats : nullptr );
+		}
+
+		list result;
+		for ( size_t i = 0; i < sequences.size(); ++i )
+		{
+			if ( withStats )
+			{
+				Int64VectorDataPtr modificationTimes = new Int64VectorData;
+				modificationTimes->writable().assign( stats[i].modificationTimes.begin(), stats[i].modificationTimes.end() );
+				UInt64VectorDataPtr sizes = new UInt64VectorData( stats[i].sizes );
+				result.append( make_tuple( sequences[i], modificationTimes, sizes ) );
+			}
+			else
+			{
+				result.append( sequences[i] );
+			}
+		}
+
+		return result;
+	}
+
 	static FrameListPtr frameListFromList( list l )
 	{
 		std::vector< FrameList::Frame > frameList;
@@ -131,6 +161,7 @@ void bindFileSequenceFunctions()
 {
 	def( "findSequences", &FileSequenceFunctionsHelper::findSequences, ( arg_("namesList"), arg_( "minSequenceSize" ) = 2 ) );
 	def( "ls", &FileSequenceFunctionsHelper::ls, ( arg_("path"), arg_( "minSequenceSize" ) = 2 ) );
+	def( "lsRecursive", &FileSequenceFunctionsHelper::lsRecursive, ( arg_( "path" ), arg_( "minSequenceSize" ) = 2, arg_( "maxDepth" ) = 1000, arg_( "followLinks" ) = false, arg_( "withStats" ) = false ) );
 	def( "frameListFromList", &FileSequenceFunctionsHelper::frameListFromList );
 }
 
@@ -40,6 +40,7 @@
 
 #include "IECorePython/IECoreBinding.h"
 #include "IECorePython/RunTimeTypedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
 
 #include "IECore/FileIndexedIO.h"
 #include "IECore/IndexedIO.h"
@@ -47,6 +48,10 @@
 #include "IECore/SimpleTypedData.h"
 #include "IECore/VectorTypedData.h"
 
+#include "tbb/atomic.h"
+#include "tbb/parallel_for.h"
+#include "tbb/task_scheduler_init.h"
+
 #include <cassert>
 #include <iostream>
 
@@ -58,12 +63,62 @@ void bindStreamIndexedIO();
 void bindFileIndexedIO();
 void bindMemoryIndexedIO();
 
+namespace
+{
+
+// Reads every float array in the directory numIterations times, using numThreads
+// threads, and returns the total number of bytes read. Used to measure the
+// throughput of concurrent reads.
+size_t testIndexedIOParallelReads( ConstIndexedIOPtr io, int numThreads, int numIterations )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	tbb::task_scheduler_init scheduler( numThreads );
+
+	IndexedIO::EntryIDList names;
+	io->entryIds( names, IndexedIO::File );
+
+	std::vector<IndexedIO::Entry> entries;
+	for( IndexedIO::EntryIDList::const_iterator it = names.begin(); it != names.end(); ++it )
+	{
+		IndexedIO::Entry e = io->entry( *it );
+		if( e.dataType() == IndexedIO::FloatArray )
+		{
+			entries.push_back( e );
+		}
+	}
+
+	tbb::atomic<size_t> bytesRead;
+	bytesRead = 0;
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, entries.size() * numIterations ),
+		[&io, &entries, &bytesRead] ( const tbb::blocked_range<size_t> &range ) {
+			std::vector<float> buffer;
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				const IndexedIO::Entry &e = entries[i % entries.size()];
+				buffer.resize( e.arrayLength() );
+				float *data = buffer.data();
+				io->read( e.id(), data, e.arrayLength() );
+				bytesRead += e.arrayLength() * sizeof( float );
+			}
+		}
+	);
+
+	return bytesRead;
+}
+
+} // namespace
+
 void bindIndexedIO()
 {
 	bindIndexedIOBase();
 	bindStreamIndexedIO();
 	bindFileIndexedIO();
 	bindMemoryIndexedIO();
+
+	/// \todo If we create an IECoreTest module, move these into it.
+	def( "testIndexedIOParallelReads", &testIndexedIOParallelReads, ( arg( "io" ), arg( "numThreads" ), arg( "numIterations" ) = 1 ) );
 }
 
 struct IndexedIOHelper
@@ -106,6 +161,14 @@ struct IndexedIOHelper
 		return new T( firstParam, rootPath, mode );
 	}
 
+	template< typename T, typename P >
+	static typename T::Ptr constructorWithCodecs( P firstParam, list root, IndexedIO::OpenMode mode, StreamIndexedIO::Codec indexCodec, StreamIndexedIO::Codec dataCodec )
+	{
+		IndexedIO::EntryIDList rootPath;
+		IndexedIOHelper::listToEntryIds( root, rootPath );
+		return new T( firstParam, rootPath, mode, indexCodec, dataCodec );
+	}
+
 	static IndexedIOPtr createAtRoot( const std::string &path, IndexedIO::OpenMode mode)
 	{
 		return IndexedIO::create( path, IndexedIO::rootPath, mode );
@@ -307,6 +370,7 @@ void bindIndexedIOBase()
 			.value("Append", IndexedIO::Append)
 			.value("Shared", IndexedIO::Shared)
 			.value("Exclusive", IndexedIO::Exclusive)
+			.value("Mapped", IndexedIO::Mapped)
 			.export_values()
 		;
 
@@ -370,6 +434,7 @@ void bindIndexedIOBase()
 	// to exist for defining default values).
 
 	indexedIOClass.def("openMode", &IndexedIO::openMode)
+		.def("memoryUsage", &IndexedIO::memoryUsage)
 		.def("parentDirectory", nonConstParentDirectory)
 		.def("directory",  &IndexedIOHelper::directory, ( arg( "path" ), arg( "missingBehaviour" ) = IndexedIO::ThrowIfMissing ) )
 		.def("subdirectory", nonConstSubdirectory, ( arg( "name" ), arg( "missingBehaviour" ) = IndexedIO::ThrowIfMissing ) )
@@ -409,7 +474,21 @@ void bindIndexedIOBase()
 
 void bindStreamIndexedIO()
 {
-	IECorePython::RunTimeTypedClass<StreamIndexedIO>();
+	scope s = IECorePython::RunTimeTypedClass<StreamIndexedIO>()
+		.def( "codecAvailable", &StreamIndexedIO::codecAvailable ).staticmethod( "codecAvailable" )
+		.def( "setDefaultCodecs", &StreamIndexedIO::setDefaultCodecs ).staticmethod( "setDefaultCodecs" )
+		.def( "defaultIndexCodec", &StreamIndexedIO::defaultIndexCodec ).staticmethod( "defaultIndexCodec" )
+		.def( "defaultDataCodec", &StreamIndexedIO::defaultDataCodec ).staticmethod( "defaultDataCodec" )
+		.def( "indexCodec", &StreamIndexedIO::indexCodec )
+		.def( "dataCodec", &StreamIndexedIO::dataCodec )
+	;
+
+	enum_< StreamIndexedIO::Codec >( "Codec" )
+		.value( "Uncompressed", StreamIndexedIO::NoCodec )
+		.value( "Gzip", StreamIndexedIO::GzipCodec )
+		.value( "LZ4", StreamIndexedIO::LZ4Codec )
+		.value( "Zstd", StreamIndexedIO::ZstdCodec )
+	;
 }
 
 void bindFileIndexedIO()
@@ -417,6 +496,7 @@ void bindFileIndexedIO()
 	IECorePython::RunTimeTypedClass<FileIndexedIO>()
 		.def("__init__", make_constructor( &IndexedIOHelper::constructorAtRoot<FileIndexedIO, const std::string &> ) )
 		.def("__init__", make_constructor( &IndexedIOHelper::constructor<FileIndexedIO, const std::string &> ) )
+		.def("__init__", make_constructor( &IndexedIOHelper::constructorWithCodecs<FileIndexedIO, const std::string &>, default_call_policies(), ( arg( "path" ), arg( "root" ), arg( "mode" ), arg( "indexCodec" ), arg( "dataCodec" ) ) ) )
 		.def( "fileName", make_function( &FileIndexedIO::fileName, return_value_policy<copy_const_reference>() ) )
 	;
 }
@@ -305,23 +305,124 @@ void testParallelLRUCacheRecursion( int numIterations, size_t numValues, int max
 	parallel_for( blocked_range<size_t>( 0, numIterations ), GetFromParallelRecursiveCache( cache, numValues ) );
 }
 
+int getScanResistance( int key, size_t &cost )
+{
+	cost = 1;
+	return key;
+}
+
+void testSerialLRUCacheScanResistance()
+{
+	SerialTestCache cache( getScanResistance, 100 );
+	cache.setEvictionPolicy( SerialTestCache::LFU );
+
+	// Access a working set repeatedly, and then
+	// scan through a series of values which are
+	// only accessed once.
+
+	for( int r = 0; r < 3; ++r )
+	{
+		for( int i = 0; i < 50; ++i )
+		{
+			cache.get( i );
+		}
+	}
+
+	for( int i = 1000; i < 1100; ++i )
+	{
+		cache.get( i );
+	}
+
+	// The scan should have evicted only
+	// its own values.
+
+	for( int i = 0; i < 50; ++i )
+	{
+		if( !cache.cached( i ) )
+		{
+			throw Exception( "Working set evicted by scan" );
+		}
+	}
+
+	const SerialTestCache::Statistics statistics = cache.statistics();
+	if( statistics.hits != 100 || statistics.misses != 150 || statistics.evictions != 50 )
+	{
+		throw Exception( "Unexpected statistics" );
+	}
+}
+
+void testSerialLRUCacheReadmission()
+{
+	SerialTestCache cache( getScanResistance, 100 );
+	cache.setEvictionPolicy( SerialTestCache::LFU );
+
+	// Fill the cache, push half of it out, and then
+	// bring that half straight back again.
+
+	for( int i = 0; i < 150; ++i )
+	{
+		cache.get( i );
+	}
+
+	for( int i = 0; i < 50; ++i )
+	{
+		cache.get( i );
+	}
+
+	// The readmitted values should have been credited
+	// as if they had been hits, so should survive a scan
+	// that evicts everything used only once.
+
+	for( int i = 1000; i < 1100; ++i )
+	{
+		cache.get( i );
+	}
+
+	for( int i = 0; i < 50; ++i )
+	{
+		if( !cache.cached( i ) )
+		{
+			throw Exception( "Readmitted value evicted by scan" );
+		}
+	}
+}
+
 } // namespace
 
 void IECorePython::bindLRUCache()
 {
 
-	class_<PythonLRUCache, boost::noncopyable>( "LRUCache", no_init )
-		.def( init<object, PythonLRUCache::Cost>( ( boost::python::arg_( "getter" ), boost::python::arg_( "maxCost" )=500  ) ) )
-		.def( init<object, object, PythonLRUCache::Cost>( ( boost::python::arg_( "getter" ), boost::python::arg_( "removalCallback" ), boost::python::arg_( "maxCost" )  ) ) )
-		.def( "clear", &PythonLRUCache::clear )
-		.def( "erase", &PythonLRUCache::erase )
-		.def( "setMaxCost", &PythonLRUCache::setMaxCost )
-		.def( "getMaxCost", &PythonLRUCache::getMaxCost )
-		.def( "currentCost", &PythonLRUCache::currentCost )
-		.def( "get", &PythonLRUCache::get )
-		.def( "set", &PythonLRUCache::set )
-		.def( "cached", &PythonLRUCache::cached )
-	;
+	{
+		scope s = class_<PythonLRUCache, boost::noncopyable>( "LRUCache", no_init )
+			.def( init<object, PythonLRUCache::Cost>( ( boost::python::arg_( "getter" ), boost::python::arg_( "maxCost" )=500  ) ) )
+			.def( init<object, object, PythonLRUCache::Cost>( ( boost::python::arg_( "getter" ), boost::python::arg_( "removalCallback" ), boost::python::arg_( "maxCost" )  ) ) )
+			.def( "clear", &PythonLRUCache::clear )
+			.def( "erase", &PythonLRUCache::erase )
+			.def( "setMaxCost", &PythonLRUCache::setMaxCost )
+			.def( "getMaxCost", &PythonLRUCache::getMaxCost )
+			.def( "currentCost", &PythonLRUCache::currentCost )
+			.def( "get", &PythonLRUCache::get )
+			.def( "set", &PythonLRUCache::set )
+			.def( "cached", &PythonLRUCache::cached )
+			.def( "setEvictionPolicy", &PythonLRUCache::setEvictionPolicy )
+			.def( "getEvictionPolicy", &PythonLRUCache::getEvictionPolicy )
+			.def( "statistics", &PythonLRUCache::statistics )
+			.def( "resetStatistics", &PythonLRUCache::resetStatistics )
+		;
+
+		enum_<PythonLRUCache::EvictionPolicy>( "EvictionPolicy" )
+			.value( "LRU", PythonLRUCache::LRU )
+			.value( "LFU", PythonLRUCache::LFU )
+		;
+
+		class_<PythonLRUCache::Statistics>( "Statistics" )
+			.def_readonly( "hits", &PythonLRUCache::Statistics::hits )
+			.def_readonly( "misses", &PythonLRUCache::Statistics::misses )
+			.def_readonly( "evictions", &PythonLRUCache::Statistics::evictions )
+			.def_readonly( "currentCost", &PythonLRUCache::Statistics::currentCost )
+			.def_readonly( "maxCost", &PythonLRUCache::Statistics::maxCost )
+		;
+	}
 
 	/// \todo If we create an IECoreTest module, move these into it.
 	def(
@@ -337,5 +438,7 @@ void IECorePython::bindLRUCache()
 
 	def( "testSerialLRUCacheRecursion", testSerialLRUCacheRecursion );
 	def( "testParallelLRUCacheRecursion", testParallelLRUCacheRecursion );
+	def( "testSerialLRUCacheScanResistance", testSerialLRUCacheScanResistance );
+	def( "testSerialLRUCacheReadmission", testSerialLRUCacheReadmission );
 
 }
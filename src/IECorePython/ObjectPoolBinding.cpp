@@ -83,6 +83,19 @@ void bindObjectPool()
 			.value("StoreReference", ObjectPool::StoreReference)
 			.export_values()
 		;
+
+		enum_< ObjectPool::EvictionPolicy > ( "EvictionPolicy" )
+			.value( "LRU", ObjectPool::LRU )
+			.value( "LFU", ObjectPool::LFU )
+		;
+
+		class_< ObjectPool::Statistics >( "Statistics" )
+			.def_readonly( "hits", &ObjectPool::Statistics::hits )
+			.def_readonly( "misses", &ObjectPool::Statistics::misses )
+			.def_readonly( "evictions", &ObjectPool::Statistics::evictions )
+			.def_readonly( "memoryUsage", &ObjectPool::Statistics::memoryUsage )
+			.def_readonly( "maxMemoryUsage", &ObjectPool::Statistics::maxMemoryUsage )
+		;
 	}
 
 	objectPoolClass
@@ -95,6 +108,10 @@ void bindObjectPool()
 		.def( "memoryUsage", &ObjectPool::memoryUsage )
 		.def( "getMaxMemoryUsage", &ObjectPool::getMaxMemoryUsage)
 		.def( "setMaxMemoryUsage", &ObjectPool::setMaxMemoryUsage )
+		.def( "setEvictionPolicy", &ObjectPool::setEvictionPolicy )
+		.def( "getEvictionPolicy", &ObjectPool::getEvictionPolicy )
+		.def( "statistics", &ObjectPool::statistics )
+		.def( "resetStatistics", &ObjectPool::resetStatistics )
 		.def( "defaultObjectPool", &ObjectPool::defaultObjectPool, return_value_policy<CastToIntrusivePtr>() )
 		.staticmethod( "defaultObjectPool" )
 	;
@@ -349,7 +349,7 @@ void IECorePython::bindPathMatcher()
 		.def( "addPaths", (bool (PathMatcher::*)( const PathMatcher & ))&PathMatcher::addPaths )
 		.def( "addPaths", (bool (PathMatcher::*)( const PathMatcher &, const std::vector<IECore::InternedString> & ))&PathMatcher::addPaths )
 		.def( "removePaths", &PathMatcher::removePaths )
-		.def( "intersection", (PathMatcher ( PathMatcher::*)( const PathMatcher & ) const)&PathMatcher::intersection )
+		.def( "intersection", &PathMatcher::intersection )
 		.def( "prune", (bool (PathMatcher::*)( const std::vector<IECore::InternedString> & ))&PathMatcher::prune )
 		.def( "prune", (bool (PathMatcher::*)( const std::string & ))&PathMatcher::prune )
 		.def( "subTree", (PathMatcher ( PathMatcher::*)( const std::vector<IECore::InternedString> & ) const)&PathMatcher::subTree )
@@ -359,6 +359,8 @@ void IECorePython::bindPathMatcher()
 		.def( "paths", &paths )
 		.def( "match", (unsigned (PathMatcher ::*)( const std::vector<IECore::InternedString> & ) const)&PathMatcher::match )
 		.def( "match", (unsigned (PathMatcher ::*)( const std::string & ) const)&PathMatcher::match )
+		.def( "save", &PathMatcher::save )
+		.def( "load", &PathMatcher::load )
 		.def( "__repr__", &pathMatcherRepr )
 		.def( self == self )
 		.def( self != self )
@@ -51,6 +51,7 @@
 #include "IECorePython/DataBinding.h"
 #include "IECorePython/GeometricTypedDataBinding.h"
 #include "IECorePython/SimpleTypedDataBinding.h"
+#include "IECorePython/BufferBinding.h"
 #include "IECorePython/VectorTypedDataBinding.h"
 #include "IECorePython/ObjectBinding.h"
 #include "IECorePython/TypeIdBinding.h"
@@ -192,6 +193,7 @@ BOOST_PYTHON_MODULE(_IECore)
 	bindData();
 	bindGeometricTypedData();
 	bindAllSimpleTypedData();
+	bindBuffer();
 	bindAllVectorTypedData();
 	bindCompoundData();
 	bindIndexedIO();
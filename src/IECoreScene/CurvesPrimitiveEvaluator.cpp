@@ -507,6 +507,15 @@ bool CurvesPrimitiveEvaluator::pointAtV( unsigned curveIndex, float v, Primitive
 	return true;
 }
 
+int CurvesPrimitiveEvaluator::elementIndex( const PrimitiveEvaluator::Result *result ) const
+{
+	return static_cast<const Result *>( result )->curveIndex();
+}
+
+bool CurvesPrimitiveEvaluator::hasNormals() const
+{
+	return false;
+}
 
 float CurvesPrimitiveEvaluator::integrateCurve( unsigned curveIndex, float vStart, float vEnd, int samples, Result& typedResult ) const
 {
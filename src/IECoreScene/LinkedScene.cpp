@@ -141,6 +141,11 @@ std::string LinkedScene::fileName() const
 	return m_mainScene->fileName();
 }
 
+size_t LinkedScene::memoryUsage() const
+{
+	return m_mainScene->memoryUsage();
+}
+
 void LinkedScene::path( Path &p ) const
 {
 	p.clear();
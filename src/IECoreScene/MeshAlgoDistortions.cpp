@@ -34,9 +34,13 @@
 
 #include "IECoreScene/MeshAlgo.h"
 #include "IECoreScene/PolygonIterator.h"
+#include "IECoreScene/private/MeshAlgoUtils.h"
 
 #include "IECore/DespatchTypedData.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace std;
 using namespace Imath;
 using namespace IECore;
@@ -54,7 +58,7 @@ struct CalculateDistortions
 	public :
 
 		CalculateDistortions(
-			const vector<int> &vertsPerFace,
+			const Detail::FaceOffsets &faces,
 			const vector<int> &vertIds,
 			size_t faceVaryingSize,
 			const vector<Imath::V3f> &p,
@@ -64,7 +68,7 @@ struct CalculateDistortions
 		) :
 			distortionData( nullptr ),
 			uvDistortionData( nullptr ),
-			m_vertsPerFace( vertsPerFace ),
+			m_faces( faces ),
 			m_vertIds( vertIds ),
 			m_faceVaryingSize( faceVaryingSize ),
 			m_p( p ),
@@ -80,7 +84,7 @@ struct CalculateDistortions
 
 	private :
 
-		const vector<int> &m_vertsPerFace;
+		const Detail::FaceOffsets &m_faces;
 		const vector<int> &m_vertIds;
 		const size_t m_faceVaryingSize;
 		const vector<Imath::V3f> &m_p;
@@ -130,56 +134,68 @@ struct CalculateDistortions
 			m_uvDistortions.clear();
 			m_uvDistortions.resize( numUniqueTangents );
 
-			size_t fvi0 = 0;
+			// compute the distortion along each edge in parallel. Edges are indexed
+			// by the face-varying index of their first vertex.
 
-			for( size_t faceIndex = 0; faceIndex < m_vertsPerFace.size() ; faceIndex++ )
-			{
-				size_t firstFvi = fvi0;
-				unsigned vertex0 = m_vertIds[ fvi0 ];
-				Imath::V2f uv0( m_uvs[ fvi0 ] );
+			vector<float> edgeDistortions( m_faceVaryingSize );
+			vector<Imath::V2f> edgeUVDirections( m_faceVaryingSize );
+			vector<int> edgeEnds( m_faceVaryingSize );
 
-				for ( int v = 1; v <= m_vertsPerFace[faceIndex]; v++, fvi0++ )
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, m_faces.numFaces() ),
+				[this, &edgeDistortions, &edgeUVDirections, &edgeEnds]( const tbb::blocked_range<size_t> &range )
 				{
-					size_t fvi1 = fvi0 + 1;
-					if ( v == m_vertsPerFace[faceIndex] )
-					{
-						// final edge must also be computed...
-						fvi1 = firstFvi;
-					}
-					unsigned vertex1 = m_vertIds[ fvi1 ];
-					// compute distortion along the edge
-					const V3f &p0 = m_p[ vertex0 ];
-					const V3f &refP0 = m_pRef[ vertex0 ];
-					const V3f &p1 = m_p[ vertex1 ];
-					const V3f &refP1 = m_pRef[ vertex1 ];
-					V3f edge = p1 - p0;
-					V3f refEdge = refP1 - refP0;
-					float edgeLen = edge.length();
-					float refEdgeLen = refEdge.length();
-					float distortion = 0;
-					if ( edgeLen >= refEdgeLen )
-					{
-						distortion = fabs((edgeLen / refEdgeLen) - 1.0f);
-					}
-					else
+					for( size_t faceIndex = range.begin(); faceIndex != range.end(); ++faceIndex )
 					{
-						distortion = -fabs( (refEdgeLen / edgeLen) - 1.0f );
+						const int firstFvi = m_faces.offset( faceIndex );
+						const int endFvi = m_faces.offset( faceIndex + 1 );
+						for( int fvi0 = firstFvi; fvi0 < endFvi; ++fvi0 )
+						{
+							// final edge must also be computed...
+							const int fvi1 = fvi0 + 1 == endFvi ? firstFvi : fvi0 + 1;
+							edgeEnds[fvi0] = fvi1;
+
+							// compute distortion along the edge
+							const unsigned vertex0 = m_vertIds[ fvi0 ];
+							const unsigned vertex1 = m_vertIds[ fvi1 ];
+							const V3f &p0 = m_p[ vertex0 ];
+							const V3f &refP0 = m_pRef[ vertex0 ];
+							const V3f &p1 = m_p[ vertex1 ];
+							const V3f &refP1 = m_pRef[ vertex1 ];
+							V3f edge = p1 - p0;
+							V3f refEdge = refP1 - refP0;
+							float edgeLen = edge.length();
+							float refEdgeLen = refEdge.length();
+							float distortion = 0;
+							if ( edgeLen >= refEdgeLen )
+							{
+								distortion = fabs((edgeLen / refEdgeLen) - 1.0f);
+							}
+							else
+							{
+								distortion = -fabs( (refEdgeLen / edgeLen) - 1.0f );
+							}
+							edgeDistortions[fvi0] = distortion;
+
+							// compute uv vector
+							edgeUVDirections[fvi0] = ( m_uvs[ fvi1 ] - m_uvs[ fvi0 ] ).normalized();
+						}
 					}
-
-					// accumulate vertex distortions
-					m_distortions[ vertex0 ].accumulateDistortion( distortion );
-					m_distortions[ vertex1 ].accumulateDistortion( distortion );
-					vertex0 = vertex1;
-
-					// compute uv vector
-					Imath::V2f uv1( m_uvs[ fvi1 ] );
-					const Imath::V2f uvDir = (uv1 - uv0).normalized();
-					// accumulate uv distortion
-					m_uvDistortions[ m_uvIds[fvi0] ].accumulateDistortion( distortion, uvDir );
-					m_uvDistortions[ m_uvIds[fvi1] ].accumulateDistortion( distortion, uvDir );
-					uv0 = uv1;
 				}
-				fvi0 = firstFvi + m_vertsPerFace[faceIndex];
+			);
+
+			// accumulate vertex and uv distortions. This is done serially, so that the
+			// order of summation, and therefore the result, is deterministic.
+			for( size_t fvi0 = 0; fvi0 < m_faceVaryingSize; ++fvi0 )
+			{
+				const int fvi1 = edgeEnds[fvi0];
+				const float distortion = edgeDistortions[fvi0];
+				m_distortions[ m_vertIds[fvi0] ].accumulateDistortion( distortion );
+				m_distortions[ m_vertIds[fvi1] ].accumulateDistortion( distortion );
+
+				const Imath::V2f &uvDir = edgeUVDirections[fvi0];
+				m_uvDistortions[ m_uvIds[fvi0] ].accumulateDistortion( distortion, uvDir );
+				m_uvDistortions[ m_uvIds[fvi1] ].accumulateDistortion( distortion, uvDir );
 			}
 
 			// normalize distortions and build output vectors
@@ -187,31 +203,54 @@ struct CalculateDistortions
 			// create the distortion prim var.
 			distortionData = new FloatVectorData();
 			std::vector<float> &distortionVec = distortionData->writable();
-			distortionVec.reserve( m_distortions.size() );
-			for( auto &dist : m_distortions )
-			{
-				float invCounter = 0;
-				if ( dist.counter )
+			distortionVec.resize( m_distortions.size() );
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, m_distortions.size() ),
+				[this, &distortionVec]( const tbb::blocked_range<size_t> &range )
 				{
-					invCounter = ( 1.0f / dist.counter );
+					for( size_t i = range.begin(); i != range.end(); ++i )
+					{
+						const VertexDistortion &dist = m_distortions[i];
+						float invCounter = 0;
+						if ( dist.counter )
+						{
+							invCounter = ( 1.0f / dist.counter );
+						}
+						distortionVec[i] = dist.distortion * invCounter;
+					}
 				}
-				distortionVec.push_back( dist.distortion * invCounter );
-			}
+			);
 
 			// create U and V distortions
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, m_uvDistortions.size() ),
+				[this]( const tbb::blocked_range<size_t> &range )
+				{
+					for( size_t i = range.begin(); i != range.end(); ++i )
+					{
+						UVDistortion &uvDist = m_uvDistortions[i];
+						if ( uvDist.counter )
+						{
+							uvDist.distortion /= (float)uvDist.counter;
+							uvDist.counter = 0;
+						}
+					}
+				}
+			);
+
 			uvDistortionData = new V2fVectorData();
 			std::vector<Imath::V2f> &uvDistortionVec = uvDistortionData->writable();
-			uvDistortionVec.reserve( m_faceVaryingSize );
-			for( auto &id : m_uvIds )
-			{
-				UVDistortion &uvDist = m_uvDistortions[id];
-				if ( uvDist.counter )
+			uvDistortionVec.resize( m_uvIds.size() );
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, m_uvIds.size() ),
+				[this, &uvDistortionVec]( const tbb::blocked_range<size_t> &range )
 				{
-					uvDist.distortion /= (float)uvDist.counter;
-					uvDist.counter = 0;
+					for( size_t i = range.begin(); i != range.end(); ++i )
+					{
+						uvDistortionVec[i] = m_uvDistortions[ m_uvIds[i] ].distortion;
+					}
 				}
-				uvDistortionVec.push_back( uvDist.distortion );
-			}
+			);
 		}
 };
 
@@ -242,8 +281,10 @@ std::pair<PrimitiveVariable, PrimitiveVariable> MeshAlgo::calculateDistortion( c
 	const V2fVectorData *uvData = runTimeCast<const V2fVectorData>( uvIt->second.data.get() );
 	const IntVectorData *uvIndicesData = uvIt->second.indices ? uvIt->second.indices.get() : mesh->vertexIds();
 
+	const Detail::FaceOffsets faces( mesh );
+
 	CalculateDistortions calc(
-		mesh->verticesPerFace()->readable(),
+		faces,
 		mesh->vertexIds()->readable(),
 		mesh->variableSize( PrimitiveVariable::FaceVarying ),
 		pData->readable(),
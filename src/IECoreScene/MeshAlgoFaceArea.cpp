@@ -34,6 +34,7 @@
 
 #include "IECoreScene/MeshAlgo.h"
 #include "IECoreScene/PolygonIterator.h"
+#include "IECoreScene/private/MeshAlgoUtils.h"
 
 #include "IECore/PolygonAlgo.h"
 
@@ -42,6 +43,9 @@
 #include "boost/iterator/zip_iterator.hpp"
 #include "boost/tuple/tuple.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace Imath;
 using namespace IECore;
 using namespace IECoreScene;
@@ -74,16 +78,23 @@ PrimitiveVariable MeshAlgo::calculateFaceArea( const MeshPrimitive *mesh, const
 	}
 	const std::vector<V3f> &p = pData->readable();
 
+	const Detail::FaceOffsets faces( mesh );
+
 	FloatVectorDataPtr areasData = new FloatVectorData;
 	std::vector<float> &areas = areasData->writable();
-	areas.reserve( mesh->variableSize( PrimitiveVariable::Uniform ) );
+	areas.resize( faces.numFaces() );
 
-	/// \todo: can MeshPrimitive::faceEnd() be const?
-	PolygonIterator faceEnd = const_cast<MeshPrimitive*>( mesh )->faceEnd();
-	for( PolygonIterator pIt = const_cast<MeshPrimitive*>( mesh )->faceBegin(); pIt != faceEnd; pIt++ )
-	{
-		areas.push_back( polygonArea( pIt.vertexBegin( p.begin() ), pIt.vertexEnd( p.begin() ) ) );
-	}
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, faces.numFaces() ),
+		[&faces, &p, &areas]( const tbb::blocked_range<size_t> &range )
+		{
+			PolygonIterator pIt = faces.faceBegin( range.begin() );
+			for( size_t i = range.begin(); i != range.end(); ++i, ++pIt )
+			{
+				areas[i] = polygonArea( pIt.vertexBegin( p.begin() ), pIt.vertexEnd( p.begin() ) );
+			}
+		}
+	);
 
 	return PrimitiveVariable( PrimitiveVariable::Uniform, areasData );
 }
@@ -103,35 +114,42 @@ PrimitiveVariable MeshAlgo::calculateFaceTextureArea( const MeshPrimitive *mesh,
 	}
 	const std::vector<Imath::V2f> &uvs = uvData->readable();
 
+	const Detail::FaceOffsets faces( mesh );
+
 	FloatVectorDataPtr textureAreasData = new FloatVectorData;
 	std::vector<float> &textureAreas = textureAreasData->writable();
-	textureAreas.reserve( mesh->variableSize( PrimitiveVariable::Uniform ) );
+	textureAreas.resize( faces.numFaces() );
 
-	/// \todo: can MeshPrimitive::faceEnd() be const?
-	PolygonIterator faceEnd = const_cast<MeshPrimitive*>( mesh )->faceEnd();
-	for( PolygonIterator pIt = const_cast<MeshPrimitive*>( mesh )->faceBegin(); pIt!=faceEnd; pIt++ )
-	{
-		if( uvInterpolation==PrimitiveVariable::Vertex )
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, faces.numFaces() ),
+		[&faces, &uvs, &textureAreas, uvInterpolation]( const tbb::blocked_range<size_t> &range )
 		{
-			typedef PolygonVertexIterator<std::vector<Imath::V2f>::const_iterator> VertexIterator;
-			typedef boost::transform_iterator<V2fToV3f, VertexIterator> STIterator;
-
-			STIterator begin( pIt.vertexBegin( uvs.begin() ) );
-			STIterator end( pIt.vertexEnd( uvs.begin() ) );
-
-			textureAreas.push_back( polygonArea( begin, end ) );
+			PolygonIterator pIt = faces.faceBegin( range.begin() );
+			for( size_t i = range.begin(); i != range.end(); ++i, ++pIt )
+			{
+				if( uvInterpolation==PrimitiveVariable::Vertex )
+				{
+					typedef PolygonVertexIterator<std::vector<Imath::V2f>::const_iterator> VertexIterator;
+					typedef boost::transform_iterator<V2fToV3f, VertexIterator> STIterator;
+
+					STIterator begin( pIt.vertexBegin( uvs.begin() ) );
+					STIterator end( pIt.vertexEnd( uvs.begin() ) );
+
+					textureAreas[i] = polygonArea( begin, end );
+				}
+				else
+				{
+					assert( uvInterpolation==PrimitiveVariable::FaceVarying );
+					typedef boost::transform_iterator<V2fToV3f, std::vector<Imath::V2f>::const_iterator> STIterator;
+
+					STIterator begin( pIt.faceVaryingBegin( uvs.begin() ) );
+					STIterator end( pIt.faceVaryingEnd( uvs.begin() ) );
+
+					textureAreas[i] = polygonArea( begin, end );
+				}
+			}
 		}
-		else
-		{
-			assert( uvInterpolation==PrimitiveVariable::FaceVarying );
-			typedef boost::transform_iterator<V2fToV3f, std::vector<Imath::V2f>::const_iterator> STIterator;
-
-			STIterator begin( pIt.faceVaryingBegin( uvs.begin() ) );
-			STIterator end( pIt.faceVaryingEnd( uvs.begin() ) );
-
-			textureAreas.push_back( polygonArea( begin, end ) );
-		}
-	}
+	);
 
 	return PrimitiveVariable( PrimitiveVariable::Uniform, textureAreasData );
 }
@@ -34,10 +34,14 @@
 
 #include "IECoreScene/FaceVaryingPromotionOp.h"
 #include "IECoreScene/MeshAlgo.h"
+#include "IECoreScene/private/MeshAlgoUtils.h"
 #include "IECoreScene/private/PrimitiveAlgoUtils.h"
 
 #include "IECore/DespatchTypedData.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace Imath;
 using namespace IECore;
 using namespace IECoreScene;
@@ -49,6 +53,24 @@ using namespace IECoreScene;
 namespace
 {
 
+// Divides each of the accumulated values by the number of contributions made to it.
+// The accumulation itself is performed serially by the callers, so that the order of
+// summation, and therefore the result, is deterministic.
+template<typename T>
+void normalise( std::vector<T> &values, const std::vector<int> &counts )
+{
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, values.size() ),
+		[&values, &counts]( const tbb::blocked_range<size_t> &range )
+		{
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				values[i] /= counts[i];
+			}
+		}
+	);
+}
+
 struct MeshVertexToUniform
 {
 	typedef DataPtr ReturnType;
@@ -63,25 +85,33 @@ struct MeshVertexToUniform
 		typename From::ValueType &trg = result->writable();
 		const typename From::ValueType &src = data->readable();
 
-		// TODO sipmlify this code by using polygon face & vertex iterators
-		trg.reserve( m_mesh->numFaces() );
+		const Detail::FaceOffsets faces( m_mesh );
+		trg.resize( faces.numFaces() );
 
-		std::vector<int>::const_iterator vId = m_mesh->vertexIds()->readable().begin();
+		const std::vector<int> &vertexIds = m_mesh->vertexIds()->readable();
 		const std::vector<int> &verticesPerFace = m_mesh->verticesPerFace()->readable();
-		for( std::vector<int>::const_iterator it = verticesPerFace.begin(); it < verticesPerFace.end(); ++it )
-		{
-			// initialize with the first value to avoid
-			// ambiguitity during default construction
-			typename From::ValueType::value_type total = src[ *vId ];
-			++vId;
 
-			for( int j = 1; j < *it; ++j, ++vId )
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, faces.numFaces() ),
+			[&faces, &vertexIds, &verticesPerFace, &src, &trg]( const tbb::blocked_range<size_t> &range )
 			{
-				total += src[ *vId ];
+				std::vector<int>::const_iterator vId = vertexIds.begin() + faces.offset( range.begin() );
+				for( size_t i = range.begin(); i != range.end(); ++i )
+				{
+					// initialize with the first value to avoid
+					// ambiguitity during default construction
+					typename From::ValueType::value_type total = src[ *vId ];
+					++vId;
+
+					for( int j = 1; j < verticesPerFace[i]; ++j, ++vId )
+					{
+						total += src[ *vId ];
+					}
+
+					trg[i] = total / verticesPerFace[i];
+				}
 			}
-
-			trg.push_back( total / *it );
-		}
+		);
 
 		return result;
 	}
@@ -119,12 +149,7 @@ struct MeshUniformToVertex
 			}
 		}
 
-		std::vector<int>::const_iterator cIt = count.begin();
-		typename From::ValueType::iterator trgIt = trg.begin(), trgEnd = trg.end();
-		for( trgIt = trg.begin(); trgIt != trgEnd ; ++trgIt, ++cIt )
-		{
-			*trgIt /= *cIt;
-		}
+		normalise( trg, count );
 
 		return result;
 	}
@@ -160,12 +185,7 @@ struct MeshFaceVaryingToVertex
 			++count[ *vertexIdIt ];
 		}
 
-		std::vector<int>::const_iterator cIt = count.begin();
-		typename From::ValueType::iterator trgIt = trg.begin(), trgEnd = trg.end();
-		for( trgIt = trg.begin(); trgIt != trgEnd ; ++trgIt, ++cIt )
-		{
-			*trgIt /= *cIt;
-		}
+		normalise( trg, count );
 
 		return result;
 	}
@@ -187,25 +207,32 @@ struct MeshFaceVaryingToUniform
 		typename From::ValueType &trg = result->writable();
 		const typename From::ValueType &src = data->readable();
 
-		trg.reserve( m_mesh->numFaces() );
-
-		typename From::ValueType::const_iterator srcIt = src.begin();
+		const Detail::FaceOffsets faces( m_mesh );
+		trg.resize( faces.numFaces() );
 
 		const std::vector<int> &verticesPerFace = m_mesh->verticesPerFace()->readable();
-		for( std::vector<int>::const_iterator it = verticesPerFace.begin(); it < verticesPerFace.end(); ++it )
-		{
-			// initialize with the first value to avoid
-			// ambiguity during default construction
-			typename From::ValueType::value_type total = *srcIt;
-			++srcIt;
 
-			for( int j = 1; j < *it; ++j, ++srcIt )
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, faces.numFaces() ),
+			[&faces, &verticesPerFace, &src, &trg]( const tbb::blocked_range<size_t> &range )
 			{
-				total += *srcIt;
+				typename From::ValueType::const_iterator srcIt = src.begin() + faces.offset( range.begin() );
+				for( size_t i = range.begin(); i != range.end(); ++i )
+				{
+					// initialize with the first value to avoid
+					// ambiguity during default construction
+					typename From::ValueType::value_type total = *srcIt;
+					++srcIt;
+
+					for( int j = 1; j < verticesPerFace[i]; ++j, ++srcIt )
+					{
+						total += *srcIt;
+					}
+
+					trg[i] = total / verticesPerFace[i];
+				}
 			}
-
-			trg.push_back( total / *it );
-		}
+		);
 
 		return result;
 	}
@@ -34,6 +34,9 @@
 
 #include "IECoreScene/MeshAlgo.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace Imath;
 using namespace IECore;
 using namespace IECoreScene;
@@ -82,87 +85,105 @@ std::pair<PrimitiveVariable, PrimitiveVariable> IECoreScene::MeshAlgo::calculate
 	const IntVectorData::ValueType &uvIndices = uvIt->second.indices ? uvIt->second.indices->readable() : vertIds;
 
 	size_t numUVs = uvs.size();
+	size_t numFaces = vertsPerFace.size();
 
-	std::vector<V3f> uTangents( numUVs, V3f( 0 ) );
-	std::vector<V3f> vTangents( numUVs, V3f( 0 ) );
-	std::vector<V3f> normals( numUVs, V3f( 0 ) );
-
-	for( size_t faceIndex = 0; faceIndex < vertsPerFace.size(); faceIndex++ )
-	{
-		assert( vertsPerFace[faceIndex] == 3 );
-
-		// indices into the facevarying data for this face
-		size_t fvi0 = faceIndex * 3;
-		size_t fvi1 = fvi0 + 1;
-		size_t fvi2 = fvi1 + 1;
-		assert( fvi2 < vertIds.size() );
-		assert( fvi2 < uvIndices.size() );
-
-		// positions for each vertex of this face
-		const V3f &p0 = points[vertIds[fvi0]];
-		const V3f &p1 = points[vertIds[fvi1]];
-		const V3f &p2 = points[vertIds[fvi2]];
+	// compute tangents and normal for each face in parallel
 
-		// uv coordinates for each vertex of this face
-		const V2f &uv0 = uvs[uvIndices[fvi0]];
-		const V2f &uv1 = uvs[uvIndices[fvi1]];
-		const V2f &uv2 = uvs[uvIndices[fvi2]];
+	std::vector<V3f> faceTangents( numFaces );
+	std::vector<V3f> faceBitangents( numFaces );
+	std::vector<V3f> faceNormals( numFaces );
 
-		// compute tangents and normal for this face
-		const V3f e0 = p1 - p0;
-		const V3f e1 = p2 - p0;
-
-		const V2f e0uv = uv1 - uv0;
-		const V2f e1uv = uv2 - uv0;
-
-		V3f tangent = ( e0 * -e1uv.y + e1 * e0uv.y ).normalized();
-		V3f bitangent = ( e0 * -e1uv.x + e1 * e0uv.x ).normalized();
-
-		V3f normal = ( p2 - p1 ).cross( p0 - p1 );
-		normal.normalize();
-
-		// and accumlate them into the computation so far
-		uTangents[uvIndices[fvi0]] += tangent;
-		uTangents[uvIndices[fvi1]] += tangent;
-		uTangents[uvIndices[fvi2]] += tangent;
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, numFaces ),
+		[&]( const tbb::blocked_range<size_t> &range )
+		{
+			for( size_t faceIndex = range.begin(); faceIndex != range.end(); ++faceIndex )
+			{
+				assert( vertsPerFace[faceIndex] == 3 );
+
+				// indices into the facevarying data for this face
+				size_t fvi0 = faceIndex * 3;
+				size_t fvi1 = fvi0 + 1;
+				size_t fvi2 = fvi1 + 1;
+				assert( fvi2 < vertIds.size() );
+				assert( fvi2 < uvIndices.size() );
+
+				// positions for each vertex of this face
+				const V3f &p0 = points[vertIds[fvi0]];
+				const V3f &p1 = points[vertIds[fvi1]];
+				const V3f &p2 = points[vertIds[fvi2]];
+
+				// uv coordinates for each vertex of this face
+				const V2f &uv0 = uvs[uvIndices[fvi0]];
+				const V2f &uv1 = uvs[uvIndices[fvi1]];
+				const V2f &uv2 = uvs[uvIndices[fvi2]];
+
+				// compute tangents and normal for this face
+				const V3f e0 = p1 - p0;
+				const V3f e1 = p2 - p0;
+
+				const V2f e0uv = uv1 - uv0;
+				const V2f e1uv = uv2 - uv0;
+
+				faceTangents[faceIndex] = ( e0 * -e1uv.y + e1 * e0uv.y ).normalized();
+				faceBitangents[faceIndex] = ( e0 * -e1uv.x + e1 * e0uv.x ).normalized();
+
+				V3f normal = ( p2 - p1 ).cross( p0 - p1 );
+				normal.normalize();
+				faceNormals[faceIndex] = normal;
+			}
+		}
+	);
 
-		vTangents[uvIndices[fvi0]] += bitangent;
-		vTangents[uvIndices[fvi1]] += bitangent;
-		vTangents[uvIndices[fvi2]] += bitangent;
+	// and accumulate them. This is done serially, so that the order of
+	// summation, and therefore the result, is deterministic.
 
-		normals[uvIndices[fvi0]] += normal;
-		normals[uvIndices[fvi1]] += normal;
-		normals[uvIndices[fvi2]] += normal;
+	std::vector<V3f> uTangents( numUVs, V3f( 0 ) );
+	std::vector<V3f> vTangents( numUVs, V3f( 0 ) );
+	std::vector<V3f> normals( numUVs, V3f( 0 ) );
 
+	for( size_t fvi = 0; fvi < numFaces * 3; fvi++ )
+	{
+		const size_t faceIndex = fvi / 3;
+		const int uvIndex = uvIndices[fvi];
+		uTangents[uvIndex] += faceTangents[faceIndex];
+		vTangents[uvIndex] += faceBitangents[faceIndex];
+		normals[uvIndex] += faceNormals[faceIndex];
 	}
 
 	// normalize and orthogonalize everything
-	for( size_t i = 0; i < uTangents.size(); i++ )
-	{
-		normals[i].normalize();
-
-		uTangents[i].normalize();
-		vTangents[i].normalize();
-
-		// Make uTangent/vTangent orthogonal to normal
-		uTangents[i] -= normals[i] * uTangents[i].dot( normals[i] );
-		vTangents[i] -= normals[i] * vTangents[i].dot( normals[i] );
-
-		uTangents[i].normalize();
-		vTangents[i].normalize();
-
-		if( orthoTangents )
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, numUVs ),
+		[&]( const tbb::blocked_range<size_t> &range )
 		{
-			vTangents[i] -= uTangents[i] * vTangents[i].dot( uTangents[i] );
-			vTangents[i].normalize();
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				normals[i].normalize();
+
+				uTangents[i].normalize();
+				vTangents[i].normalize();
+
+				// Make uTangent/vTangent orthogonal to normal
+				uTangents[i] -= normals[i] * uTangents[i].dot( normals[i] );
+				vTangents[i] -= normals[i] * vTangents[i].dot( normals[i] );
+
+				uTangents[i].normalize();
+				vTangents[i].normalize();
+
+				if( orthoTangents )
+				{
+					vTangents[i] -= uTangents[i] * vTangents[i].dot( uTangents[i] );
+					vTangents[i].normalize();
+				}
+
+				// Ensure we have set of basis vectors (n, uT, vT) with the correct handedness.
+				if( uTangents[i].cross( vTangents[i] ).dot( normals[i] ) < 0.0f )
+				{
+					uTangents[i] *= -1.0f;
+				}
+			}
 		}
-
-		// Ensure we have set of basis vectors (n, uT, vT) with the correct handedness.
-		if( uTangents[i].cross( vTangents[i] ).dot( normals[i] ) < 0.0f )
-		{
-			uTangents[i] *= -1.0f;
-		}
-	}
+	);
 
 	// convert the tangents back to facevarying data and add that to the mesh
 	V3fVectorDataPtr fvUD = new V3fVectorData();
@@ -173,11 +194,17 @@ std::pair<PrimitiveVariable, PrimitiveVariable> IECoreScene::MeshAlgo::calculate
 	fvU.resize( uvIndices.size() );
 	fvV.resize( uvIndices.size() );
 
-	for( unsigned i = 0; i < uvIndices.size(); i++ )
-	{
-		fvU[i] = uTangents[uvIndices[i]];
-		fvV[i] = vTangents[uvIndices[i]];
-	}
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, uvIndices.size() ),
+		[&]( const tbb::blocked_range<size_t> &range )
+		{
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				fvU[i] = uTangents[uvIndices[i]];
+				fvV[i] = vTangents[uvIndices[i]];
+			}
+		}
+	);
 
 	PrimitiveVariable tangentPrimVar( PrimitiveVariable::FaceVarying, fvUD );
 	PrimitiveVariable bitangentPrimVar( PrimitiveVariable::FaceVarying, fvVD );
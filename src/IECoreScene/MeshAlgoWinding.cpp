@@ -34,9 +34,15 @@
 
 #include "IECoreScene/MeshAlgo.h"
 #include "IECoreScene/PolygonIterator.h"
+#include "IECoreScene/private/MeshAlgoUtils.h"
 
 #include "IECore/DespatchTypedData.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
+#include <type_traits>
+
 using namespace Imath;
 using namespace IECore;
 using namespace IECoreScene;
@@ -49,12 +55,23 @@ namespace
 {
 
 template<typename T>
-void reverseWinding( MeshPrimitive *mesh, T &values )
+void reverseWinding( const Detail::FaceOffsets &faces, T &values )
 {
-	for( PolygonIterator it = mesh->faceBegin(), eIt = mesh->faceEnd(); it != eIt; ++it )
-	{
-		std::reverse( it.faceVaryingBegin( values.begin() ), it.faceVaryingEnd( values.begin() ) );
-	}
+	// Faces are reversed in parallel, except for std::vector<bool>, where
+	// neighbouring elements share storage and can't be written concurrently.
+	const size_t grainSize = std::is_same<T, std::vector<bool> >::value ? faces.numFaces() + 1 : 1;
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, faces.numFaces(), grainSize ),
+		[&faces, &values]( const tbb::blocked_range<size_t> &range )
+		{
+			PolygonIterator it = faces.faceBegin( range.begin() );
+			for( size_t i = range.begin(); i != range.end(); ++i, ++it )
+			{
+				std::reverse( it.faceVaryingBegin( values.begin() ), it.faceVaryingEnd( values.begin() ) );
+			}
+		}
+	);
 }
 
 struct ReverseWindingFunctor
@@ -62,19 +79,19 @@ struct ReverseWindingFunctor
 
 	typedef void ReturnType;
 
-	ReverseWindingFunctor( MeshPrimitive *mesh ) : m_mesh( mesh )
+	ReverseWindingFunctor( const Detail::FaceOffsets &faces ) : m_faces( faces )
 	{
 	}
 
 	template<typename T>
 	void operator()( T *data )
 	{
-		reverseWinding( m_mesh, data->writable() );
+		reverseWinding( m_faces, data->writable() );
 	}
 
 	private :
 
-		MeshPrimitive *m_mesh;
+		const Detail::FaceOffsets &m_faces;
 
 };
 
@@ -82,8 +99,13 @@ struct ReverseWindingFunctor
 
 void IECoreScene::MeshAlgo::reverseWinding( MeshPrimitive *mesh )
 {
-	IntVectorDataPtr vertexIds = mesh->vertexIds()->copy();
-	::reverseWinding( mesh, vertexIds->writable() );
+	// Keep the original topology alive while we use it to access the faces.
+	ConstIntVectorDataPtr verticesPerFace = mesh->verticesPerFace();
+	ConstIntVectorDataPtr originalVertexIds = mesh->vertexIds();
+	const Detail::FaceOffsets faces( mesh );
+
+	IntVectorDataPtr vertexIds = originalVertexIds->copy();
+	::reverseWinding( faces, vertexIds->writable() );
 	mesh->setTopologyUnchecked(
 		mesh->verticesPerFace(),
 		vertexIds,
@@ -91,14 +113,14 @@ void IECoreScene::MeshAlgo::reverseWinding( MeshPrimitive *mesh )
 		mesh->interpolation()
 	);
 
-	ReverseWindingFunctor reverseWindingFunctor( mesh );
+	ReverseWindingFunctor reverseWindingFunctor( faces );
 	for( auto &it : mesh->variables )
 	{
 		if( it.second.interpolation == PrimitiveVariable::FaceVarying )
 		{
 			if( it.second.indices )
 			{
-				::reverseWinding<IntVectorData::ValueType>( mesh, it.second.indices->writable() );
+				::reverseWinding<IntVectorData::ValueType>( faces, it.second.indices->writable() );
 			}
 			else
 			{
@@ -35,6 +35,7 @@
 #include "IECoreScene/MeshPrimitiveEvaluator.h"
 
 #include "IECoreScene/PrimitiveVariable.h"
+#include "IECoreScene/private/TriangleBVH.h"
 
 #include "IECore/BoxOps.h"
 #include "IECore/Exception.h"
@@ -49,6 +50,9 @@ IECORE_POP_DEFAULT_VISIBILITY
 #include "OpenEXR/ImathBoxAlgo.h"
 #include "OpenEXR/ImathLineAlgo.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 #include <cassert>
 
 using namespace IECore;
@@ -217,8 +221,11 @@ const V3i &MeshPrimitiveEvaluator::Result::vertexIds() const
 	return m_vertexIds;
 }
 
-MeshPrimitiveEvaluator::MeshPrimitiveEvaluator( ConstMeshPrimitivePtr mesh ) : m_uvTree(nullptr), m_haveMassProperties( false ), m_haveSurfaceArea( false ), m_haveAverageNormals( false )
+MeshPrimitiveEvaluator::MeshPrimitiveEvaluator( ConstMeshPrimitivePtr mesh, AccelerationStructure accelerationStructure )
+	:	m_accelerationStructure( accelerationStructure ), m_tree( nullptr ), m_bvh( nullptr ), m_haveMassProperties( false ), m_haveSurfaceArea( false ), m_haveAverageNormals( false )
 {
+	m_uvTree = nullptr;
+
 	if (! mesh )
 	{
 		throw InvalidArgumentException( "No mesh given to MeshPrimitiveEvaluator");
@@ -255,60 +262,63 @@ MeshPrimitiveEvaluator::MeshPrimitiveEvaluator( ConstMeshPrimitivePtr mesh ) : m
 	}
 
 	const std::vector<int> &verticesPerFace = m_mesh->verticesPerFace()->readable();
-	m_triangles.reserve( verticesPerFace.size() );
-	m_uvTriangles.reserve( verticesPerFace.size() );
-	unsigned int triangleIdx = 0;
-	IntVectorData::ValueType::const_iterator vertexIdIt = m_meshVertexIds->begin();
-	for ( IntVectorData::ValueType::const_iterator it = verticesPerFace.begin();
-		it != verticesPerFace.end(); ++it, ++triangleIdx)
+	for( std::vector<int>::const_iterator it = verticesPerFace.begin(); it != verticesPerFace.end(); ++it )
 	{
-
 		if (*it != 3 )
 		{
 			throw InvalidArgumentException( "Non-triangular mesh given to MeshPrimitiveEvaluator");
 		}
+	}
 
-		Imath::V3i triangleVertexIds;
+	const bool haveUVs = m_uv.interpolation != PrimitiveVariable::Invalid;
+	m_triangles.resize( verticesPerFace.size() );
+	if( haveUVs )
+	{
+		m_uvTriangles.resize( verticesPerFace.size() );
+	}
 
-		triangleVertexIds[0] = *vertexIdIt++;
-		assert( triangleVertexIds[0] < (int)( m_verts->readable().size() ) );
-		triangleVertexIds[1] = *vertexIdIt++;
-		assert( triangleVertexIds[1] < (int)( m_verts->readable().size() ) );
-		triangleVertexIds[2] = *vertexIdIt++;
-		assert( triangleVertexIds[2] < (int)( m_verts->readable().size() ) );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, verticesPerFace.size() ),
+		[this, haveUVs]( const tbb::blocked_range<size_t> &range ) {
 
-		const V3f &p0 = m_verts->readable()[ triangleVertexIds[0] ];
-		const V3f &p1 = m_verts->readable()[ triangleVertexIds[1] ];
-		const V3f &p2 = m_verts->readable()[ triangleVertexIds[2] ];
+			const std::vector<V3f> &verts = m_verts->readable();
+			for( size_t triangleIdx = range.begin(); triangleIdx != range.end(); ++triangleIdx )
+			{
+				const size_t vertIdOffset = triangleIdx * 3;
+				const Imath::V3i triangleVertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
 
-		Box3f bound( p0 );
-		bound.extendBy( p1 );
-		bound.extendBy( p2 );
+				assert( triangleVertexIds[0] < (int)( verts.size() ) );
+				assert( triangleVertexIds[1] < (int)( verts.size() ) );
+				assert( triangleVertexIds[2] < (int)( verts.size() ) );
 
-		m_triangles.push_back( bound );
+				Box3f bound( verts[ triangleVertexIds[0] ] );
+				bound.extendBy( verts[ triangleVertexIds[1] ] );
+				bound.extendBy( verts[ triangleVertexIds[2] ] );
 
-		if( m_uv.interpolation != PrimitiveVariable::Invalid )
-		{
-			Imath::V2f uv[3];
-			triangleUVs( triangleIdx, triangleVertexIds, uv );
+				m_triangles[triangleIdx] = bound;
 
-			Box2f uvBound( uv[0] );
-			uvBound.extendBy( uv[1] );
-			uvBound.extendBy( uv[2] );
+				if( haveUVs )
+				{
+					Imath::V2f uv[3];
+					triangleUVs( triangleIdx, triangleVertexIds, uv );
 
-			m_uvTriangles.push_back( uvBound );
-		}
-	}
+					Box2f uvBound( uv[0] );
+					uvBound.extendBy( uv[1] );
+					uvBound.extendBy( uv[2] );
 
-	m_tree = new TriangleBoundTree( m_triangles.begin(), m_triangles.end() );
+					m_uvTriangles[triangleIdx] = uvBound;
+				}
+			}
+		}
+	);
 
-	if( m_uv.interpolation != PrimitiveVariable::Invalid )
+	if( m_accelerationStructure == BVH )
 	{
-		m_uvTree = new UVBoundTree( m_uvTriangles.begin(), m_uvTriangles.end() );
+		m_bvh = new Detail::TriangleBVH( m_triangles );
 	}
 	else
 	{
-		m_uvTree = nullptr;
+		m_tree = new TriangleBoundTree( m_triangles.begin(), m_triangles.end() );
 	}
 }
 
@@ -322,11 +332,12 @@ PrimitiveEvaluatorPtr MeshPrimitiveEvaluator::create( ConstPrimitivePtr primitiv
 
 MeshPrimitiveEvaluator::~MeshPrimitiveEvaluator()
 {
-	assert( m_tree );
-
 	delete m_tree;
 	m_tree = nullptr;
 
+	delete m_bvh;
+	m_bvh = nullptr;
+
 	delete m_uvTree;
 	m_uvTree = nullptr;
 }
@@ -341,6 +352,11 @@ MeshPrimitive::ConstPtr MeshPrimitiveEvaluator::mesh() const
 	return m_mesh;
 }
 
+MeshPrimitiveEvaluator::AccelerationStructure MeshPrimitiveEvaluator::accelerationStructure() const
+{
+	return m_accelerationStructure;
+}
+
 float MeshPrimitiveEvaluator::volume() const
 {
 	if ( !m_haveMassProperties )
@@ -772,10 +788,16 @@ bool MeshPrimitiveEvaluator::closestPoint( const V3f &p, PrimitiveEvaluator::Res
 		return false;
 	}
 
-	assert( m_tree );
-
 	Result *mr = static_cast<Result *>( result );
 
+	if( m_bvh )
+	{
+		closestPointBVH( p, mr );
+		return true;
+	}
+
+	assert( m_tree );
+
 	float maxDistSqrd = limits<float>::max();
 
 	closestPointWalk( m_tree->rootIndex(), p, maxDistSqrd, mr );
@@ -792,10 +814,10 @@ bool MeshPrimitiveEvaluator::pointAtUV( const Imath::V2f &uv, PrimitiveEvaluator
 		throw Exception("No uvs available for pointAtUV");
 	}
 
-	assert( m_uvTree );
+	const UVBoundTree *uvTree = uvBoundTree();
 	Result *mr = static_cast<Result *>( result );
 
-	return pointAtUVWalk( m_uvTree->rootIndex(), uv, mr );
+	return pointAtUVWalk( uvTree->rootIndex(), uv, mr );
 }
 
 bool MeshPrimitiveEvaluator::intersectionPoint( const Imath::V3f &origin, const Imath::V3f &direction,
@@ -808,8 +830,6 @@ bool MeshPrimitiveEvaluator::intersectionPoint( const Imath::V3f &origin, const
 		return false;
 	}
 
-	assert( m_tree );
-
 	Result *mr = static_cast<Result *>( result );
 
 	float maxDistSqrd = maxDistance * maxDistance;
@@ -818,6 +838,13 @@ bool MeshPrimitiveEvaluator::intersectionPoint( const Imath::V3f &origin, const
 	ray.pos = origin;
 	ray.dir = direction.normalized();
 
+	if( m_bvh )
+	{
+		return intersectionPointBVH( ray, maxDistSqrd, mr );
+	}
+
+	assert( m_tree );
+
 	bool hit = false;
 
 	intersectionPointWalk( m_tree->rootIndex(), ray, maxDistSqrd, mr, hit );
@@ -834,19 +861,30 @@ int MeshPrimitiveEvaluator::intersectionPoints( const Imath::V3f &origin, const
 		return 0;
 	}
 
-	assert( m_tree );
-
 	float maxDistSqrd = maxDistance * maxDistance;
 
 	Imath::Line3f ray;
 	ray.pos = origin;
 	ray.dir = direction.normalized();
 
+	if( m_bvh )
+	{
+		intersectionPointsBVH( ray, maxDistSqrd, results );
+		return results.size();
+	}
+
+	assert( m_tree );
+
 	intersectionPointsWalk( m_tree->rootIndex(), ray, maxDistSqrd, results );
 
 	return results.size();
 }
 
+int MeshPrimitiveEvaluator::elementIndex( const PrimitiveEvaluator::Result *result ) const
+{
+	return static_cast<const Result *>( result )->triangleIndex();
+}
+
 bool MeshPrimitiveEvaluator::barycentricPosition( unsigned int triangleIndex, const Imath::V3f &barycentricCoordinates, PrimitiveEvaluator::Result *result ) const
 {
 	if( triangleIndex >= m_triangles.size() )
@@ -889,42 +927,7 @@ void MeshPrimitiveEvaluator::closestPointWalk( TriangleBoundTree::NodeIndex node
 		for( TriangleBoundTree::Iterator *perm = node.permFirst(); perm!=permLast; perm++ )
 		{
 			size_t triangleIndex = *perm - m_triangles.begin(); // triangle index is just the distance of the triangle from the beginning of the vector
-			size_t vertIdOffset = triangleIndex * 3;
-			Imath::V3i vertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
-
-			assert( vertexIds[0] < (int)( m_verts->readable().size() ) );
-			assert( vertexIds[1] < (int)( m_verts->readable().size() ) );
-			assert( vertexIds[2] < (int)( m_verts->readable().size() ) );
-
-			V3f bary;
-			float dSqrd = triangleClosestBarycentric(
-				m_verts->readable()[vertexIds[0]],
-				m_verts->readable()[vertexIds[1]],
-				m_verts->readable()[vertexIds[2]],
-				p,
-				bary );
-
-			if (dSqrd < closestDistanceSqrd)
-			{
-				closestDistanceSqrd = dSqrd;
-
-				result->m_bary = bary;
-				result->m_vertexIds = vertexIds;
-				result->m_triangleIdx = triangleIndex;
-
-				if( m_uv.interpolation != PrimitiveVariable::Invalid )
-				{
-					result->m_uv = result->vec2PrimVar( m_uv );
-				}
-
-				const Imath::V3f &p0 = m_verts->readable()[vertexIds[0]];
-				const Imath::V3f &p1 = m_verts->readable()[vertexIds[1]];
-				const Imath::V3f &p2 = m_verts->readable()[vertexIds[2]];
-
-				result->m_p = trianglePoint( p0, p1, p2, result->m_bary );
-
-				result->m_n = triangleNormal( p0, p1, p2 );
-			}
+			closestPointTriangle( triangleIndex, p, closestDistanceSqrd, result );
 		}
 	}
 	else
@@ -1050,44 +1053,10 @@ bool MeshPrimitiveEvaluator::intersectionPointWalk( TriangleBoundTree::NodeIndex
 		for( TriangleBoundTree::Iterator *perm = node.permFirst(); perm!=permLast; perm++ )
 		{
 			size_t triangleIndex = *perm - m_triangles.begin(); // triangle index is just the distance of the triangle from the beginning of the vector
-			size_t vertIdOffset = triangleIndex * 3;
-			Imath::V3i vertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
-
-			assert( vertexIds[0] < (int)( m_verts->readable().size() ) );
-			assert( vertexIds[1] < (int)( m_verts->readable().size() ) );
-			assert( vertexIds[2] < (int)( m_verts->readable().size() ) );
-
-			const Imath::V3f &p0 = m_verts->readable()[ vertexIds[0] ];
-			const Imath::V3f &p1 = m_verts->readable()[ vertexIds[1] ];
-			const Imath::V3f &p2 = m_verts->readable()[ vertexIds[2] ];
-
-			V3f hitPoint, bary;
-			bool front;
-
-			if ( triangleRayIntersection( p0, p1, p2, ray.pos, ray.dir, hitPoint, bary, front ) )
+			if( intersectionPointTriangle( triangleIndex, ray, maxDistSqrd, result ) )
 			{
-				float dSqrd = vecDistance2( hitPoint, ray.pos );
-
-				if (dSqrd < maxDistSqrd)
-				{
-					maxDistSqrd = dSqrd;
-
-					result->m_bary = bary;
-					result->m_vertexIds = vertexIds;
-					result->m_triangleIdx = triangleIndex;
-
-					result->m_p = hitPoint;
-
-					if( m_uv.interpolation != PrimitiveVariable::Invalid )
-					{
-						result->m_uv = result->vec2PrimVar( m_uv );
-					}
-
-					result->m_n = triangleNormal( p0, p1, p2 );
-
-					intersects = true;
-					hit = true;
-				}
+				intersects = true;
+				hit = true;
 			}
 		}
 
@@ -1206,44 +1175,7 @@ void MeshPrimitiveEvaluator::intersectionPointsWalk( TriangleBoundTree::NodeInde
 		for( TriangleBoundTree::Iterator *perm = node.permFirst(); perm!=permLast; perm++ )
 		{
 			size_t triangleIndex = *perm - m_triangles.begin(); // triangle index is just the distance of the triangle from the beginning of the vector
-			size_t vertIdOffset = triangleIndex * 3;
-			Imath::V3i vertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
-
-			assert( vertexIds[0] < (int)( m_verts->readable().size() ) );
-			assert( vertexIds[1] < (int)( m_verts->readable().size() ) );
-			assert( vertexIds[2] < (int)( m_verts->readable().size() ) );
-
-			const Imath::V3f &p0 =  m_verts->readable()[ vertexIds[0] ];
-			const Imath::V3f &p1 =  m_verts->readable()[ vertexIds[1] ];
-			const Imath::V3f &p2 =  m_verts->readable()[ vertexIds[2] ];
-
-			V3f hitPoint, bary;
-			bool front;
-
-			if ( triangleRayIntersection( p0, p1, p2, ray.pos, ray.dir, hitPoint, bary, front ) )
-			{
-				float dSqrd = vecDistance2( hitPoint, ray.pos );
-
-				if (dSqrd < maxDistSqrd)
-				{
-					ResultPtr result = new Result();
-
-					result->m_bary = bary;
-					result->m_vertexIds = vertexIds;
-					result->m_triangleIdx = triangleIndex;
-
-					result->m_p = hitPoint;
-
-					if ( m_uv.interpolation != PrimitiveVariable::Invalid )
-					{
-						result->m_uv = result->vec2PrimVar( m_uv );
-					}
-
-					result->m_n = triangleNormal( p0, p1, p2 );
-
-					results.push_back( result );
-				}
-			}
+			intersectionPointsTriangle( triangleIndex, ray, maxDistSqrd, results );
 		}
 	}
 	else
@@ -1278,13 +1210,299 @@ void MeshPrimitiveEvaluator::intersectionPointsWalk( TriangleBoundTree::NodeInde
 	}
 }
 
+void MeshPrimitiveEvaluator::closestPointBVH( const V3f &p, Result *result ) const
+{
+	const Detail::TriangleBVH::NodeVector &nodes = m_bvh->nodes();
+	const std::vector<uint32_t> &triangleIndices = m_bvh->triangleIndices();
+
+	float closestDistanceSqrd = limits<float>::max();
+
+	// Stack of node indices, paired with the squared distance to the node bound.
+	std::pair<uint32_t, float> stack[2 * Detail::TriangleBVH::maxDepth];
+	size_t stackSize = 0;
+	stack[stackSize++] = std::make_pair( 0, 0.0f );
+
+	while( stackSize )
+	{
+		const uint32_t nodeIndex = stack[--stackSize].first;
+		if( stack[stackSize].second >= closestDistanceSqrd )
+		{
+			continue;
+		}
+
+		const Detail::TriangleBVH::Node &node = nodes[nodeIndex];
+		if( node.isLeaf() )
+		{
+			for( uint32_t i = node.offset, e = node.offset + node.count; i < e; ++i )
+			{
+				closestPointTriangle( triangleIndices[i], p, closestDistanceSqrd, result );
+			}
+			continue;
+		}
+
+		const uint32_t firstChild = nodeIndex + 1;
+		const uint32_t secondChild = node.offset;
+		const float dFirst = vecDistance2( closestPointInBox( p, nodes[firstChild].bound ), p );
+		const float dSecond = vecDistance2( closestPointInBox( p, nodes[secondChild].bound ), p );
+
+		/// Push the furthest child first, so that we descend into the closest first
+		if( dFirst < dSecond )
+		{
+			stack[stackSize++] = std::make_pair( secondChild, dSecond );
+			stack[stackSize++] = std::make_pair( firstChild, dFirst );
+		}
+		else
+		{
+			stack[stackSize++] = std::make_pair( firstChild, dFirst );
+			stack[stackSize++] = std::make_pair( secondChild, dSecond );
+		}
+	}
+}
+
+bool MeshPrimitiveEvaluator::intersectionPointBVH( const Imath::Line3f &ray, float maxDistSqrd, Result *result ) const
+{
+	const Detail::TriangleBVH::NodeVector &nodes = m_bvh->nodes();
+	const std::vector<uint32_t> &triangleIndices = m_bvh->triangleIndices();
+	const V3f inverseDirection( 1.0f / ray.dir.x, 1.0f / ray.dir.y, 1.0f / ray.dir.z );
+
+	float distance;
+	if( !Detail::TriangleBVH::rayIntersects( nodes[0].bound, ray.pos, inverseDirection, sqrtf( maxDistSqrd ), distance ) )
+	{
+		return false;
+	}
+
+	// Stack of node indices, paired with the distance at which the ray enters the node bound.
+	std::pair<uint32_t, float> stack[2 * Detail::TriangleBVH::maxDepth];
+	size_t stackSize = 0;
+	stack[stackSize++] = std::make_pair( 0, distance );
+
+	bool hit = false;
+	while( stackSize )
+	{
+		const uint32_t nodeIndex = stack[--stackSize].first;
+		const float entryDistance = stack[stackSize].second;
+		if( entryDistance * entryDistance > maxDistSqrd )
+		{
+			continue;
+		}
+
+		const Detail::TriangleBVH::Node &node = nodes[nodeIndex];
+		if( node.isLeaf() )
+		{
+			for( uint32_t i = node.offset, e = node.offset + node.count; i < e; ++i )
+			{
+				if( intersectionPointTriangle( triangleIndices[i], ray, maxDistSqrd, result ) )
+				{
+					hit = true;
+				}
+			}
+			continue;
+		}
+
+		const float maxDistance = sqrtf( maxDistSqrd );
+		const uint32_t firstChild = nodeIndex + 1;
+		const uint32_t secondChild = node.offset;
+		float dFirst, dSecond;
+		const bool firstHit = Detail::TriangleBVH::rayIntersects( nodes[firstChild].bound, ray.pos, inverseDirection, maxDistance, dFirst );
+		const bool secondHit = Detail::TriangleBVH::rayIntersects( nodes[secondChild].bound, ray.pos, inverseDirection, maxDistance, dSecond );
+
+		/// Push the furthest child first, so that we descend into the closest intersection first
+		if( firstHit && secondHit )
+		{
+			if( dFirst < dSecond )
+			{
+				stack[stackSize++] = std::make_pair( secondChild, dSecond );
+				stack[stackSize++] = std::make_pair( firstChild, dFirst );
+			}
+			else
+			{
+				stack[stackSize++] = std::make_pair( firstChild, dFirst );
+				stack[stackSize++] = std::make_pair( secondChild, dSecond );
+			}
+		}
+		else if( firstHit )
+		{
+			stack[stackSize++] = std::make_pair( firstChild, dFirst );
+		}
+		else if( secondHit )
+		{
+			stack[stackSize++] = std::make_pair( secondChild, dSecond );
+		}
+	}
+
+	return hit;
+}
+
+void MeshPrimitiveEvaluator::intersectionPointsBVH( const Imath::Line3f &ray, float maxDistSqrd, std::vector<PrimitiveEvaluator::ResultPtr> &results ) const
+{
+	const Detail::TriangleBVH::NodeVector &nodes = m_bvh->nodes();
+	const std::vector<uint32_t> &triangleIndices = m_bvh->triangleIndices();
+	const V3f inverseDirection( 1.0f / ray.dir.x, 1.0f / ray.dir.y, 1.0f / ray.dir.z );
+	const float maxDistance = sqrtf( maxDistSqrd );
+
+	uint32_t stack[2 * Detail::TriangleBVH::maxDepth];
+	size_t stackSize = 0;
+	stack[stackSize++] = 0;
+
+	while( stackSize )
+	{
+		const uint32_t nodeIndex = stack[--stackSize];
+		const Detail::TriangleBVH::Node &node = nodes[nodeIndex];
+
+		float distance;
+		if( !Detail::TriangleBVH::rayIntersects( node.bound, ray.pos, inverseDirection, maxDistance, distance ) )
+		{
+			continue;
+		}
+
+		if( node.isLeaf() )
+		{
+			for( uint32_t i = node.offset, e = node.offset + node.count; i < e; ++i )
+			{
+				intersectionPointsTriangle( triangleIndices[i], ray, maxDistSqrd, results );
+			}
+			continue;
+		}
+
+		stack[stackSize++] = node.offset;
+		stack[stackSize++] = nodeIndex + 1;
+	}
+}
+
+void MeshPrimitiveEvaluator::closestPointTriangle( size_t triangleIndex, const V3f &p, float &closestDistanceSqrd, Result *result ) const
+{
+	size_t vertIdOffset = triangleIndex * 3;
+	Imath::V3i vertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
+
+	assert( vertexIds[0] < (int)( m_verts->readable().size() ) );
+	assert( vertexIds[1] < (int)( m_verts->readable().size() ) );
+	assert( vertexIds[2] < (int)( m_verts->readable().size() ) );
+
+	V3f bary;
+	float dSqrd = triangleClosestBarycentric(
+		m_verts->readable()[vertexIds[0]],
+		m_verts->readable()[vertexIds[1]],
+		m_verts->readable()[vertexIds[2]],
+		p,
+		bary );
+
+	if (dSqrd < closestDistanceSqrd)
+	{
+		closestDistanceSqrd = dSqrd;
+
+		result->m_bary = bary;
+		result->m_vertexIds = vertexIds;
+		result->m_triangleIdx = triangleIndex;
+
+		if( m_uv.interpolation != PrimitiveVariable::Invalid )
+		{
+			result->m_uv = result->vec2PrimVar( m_uv );
+		}
+
+		const Imath::V3f &p0 = m_verts->readable()[vertexIds[0]];
+		const Imath::V3f &p1 = m_verts->readable()[vertexIds[1]];
+		const Imath::V3f &p2 = m_verts->readable()[vertexIds[2]];
+
+		result->m_p = trianglePoint( p0, p1, p2, result->m_bary );
+
+		result->m_n = triangleNormal( p0, p1, p2 );
+	}
+}
+
+bool MeshPrimitiveEvaluator::intersectionPointTriangle( size_t triangleIndex, const Imath::Line3f &ray, float &maxDistSqrd, Result *result ) const
+{
+	size_t vertIdOffset = triangleIndex * 3;
+	Imath::V3i vertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
+
+	assert( vertexIds[0] < (int)( m_verts->readable().size() ) );
+	assert( vertexIds[1] < (int)( m_verts->readable().size() ) );
+	assert( vertexIds[2] < (int)( m_verts->readable().size() ) );
+
+	const Imath::V3f &p0 = m_verts->readable()[ vertexIds[0] ];
+	const Imath::V3f &p1 = m_verts->readable()[ vertexIds[1] ];
+	const Imath::V3f &p2 = m_verts->readable()[ vertexIds[2] ];
+
+	V3f hitPoint, bary;
+	bool front;
+
+	if ( triangleRayIntersection( p0, p1, p2, ray.pos, ray.dir, hitPoint, bary, front ) )
+	{
+		float dSqrd = vecDistance2( hitPoint, ray.pos );
+
+		if (dSqrd < maxDistSqrd)
+		{
+			maxDistSqrd = dSqrd;
+
+			result->m_bary = bary;
+			result->m_vertexIds = vertexIds;
+			result->m_triangleIdx = triangleIndex;
+
+			result->m_p = hitPoint;
+
+			if( m_uv.interpolation != PrimitiveVariable::Invalid )
+			{
+				result->m_uv = result->vec2PrimVar( m_uv );
+			}
+
+			result->m_n = triangleNormal( p0, p1, p2 );
+
+			return true;
+		}
+	}
+
+	return false;
+}
+
+void MeshPrimitiveEvaluator::intersectionPointsTriangle( size_t triangleIndex, const Imath::Line3f &ray, float maxDistSqrd, std::vector<PrimitiveEvaluator::ResultPtr> &results ) const
+{
+	size_t vertIdOffset = triangleIndex * 3;
+	Imath::V3i vertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
+
+	assert( vertexIds[0] < (int)( m_verts->readable().size() ) );
+	assert( vertexIds[1] < (int)( m_verts->readable().size() ) );
+	assert( vertexIds[2] < (int)( m_verts->readable().size() ) );
+
+	const Imath::V3f &p0 =  m_verts->readable()[ vertexIds[0] ];
+	const Imath::V3f &p1 =  m_verts->readable()[ vertexIds[1] ];
+	const Imath::V3f &p2 =  m_verts->readable()[ vertexIds[2] ];
+
+	V3f hitPoint, bary;
+	bool front;
+
+	if ( triangleRayIntersection( p0, p1, p2, ray.pos, ray.dir, hitPoint, bary, front ) )
+	{
+		float dSqrd = vecDistance2( hitPoint, ray.pos );
+
+		if (dSqrd < maxDistSqrd)
+		{
+			ResultPtr result = new Result();
+
+			result->m_bary = bary;
+			result->m_vertexIds = vertexIds;
+			result->m_triangleIdx = triangleIndex;
+
+			result->m_p = hitPoint;
+
+			if ( m_uv.interpolation != PrimitiveVariable::Invalid )
+			{
+				result->m_uv = result->vec2PrimVar( m_uv );
+			}
+
+			result->m_n = triangleNormal( p0, p1, p2 );
+
+			results.push_back( result );
+		}
+	}
+}
+
 const Imath::Box2f MeshPrimitiveEvaluator::uvBound() const
 {
-	if( !m_uvTree )
+	const UVBoundTree *uvTree = uvBoundTree();
+	if( !uvTree )
 	{
 		return Imath::Box2f();
 	}
-	return m_uvTree->node( m_uvTree->rootIndex() ).bound();
+	return uvTree->node( uvTree->rootIndex() ).bound();
 }
 
 const MeshPrimitiveEvaluator::TriangleBoundVector *MeshPrimitiveEvaluator::triangleBounds() const
@@ -1299,11 +1517,31 @@ const MeshPrimitiveEvaluator::TriangleBoundTree *MeshPrimitiveEvaluator::triangl
 
 const MeshPrimitiveEvaluator::UVBoundVector *MeshPrimitiveEvaluator::uvBounds() const
 {
-	return m_uvTree ? &m_uvTriangles : nullptr;
+	return m_uv.interpolation != PrimitiveVariable::Invalid ? &m_uvTriangles : nullptr;
 }
 
 const MeshPrimitiveEvaluator::UVBoundTree *MeshPrimitiveEvaluator::uvBoundTree() const
 {
+	if( m_uv.interpolation == PrimitiveVariable::Invalid )
+	{
+		return nullptr;
+	}
+
+	if( m_uvTree )
+	{
+		return m_uvTree;
+	}
+
+	UVTreeMutex::scoped_lock lock( m_uvTreeMutex );
+	if( !m_uvTree )
+	{
+		// Another thread may have built the tree while we waited for the mutex,
+		// so we only build it if it still doesn't exist. The tree requires
+		// non-const iterators, but doesn't modify the bounds.
+		UVBoundVector &uvTriangles = const_cast<UVBoundVector &>( m_uvTriangles );
+		m_uvTree = new UVBoundTree( uvTriangles.begin(), uvTriangles.end() );
+	}
+
 	return m_uvTree;
 }
 
@@ -1,6 +1,6 @@
 //////////////////////////////////////////////////////////////////////////
 //
-//  Copyright (c) 2007-2010, Image Engine Design Inc. All rights reserved.
+//  Copyright (c) 2007-2018, Image Engine Design Inc. All rights reserved.
 //
 //  Redistribution and use in source and binary forms, with or without
 //  modification, are permitted provided that the following conditions are
@@ -37,324 +37,699 @@
 
 #include "IECoreScene/MeshPrimitive.h"
 
-#include "IECore/CompoundData.h"
 #include "IECore/CompoundParameter.h"
+#include "IECore/Exception.h"
 #include "IECore/FileNameParameter.h"
-#include "IECore/MessageHandler.h"
 #include "IECore/NullObject.h"
-#include "IECore/NumericParameter.h"
 #include "IECore/ObjectParameter.h"
-#include "IECore/SimpleTypedData.h"
-#include "IECore/TypedParameter.h"
 #include "IECore/VectorTypedData.h"
 
-#include "boost/bind.hpp"
-#include "boost/version.hpp"
+#include "boost/filesystem/operations.hpp"
+#include "boost/iostreams/device/mapped_file.hpp"
 
-#if BOOST_VERSION >= 103600
-#define BOOST_SPIRIT_USE_OLD_NAMESPACE
-#include "boost/spirit/include/classic.hpp"
-#else
-#include "boost/spirit.hpp"
-#endif
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
 
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <cstring>
 #include <fstream>
-#include <iostream>
-#include <iterator>
+#include <numeric>
 
 using namespace std;
 using namespace IECore;
 using namespace IECoreScene;
 using namespace Imath;
-using namespace boost;
-using namespace boost::spirit;
 
-IE_CORE_DEFINERUNTIMETYPED(OBJReader);
+namespace io = boost::iostreams;
 
-// syntactic sugar for specifying our grammar
-typedef boost::spirit::rule<boost::spirit::phrase_scanner_t> srule;
+IE_CORE_DEFINERUNTIMETYPED(OBJReader);
 
 const Reader::ReaderDescription<OBJReader> OBJReader::m_readerDescription("obj");
 
-OBJReader::OBJReader( const std::string &fileName )
-	: Reader( "Alias Wavefront OBJ 3D data reader", new ObjectParameter("result", "the loaded 3D object", new
-	NullObject, MeshPrimitive::staticTypeId()))
+//////////////////////////////////////////////////////////////////////////
+// Parsing
+//////////////////////////////////////////////////////////////////////////
+
+namespace
 {
-	m_fileNameParameter->setTypedValue( fileName );
+
+// The file is split into chunks of roughly this size, at line boundaries,
+// and the chunks are parsed in parallel.
+const size_t g_chunkSize = 4 * 1024 * 1024;
+
+inline bool isSpace( char c )
+{
+	return c == ' ' || c == '\t' || c == '\r';
 }
 
-bool OBJReader::canRead( const string &fileName )
+inline bool isDigit( char c )
 {
-	// there really are no magic numbers, .obj is a simple ascii text file
+	return c >= '0' && c <= '9';
+}
 
-	// so: enforce at least that the file has '.obj' extension
-	if(fileName.rfind(".obj") != fileName.length() - 4)
-		return false;
+inline const char *skipSpace( const char *p, const char *end )
+{
+	while( p != end && isSpace( *p ) )
+	{
+		++p;
+	}
+	return p;
+}
 
-	// attempt to open the file
-	ifstream in(fileName.c_str());
-	return in.is_open();
+// Returns true if the statement at p starts with the specified keyword.
+inline bool isKeyword( const char *p, const char *end, const char *keyword )
+{
+	for( ; *keyword; ++keyword, ++p )
+	{
+		if( p == end || *p != *keyword )
+		{
+			return false;
+		}
+	}
+	return p == end || isSpace( *p );
 }
 
-ObjectPtr OBJReader::doOperation(const CompoundObject * operands)
+inline double powerOfTen( int exponent )
 {
-	// for now we are going to retrieve vertex, texture, normal coordinates, faces.
-	// later (when we have the primitives), we will handle a larger subset of the
-	// OBJ format
+	static const double powers[] = {
+		1e0, 1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9, 1e10, 1e11,
+		1e12, 1e13, 1e14, 1e15, 1e16, 1e17, 1e18, 1e19, 1e20, 1e21, 1e22
+	};
+	return exponent <= 22 ? powers[exponent] : std::pow( 10.0, exponent );
+}
 
-	IntVectorDataPtr vpf = new IntVectorData();
-	m_vpf = &vpf->writable();
+// Parses a floating point number of the form accepted by strtof(), with the
+// exception of "inf" and "nan". Unlike strtof() this is independent of the
+// locale and doesn't require a null terminated string.
+bool parseFloat( const char *&p, const char *end, float &result )
+{
+	const char *c = p;
+	bool negative = false;
+	if( c != end && ( *c == '-' || *c == '+' ) )
+	{
+		negative = *c == '-';
+		++c;
+	}
 
-	IntVectorDataPtr vids = new IntVectorData();
-	m_vids = &vids->writable();
+	// Digits beyond those that fit in the mantissa can't affect
+	// a float result, so we just account for them in the exponent.
+	const uint64_t maxMantissa = 100000000000000000ull;
+	uint64_t mantissa = 0;
+	int exponent = 0;
+	int numDigits = 0;
+	for( ; c != end && isDigit( *c ); ++c, ++numDigits )
+	{
+		if( mantissa < maxMantissa )
+		{
+			mantissa = mantissa * 10 + ( *c - '0' );
+		}
+		else
+		{
+			++exponent;
+		}
+	}
 
-	V3fVectorDataPtr vertices = new V3fVectorData();
-	m_vertices = &vertices->writable();
+	if( c != end && *c == '.' )
+	{
+		++c;
+		for( ; c != end && isDigit( *c ); ++c, ++numDigits )
+		{
+			if( mantissa < maxMantissa )
+			{
+				mantissa = mantissa * 10 + ( *c - '0' );
+				--exponent;
+			}
+		}
+	}
 
- 	// separate texture coordinates
-	FloatVectorDataPtr sTextureCoordinates = new FloatVectorData();
-	m_sTextureCoordinates = &sTextureCoordinates->writable();
+	if( !numDigits )
+	{
+		return false;
+	}
+
+	if( c != end && ( *c == 'e' || *c == 'E' ) )
+	{
+		const char *e = c + 1;
+		bool negativeExponent = false;
+		if( e != end && ( *e == '-' || *e == '+' ) )
+		{
+			negativeExponent = *e == '-';
+			++e;
+		}
+		if( e != end && isDigit( *e ) )
+		{
+			int value = 0;
+			for( ; e != end && isDigit( *e ); ++e )
+			{
+				if( value < 10000 )
+				{
+					value = value * 10 + ( *e - '0' );
+				}
+			}
+			exponent += negativeExponent ? -value : value;
+			c = e;
+		}
+	}
 
-	FloatVectorDataPtr tTextureCoordinates = new FloatVectorData();
-	m_tTextureCoordinates = &tTextureCoordinates->writable();
+	if( c != end && !isSpace( *c ) )
+	{
+		return false;
+	}
 
-	// build normals
-	V3fVectorDataPtr normals = new V3fVectorData();
-	m_normals = &normals->writable();
+	double value = mantissa;
+	if( exponent < 0 )
+	{
+		value /= powerOfTen( -exponent );
+	}
+	else if( exponent > 0 )
+	{
+		value *= powerOfTen( exponent );
+	}
 
-	// parse the file
-	parseOBJ();
+	result = negative ? -value : value;
+	p = c;
+	return true;
+}
 
-	// create our MeshPrimitive
-	MeshPrimitivePtr mesh = new MeshPrimitive( vpf, vids, "linear", vertices );
-	if( sTextureCoordinates->readable().size() )
+bool parseInt( const char *&p, const char *end, int &result )
+{
+	const char *c = p;
+	bool negative = false;
+	if( c != end && ( *c == '-' || *c == '+' ) )
 	{
-		mesh->variables.insert(PrimitiveVariableMap::value_type("s", PrimitiveVariable( PrimitiveVariable::FaceVarying, sTextureCoordinates)));
+		negative = *c == '-';
+		++c;
+	}
 
+	if( c == end || !isDigit( *c ) )
+	{
+		return false;
 	}
-	if( tTextureCoordinates->readable().size() )
+
+	int value = 0;
+	for( ; c != end && isDigit( *c ); ++c )
 	{
-		mesh->variables.insert(PrimitiveVariableMap::value_type("t", PrimitiveVariable(  PrimitiveVariable::FaceVarying, tTextureCoordinates)));
+		value = value * 10 + ( *c - '0' );
 	}
-	if( normals->readable().size() )
+
+	result = negative ? -value : value;
+	p = c;
+	return true;
+}
+
+// Parses the specified number of whitespace separated floats, ignoring
+// anything which follows them.
+bool parseFloats( const char *p, const char *end, float *result, int count )
+{
+	for( int i = 0; i < count; ++i )
 	{
-		mesh->variables.insert(PrimitiveVariableMap::value_type("N", PrimitiveVariable(  PrimitiveVariable::FaceVarying, normals)));
+		p = skipSpace( p, end );
+		if( !parseFloat( p, end, result[i] ) )
+		{
+			return false;
+		}
 	}
-	return mesh;
+	return true;
 }
 
+// The elements parsed from a single chunk of the file. Because a chunk doesn't
+// know how many elements precede it, indices which are relative to the current
+// element count are stored relative to the start of the chunk, and are offset
+// when the chunks are merged.
+struct Chunk
+{
+
+	Chunk( const char *begin, const char *end )
+		:	begin( begin ), end( end )
+	{
+	}
+
+	const char *begin;
+	const char *end;
+
+	vector<V3f> positions;
+	vector<V2f> uvs;
+	vector<V3f> normals;
+
+	vector<int> verticesPerFace;
+	vector<int> vertexIds;
+	// These are either empty, meaning that no face in the chunk
+	// specified the element, or are the same length as vertexIds,
+	// with -1 for face vertices which didn't specify the element.
+	vector<int> uvIndices;
+	vector<int> normalIndices;
+
+	// Positions of the relative indices within the arrays above.
+	vector<size_t> relativeVertexIds;
+	vector<size_t> relativeUVIndices;
+	vector<size_t> relativeNormalIndices;
+
+};
 
-// parse a vertex
-void OBJReader::parseVertex(const char * begin, const char * end)
+void throwInvalidFace()
 {
-	vector<float> vec;
-	srule vertex = "v" >> real_p[append(vec)] >> real_p[append(vec)] >> real_p[append(vec)];
-	parse(begin, vertex, space_p);
-
-	// build v
-	V3f v;
-	v[0] = vec[0];
- 	v[1] = vec[1];
- 	v[2] = vec[2];
-
-	// add this vertex
-	m_vertices->push_back(v);
+	throw Exception( "OBJReader : Invalid face specification" );
 }
 
-// parse a texture coordinate
-void OBJReader::parseTextureCoordinate(const char * begin, const char * end)
+// Converts a one based (or negative, relative) OBJ index to a zero
+// based index relative to the start of the chunk.
+inline int chunkIndex( int index, size_t count, vector<size_t> &relativeIndices, size_t position )
 {
-	vector<float> vec;
-	srule vertex = "vt" >> real_p[append(vec)] >> real_p[append(vec)] >> *(real_p[append(vec)]);
-	parse(begin, vertex, space_p);
-
-	// build v
-	V3f vt;
-	vt[0] = vec[0];
- 	vt[1] = vec[1];
-	vt[2] = vec.size() == 3 ? vec[2] : 0.0f;
-
-	// add this texture coordinate
-	m_introducedTextureCoordinates.push_back(vt);
+	if( index > 0 )
+	{
+		return index - 1;
+	}
+	else if( index == 0 )
+	{
+		throwInvalidFace();
+	}
+	relativeIndices.push_back( position );
+	return (int)count + index;
 }
 
-// parse a normal
-void OBJReader::parseNormal(const char * begin, const char * end)
+inline void appendIndex( vector<int> &indices, int index, size_t position )
 {
-	vector<float> vec;
-	srule vertex = "vn" >> real_p[append(vec)] >> real_p[append(vec)] >> real_p[append(vec)];
-	parse(begin, vertex, space_p);
-
-	// build v
-	V3f vn;
-	vn[0] = vec[0];
-	vn[1] = vec[1];
-	vn[2] = vec[2];
-
-	// add this normal
-	m_introducedNormals.push_back(vn);
+	if( indices.size() < position )
+	{
+		indices.resize( position, -1 );
+	}
+	indices.push_back( index );
 }
 
-// parse face
-void OBJReader::parseFace(const char * begin, const char * end)
+void parseFace( const char *p, const char *end, Chunk &chunk, bool readUVs, bool readNormals )
 {
-	vector<int> vec;
-	vector<int> tvec;
-	vector<int> nvec;
+	int numVertices = 0;
+	int faceLayout = -1;
+	while( true )
+	{
+		p = skipSpace( p, end );
+		if( p == end )
+		{
+			break;
+		}
 
-	srule entry = int_p[append(vec)] >>
-		(
-			("/" >> (int_p[append(tvec)] | epsilon_p) >> "/" >> (int_p[append(nvec)] | epsilon_p))
-			| epsilon_p
-		);
+		const size_t position = chunk.vertexIds.size();
 
-	srule face = "f"  >> entry >> entry >> entry >> *(entry);
-	parse(begin, face, space_p);
+		int vertexId = 0;
+		if( !parseInt( p, end, vertexId ) )
+		{
+			throwInvalidFace();
+		}
+		chunk.vertexIds.push_back( chunkIndex( vertexId, chunk.positions.size(), chunk.relativeVertexIds, position ) );
+
+		// Vertices are specified as "v", "v/vt", "v//vn" or "v/vt/vn".
+		int layout = 0;
+		if( p != end && *p == '/' )
+		{
+			++p;
+			int uvIndex = 0;
+			if( parseInt( p, end, uvIndex ) )
+			{
+				layout |= 1;
+				if( readUVs )
+				{
+					appendIndex( chunk.uvIndices, chunkIndex( uvIndex, chunk.uvs.size(), chunk.relativeUVIndices, position ), position );
+				}
+			}
+			if( p != end && *p == '/' )
+			{
+				++p;
+				int normalIndex = 0;
+				if( !parseInt( p, end, normalIndex ) )
+				{
+					throwInvalidFace();
+				}
+				layout |= 2;
+				if( readNormals )
+				{
+					appendIndex( chunk.normalIndices, chunkIndex( normalIndex, chunk.normals.size(), chunk.relativeNormalIndices, position ), position );
+				}
+			}
+		}
 
-	// push back the degree of the face
-	m_vpf->push_back(vec.size());
+		if( p != end && !isSpace( *p ) )
+		{
+			throwInvalidFace();
+		}
+
+		// OBJ requires that the layout is consistent across the whole face.
+		if( faceLayout != -1 && layout != faceLayout )
+		{
+			throwInvalidFace();
+		}
+		faceLayout = layout;
+		++numVertices;
+	}
 
-	// merge in the edges.  we index from 0, so shift them down.
-	// also, vertices may be indexed negatively, in which case they are relative to
-	// the current set of vertices
-	for(vector<int>::const_iterator i = vec.begin(); i != vec.end(); ++i)
+	if( numVertices < 3 )
 	{
-		m_vids->push_back(*i > 0 ? *i - 1 : m_vertices->size() + *i);
+		throwInvalidFace();
 	}
 
+	chunk.verticesPerFace.push_back( numVertices );
+}
 
-	// merge in texture coordinates and normals, if present
-	// OBJ format requires an encoding for faces which uses one of the vertex/texture/normal specifications
-	// consistently across the entire face.  eg. we can have all v/vt/vn, or all v//vn, or all v, but not
-	// v//vn then v/vt/vn ...
-	if(!nvec.empty())
+void parseChunk( Chunk &chunk, bool readUVs, bool readNormals )
+{
+	const char *p = chunk.begin;
+	while( p < chunk.end )
 	{
-		if(nvec.size() != vec.size())
-			throw Exception("invalid face specification");
+		const char *lineEnd = static_cast<const char *>( memchr( p, '\n', chunk.end - p ) );
+		if( !lineEnd )
+		{
+			lineEnd = chunk.end;
+		}
 
-		// copy in these references to normal vectors to the mesh's normal vector
-		for(vector<int>::const_iterator i = nvec.begin(); i != nvec.end(); ++i)
+		p = skipSpace( p, lineEnd );
+		if( p != lineEnd )
 		{
-			m_normals->push_back(m_introducedNormals[*i > 0 ? *i - 1 : m_introducedNormals.size() + *i]);
+			// Only vertex data and faces are supported. Everything else,
+			// including comments, groups and materials, is ignored.
+			if( isKeyword( p, lineEnd, "v" ) )
+			{
+				V3f v;
+				if( !parseFloats( p + 1, lineEnd, v.getValue(), 3 ) )
+				{
+					throw Exception( "OBJReader : Invalid vertex" );
+				}
+				chunk.positions.push_back( v );
+			}
+			else if( isKeyword( p, lineEnd, "vt" ) )
+			{
+				// We must count texture coordinates even if we're not reading
+				// them, so that relative indices can be resolved.
+				V2f uv;
+				if( !parseFloats( p + 2, lineEnd, uv.getValue(), 2 ) )
+				{
+					throw Exception( "OBJReader : Invalid texture coordinate" );
+				}
+				chunk.uvs.push_back( uv );
+			}
+			else if( isKeyword( p, lineEnd, "vn" ) )
+			{
+				V3f n;
+				if( !parseFloats( p + 2, lineEnd, n.getValue(), 3 ) )
+				{
+					throw Exception( "OBJReader : Invalid normal" );
+				}
+				chunk.normals.push_back( n );
+			}
+			else if( isKeyword( p, lineEnd, "f" ) )
+			{
+				parseFace( p + 1, lineEnd, chunk, readUVs, readNormals );
+			}
 		}
-	}
-	// otherwise, check if we have specified normals in some previous face
-	// if so, and no normals were given here (examples, encoders that do this?), pump in
-	// default normal.  the default normal defined here is the zero normal, which is by
-	// definition orthogonal to every other vector.  this might result in odd lighting.
-	else
-	{
-		V3f zero(0.0f, 0.0f, 0.0f);
-		for(unsigned int i = 0; i < nvec.size(); ++i)
+
+		if( lineEnd == chunk.end )
 		{
-			m_normals->push_back(zero);
+			break;
 		}
+		p = lineEnd + 1;
 	}
 
-	//
-	// merge in texture coordinates, if present
-	//
-	if(!tvec.empty())
+	const size_t numFaceVertices = chunk.vertexIds.size();
+	if( chunk.uvIndices.size() && chunk.uvIndices.size() < numFaceVertices )
+	{
+		chunk.uvIndices.resize( numFaceVertices, -1 );
+	}
+	if( chunk.normalIndices.size() && chunk.normalIndices.size() < numFaceVertices )
+	{
+		chunk.normalIndices.resize( numFaceVertices, -1 );
+	}
+}
+
+struct Counts
+{
+
+	Counts()
+		:	positions( 0 ), uvs( 0 ), normals( 0 ), faces( 0 ), faceVertices( 0 )
+	{
+	}
+
+	Counts( const Chunk &chunk )
+		:	positions( chunk.positions.size() ), uvs( chunk.uvs.size() ), normals( chunk.normals.size() ),
+			faces( chunk.verticesPerFace.size() ), faceVertices( chunk.vertexIds.size() )
+	{
+	}
+
+	Counts operator + ( const Counts &other ) const
+	{
+		Counts result;
+		result.positions = positions + other.positions;
+		result.uvs = uvs + other.uvs;
+		result.normals = normals + other.normals;
+		result.faces = faces + other.faces;
+		result.faceVertices = faceVertices + other.faceVertices;
+		return result;
+	}
+
+	size_t positions;
+	size_t uvs;
+	size_t normals;
+	size_t faces;
+	size_t faceVertices;
+
+};
+
+// Copies the indices from a chunk into the merged array, making relative
+// indices absolute and validating them. Returns the number of face vertices
+// which didn't specify an index.
+size_t mergeIndices( const vector<int> &indices, const vector<size_t> &relativeIndices, size_t offset, size_t size, size_t numFaceVertices, int *result )
+{
+	if( indices.empty() )
 	{
-		if(tvec.size() != vec.size())
-			throw Exception("invalid face specification");
+		std::fill( result, result + numFaceVertices, -1 );
+		return numFaceVertices;
+	}
 
-		for(unsigned int i = 0; i < tvec.size(); ++i)
+	std::copy( indices.begin(), indices.end(), result );
+	for( size_t position : relativeIndices )
+	{
+		result[position] += offset;
+		if( result[position] < 0 )
 		{
-			int index = tvec[i] > 0 ? tvec[i] - 1 : m_introducedTextureCoordinates.size() + tvec[i];
-			m_sTextureCoordinates->push_back(m_introducedTextureCoordinates[index][0]);
-			m_tTextureCoordinates->push_back(m_introducedTextureCoordinates[index][1]);
+			throwInvalidFace();
 		}
 	}
-	else
+
+	size_t numMissing = 0;
+	for( size_t i = 0; i < numFaceVertices; ++i )
 	{
-		for(unsigned int i = 0; i < tvec.size(); ++i)
+		if( result[i] == -1 )
 		{
-			m_sTextureCoordinates->push_back(0.0f);
-			m_tTextureCoordinates->push_back(0.0f);
+			++numMissing;
+		}
+		else if( (size_t)result[i] >= size )
+		{
+			throw Exception( "OBJReader : Index out of range" );
 		}
 	}
+
+	return numMissing;
 }
 
-void OBJReader::parseGroup(const char *begin, const char *end)
+// Adds an indexed FaceVarying primitive variable, unless no face specified
+// it at all. Face vertices which didn't specify an index are given a zero
+// value.
+template<typename DataType>
+void addPrimitiveVariable( MeshPrimitive *mesh, const std::string &name, DataType *data, IntVectorData *indices, size_t numMissing )
 {
-	// set current group
-	vector<string> groupNames;
-	srule grouping = "g" >> *(lexeme_d[alnum_p >> *(alnum_p)][append(groupNames)]);
+	typedef typename DataType::ValueType::value_type ElementType;
 
-	parse(begin, grouping, space_p);
+	vector<int> &writableIndices = indices->writable();
+	if( numMissing == writableIndices.size() )
+	{
+		return;
+	}
 
-	// from 'http://local.wasp.uwa.edu.au/~pbourke/dataformats/obj/':
-	// The default group name is default.
-	if(groupNames.empty())
+	if( numMissing )
 	{
-		groupNames.push_back("default");
+		typename DataType::ValueType &writableData = data->writable();
+		const int defaultIndex = writableData.size();
+		writableData.push_back( ElementType( 0 ) );
+		std::replace( writableIndices.begin(), writableIndices.end(), -1, defaultIndex );
 	}
 
-	// \todo associate mesh objects with group names
+	mesh->variables[name] = PrimitiveVariable( PrimitiveVariable::FaceVarying, data, indices );
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// OBJReader
+//////////////////////////////////////////////////////////////////////////
+
+OBJReader::OBJReader( const std::string &fileName )
+	: Reader( "Alias Wavefront OBJ 3D data reader", new ObjectParameter("result", "the loaded 3D object", new
+	NullObject, MeshPrimitive::staticTypeId()))
+{
+	m_fileNameParameter->setTypedValue( fileName );
+
+	StringVectorDataPtr defaultPrimVarNames = new StringVectorData;
+	defaultPrimVarNames->writable().push_back( "N" );
+	defaultPrimVarNames->writable().push_back( "uv" );
+	m_primVarNamesParameter = new StringVectorParameter(
+		"primVarNames",
+		"The primitive variables to load, from \"N\" and \"uv\". \"P\" is always loaded.",
+		defaultPrimVarNames
+	);
+
+	parameters()->addParameter( m_primVarNamesParameter );
+}
+
+bool OBJReader::canRead( const string &fileName )
+{
+	// there really are no magic numbers, .obj is a simple ascii text file
+
+	// so: enforce at least that the file has '.obj' extension
+	if(fileName.rfind(".obj") != fileName.length() - 4)
+		return false;
+
+	// attempt to open the file
+	ifstream in(fileName.c_str());
+	return in.is_open();
 }
 
-void OBJReader::parseOBJ() {
-
-	srule comment = comment_p("#");
-
-	// see
-	// http://local.wasp.uwa.edu.au/~pbourke/dataformats/obj/
-
-	// vertices
-	srule vertex         = ("v"  >> real_p >> real_p >> real_p) [bind(&OBJReader::parseVertex,            this, _1, _2)];
-	srule vertex_texture = ("vt" >> real_p >> real_p)           [bind(&OBJReader::parseTextureCoordinate, this, _1, _2)];
-	srule vertex_normal  = ("vn" >> real_p >> real_p >> real_p) [bind(&OBJReader::parseNormal,            this, _1, _2)];
-	//srule vertex_parameter_space  = "vp" >> real_p >> real_p >> real_p;
-
-	// srule cs_types = ("bmatrix" | "bezier" | "bspline" | "cardinal" | "taylor");
-	// srule vertex_curve_or_surface = "cstype" >> "rat" >> cs_types;
-	// srule vertex_degree  = "deg" >> real_p >> real_p;
-	// srule vertex_basis_matrix  = "bmat";
-	// srule vertex_step_size  = "step" >> int_p >> int_p;
-	srule vertex_type = vertex | vertex_texture | vertex_normal;
-
-	// elements
-	srule point = "p" >> real_p >> *(real_p);
-	srule  line = "l" >> int_p >> int_p >> *(int_p);
-	srule  face = (ch_p('f') >> *(anychar_p))[bind(&OBJReader::parseFace, this, _1, _2)];
-	// srule curve = "curv";
-	// srule curve_2d = "curv2";
-	// srule surface = "surf";
-	srule element = point | line | face;
-
- 	// free-form curve / surface statements
-	// srule parameter = "parm";
-	// srule trim_loop = "trim";
-	// srule hole_loop = "hole";
-	// srule special_curve = "scrv";
-	// srule special_point = "sp";
-	// srule end_statement = "end";
-
-	// connectivity
-	//srule connect = "con";
-
-	// grouping
-	srule group_name = ("g" >> *(anychar_p))[bind(&OBJReader::parseGroup, this, _1, _2)];
-	//	srule smoothing_group = "s";
-	//	srule merging_group = "mg";
-	srule object_name = "o" >> int_p;
-	srule grouping = group_name | object_name;
-
-	// display and render attributes
-	// srule bevel_interpretation = "bevel";
-	// srule color_interpolation = "c_interp";
-	// srule dissolve_interpolation = "d_interp";
-	// srule level_of_detail = "lod";
-	// srule material_name = "usemtl";
-	// srule material_library = "mtllib";
-	// srule shadow_casting = "shadow_obj";
-	// srule ray_tracing = "trace_obj";
-	// srule curve_approximation_technique = "ctech";
-	// srule surface_approximation_technique = "stech";
-
-	ifstream in(fileName().c_str());
-	string str;
-	while(getline(in, str))
-		parse(str.c_str(), vertex_type | element | grouping | comment, space_p);
+ObjectPtr OBJReader::doOperation(const CompoundObject * operands)
+{
+	// for now we are going to retrieve vertex, texture, normal coordinates, faces.
+	// later (when we have the primitives), we will handle a larger subset of the
+	// OBJ format
+
+	const vector<string> &primVarNames = m_primVarNamesParameter->getTypedValue();
+	const bool readUVs = std::find( primVarNames.begin(), primVarNames.end(), "uv" ) != primVarNames.end();
+	const bool readNormals = std::find( primVarNames.begin(), primVarNames.end(), "N" ) != primVarNames.end();
+
+	// Map the file, and split it into chunks at line boundaries.
+
+	io::mapped_file_source file;
+	try
+	{
+		// Mapping an empty file is an error.
+		if( boost::filesystem::file_size( fileName() ) )
+		{
+			file.open( fileName() );
+		}
+	}
+	catch( const std::exception &e )
+	{
+		throw IOException( "OBJReader : Unable to open file \"" + fileName() + "\" : " + e.what() );
+	}
+
+	vector<Chunk> chunks;
+	const char *end = file.is_open() ? file.data() + file.size() : nullptr;
+	for( const char *begin = file.is_open() ? file.data() : nullptr; begin < end; )
+	{
+		const char *chunkEnd = begin + std::min<size_t>( g_chunkSize, end - begin );
+		if( chunkEnd < end )
+		{
+			chunkEnd = static_cast<const char *>( memchr( chunkEnd, '\n', end - chunkEnd ) );
+			chunkEnd = chunkEnd ? chunkEnd + 1 : end;
+		}
+		chunks.push_back( Chunk( begin, chunkEnd ) );
+		begin = chunkEnd;
+	}
+
+	// Parse the chunks in parallel.
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, chunks.size(), 1 ),
+		[&chunks, readUVs, readNormals]( const tbb::blocked_range<size_t> &range )
+		{
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				parseChunk( chunks[i], readUVs, readNormals );
+			}
+		}
+	);
+
+	// Merge the chunks in file order, so the result is independent of
+	// the order in which the chunks were parsed.
+
+	vector<Counts> offsets( chunks.size() + 1 );
+	for( size_t i = 0; i < chunks.size(); ++i )
+	{
+		offsets[i+1] = offsets[i] + Counts( chunks[i] );
+	}
+	const Counts &totals = offsets.back();
+
+	IntVectorDataPtr verticesPerFaceData = new IntVectorData;
+	vector<int> &verticesPerFace = verticesPerFaceData->writable();
+	verticesPerFace.resize( totals.faces );
+
+	IntVectorDataPtr vertexIdsData = new IntVectorData;
+	vector<int> &vertexIds = vertexIdsData->writable();
+	vertexIds.resize( totals.faceVertices );
+
+	V3fVectorDataPtr positionsData = new V3fVectorData;
+	vector<V3f> &positions = positionsData->writable();
+	positions.resize( totals.positions );
+
+	V2fVectorDataPtr uvsData = new V2fVectorData( vector<V2f>(), GeometricData::UV );
+	vector<V2f> &uvs = uvsData->writable();
+	IntVectorDataPtr uvIndicesData = new IntVectorData;
+	vector<int> &uvIndices = uvIndicesData->writable();
+	if( readUVs )
+	{
+		uvs.resize( totals.uvs );
+		uvIndices.resize( totals.faceVertices );
+	}
+
+	V3fVectorDataPtr normalsData = new V3fVectorData( vector<V3f>(), GeometricData::Normal );
+	vector<V3f> &normals = normalsData->writable();
+	IntVectorDataPtr normalIndicesData = new IntVectorData;
+	vector<int> &normalIndices = normalIndicesData->writable();
+	if( readNormals )
+	{
+		normals.resize( totals.normals );
+		normalIndices.resize( totals.faceVertices );
+	}
+
+	vector<size_t> numMissingUVs( chunks.size(), 0 );
+	vector<size_t> numMissingNormals( chunks.size(), 0 );
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, chunks.size(), 1 ),
+		[&]( const tbb::blocked_range<size_t> &range )
+		{
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				Chunk &chunk = chunks[i];
+				const Counts &offset = offsets[i];
+
+				std::copy( chunk.positions.begin(), chunk.positions.end(), positions.begin() + offset.positions );
+				std::copy( chunk.verticesPerFace.begin(), chunk.verticesPerFace.end(), verticesPerFace.begin() + offset.faces );
+				mergeIndices( chunk.vertexIds, chunk.relativeVertexIds, offset.positions, totals.positions, chunk.vertexIds.size(), vertexIds.data() + offset.faceVertices );
+
+				if( readUVs )
+				{
+					std::copy( chunk.uvs.begin(), chunk.uvs.end(), uvs.begin() + offset.uvs );
+					numMissingUVs[i] = mergeIndices( chunk.uvIndices, chunk.relativeUVIndices, offset.uvs, totals.uvs, chunk.vertexIds.size(), uvIndices.data() + offset.faceVertices );
+				}
+
+				if( readNormals )
+				{
+					std::copy( chunk.normals.begin(), chunk.normals.end(), normals.begin() + offset.normals );
+					numMissingNormals[i] = mergeIndices( chunk.normalIndices, chunk.relativeNormalIndices, offset.normals, totals.normals, chunk.vertexIds.size(), normalIndices.data() + offset.faceVertices );
+				}
+
+				// Release the chunk's memory as we go, to limit the peak usage.
+				chunk = Chunk( chunk.begin, chunk.end );
+			}
+		}
+	);
+
+	// create our MeshPrimitive
+	MeshPrimitivePtr mesh = new MeshPrimitive( verticesPerFaceData, vertexIdsData, "linear", positionsData );
+	if( readUVs )
+	{
+		addPrimitiveVariable( mesh.get(), "uv", uvsData.get(), uvIndicesData.get(), std::accumulate( numMissingUVs.begin(), numMissingUVs.end(), size_t( 0 ) ) );
+	}
+	if( readNormals )
+	{
+		addPrimitiveVariable( mesh.get(), "N", normalsData.get(), normalIndicesData.get(), std::accumulate( numMissingNormals.begin(), numMissingNormals.end(), size_t( 0 ) ) );
+	}
+	return mesh;
 }
@@ -250,6 +250,21 @@ int PointsPrimitiveEvaluator::intersectionPoints( const Imath::V3f &origin, cons
 	throw NotImplementedException( __PRETTY_FUNCTION__ );
 }
 
+int PointsPrimitiveEvaluator::elementIndex( const PrimitiveEvaluator::Result *result ) const
+{
+	return static_cast<const Result *>( result )->pointIndex();
+}
+
+bool PointsPrimitiveEvaluator::hasNormals() const
+{
+	return false;
+}
+
+bool PointsPrimitiveEvaluator::hasUVs() const
+{
+	return false;
+}
+
 void PointsPrimitiveEvaluator::buildTree()
 {
 	if( m_haveTree )
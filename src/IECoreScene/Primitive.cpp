@@ -378,7 +378,22 @@ void Primitive::load( IECore::Object::LoadContextPtr context )
 
 PrimitiveVariableMap Primitive::loadPrimitiveVariables( const IndexedIO *ioInterface, const IndexedIO::EntryID &name, const IndexedIO::EntryIDList &primVarNames )
 {
-	IECore::Object::LoadContextPtr context = new Object::LoadContext( ioInterface->subdirectory( name )->subdirectory( g_dataEntry ) );
+	ConstIndexedIOPtr ioPrimitive;
+	const IndexedIO::Entry entry = ioInterface->entry( name );
+	if( entry.entryType() == IndexedIO::File && entry.dataType() == IndexedIO::InternedStringArray )
+	{
+		// the primitive was saved as a reference to an identical primitive elsewhere in the file.
+		IndexedIO::EntryIDList path( entry.arrayLength() );
+		InternedString *p = &path[0];
+		ioInterface->read( name, p, entry.arrayLength() );
+		ioPrimitive = ioInterface->directory( path );
+	}
+	else
+	{
+		ioPrimitive = ioInterface->subdirectory( name );
+	}
+
+	IECore::Object::LoadContextPtr context = new Object::LoadContext( ioPrimitive->subdirectory( g_dataEntry ) );
 
 	unsigned int v = m_ioVersion;
 	ConstIndexedIOPtr container = context->container( Primitive::staticTypeName(), v );
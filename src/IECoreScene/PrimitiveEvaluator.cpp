@@ -38,6 +38,11 @@
 #include "IECoreScene/MeshPrimitiveEvaluator.h"
 #include "IECoreScene/SpherePrimitiveEvaluator.h"
 
+#include "IECore/Exception.h"
+
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace IECore;
 using namespace IECoreScene;
 
@@ -102,3 +107,144 @@ bool PrimitiveEvaluator::signedDistance( const Imath::V3f &p, float &distance, R
 
 	return true;
 }
+
+PrimitiveEvaluator::BatchResults::BatchResults( size_t size )
+	:	success( new BoolVectorData( std::vector<bool>( size, false ) ) ),
+		point( new V3fVectorData( std::vector<Imath::V3f>( size, Imath::V3f( 0 ) ) ) ),
+		normal( new V3fVectorData( std::vector<Imath::V3f>( size, Imath::V3f( 0 ) ) ) ),
+		uv( new V2fVectorData( std::vector<Imath::V2f>( size, Imath::V2f( 0 ) ) ) ),
+		distance( new FloatVectorData( std::vector<float>( size, 0.0f ) ) ),
+		elementIndex( new IntVectorData( std::vector<int>( size, -1 ) ) )
+{
+}
+
+template<typename Query>
+PrimitiveEvaluator::BatchResults PrimitiveEvaluator::batchQuery( size_t size, const Query &query ) const
+{
+	BatchResults results( size );
+
+	// We can't write to the elements of a std::vector<bool> concurrently,
+	// so we record success separately and transfer it at the end.
+	std::vector<char> success( size, 0 );
+
+	std::vector<Imath::V3f> &point = results.point->writable();
+	std::vector<Imath::V3f> &normal = results.normal->writable();
+	std::vector<Imath::V2f> &uv = results.uv->writable();
+	std::vector<float> &distance = results.distance->writable();
+	std::vector<int> &elementIndex = results.elementIndex->writable();
+
+	const bool hasNormals = this->hasNormals();
+	const bool hasUVs = this->hasUVs();
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, size ),
+		[&]( const tbb::blocked_range<size_t> &range ) {
+			// One Result per task, as required by the threading
+			// guarantees of the query functions.
+			ResultPtr result = createResult();
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				float d = 0.0f;
+				if( !query( i, result.get(), d ) )
+				{
+					continue;
+				}
+				success[i] = 1;
+				point[i] = result->point();
+				if( hasNormals )
+				{
+					normal[i] = result->normal();
+				}
+				if( hasUVs )
+				{
+					uv[i] = result->uv();
+				}
+				distance[i] = d;
+				elementIndex[i] = this->elementIndex( result.get() );
+			}
+		}
+	);
+
+	std::vector<bool> &resultSuccess = results.success->writable();
+	for( size_t i = 0; i < size; ++i )
+	{
+		resultSuccess[i] = success[i];
+	}
+
+	return results;
+}
+
+PrimitiveEvaluator::BatchResults PrimitiveEvaluator::batchClosestPoint( const std::vector<Imath::V3f> &points ) const
+{
+	return batchQuery(
+		points.size(),
+		[this, &points]( size_t i, Result *result, float &distance ) {
+			if( !closestPoint( points[i], result ) )
+			{
+				return false;
+			}
+			distance = ( result->point() - points[i] ).length();
+			return true;
+		}
+	);
+}
+
+PrimitiveEvaluator::BatchResults PrimitiveEvaluator::batchSignedDistance( const std::vector<Imath::V3f> &points ) const
+{
+	if( !hasNormals() )
+	{
+		throw NotImplementedException( "PrimitiveEvaluator::batchSignedDistance : Evaluator does not provide normals" );
+	}
+
+	return batchQuery(
+		points.size(),
+		[this, &points]( size_t i, Result *result, float &distance ) {
+			return signedDistance( points[i], distance, result );
+		}
+	);
+}
+
+PrimitiveEvaluator::BatchResults PrimitiveEvaluator::batchPointAtUV( const std::vector<Imath::V2f> &uvs ) const
+{
+	return batchQuery(
+		uvs.size(),
+		[this, &uvs]( size_t i, Result *result, float &distance ) {
+			return pointAtUV( uvs[i], result );
+		}
+	);
+}
+
+PrimitiveEvaluator::BatchResults PrimitiveEvaluator::batchIntersectionPoint( const std::vector<Imath::V3f> &origins, const std::vector<Imath::V3f> &directions, float maxDistance ) const
+{
+	if( origins.size() != directions.size() )
+	{
+		throw InvalidArgumentException( "PrimitiveEvaluator::batchIntersectionPoint : Number of origins and directions must match" );
+	}
+
+	return batchQuery(
+		origins.size(),
+		[this, &origins, &directions, maxDistance]( size_t i, Result *result, float &distance ) {
+			if( !intersectionPoint( origins[i], directions[i], result, maxDistance ) )
+			{
+				return false;
+			}
+			distance = ( result->point() - origins[i] ).length();
+			return true;
+		}
+	);
+}
+
+int PrimitiveEvaluator::elementIndex( const Result *result ) const
+{
+	return -1;
+}
+
+bool PrimitiveEvaluator::hasNormals() const
+{
+	return true;
+}
+
+bool PrimitiveEvaluator::hasUVs() const
+{
+	return true;
+}
@@ -34,13 +34,112 @@
 
 #include "IECoreScene/SampledSceneInterface.h"
 
+#include "IECore/ComputationCache.h"
 #include "IECore/ObjectInterpolator.h"
 #include "IECore/SimpleTypedData.h"
 #include "IECore/TransformationMatrixData.h"
 
+#include "boost/lexical_cast.hpp"
+
 using namespace IECore;
 using namespace IECoreScene;
 
+//////////////////////////////////////////////////////////////////////////
+// Interpolation cache internals
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+struct InterpolationKey
+{
+
+	InterpolationKey( const SampledSceneInterface *scene, SceneInterface::HashType hashType, double time, const SceneInterface::Name *attributeName, size_t sample1, size_t sample2, double x )
+		:	scene( scene ), hashType( hashType ), time( time ), attributeName( attributeName ), sample1( sample1 ), sample2( sample2 ), x( x )
+	{
+	}
+
+	const SampledSceneInterface *scene;
+	SceneInterface::HashType hashType;
+	double time;
+	const SceneInterface::Name *attributeName;
+	size_t sample1;
+	size_t sample2;
+	double x;
+
+};
+
+MurmurHash interpolationHash( const InterpolationKey &key )
+{
+	// hash() identifies the location, and the sample interval and
+	// factor identify the interpolation.
+	MurmurHash h;
+	key.scene->hash( key.hashType, key.time, h );
+	if( key.attributeName )
+	{
+		h.append( *key.attributeName );
+	}
+	h.append( (uint64_t)key.sample1 );
+	h.append( (uint64_t)key.sample2 );
+	h.append( key.x );
+	return h;
+}
+
+ConstObjectPtr interpolate( const InterpolationKey &key )
+{
+	ConstObjectPtr y0, y1;
+	switch( key.hashType )
+	{
+		case SceneInterface::TransformHash :
+			y0 = key.scene->readTransformAtSample( key.sample1 );
+			y1 = key.scene->readTransformAtSample( key.sample2 );
+			break;
+		case SceneInterface::AttributesHash :
+			y0 = key.scene->readAttributeAtSample( *key.attributeName, key.sample1 );
+			y1 = key.scene->readAttributeAtSample( *key.attributeName, key.sample2 );
+			break;
+		case SceneInterface::ObjectHash :
+			y0 = key.scene->readObjectAtSample( key.sample1 );
+			y1 = key.scene->readObjectAtSample( key.sample2 );
+			break;
+		default :
+			throw Exception( "Unsupported interpolation" );
+	}
+
+	ObjectPtr result = linearObjectInterpolation( y0.get(), y1.get(), key.x );
+	if( !result )
+	{
+		// failed to interpolate, return the closest one
+		return ( key.x >= 0.5 ? y1 : y0 );
+	}
+	return result;
+}
+
+typedef ComputationCache<InterpolationKey> InterpolationComputationCache;
+
+InterpolationComputationCache *interpolationComputationCache()
+{
+	static InterpolationComputationCache::Ptr c = new InterpolationComputationCache(
+		interpolate, interpolationHash, 100000, SampledSceneInterface::interpolationCache()
+	);
+	return c.get();
+}
+
+ConstObjectPtr interpolatedSample( const InterpolationKey &key )
+{
+	if( !SampledSceneInterface::interpolationCache()->getMaxMemoryUsage() )
+	{
+		return interpolate( key );
+	}
+	return interpolationComputationCache()->get( key );
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// SampledSceneInterface
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPEDDESCRIPTION( SampledSceneInterface )
 
 SampledSceneInterface::~SampledSceneInterface()
@@ -82,15 +181,7 @@ ConstDataPtr SampledSceneInterface::readTransform( double time ) const
 		return readTransformAtSample( sample2 );
 	}
 
-	ConstDataPtr transformData1 = readTransformAtSample( sample1 );
-	ConstDataPtr transformData2 = readTransformAtSample( sample2 );
-	DataPtr transformData = runTimeCast< Data >( linearObjectInterpolation( transformData1.get(), transformData2.get(), x ) );
-	if( !transformData )
-	{
-		// failed to interpolate, return the closest one
-		return ( x >= 0.5 ? transformData2 : transformData1 );
-	}
-	return transformData;
+	return runTimeCast<const Data>( interpolatedSample( InterpolationKey( this, TransformHash, time, nullptr, sample1, sample2, x ) ) );
 }
 
 Imath::M44d SampledSceneInterface::readTransformAsMatrix( double time ) const
@@ -121,16 +212,7 @@ ConstObjectPtr SampledSceneInterface::readAttribute( const Name &name, double ti
 		return readAttributeAtSample( name, sample2 );
 	}
 
-	ConstObjectPtr attributeObj1 = readAttributeAtSample( name, sample1 );
-	ConstObjectPtr attributeObj2 = readAttributeAtSample( name, sample2 );
-
-	ObjectPtr attributeObj = linearObjectInterpolation( attributeObj1.get(), attributeObj2.get(), x );
-	if( !attributeObj )
-	{
-		// failed to interpolate, return the closest one
-		return ( x >= 0.5 ? attributeObj2 : attributeObj1 );
-	}
-	return attributeObj;
+	return interpolatedSample( InterpolationKey( this, AttributesHash, time, &name, sample1, sample2, x ) );
 }
 
 ConstObjectPtr SampledSceneInterface::readObject( double time ) const
@@ -147,15 +229,21 @@ ConstObjectPtr SampledSceneInterface::readObject( double time ) const
 		return readObjectAtSample( sample2 );
 	}
 
-	ConstObjectPtr object1 = readObjectAtSample( sample1 );
-	ConstObjectPtr object2 = readObjectAtSample( sample2 );
+	return interpolatedSample( InterpolationKey( this, ObjectHash, time, nullptr, sample1, sample2, x ) );
+}
 
-	ObjectPtr object = linearObjectInterpolation( object1.get(), object2.get(), x );
-	if( !object )
+ObjectPool *SampledSceneInterface::interpolationCache()
+{
+	static ObjectPoolPtr c = nullptr;
+	if( !c )
 	{
-		// failed to interpolate, return the closest one
-		return ( x >= 0.5 ? object2 : object1 );
+		const char *m = getenv( "IECORESCENE_INTERPOLATIONCACHE_MEMORY" );
+		size_t mi = m ? boost::lexical_cast<size_t>( m ) : 0;
+		c = new ObjectPool( 1024 * 1024 * mi );
 	}
-
-	return object;
+	return c.get();
 }
+
+/// make sure the cache is created at load time and avoid
+/// running conditions on multi-threaded environments.
+static ObjectPoolPtr g_interpolationCacheInitializer = SampledSceneInterface::interpolationCache();
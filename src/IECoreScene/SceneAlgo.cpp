@@ -0,0 +1,247 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#include "IECoreScene/SceneAlgo.h"
+
+#include "IECoreScene/SampledSceneInterface.h"
+
+#include "tbb/atomic.h"
+#include "tbb/enumerable_thread_specific.h"
+
+using namespace IECore;
+using namespace IECoreScene;
+
+//////////////////////////////////////////////////////////////////////////
+// Internal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Reads the samples required to evaluate a SampledSceneInterface at the
+// specified time, without the overhead of interpolating between them.
+template<typename SampleIntervalFn, typename ReadFn>
+void readSamples( double time, SampleIntervalFn sampleInterval, ReadFn read )
+{
+	size_t sample1, sample2;
+	const double x = sampleInterval( time, sample1, sample2 );
+	if( x < 1 )
+	{
+		read( sample1 );
+	}
+	if( x > 0 && sample2 != sample1 )
+	{
+		read( sample2 );
+	}
+}
+
+class ReadAll
+{
+
+	public :
+
+		ReadAll( const std::vector<double> &times, unsigned flags )
+			:	m_times( times ), m_flags( flags )
+		{
+			m_locations = 0;
+		}
+
+		void operator()( const SceneInterface *scene, const SceneInterface::Path &path )
+		{
+			if( const SampledSceneInterface *sampledScene = runTimeCast<const SampledSceneInterface>( scene ) )
+			{
+				readSampled( sampledScene );
+			}
+			else
+			{
+				read( scene );
+			}
+			m_locations++;
+		}
+
+		size_t locations() const
+		{
+			return m_locations;
+		}
+
+	private :
+
+		void read( const SceneInterface *scene ) const
+		{
+			SceneInterface::NameList attributeNames;
+			if( m_flags & SceneAlgo::Attributes )
+			{
+				scene->attributeNames( attributeNames );
+			}
+
+			if( m_flags & SceneAlgo::Tags )
+			{
+				SceneInterface::NameList tags;
+				scene->readTags( tags, SceneInterface::LocalTag );
+			}
+
+			const bool readBound = ( m_flags & SceneAlgo::Bounds ) && scene->hasBound();
+			const bool readObject = ( m_flags & SceneAlgo::Objects ) && scene->hasObject();
+
+			for( std::vector<double>::const_iterator it = m_times.begin(), eIt = m_times.end(); it != eIt; ++it )
+			{
+				if( readBound )
+				{
+					scene->readBound( *it );
+				}
+				if( m_flags & SceneAlgo::Transforms )
+				{
+					scene->readTransform( *it );
+				}
+				for( SceneInterface::NameList::const_iterator aIt = attributeNames.begin(), aeIt = attributeNames.end(); aIt != aeIt; ++aIt )
+				{
+					scene->readAttribute( *aIt, *it );
+				}
+				if( readObject )
+				{
+					scene->readObject( *it );
+				}
+			}
+		}
+
+		void readSampled( const SampledSceneInterface *scene ) const
+		{
+			SceneInterface::NameList attributeNames;
+			if( m_flags & SceneAlgo::Attributes )
+			{
+				scene->attributeNames( attributeNames );
+			}
+
+			if( m_flags & SceneAlgo::Tags )
+			{
+				SceneInterface::NameList tags;
+				scene->readTags( tags, SceneInterface::LocalTag );
+			}
+
+			const bool readBound = ( m_flags & SceneAlgo::Bounds ) && scene->hasBound();
+			const bool readObject = ( m_flags & SceneAlgo::Objects ) && scene->hasObject();
+
+			for( std::vector<double>::const_iterator it = m_times.begin(), eIt = m_times.end(); it != eIt; ++it )
+			{
+				if( readBound )
+				{
+					readSamples(
+						*it,
+						[scene]( double time, size_t &s1, size_t &s2 ) { return scene->boundSampleInterval( time, s1, s2 ); },
+						[scene]( size_t sample ) { scene->readBoundAtSample( sample ); }
+					);
+				}
+				if( m_flags & SceneAlgo::Transforms )
+				{
+					readSamples(
+						*it,
+						[scene]( double time, size_t &s1, size_t &s2 ) { return scene->transformSampleInterval( time, s1, s2 ); },
+						[scene]( size_t sample ) { scene->readTransformAtSample( sample ); }
+					);
+				}
+				for( SceneInterface::NameList::const_iterator aIt = attributeNames.begin(), aeIt = attributeNames.end(); aIt != aeIt; ++aIt )
+				{
+					const SceneInterface::Name &name = *aIt;
+					readSamples(
+						*it,
+						[scene, &name]( double time, size_t &s1, size_t &s2 ) { return scene->attributeSampleInterval( name, time, s1, s2 ); },
+						[scene, &name]( size_t sample ) { scene->readAttributeAtSample( name, sample ); }
+					);
+				}
+				if( readObject )
+				{
+					readSamples(
+						*it,
+						[scene]( double time, size_t &s1, size_t &s2 ) { return scene->objectSampleInterval( time, s1, s2 ); },
+						[scene]( size_t sample ) { scene->readObjectAtSample( sample ); }
+					);
+				}
+			}
+		}
+
+		const std::vector<double> &m_times;
+		const unsigned m_flags;
+		tbb::atomic<size_t> m_locations;
+
+};
+
+class MatchingPaths
+{
+
+	public :
+
+		void operator()( const SceneInterface *scene, const SceneInterface::Path &path )
+		{
+			m_threadResults.local().addPath( path );
+		}
+
+		PathMatcher result() const
+		{
+			// Combining with addPaths() shares the subtrees
+			// from the per-thread results rather than copying them.
+			PathMatcher result;
+			for( ThreadResults::const_iterator it = m_threadResults.begin(), eIt = m_threadResults.end(); it != eIt; ++it )
+			{
+				result.addPaths( *it );
+			}
+			return result;
+		}
+
+	private :
+
+		typedef tbb::enumerable_thread_specific<PathMatcher> ThreadResults;
+		ThreadResults m_threadResults;
+
+};
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// Public API
+//////////////////////////////////////////////////////////////////////////
+
+size_t SceneAlgo::parallelReadAll( const SceneInterface *location, const std::vector<double> &times, unsigned flags, const IECore::PathMatcher *filter )
+{
+	ReadAll readAll( times, flags );
+	parallelTraverse( location, readAll, filter );
+	return readAll.locations();
+}
+
+IECore::PathMatcher SceneAlgo::matchingPaths( const IECore::PathMatcher &filter, const SceneInterface *location )
+{
+	MatchingPaths matchingPaths;
+	parallelTraverse( location, matchingPaths, &filter );
+	return matchingPaths.result();
+}
@@ -50,7 +50,16 @@
 
 #include "boost/tuple/tuple.hpp"
 
+#include "tbb/atomic.h"
+#include "tbb/blocked_range.h"
 #include "tbb/concurrent_hash_map.h"
+#include "tbb/mutex.h"
+#include "tbb/parallel_for.h"
+#include "tbb/spin_mutex.h"
+
+#include <cstdlib>
+#include <cstring>
+#include <thread>
 
 using namespace IECore;
 using namespace IECoreScene;
@@ -105,6 +114,11 @@ class SceneCache::Implementation : public RefCounted
 			throw Exception( "File name not available in scene cache!" );
 		}
 
+		size_t memoryUsage() const
+		{
+			return m_indexedIO->memoryUsage();
+		}
+
 		bool hasObject() const
 		{
 			return m_indexedIO->hasEntry( objectEntry );
@@ -1030,6 +1044,9 @@ SceneCache::ReaderImplementation::Defaults SceneCache::ReaderImplementation::g_d
 /// Writer implementation for SceneCache
 /// Each location keeps refcount pointers to their child locations, so they can always return the same (unfinished child) and when the root is destroyed, it
 /// can trigger the recursive computation of bounding boxes and the global storage of all sampleTime vectors used in the file.
+/// Different locations may be written concurrently from different threads. The children of each location and the maps shared
+/// from the root are guarded by mutexes. When that has happened, the final flush also processes sibling locations in parallel,
+/// otherwise it runs serially so that files written from a single thread are reproducible.
 class SceneCache::WriterImplementation : public SceneCache::Implementation
 {
 	public :
@@ -1040,13 +1057,17 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 		{
 			if ( m_parent )
 			{
-				// use same map from the root
+				// use same maps from the root
 				m_sampleTimesMap = m_parent->m_sampleTimesMap;
+				m_savedSamplesMap = m_parent->m_savedSamplesMap;
+				m_sharedState = m_parent->m_sharedState;
 			}
 			else
 			{
-				// only the root instance allocate the map.
+				// only the root instance allocate the maps.
 				m_sampleTimesMap = new SampleTimesMap;
+				m_savedSamplesMap = new SavedSamplesMap;
+				m_sharedState = new SharedState;
 			}
 		}
 
@@ -1057,7 +1078,7 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 			{
 				try
 				{
-					flush();
+					flush( m_sharedState->concurrentWrites );
 				}
 				catch ( Exception &e )
 				{
@@ -1139,7 +1160,7 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 			size_t sampleIndex = m_transformSampleTimes.size();
 			m_transformSampleTimes.push_back( time );
 			IndexedIOPtr io = m_indexedIO->subdirectory( transformEntry, IndexedIO::CreateIfMissing );
-			((const Object *)transform)->save( io, sampleEntry(sampleIndex) );
+			saveSample( transform, io.get(), sampleIndex );
 			m_transformSamples.push_back( transform );
 		}
 
@@ -1165,7 +1186,7 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 			sampleTimes.push_back( time );
 			IndexedIOPtr io = m_indexedIO->subdirectory( attributesEntry, IndexedIO::CreateIfMissing );
 			io = io->subdirectory( name, IndexedIO::CreateIfMissing );
-			attribute->save( io, sampleEntry(sampleIndex) );
+			saveSample( attribute, io.get(), sampleIndex );
 		}
 
 		void writeLocalTag( const char *tag )
@@ -1230,7 +1251,7 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 			size_t sampleIndex = m_objectSampleTimes.size();
 			m_objectSampleTimes.push_back( time );
 			IndexedIOPtr io = m_indexedIO->subdirectory( objectEntry, IndexedIO::CreateIfMissing );
-			object->save( io, sampleEntry(sampleIndex) );
+			saveSample( object, io.get(), sampleIndex );
 
 			const VisibleRenderable *renderable = runTimeCast< const VisibleRenderable >( object );
 			if ( renderable )
@@ -1308,6 +1329,7 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 				writable();
 			}
 
+			ChildrenMutex::scoped_lock lock( m_childrenMutex );
 			std::map< SceneCache::Name, WriterImplementationPtr >::const_iterator it = m_children.find( name );
 			if ( it != m_children.end() )
 			{
@@ -1332,6 +1354,7 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 		SceneCache::ImplementationPtr createChild( const SceneCache::Name &name )
 		{
 			writable();
+			ChildrenMutex::scoped_lock lock( m_childrenMutex );
 			IndexedIOPtr children = m_indexedIO->subdirectory( childrenEntry, IndexedIO::CreateIfMissing );
 			if ( children->hasEntry( name ) )
 			{
@@ -1374,6 +1397,10 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 			{
 				throw Exception( "This scene has already been flushed to disk. You can't make further changes to it." );
 			}
+			if ( !m_sharedState->concurrentWrites && std::this_thread::get_id() != m_sharedState->writerThread )
+			{
+				m_sharedState->concurrentWrites = true;
+			}
 		}
 
 		// Function to store intelligently the given sample times in the file location.
@@ -1381,30 +1408,72 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 		void storeSampleTimes( const SampleTimes &sampleTimes, IndexedIOPtr location )
 		{
 			assert( m_sampleTimesMap );
-			uint64_t sampleTimesIndex = 	0;
-			IndexedIO::EntryID samplesEntry;
+			// Reserve the index under the maps lock, but write the sample times outside
+			// it, so that we don't spin other threads while doing I/O.
+			SharedMapsMutex::scoped_lock lock( m_sharedState->mapsMutex );
 			std::pair< SampleTimesMap::iterator, bool > it = m_sampleTimesMap->insert( std::pair< SampleTimes, uint64_t >( sampleTimes, 0 ) );
 			if ( it.second )
 			{
 				// Unique Id for the sampleTimes (incremental integer)
-				sampleTimesIndex = m_sampleTimesMap->size() - 1;
-				// store the uniqueId in the global map
-				it.first->second = sampleTimesIndex;
-				// find the global location for the sample times from the root Scene.
-				IndexedIOPtr sampleTimesIO = globalSampleTimes();
-				samplesEntry = sampleEntry(sampleTimesIndex);
-				// write the sampleTimes in the file
-				sampleTimesIO->write( samplesEntry, &sampleTimes[0], sampleTimes.size() );
+				it.first->second = m_sampleTimesMap->size() - 1;
 			}
-			else
+			const uint64_t sampleTimesIndex = it.first->second;
+			lock.release();
+
+			const IndexedIO::EntryID samplesEntry = sampleEntry( sampleTimesIndex );
+			if ( it.second )
 			{
-				// already saved in the global sample times section...
-				sampleTimesIndex = it.first->second;
-				samplesEntry = sampleEntry(sampleTimesIndex);
+				// write the sampleTimes in the global location shared by all locations,
+				// which may only be modified by one thread at a time.
+				SampleTimesIOMutex::scoped_lock sampleTimesIOLock( m_sharedState->sampleTimesIOMutex );
+				globalSampleTimes()->write( samplesEntry, &sampleTimes[0], sampleTimes.size() );
 			}
 			location->createSubdirectory( sampleTimesEntry )->createSubdirectory( samplesEntry );
 		}
 
+		// Saves a transform, attribute or object sample in the given directory. When deduplication is enabled,
+		// samples that are identical to one previously saved anywhere in the file are not serialized again -
+		// instead we write a reference to the path of the original, which Object::load() follows transparently.
+		// This avoids the cost of saving and hashing every block of data for static or instanced objects, but
+		// versions prior to 10.0.0-a15 can't load primitive variables from such references, so it is opt-in.
+		//
+		// The sample is saved outside the lock, so that locations written from different threads
+		// can serialize concurrently. An identical sample that is still being saved by another
+		// thread has no path yet, and is simply saved again.
+		void saveSample( const Object *sample, IndexedIO *io, size_t sampleIndex )
+		{
+			const IndexedIO::EntryID entry = sampleEntry( sampleIndex );
+			if ( !m_sharedState->deduplicateSamples )
+			{
+				sample->save( io, entry );
+				return;
+			}
+
+			const MurmurHash hash = sample->hash();
+
+			IndexedIO::EntryIDList path;
+			SharedMapsMutex::scoped_lock lock( m_sharedState->mapsMutex );
+			std::pair< SavedSamplesMap::iterator, bool > it = m_savedSamplesMap->insert( SavedSamplesMap::value_type( hash, IndexedIO::EntryIDList() ) );
+			path = it.first->second;
+			lock.release();
+
+			if ( !it.second && path.size() )
+			{
+				io->write( entry, &path[0], path.size() );
+				return;
+			}
+
+			sample->save( io, entry );
+
+			if ( it.second )
+			{
+				io->path( path );
+				path.push_back( entry );
+				lock.acquire( m_sharedState->mapsMutex );
+				it.first->second.swap( path );
+			}
+		}
+
 		// Helper function which interpolates the time varying bounding box described by sampleTimes and boxSamples at time t,
 		// then extends newSample by the resulting bounding box. "upper" should an iterator into sample times pointing to the
 		// first element greater than t.
@@ -1520,13 +1589,16 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 		}
 
 		// Called from the destructor of the root location.
-		// It triggers flush recursivelly on all the child locations.
+		// It triggers flush recursivelly on all the child locations, and then reduces their bounds and tags
+		// into this location. Siblings are processed in parallel only if `parallel` is true, which the root passes
+		// when the scene was written from several threads. Otherwise they are processed in order, because the
+		// order in which they are flushed determines the indices of the shared sample times.
 		// It also sets m_sampleTimesMap to NULL which prevents further modification on this and all child scene interface objects through their call to writable().
 		// Responsible for writing missing data such as all the sample
 		// times from object,transform,attributes and bounds. And also computes the
 		// animated bounding boxes in case they were not explicitly writen.
 		//
-		void flush()
+		void flush( bool parallel )
 		{
 			if ( m_parent )
 			{
@@ -1536,9 +1608,40 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 				writeTags( tags, SceneInterface::AncestorTag );
 			}
 			/// first call flush recursively on children...
+			std::vector< WriterImplementation * > children;
+			children.reserve( m_children.size() );
 			for ( std::map< SceneCache::Name, WriterImplementationPtr >::const_iterator cit = m_children.begin(); cit != m_children.end(); cit++ )
 			{
-				cit->second->flush();
+				children.push_back( cit->second.get() );
+			}
+
+			if ( parallel )
+			{
+				tbb::parallel_for(
+					tbb::blocked_range<size_t>( 0, children.size() ),
+					[&children]( const tbb::blocked_range<size_t> &range )
+					{
+						for( size_t i = range.begin(); i != range.end(); ++i )
+						{
+							children[i]->flush( true );
+						}
+					}
+				);
+			}
+			else
+			{
+				for ( std::vector< WriterImplementation * >::const_iterator cit = children.begin(); cit != children.end(); cit++ )
+				{
+					(*cit)->flush( false );
+				}
+			}
+
+			/// ... then propagate their tags to this location
+			for ( std::vector< WriterImplementation * >::const_iterator cit = children.begin(); cit != children.end(); cit++ )
+			{
+				NameList tags;
+				(*cit)->readTags( tags, SceneInterface::LocalTag | SceneInterface::DescendantTag );
+				writeTags( tags, SceneInterface::DescendantTag );
 			}
 
 			IndexedIOPtr io;
@@ -1758,22 +1861,16 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 				}
 			}
 
-			if ( m_parent )
-			{
-				NameList tags;
-				// propagate tags to parent
-				readTags( tags, SceneInterface::LocalTag | SceneInterface::DescendantTag );
-				m_parent->writeTags( tags, SceneInterface::DescendantTag );
-			}
-
 			// deallocate children since we now computed everything from them anyways...
 			m_children.clear();
 
 			if ( !m_parent && m_sampleTimesMap )
 			{
 				// we are at the root...
-				// deallocate samples map stored in the root object.
+				// deallocate samples maps stored in the root object.
 				delete m_sampleTimesMap;
+				delete m_savedSamplesMap;
+				delete m_sharedState;
 				// and make sure the cache does not contain this file, forcing it to reload it.
 				if ( m_indexedIO->typeId() == FileIndexedIOTypeId )
 				{
@@ -1781,6 +1878,8 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 				}
 			}
 			m_sampleTimesMap = nullptr;
+			m_savedSamplesMap = nullptr;
+			m_sharedState = nullptr;
 		}
 
 		/// This functions transforms the bounding boxes with the animated transforms and also scales the bounding boxes in a way that it
@@ -1911,11 +2010,46 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 
 		WriterImplementation* m_parent;
 		std::map< SceneCache::Name, WriterImplementationPtr > m_children;
+		typedef tbb::spin_mutex ChildrenMutex;
+		ChildrenMutex m_childrenMutex;
 
 		typedef std::map< SampleTimes, uint64_t > SampleTimesMap;
 		typedef std::map< SceneCache::Name, SampleTimes > AttributeSamplesMap;
 
+		// maps from the hash of a saved sample to its location in the file.
+		typedef std::map< MurmurHash, IndexedIO::EntryIDList > SavedSamplesMap;
+
+		typedef tbb::spin_mutex SharedMapsMutex;
+		typedef tbb::mutex SampleTimesIOMutex;
+
+		// state shared by all locations, allocated by the root.
+		struct SharedState
+		{
+			SharedState() : writerThread( std::this_thread::get_id() ), deduplicateSamples( false )
+			{
+				concurrentWrites = false;
+				if( const char *d = getenv( "IECORESCENE_SCENECACHE_DEDUPLICATESAMPLES" ) )
+				{
+					deduplicateSamples = !strcmp( d, "1" );
+				}
+			}
+
+			// guards the maps above.
+			SharedMapsMutex mapsMutex;
+			// guards writes to the global sample times directory.
+			SampleTimesIOMutex sampleTimesIOMutex;
+			// the thread which created the root, and whether any
+			// location has since been written from a different one.
+			const std::thread::id writerThread;
+			tbb::atomic<bool> concurrentWrites;
+			// whether identical samples are saved as references
+			// to the first copy.
+			bool deduplicateSamples;
+		};
+
 		SampleTimesMap *m_sampleTimesMap;
+		SavedSamplesMap *m_savedSamplesMap;
+		SharedState *m_sharedState;
 		SampleTimes m_boundSampleTimes;		// implicit or explicit bound sample times
 		SampleTimes m_transformSampleTimes;
 		AttributeSamplesMap m_attributeSampleTimes;
@@ -2005,6 +2139,11 @@ std::string SceneCache::fileName() const
 	return m_implementation->fileName();
 }
 
+size_t SceneCache::memoryUsage() const
+{
+	return m_implementation->memoryUsage();
+}
+
 void SceneCache::path( SceneCache::Path &p ) const
 {
 	p.clear();
@@ -121,6 +121,11 @@ SceneInterface::~SceneInterface()
 {
 }
 
+size_t SceneInterface::memoryUsage() const
+{
+	return 0;
+}
+
 bool SceneInterface::hasBound() const
 {
 	return true;
@@ -35,6 +35,16 @@
 #include "IECoreScene/SharedSceneInterfaces.h"
 
 #include "IECore/LRUCache.h"
+#include "IECore/MessageHandler.h"
+
+#include "boost/lexical_cast.hpp"
+
+#include "tbb/atomic.h"
+#include "tbb/concurrent_hash_map.h"
+#include "tbb/parallel_for.h"
+
+#include <algorithm>
+#include <cstdlib>
 
 using namespace IECore;
 using namespace IECoreScene;
@@ -46,6 +56,19 @@ using namespace IECoreScene;
 namespace
 {
 
+// Every open file costs file descriptors as well as memory, so each file
+// is counted as at least this size. This limits the number of files open
+// at once, which with the default memory limit is about 200.
+const size_t g_minFileCost = 10 * 1024 * 1024;
+const size_t g_defaultMaxCostMB = 2048;
+
+// The cost is measured when the file is added to the cache, so any
+// of the index loaded lazily afterwards is not accounted for.
+size_t fileCost( const SceneInterface *scene )
+{
+	return std::max( scene->memoryUsage(), g_minFileCost );
+}
+
 typedef IECore::LRUCache< std::string, IECoreScene::ConstSceneInterfacePtr > SceneLRUCache;
 
 class Cache : public SceneLRUCache
@@ -53,24 +76,49 @@ class Cache : public SceneLRUCache
 	public :
 
 		Cache( SceneLRUCache::Cost maxCost )
-			: SceneLRUCache( fileCacheGetter, maxCost )
+			: SceneLRUCache( [this]( const std::string &fileName, size_t &cost ) { return getter( fileName, cost ); }, maxCost )
 		{
+			pinnedHits = 0;
 		}
 
+		typedef tbb::concurrent_hash_map<std::string, ConstSceneInterfacePtr> PinnedFiles;
+		PinnedFiles pinnedFiles;
+		// Lookups of pinned files bypass the LRUCache, so
+		// we count them ourselves.
+		tbb::atomic<size_t> pinnedHits;
+
 	private :
 
-		static SceneInterfacePtr fileCacheGetter( const std::string &fileName, size_t &cost )
+		ConstSceneInterfacePtr getter( const std::string &fileName, size_t &cost )
 		{
-			SceneInterfacePtr result = SceneInterface::create( fileName, IECore::IndexedIO::Read );
-			cost = 1;
+			ConstSceneInterfacePtr result = SceneInterface::create( fileName, IECore::IndexedIO::Read );
+			cost = fileCost( result.get() );
 			return result;
 		}
+
 };
 
+size_t defaultMaxCost()
+{
+	size_t mb = g_defaultMaxCostMB;
+	if( const char *m = getenv( "IECORESCENE_SHAREDSCENEINTERFACES_MEMORY" ) )
+	{
+		try
+		{
+			mb = boost::lexical_cast<size_t>( m );
+		}
+		catch( const boost::bad_lexical_cast & )
+		{
+			msg( Msg::Warning, "SharedSceneInterfaces", boost::format( "Ignoring invalid IECORESCENE_SHAREDSCENEINTERFACES_MEMORY value \"%s\"" ) % m );
+		}
+	}
+	return mb * 1024 * 1024;
+}
+
 Cache &cache()
 {
-	static Cache *cache = new Cache( 200 );
-	return *cache;
+	static Cache *c = new Cache( defaultMaxCost() );
+	return *c;
 }
 
 } // namespace
@@ -81,15 +129,121 @@ Cache &cache()
 
 ConstSceneInterfacePtr SharedSceneInterfaces::get( const std::string &fileName )
 {
-	return cache().get( fileName );
+	Cache &c = cache();
+	{
+		Cache::PinnedFiles::const_accessor it;
+		if( c.pinnedFiles.find( it, fileName ) )
+		{
+			c.pinnedHits++;
+			return it->second;
+		}
+	}
+	return c.get( fileName );
 }
 
 void SharedSceneInterfaces::erase( const std::string &fileName )
 {
+	cache().pinnedFiles.erase( fileName );
 	cache().erase( fileName );
 }
 
 void SharedSceneInterfaces::clear()
 {
+	cache().pinnedFiles.clear();
 	cache().clear();
 }
+
+void SharedSceneInterfaces::prefetch( const std::vector<std::string> &fileNames )
+{
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, fileNames.size(), 1 ),
+		[&fileNames]( const tbb::blocked_range<size_t> &range ) {
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				try
+				{
+					get( fileNames[i] );
+				}
+				catch( ... )
+				{
+					// The cache stores the failure, so it
+					// will be reported by get().
+				}
+			}
+		}
+	);
+}
+
+void SharedSceneInterfaces::pin( const std::string &fileName )
+{
+	ConstSceneInterfacePtr scene = get( fileName );
+
+	Cache &c = cache();
+	Cache::PinnedFiles::accessor it;
+	if( c.pinnedFiles.insert( it, fileName ) )
+	{
+		it->second = scene;
+	}
+	it.release();
+
+	// The pinned reference keeps the file open, so we
+	// don't need to account for it in the cache too.
+	c.erase( fileName );
+}
+
+void SharedSceneInterfaces::unpin( const std::string &fileName )
+{
+	Cache &c = cache();
+	Cache::PinnedFiles::accessor it;
+	if( !c.pinnedFiles.find( it, fileName ) )
+	{
+		return;
+	}
+
+	// Return the file to the cache, so that the scene remains shared
+	// with existing clients. We do this before removing the pinned
+	// entry, so that a concurrent get() can't reopen the file.
+	c.set( fileName, it->second, fileCost( it->second.get() ) );
+	c.pinnedFiles.erase( it );
+}
+
+void SharedSceneInterfaces::setMaxMemoryUsage( size_t bytes )
+{
+	cache().setMaxCost( bytes );
+}
+
+size_t SharedSceneInterfaces::getMaxMemoryUsage()
+{
+	return cache().getMaxCost();
+}
+
+size_t SharedSceneInterfaces::memoryUsage()
+{
+	return cache().currentCost();
+}
+
+SharedSceneInterfaces::Statistics::Statistics()
+	:	hits( 0 ), misses( 0 ), evictions( 0 ), memoryUsage( 0 ), maxMemoryUsage( 0 ), pinned( 0 )
+{
+}
+
+SharedSceneInterfaces::Statistics SharedSceneInterfaces::statistics()
+{
+	Cache &c = cache();
+	const Cache::Statistics cacheStatistics = c.statistics();
+
+	Statistics result;
+	result.hits = cacheStatistics.hits + c.pinnedHits;
+	result.misses = cacheStatistics.misses;
+	result.evictions = cacheStatistics.evictions;
+	result.memoryUsage = cacheStatistics.currentCost;
+	result.maxMemoryUsage = cacheStatistics.maxCost;
+	result.pinned = c.pinnedFiles.size();
+	return result;
+}
+
+void SharedSceneInterfaces::resetStatistics()
+{
+	cache().pinnedHits = 0;
+	cache().resetStatistics();
+}
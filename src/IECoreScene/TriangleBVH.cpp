@@ -0,0 +1,315 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#include "IECoreScene/private/TriangleBVH.h"
+
+#include "tbb/atomic.h"
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+#include "tbb/parallel_invoke.h"
+
+#include <algorithm>
+#include <limits>
+#include <memory>
+
+using namespace Imath;
+using namespace IECoreScene::Detail;
+
+//////////////////////////////////////////////////////////////////////////
+// Internal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+const int g_numBins = 16;
+// Subtrees containing more triangles than this are built in parallel.
+const size_t g_parallelThreshold = 4096;
+// Beyond this depth we use median splits, which halve the number of
+// triangles at each level and therefore keep the total depth within
+// TriangleBVH::maxDepth.
+const size_t g_maxSAHDepth = 32;
+
+float halfArea( const Box3f &b )
+{
+	if( b.isEmpty() )
+	{
+		return 0.0f;
+	}
+	const V3f s = b.size();
+	return s.x * s.y + s.y * s.z + s.z * s.x;
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// Builder
+//////////////////////////////////////////////////////////////////////////
+
+struct TriangleBVH::BuildNode
+{
+	Box3f bound;
+	uint32_t begin;
+	uint32_t end;
+	std::unique_ptr<BuildNode> children[2];
+};
+
+class TriangleBVH::Builder
+{
+
+	public :
+
+		Builder( const std::vector<Box3f> &bounds, std::vector<uint32_t> &indices, size_t maxLeafSize )
+			:	m_bounds( bounds ), m_indices( indices ), m_maxLeafSize( maxLeafSize ), m_centroids( bounds.size() )
+		{
+			m_numNodes = 0;
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, bounds.size() ),
+				[this]( const tbb::blocked_range<size_t> &range ) {
+					for( size_t i = range.begin(); i != range.end(); ++i )
+					{
+						m_centroids[i] = m_bounds[i].center();
+					}
+				}
+			);
+		}
+
+		BuildNode *build( uint32_t begin, uint32_t end, size_t depth )
+		{
+			m_numNodes++;
+
+			std::unique_ptr<BuildNode> node( new BuildNode );
+			node->begin = begin;
+			node->end = end;
+
+			Box3f centroidBound;
+			for( uint32_t i = begin; i < end; ++i )
+			{
+				node->bound.extendBy( m_bounds[m_indices[i]] );
+				centroidBound.extendBy( m_centroids[m_indices[i]] );
+			}
+
+			if( end - begin <= m_maxLeafSize )
+			{
+				return node.release();
+			}
+
+			const uint32_t mid = split( begin, end, centroidBound, depth );
+
+			if( end - begin > g_parallelThreshold )
+			{
+				tbb::parallel_invoke(
+					[&]() { node->children[0].reset( build( begin, mid, depth + 1 ) ); },
+					[&]() { node->children[1].reset( build( mid, end, depth + 1 ) ); }
+				);
+			}
+			else
+			{
+				node->children[0].reset( build( begin, mid, depth + 1 ) );
+				node->children[1].reset( build( mid, end, depth + 1 ) );
+			}
+
+			return node.release();
+		}
+
+		size_t numNodes() const
+		{
+			return m_numNodes;
+		}
+
+	private :
+
+		// Partitions the range, returning the index of the first triangle
+		// in the second child. Both children are guaranteed to be non-empty.
+		uint32_t split( uint32_t begin, uint32_t end, const Box3f &centroidBound, size_t depth )
+		{
+			uint32_t *first = m_indices.data() + begin;
+			uint32_t *last = m_indices.data() + end;
+			uint32_t *mid = first + ( end - begin ) / 2;
+
+			const int axis = centroidBound.majorAxis();
+			const float min = centroidBound.min[axis];
+			const float extent = centroidBound.max[axis] - min;
+			if( extent <= 0.0f )
+			{
+				// All centroids coincide, so any split is as good as any other.
+				return mid - m_indices.data();
+			}
+
+			if( depth < g_maxSAHDepth )
+			{
+				const float scale = g_numBins / extent;
+				auto bin = [&]( uint32_t triangleIndex ) {
+					return std::min( (int)( ( m_centroids[triangleIndex][axis] - min ) * scale ), g_numBins - 1 );
+				};
+
+				Box3f binBounds[g_numBins];
+				size_t binCounts[g_numBins] = { 0 };
+				for( uint32_t *it = first; it != last; ++it )
+				{
+					const int b = bin( *it );
+					binBounds[b].extendBy( m_bounds[*it] );
+					binCounts[b]++;
+				}
+
+				// Sweep from the right to find the cost of everything
+				// above each candidate split, and then from the left
+				// to find the cheapest split.
+
+				float rightCosts[g_numBins];
+				Box3f bound;
+				size_t count = 0;
+				for( int i = g_numBins - 1; i > 0; --i )
+				{
+					bound.extendBy( binBounds[i] );
+					count += binCounts[i];
+					rightCosts[i] = count ? halfArea( bound ) * count : -1.0f;
+				}
+
+				int bestSplit = -1;
+				float bestCost = std::numeric_limits<float>::max();
+				bound.makeEmpty();
+				count = 0;
+				for( int i = 1; i < g_numBins; ++i )
+				{
+					bound.extendBy( binBounds[i-1] );
+					count += binCounts[i-1];
+					if( !count || rightCosts[i] < 0.0f )
+					{
+						continue;
+					}
+					const float cost = halfArea( bound ) * count + rightCosts[i];
+					if( cost < bestCost )
+					{
+						bestCost = cost;
+						bestSplit = i;
+					}
+				}
+
+				if( bestSplit > 0 )
+				{
+					uint32_t *split = std::partition(
+						first, last,
+						[&]( uint32_t triangleIndex ) { return bin( triangleIndex ) < bestSplit; }
+					);
+					return split - m_indices.data();
+				}
+			}
+
+			std::nth_element(
+				first, mid, last,
+				[&]( uint32_t a, uint32_t b ) { return m_centroids[a][axis] < m_centroids[b][axis]; }
+			);
+
+			return mid - m_indices.data();
+		}
+
+		const std::vector<Box3f> &m_bounds;
+		std::vector<uint32_t> &m_indices;
+		const size_t m_maxLeafSize;
+		std::vector<V3f> m_centroids;
+		tbb::atomic<size_t> m_numNodes;
+
+};
+
+//////////////////////////////////////////////////////////////////////////
+// TriangleBVH
+//////////////////////////////////////////////////////////////////////////
+
+TriangleBVH::TriangleBVH( const std::vector<Box3f> &triangleBounds, size_t maxLeafSize )
+{
+	if( triangleBounds.empty() )
+	{
+		return;
+	}
+
+	m_triangleIndices.resize( triangleBounds.size() );
+	for( size_t i = 0; i < m_triangleIndices.size(); ++i )
+	{
+		m_triangleIndices[i] = i;
+	}
+
+	Builder builder( triangleBounds, m_triangleIndices, std::max<size_t>( maxLeafSize, 1 ) );
+	std::unique_ptr<BuildNode> root( builder.build( 0, m_triangleIndices.size(), 0 ) );
+
+	m_nodes.reserve( builder.numNodes() );
+	flatten( root.get() );
+}
+
+void TriangleBVH::flatten( const BuildNode *buildNode )
+{
+	const size_t index = m_nodes.size();
+	m_nodes.push_back( Node() );
+	m_nodes[index].bound = buildNode->bound;
+
+	if( !buildNode->children[0] )
+	{
+		m_nodes[index].offset = buildNode->begin;
+		m_nodes[index].count = buildNode->end - buildNode->begin;
+		return;
+	}
+
+	// The first child immediately follows the parent, so
+	// we need only record the location of the second.
+	flatten( buildNode->children[0].get() );
+	m_nodes[index].offset = m_nodes.size();
+	m_nodes[index].count = 0;
+	flatten( buildNode->children[1].get() );
+}
+
+bool TriangleBVH::rayIntersects( const Box3f &box, const V3f &origin, const V3f &inverseDirection, float maxDistance, float &distance )
+{
+	float tMin = 0.0f;
+	float tMax = maxDistance;
+	for( int i = 0; i < 3; ++i )
+	{
+		float t0 = ( box.min[i] - origin[i] ) * inverseDirection[i];
+		float t1 = ( box.max[i] - origin[i] ) * inverseDirection[i];
+		if( t0 > t1 )
+		{
+			std::swap( t0, t1 );
+		}
+		// When the ray lies in the plane of a slab these may be NaN,
+		// in which case the comparisons leave the interval unchanged.
+		tMin = t0 > tMin ? t0 : tMin;
+		tMax = t1 < tMax ? t1 : tMax;
+		if( tMin > tMax )
+		{
+			return false;
+		}
+	}
+	distance = tMin;
+	return true;
+}
@@ -99,6 +99,7 @@
 #include "RendererBinding.h"
 #include "ReorderSmoothSkinningInfluencesOpBinding.h"
 #include "SampledSceneInterfaceBinding.h"
+#include "SceneAlgoBinding.h"
 #include "SceneCacheBinding.h"
 #include "SceneInterfaceBinding.h"
 #include "ShaderBinding.h"
@@ -214,6 +215,7 @@ BOOST_PYTHON_MODULE(_IECoreScene)
 	bindMeshAlgo();
 	bindCurvesAlgo();
 	bindPointsAlgo();
+	bindSceneAlgo();
 	bindTypedObjectParameter();
 	bindTypeId();
 
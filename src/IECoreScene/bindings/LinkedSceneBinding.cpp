@@ -41,6 +41,7 @@
 #include "IECoreScene/LinkedScene.h"
 
 #include "IECorePython/RunTimeTypedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
 
 using namespace boost::python;
 using namespace IECore;
@@ -52,14 +53,22 @@ namespace IECoreSceneModule
 
 static LinkedScenePtr constructor( const std::string &fileName, IndexedIO::OpenMode mode )
 {
+	ScopedGILRelease gilRelease;
 	return new LinkedScene( fileName, mode );
 }
 
 static LinkedScenePtr constructor2( SceneInterfacePtr scn )
 {
+	ScopedGILRelease gilRelease;
 	return new LinkedScene( scn );
 }
 
+static void writeLink( LinkedScene &scene, const SceneInterface *linkedScene )
+{
+	ScopedGILRelease gilRelease;
+	scene.writeLink( linkedScene );
+}
+
 void bindLinkedScene()
 {
 	IECore::CompoundDataPtr (*linkAttributeData)( const SceneInterface *scene) = &LinkedScene::linkAttributeData;
@@ -68,7 +77,7 @@ void bindLinkedScene()
 	RunTimeTypedClass<LinkedScene>()
 		.def( "__init__", make_constructor( &constructor ), "Opens a linked scene file for read or write." )
 		.def( "__init__", make_constructor( &constructor2 ), "Creates a linked scene to expand links in the given scene file." )
-		.def( "writeLink", &LinkedScene::writeLink )
+		.def( "writeLink", &writeLink )
 		.def( "linkAttributeData", linkAttributeData )
 		.def( "linkAttributeData", retimedLinkAttributeData ).staticmethod( "linkAttributeData" )
 		.def_readonly("linkAttribute", &LinkedScene::linkAttribute )
@@ -58,15 +58,16 @@ static bool barycentricPosition( const MeshPrimitiveEvaluator &e, unsigned int t
 
 void bindMeshPrimitiveEvaluator()
 {
-	object m = RunTimeTypedClass<MeshPrimitiveEvaluator>()
-		.def( init< MeshPrimitivePtr > () )
-		.def( "barycentricPosition", &barycentricPosition )
-		.def( "uvBound", &MeshPrimitiveEvaluator::uvBound )
-	;
+	RunTimeTypedClass<MeshPrimitiveEvaluator> m;
 
 	{
 		scope ms( m );
 
+		enum_<MeshPrimitiveEvaluator::AccelerationStructure>( "AccelerationStructure" )
+			.value( "KDTree", MeshPrimitiveEvaluator::KDTree )
+			.value( "BVH", MeshPrimitiveEvaluator::BVH )
+		;
+
 		RefCountedClass<MeshPrimitiveEvaluator::Result, PrimitiveEvaluator::Result>( "Result" )
 			.def( "triangleIndex", &MeshPrimitiveEvaluator::Result::triangleIndex )
 			.def( "barycentricCoordinates", &MeshPrimitiveEvaluator::Result::barycentricCoordinates, return_value_policy<copy_const_reference>() )
@@ -74,6 +75,13 @@ void bindMeshPrimitiveEvaluator()
 		;
 
 	}
+
+	m
+		.def( init< MeshPrimitivePtr, MeshPrimitiveEvaluator::AccelerationStructure >( ( arg( "mesh" ), arg( "accelerationStructure" ) = MeshPrimitiveEvaluator::KDTree ) ) )
+		.def( "barycentricPosition", &barycentricPosition )
+		.def( "uvBound", &MeshPrimitiveEvaluator::uvBound )
+		.def( "accelerationStructure", &MeshPrimitiveEvaluator::accelerationStructure )
+	;
 }
 
 }
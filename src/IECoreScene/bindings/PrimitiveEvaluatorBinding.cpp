@@ -39,6 +39,9 @@
 #include "IECoreScene/PrimitiveEvaluator.h"
 
 #include "IECorePython/RunTimeTypedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
+
+#include "IECore/CompoundData.h"
 
 using namespace IECore;
 using namespace IECorePython;
@@ -131,6 +134,42 @@ struct PrimitiveEvaluatorHelper
 		return result;
 	}
 
+	static CompoundDataPtr batchResults( const PrimitiveEvaluator::BatchResults &results )
+	{
+		CompoundDataPtr result = new CompoundData;
+		result->writable()["success"] = results.success;
+		result->writable()["point"] = results.point;
+		result->writable()["normal"] = results.normal;
+		result->writable()["uv"] = results.uv;
+		result->writable()["distance"] = results.distance;
+		result->writable()["elementIndex"] = results.elementIndex;
+		return result;
+	}
+
+	static CompoundDataPtr batchClosestPoint( PrimitiveEvaluator &evaluator, const V3fVectorData *points )
+	{
+		ScopedGILRelease gilRelease;
+		return batchResults( evaluator.batchClosestPoint( points->readable() ) );
+	}
+
+	static CompoundDataPtr batchSignedDistance( PrimitiveEvaluator &evaluator, const V3fVectorData *points )
+	{
+		ScopedGILRelease gilRelease;
+		return batchResults( evaluator.batchSignedDistance( points->readable() ) );
+	}
+
+	static CompoundDataPtr batchPointAtUV( PrimitiveEvaluator &evaluator, const V2fVectorData *uvs )
+	{
+		ScopedGILRelease gilRelease;
+		return batchResults( evaluator.batchPointAtUV( uvs->readable() ) );
+	}
+
+	static CompoundDataPtr batchIntersectionPoint( PrimitiveEvaluator &evaluator, const V3fVectorData *origins, const V3fVectorData *directions, float maxDistance )
+	{
+		ScopedGILRelease gilRelease;
+		return batchResults( evaluator.batchIntersectionPoint( origins->readable(), directions->readable(), maxDistance ) );
+	}
+
 	static PrimitivePtr primitive( PrimitiveEvaluator &evaluator )
 	{
 		return evaluator.primitive()->copy();
@@ -184,6 +223,17 @@ void bindPrimitiveEvaluator()
 		.def( "intersectionPoint", intersectionPointMaxDist )
 		.def( "intersectionPoints", intersectionPoints )
 		.def( "intersectionPoints", intersectionPointsMaxDist )
+		.def( "batchClosestPoint", &PrimitiveEvaluatorHelper::batchClosestPoint )
+		.def( "batchSignedDistance", &PrimitiveEvaluatorHelper::batchSignedDistance )
+		.def( "batchPointAtUV", &PrimitiveEvaluatorHelper::batchPointAtUV )
+		.def(
+			"batchIntersectionPoint", &PrimitiveEvaluatorHelper::batchIntersectionPoint,
+			(
+				arg( "origins" ),
+				arg( "directions" ),
+				arg( "maxDistance" ) = Imath::limits<float>::max()
+			)
+		)
 		.def( "primitive", &PrimitiveEvaluatorHelper::primitive )
 		.def( "volume", &PrimitiveEvaluator::volume )
 		.def( "centerOfGravity", &PrimitiveEvaluator::centerOfGravity )
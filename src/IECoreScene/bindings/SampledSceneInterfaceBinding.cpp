@@ -40,7 +40,9 @@
 
 #include "IECoreScene/SampledSceneInterface.h"
 
+#include "IECorePython/RefCountedBinding.h"
 #include "IECorePython/RunTimeTypedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
 
 using namespace boost::python;
 using namespace IECore;
@@ -78,8 +80,15 @@ static tuple objectSampleInterval( const SampledSceneInterface &m, double time )
 	return make_tuple( x, floorIndex, ceilIndex );
 }
 
+Imath::Box3d readBoundAtSample( const SampledSceneInterface &m, size_t sampleIndex )
+{
+	ScopedGILRelease gilRelease;
+	return m.readBoundAtSample( sampleIndex );
+}
+
 DataPtr readTransformAtSample( SampledSceneInterface &m, size_t sampleIndex )
 {
+	ScopedGILRelease gilRelease;
 	ConstDataPtr d = m.readTransformAtSample(sampleIndex);
 	if ( d )
 	{
@@ -88,8 +97,15 @@ DataPtr readTransformAtSample( SampledSceneInterface &m, size_t sampleIndex )
 	return nullptr;
 }
 
+Imath::M44d readTransformAsMatrixAtSample( const SampledSceneInterface &m, size_t sampleIndex )
+{
+	ScopedGILRelease gilRelease;
+	return m.readTransformAsMatrixAtSample( sampleIndex );
+}
+
 ObjectPtr readAttributeAtSample( SampledSceneInterface &m, const SceneInterface::Name &name, size_t sampleIndex )
 {
+	ScopedGILRelease gilRelease;
 	ConstObjectPtr o = m.readAttributeAtSample(name,sampleIndex);
 	if ( o )
 	{
@@ -100,6 +116,7 @@ ObjectPtr readAttributeAtSample( SampledSceneInterface &m, const SceneInterface:
 
 ObjectPtr readObjectAtSample( SampledSceneInterface &m, size_t sampleIndex )
 {
+	ScopedGILRelease gilRelease;
 	ConstObjectPtr o = m.readObjectAtSample(sampleIndex);
 	if ( o )
 	{
@@ -119,9 +136,9 @@ void bindSampledSceneInterface()
 		.def( "transformSampleTime", &SampledSceneInterface::transformSampleTime )
 		.def( "attributeSampleTime", &SampledSceneInterface::attributeSampleTime )
 		.def( "objectSampleTime", &SampledSceneInterface::objectSampleTime )
-		.def( "readBoundAtSample", &SampledSceneInterface::readBoundAtSample )
+		.def( "readBoundAtSample", &readBoundAtSample )
 		.def( "readTransformAtSample", &readTransformAtSample )
-		.def( "readTransformAsMatrixAtSample", &SampledSceneInterface::readTransformAsMatrixAtSample )
+		.def( "readTransformAsMatrixAtSample", &readTransformAsMatrixAtSample )
 		.def( "readAttributeAtSample", &readAttributeAtSample )
 		.def( "readObjectAtSample", &readObjectAtSample )
 
@@ -129,6 +146,9 @@ void bindSampledSceneInterface()
 		.def( "transformSampleInterval", &transformSampleInterval )
 		.def( "attributeSampleInterval", &attributeSampleInterval )
 		.def( "objectSampleInterval", &objectSampleInterval )
+
+		.def( "interpolationCache", &SampledSceneInterface::interpolationCache, return_value_policy<CastToIntrusivePtr>() )
+		.staticmethod( "interpolationCache" )
 	;
 }
 
@@ -0,0 +1,98 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#include "boost/python.hpp"
+
+#include "SceneAlgoBinding.h"
+
+#include "IECoreScene/SceneAlgo.h"
+
+#include "IECorePython/ScopedGILRelease.h"
+
+#include "boost/python/suite/indexing/container_utils.hpp"
+
+using namespace boost::python;
+using namespace IECore;
+using namespace IECorePython;
+using namespace IECoreScene;
+
+namespace
+{
+
+size_t parallelReadAll( const SceneInterface *location, object pythonTimes, unsigned flags, const PathMatcher *filter )
+{
+	std::vector<double> times;
+	container_utils::extend_container( times, pythonTimes );
+
+	ScopedGILRelease gilRelease;
+	return SceneAlgo::parallelReadAll( location, times, flags, filter );
+}
+
+PathMatcher matchingPaths( const PathMatcher &filter, const SceneInterface *location )
+{
+	ScopedGILRelease gilRelease;
+	return SceneAlgo::matchingPaths( filter, location );
+}
+
+} // namespace
+
+namespace IECoreSceneModule
+{
+
+void bindSceneAlgo()
+{
+	object sceneAlgoModule( borrowed( PyImport_AddModule( "IECoreScene.SceneAlgo" ) ) );
+	scope().attr( "SceneAlgo" ) = sceneAlgoModule;
+
+	scope sceneAlgoScope( sceneAlgoModule );
+
+	enum_<SceneAlgo::ProcessFlags>( "ProcessFlags" )
+		.value( "Bounds", SceneAlgo::Bounds )
+		.value( "Transforms", SceneAlgo::Transforms )
+		.value( "Attributes", SceneAlgo::Attributes )
+		.value( "Tags", SceneAlgo::Tags )
+		.value( "Objects", SceneAlgo::Objects )
+		.value( "All", SceneAlgo::All )
+	;
+
+	def(
+		"parallelReadAll", &parallelReadAll,
+		( arg( "location" ), arg( "times" ), arg( "flags" ) = (unsigned)SceneAlgo::All, arg( "filter" ) = object() )
+	);
+
+	def( "matchingPaths", &matchingPaths, ( arg( "filter" ), arg( "location" ) ) );
+}
+
+} // namespace IECoreSceneModule
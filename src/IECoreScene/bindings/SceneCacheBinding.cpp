@@ -42,6 +42,7 @@
 #include "IECoreScene/SharedSceneInterfaces.h"
 
 #include "IECorePython/RunTimeTypedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
 
 #include "tbb/tbb.h"
 
@@ -60,11 +61,13 @@ namespace
 
 SceneCachePtr constructor( const std::string &fileName, IndexedIO::OpenMode mode )
 {
+	ScopedGILRelease gilRelease;
 	return new SceneCache( fileName, mode );
 }
 
 SceneCachePtr constructor2( IECore::IndexedIOPtr indexedIO )
 {
+	ScopedGILRelease gilRelease;
 	return new SceneCache( indexedIO );
 }
 
@@ -131,6 +134,7 @@ struct TestSceneCache
 
 void testSceneCacheParallelAttributeRead()
 {
+	ScopedGILRelease gilRelease;
 	task_scheduler_init scheduler( 100 );
 
 	TestSceneCache task( "w" );
@@ -144,6 +148,7 @@ void testSceneCacheParallelAttributeRead()
 
 void testSceneCacheParallelFakeAttributeRead()
 {
+	ScopedGILRelease gilRelease;
 	task_scheduler_init scheduler( 100 );
 
 	TestSceneCache task( "fake" );
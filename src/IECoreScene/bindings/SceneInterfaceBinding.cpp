@@ -41,6 +41,7 @@
 
 #include "IECorePython/IECoreBinding.h"
 #include "IECorePython/RunTimeTypedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
 
 #include "boost/python/suite/indexing/container_utils.hpp"
 
@@ -65,7 +66,10 @@ inline list arrayToList( std::vector<IndexedIO::EntryID> &ids )
 static list childNames( const SceneInterface &m )
 {
 	SceneInterface::NameList n;
-	m.childNames( n );
+	{
+		ScopedGILRelease gilRelease;
+		m.childNames( n );
+	}
 	return arrayToList( n );
 }
 
@@ -89,16 +93,44 @@ static SceneInterfacePtr nonConstScene( SceneInterface &m, list l, SceneInterfac
 {
 	SceneInterface::Path p;
 	container_utils::extend_container( p, l );
+	ScopedGILRelease gilRelease;
 	return m.scene( p, b );
 }
 
+static SceneInterfacePtr nonConstChild( SceneInterface &m, const SceneInterface::Name &name, SceneInterface::MissingBehaviour b )
+{
+	ScopedGILRelease gilRelease;
+	return m.child( name, b );
+}
+
+static SceneInterfacePtr createChild( SceneInterface &m, const SceneInterface::Name &name )
+{
+	ScopedGILRelease gilRelease;
+	return m.createChild( name );
+}
+
+static bool hasChild( const SceneInterface &m, const SceneInterface::Name &name )
+{
+	ScopedGILRelease gilRelease;
+	return m.hasChild( name );
+}
+
 static list attributeNames( const SceneInterface &m )
 {
 	SceneInterface::NameList a;
-	m.attributeNames( a );
+	{
+		ScopedGILRelease gilRelease;
+		m.attributeNames( a );
+	}
 	return arrayToList( a );
 }
 
+static bool hasAttribute( const SceneInterface &m, const SceneInterface::Name &name )
+{
+	ScopedGILRelease gilRelease;
+	return m.hasAttribute( name );
+}
+
 static std::string pathToString( list l )
 {
 	SceneInterface::Path p;
@@ -115,6 +147,12 @@ static list stringToPath( std::string str )
 	return arrayToList( p );
 }
 
+static SceneInterfacePtr create( const std::string &path, IndexedIO::OpenMode mode )
+{
+	ScopedGILRelease gilRelease;
+	return SceneInterface::create( path, mode );
+}
+
 static list supportedExtensions( IndexedIO::OpenMode modes )
 {
 	std::vector<std::string> e = SceneInterface::supportedExtensions( modes );
@@ -131,7 +169,12 @@ static dict readObjectPrimitiveVariables( const SceneInterface &m, list varNameL
 	SceneInterface::NameList v;
 	container_utils::extend_container( v, varNameList );
 
-	PrimitiveVariableMap varMap = m.readObjectPrimitiveVariables( v, time );
+	PrimitiveVariableMap varMap;
+	{
+		ScopedGILRelease gilRelease;
+		varMap = m.readObjectPrimitiveVariables( v, time );
+	}
+
 	dict result;
 	for ( PrimitiveVariableMap::const_iterator it = varMap.begin(); it != varMap.end(); it++ )
 	{
@@ -143,7 +186,11 @@ static dict readObjectPrimitiveVariables( const SceneInterface &m, list varNameL
 list readTags( const SceneInterface &m, int filter )
 {
 	SceneInterface::NameList tags;
-	m.readTags( tags, filter );
+	{
+		ScopedGILRelease gilRelease;
+		m.readTags( tags, filter );
+	}
+
 	list result;
 	for ( SceneInterface::NameList::const_iterator it = tags.begin(); it != tags.end(); it++ )
 	{
@@ -156,11 +203,37 @@ void writeTags( SceneInterface &m, list tagList )
 {
 	SceneInterface::NameList v;
 	container_utils::extend_container( v, tagList );
+	ScopedGILRelease gilRelease;
 	m.writeTags(v);
 }
 
+bool hasTag( const SceneInterface &m, const SceneInterface::Name &name, int filter )
+{
+	ScopedGILRelease gilRelease;
+	return m.hasTag( name, filter );
+}
+
+bool hasBound( const SceneInterface &m )
+{
+	ScopedGILRelease gilRelease;
+	return m.hasBound();
+}
+
+Imath::Box3d readBound( const SceneInterface &m, double time )
+{
+	ScopedGILRelease gilRelease;
+	return m.readBound( time );
+}
+
+void writeBound( SceneInterface &m, const Imath::Box3d &bound, double time )
+{
+	ScopedGILRelease gilRelease;
+	m.writeBound( bound, time );
+}
+
 DataPtr readTransform( SceneInterface &m, double time )
 {
+	ScopedGILRelease gilRelease;
 	ConstDataPtr t = m.readTransform(time);
 	if ( t )
 	{
@@ -169,8 +242,21 @@ DataPtr readTransform( SceneInterface &m, double time )
 	return nullptr;
 }
 
+Imath::M44d readTransformAsMatrix( const SceneInterface &m, double time )
+{
+	ScopedGILRelease gilRelease;
+	return m.readTransformAsMatrix( time );
+}
+
+void writeTransform( SceneInterface &m, const Data *transform, double time )
+{
+	ScopedGILRelease gilRelease;
+	m.writeTransform( transform, time );
+}
+
 ObjectPtr readAttribute( SceneInterface &m, const SceneInterface::Name &name, double time )
 {
+	ScopedGILRelease gilRelease;
 	ConstObjectPtr o = m.readAttribute(name,time);
 	if ( o )
 	{
@@ -179,8 +265,21 @@ ObjectPtr readAttribute( SceneInterface &m, const SceneInterface::Name &name, do
 	return nullptr;
 }
 
+void writeAttribute( SceneInterface &m, const SceneInterface::Name &name, const Object *attribute, double time )
+{
+	ScopedGILRelease gilRelease;
+	m.writeAttribute( name, attribute, time );
+}
+
+bool hasObject( const SceneInterface &m )
+{
+	ScopedGILRelease gilRelease;
+	return m.hasObject();
+}
+
 ObjectPtr readObject( SceneInterface &m, double time )
 {
+	ScopedGILRelease gilRelease;
 	ConstObjectPtr o = m.readObject(time);
 	if ( o )
 	{
@@ -189,8 +288,15 @@ ObjectPtr readObject( SceneInterface &m, double time )
 	return nullptr;
 }
 
+void writeObject( SceneInterface &m, const Object *object, double time )
+{
+	ScopedGILRelease gilRelease;
+	m.writeObject( object, time );
+}
+
 static MurmurHash sceneHash( SceneInterface &m, SceneInterface::HashType hashType, double time )
 {
+	ScopedGILRelease gilRelease;
 	MurmurHash h;
 	m.hash( hashType, time, h );
 	return h;
@@ -198,8 +304,6 @@ static MurmurHash sceneHash( SceneInterface &m, SceneInterface::HashType hashTyp
 
 void bindSceneInterface()
 {
-	SceneInterfacePtr (SceneInterface::*nonConstChild)(const SceneInterface::Name &, SceneInterface::MissingBehaviour) = &SceneInterface::child;
-
 	// make the SceneInterface class first
 	IECorePython::RunTimeTypedClass<SceneInterface> sceneInterfaceClass;
 
@@ -240,35 +344,36 @@ void bindSceneInterface()
 
 	sceneInterfaceClass.def( "path", path )
 		.def( "fileName", &SceneInterface::fileName )
+		.def( "memoryUsage", &SceneInterface::memoryUsage )
 		.def( "pathAsString", pathAsString )
 		.def( "name", &SceneInterface::name )
-		.def( "hasBound", &SceneInterface::hasBound )
-		.def( "readBound", &SceneInterface::readBound )
-		.def( "writeBound", &SceneInterface::writeBound )
+		.def( "hasBound", &hasBound )
+		.def( "readBound", &readBound )
+		.def( "writeBound", &writeBound )
 		.def( "readTransform", &readTransform )
-		.def( "readTransformAsMatrix", &SceneInterface::readTransformAsMatrix )
-		.def( "writeTransform", &SceneInterface::writeTransform )
-		.def( "hasAttribute", &SceneInterface::hasAttribute )
+		.def( "readTransformAsMatrix", &readTransformAsMatrix )
+		.def( "writeTransform", &writeTransform )
+		.def( "hasAttribute", &hasAttribute )
 		.def( "attributeNames", attributeNames )
 		.def( "readAttribute", &readAttribute )
-		.def( "writeAttribute", &SceneInterface::writeAttribute )
-		.def( "hasTag", &SceneInterface::hasTag, ( arg( "name" ), arg( "filter" ) = SceneInterface::LocalTag ) )
+		.def( "writeAttribute", &writeAttribute )
+		.def( "hasTag", &hasTag, ( arg( "name" ), arg( "filter" ) = SceneInterface::LocalTag ) )
 		.def( "readTags", readTags, ( arg( "filter" ) = SceneInterface::LocalTag ) )
 		.def( "writeTags", writeTags )
 		.def( "readObject", &readObject )
 		.def( "readObjectPrimitiveVariables", &readObjectPrimitiveVariables )
-		.def( "writeObject", &SceneInterface::writeObject )
-		.def( "hasObject", &SceneInterface::hasObject )
-		.def( "hasChild", &SceneInterface::hasChild )
+		.def( "writeObject", &writeObject )
+		.def( "hasObject", &hasObject )
+		.def( "hasChild", &hasChild )
 		.def( "childNames", &childNames )
-		.def( "child", nonConstChild, ( arg( "name" ), arg( "missingBehaviour" ) = SceneInterface::ThrowIfMissing ) )
-		.def( "createChild", &SceneInterface::createChild )
+		.def( "child", &nonConstChild, ( arg( "name" ), arg( "missingBehaviour" ) = SceneInterface::ThrowIfMissing ) )
+		.def( "createChild", &createChild )
 		.def( "scene", &nonConstScene, ( arg( "path" ), arg( "missingBehaviour" ) = SceneInterface::ThrowIfMissing ) )
 		.def( "hash", &sceneHash )
 
 		.def( "pathToString", pathToString ).staticmethod("pathToString")
 		.def( "stringToPath", stringToPath ).staticmethod("stringToPath")
-		.def( "create", SceneInterface::create ).staticmethod( "create" )
+		.def( "create", &create ).staticmethod( "create" )
 		.def( "supportedExtensions", supportedExtensions, ( arg("modes") = IndexedIO::Read|IndexedIO::Write|IndexedIO::Append ) ).staticmethod( "supportedExtensions" )
 
 		.def_readonly("visibilityName", &SceneInterface::visibilityName )
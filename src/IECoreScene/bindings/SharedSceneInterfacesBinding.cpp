@@ -38,7 +38,12 @@
 
 #include "IECoreScene/SharedSceneInterfaces.h"
 
+#include "IECorePython/ScopedGILRelease.h"
+
+#include "boost/python/suite/indexing/container_utils.hpp"
+
 using namespace boost::python;
+using namespace IECorePython;
 using namespace IECoreScene;
 
 namespace IECoreSceneModule
@@ -46,16 +51,73 @@ namespace IECoreSceneModule
 
 static SceneInterfacePtr nonConstGet( std::string fileName )
 {
+	ScopedGILRelease gilRelease;
 	ConstSceneInterfacePtr scene = SharedSceneInterfaces::get( fileName );
 	return const_cast<SceneInterface*>( scene.get() );
 }
 
+static void erase( std::string fileName )
+{
+	ScopedGILRelease gilRelease;
+	SharedSceneInterfaces::erase( fileName );
+}
+
+static void clear()
+{
+	ScopedGILRelease gilRelease;
+	SharedSceneInterfaces::clear();
+}
+
+static void prefetch( object fileNames )
+{
+	std::vector<std::string> v;
+	container_utils::extend_container( v, fileNames );
+
+	ScopedGILRelease gilRelease;
+	SharedSceneInterfaces::prefetch( v );
+}
+
+static void pin( std::string fileName )
+{
+	ScopedGILRelease gilRelease;
+	SharedSceneInterfaces::pin( fileName );
+}
+
+static void unpin( std::string fileName )
+{
+	ScopedGILRelease gilRelease;
+	SharedSceneInterfaces::unpin( fileName );
+}
+
+static void setMaxMemoryUsage( size_t bytes )
+{
+	ScopedGILRelease gilRelease;
+	SharedSceneInterfaces::setMaxMemoryUsage( bytes );
+}
+
 void bindSharedSceneInterfaces()
 {
-	class_<SharedSceneInterfaces>( "SharedSceneInterfaces" )
+	scope s = class_<SharedSceneInterfaces>( "SharedSceneInterfaces" )
 		.def( "get", nonConstGet ).staticmethod( "get" )
-		.def( "erase", SharedSceneInterfaces::erase ).staticmethod( "erase" )
-		.def( "clear", SharedSceneInterfaces::clear ).staticmethod( "clear" )
+		.def( "erase", &erase ).staticmethod( "erase" )
+		.def( "clear", &clear ).staticmethod( "clear" )
+		.def( "prefetch", &prefetch ).staticmethod( "prefetch" )
+		.def( "pin", &pin ).staticmethod( "pin" )
+		.def( "unpin", &unpin ).staticmethod( "unpin" )
+		.def( "setMaxMemoryUsage", &setMaxMemoryUsage ).staticmethod( "setMaxMemoryUsage" )
+		.def( "getMaxMemoryUsage", &SharedSceneInterfaces::getMaxMemoryUsage ).staticmethod( "getMaxMemoryUsage" )
+		.def( "memoryUsage", &SharedSceneInterfaces::memoryUsage ).staticmethod( "memoryUsage" )
+		.def( "statistics", &SharedSceneInterfaces::statistics ).staticmethod( "statistics" )
+		.def( "resetStatistics", &SharedSceneInterfaces::resetStatistics ).staticmethod( "resetStatistics" )
+	;
+
+	class_<SharedSceneInterfaces::Statistics>( "Statistics" )
+		.def_readonly( "hits", &SharedSceneInterfaces::Statistics::hits )
+		.def_readonly( "misses", &SharedSceneInterfaces::Statistics::misses )
+		.def_readonly( "evictions", &SharedSceneInterfaces::Statistics::evictions )
+		.def_readonly( "memoryUsage", &SharedSceneInterfaces::Statistics::memoryUsage )
+		.def_readonly( "maxMemoryUsage", &SharedSceneInterfaces::Statistics::maxMemoryUsage )
+		.def_readonly( "pinned", &SharedSceneInterfaces::Statistics::pinned )
 	;
 }
 
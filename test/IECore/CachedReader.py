@@ -277,5 +277,43 @@ class CachedReaderTest( unittest.TestCase ) :
 		t2.join()
 		t3.join()
 
+	def testReadAsync( self ) :
+
+		pool = IECore.ObjectPool( 100 * 1024 * 1024 )
+		r = IECore.CachedReader( IECore.SearchPath( "./" ), pool )
+
+		f = r.readAsync( "test/IECore/data/cobFiles/compoundData.cob" )
+		f.wait()
+		self.assertTrue( f.done() )
+
+		o = f.get()
+		self.assertEqual( o.typeName(), "CompoundData" )
+		self.assertEqual( o, r.read( "test/IECore/data/cobFiles/compoundData.cob" ) )
+		self.assertTrue( r.cached( "test/IECore/data/cobFiles/compoundData.cob" ) )
+
+		f = r.readAsync( "doesNotExist" )
+		self.assertRaises( RuntimeError, f.get )
+		self.assertRaises( RuntimeError, r.read, "doesNotExist" )
+
+	def testPrefetch( self ) :
+
+		files = [
+			"test/IECore/data/cobFiles/compoundData.cob",
+			"test/IECore/data/cobFiles/intDataTen.cob",
+			"test/IECore/data/cachedReaderPath2/file.cob",
+		]
+
+		pool = IECore.ObjectPool( 100 * 1024 * 1024 )
+		r = IECore.CachedReader( IECore.SearchPath( "./" ), pool )
+		r.prefetch( files + [ "doesNotExist" ] )
+
+		# Wait for the prefetch to complete by making an
+		# asynchronous read of each file.
+		for f in files :
+			r.readAsync( f ).wait()
+			self.assertTrue( r.cached( f ) )
+
+		self.assertRaises( RuntimeError, r.read, "doesNotExist" )
+
 if __name__ == "__main__":
     unittest.main()
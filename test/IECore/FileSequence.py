@@ -434,6 +434,84 @@ class testLs( unittest.TestCase ) :
 		l = IECore.ls( "test/sequences/lsTest" )
 		self.assertEqual( len( l ), 0 )
 
+	def testFindSequencesTokenization( self ) :
+
+		# Names with negative frames, numeric extensions and
+		# multiple numbers must all be split in the same way as
+		# the regex previously used by findSequences().
+		for names, expected in [
+			( [ "a1.mp3", "a2.mp3" ], "a#.mp3 1-2" ),
+			( [ "a.mp3", "a.mp4" ], "a.mp# 3-4" ),
+			( [ "s1.0010.exr", "s1.0011.exr" ], "s1.####.exr 10-11" ),
+			( [ "s-0010.exr", "s-0011.exr" ], "s####.exr -11--10" ),
+			( [ "1", "2", "3" ], "# 1-3" ),
+		] :
+			l = IECore.findSequences( names )
+			self.assertEqual( len( l ), 1 )
+			self.assertEqual( l[0], IECore.FileSequence( expected ) )
+
+		self.assertEqual( IECore.findSequences( [ "a", "b" ] ), [] )
+		self.assertEqual( IECore.findSequences( [ "a#1", "a#2" ] ), [] )
+
+	def testRecursive( self ) :
+
+		self.tearDown()
+
+		sequences = [
+			IECore.FileSequence( "test/sequences/lsTest/a.####.tif", IECore.FrameRange( 1, 10 ) ),
+			IECore.FileSequence( "test/sequences/lsTest/sub/b.#.exr", IECore.FrameRange( 1, 5 ) ),
+			IECore.FileSequence( "test/sequences/lsTest/sub/subsub/c.##.exr", IECore.FrameRange( 10, 20 ) ),
+			IECore.FileSequence( "test/sequences/lsTest/sub2/d.#.exr", IECore.FrameRange( 1, 3 ) ),
+		]
+
+		for sequence in sequences :
+			os.system( "mkdir -p " + os.path.dirname( sequence.fileName ) )
+			for f in sequence.fileNames() :
+				os.system( "touch '" + f + "'" )
+
+		l = IECore.lsRecursive( "test/sequences/lsTest" )
+		self.assertEqual(
+			l,
+			[
+				IECore.FileSequence( "a.####.tif", IECore.FrameRange( 1, 10 ) ),
+				IECore.FileSequence( "sub/b.#.exr", IECore.FrameRange( 1, 5 ) ),
+				IECore.FileSequence( "sub/subsub/c.##.exr", IECore.FrameRange( 10, 20 ) ),
+				IECore.FileSequence( "sub2/d.#.exr", IECore.FrameRange( 1, 3 ) ),
+			]
+		)
+
+		l = IECore.lsRecursive( "test/sequences/lsTest", maxDepth = 1 )
+		self.assertEqual( [ s.fileName for s in l ], [ "a.####.tif", "sub/b.#.exr", "sub2/d.#.exr" ] )
+
+		l = IECore.lsRecursive( "test/sequences/lsTest", maxDepth = 0 )
+		self.assertEqual( l, IECore.ls( "test/sequences/lsTest" ) )
+
+		l = IECore.lsRecursive( "test/sequences/lsTest", minSequenceSize = 4 )
+		self.assertEqual( [ s.fileName for s in l ], [ "a.####.tif", "sub/b.#.exr", "sub/subsub/c.##.exr" ] )
+
+		self.assertEqual( IECore.lsRecursive( "test/sequences/iDontExist" ), [] )
+
+	def testRecursiveStats( self ) :
+
+		self.tearDown()
+		os.system( "mkdir -p test/sequences/lsTest/sub" )
+
+		s = IECore.FileSequence( "test/sequences/lsTest/sub/a.#.tif", IECore.FrameRange( 1, 3 ) )
+		for i, f in enumerate( s.fileNames() ) :
+			with open( f, "w" ) as fh :
+				fh.write( "x" * i )
+
+		l = IECore.lsRecursive( "test/sequences/lsTest", withStats = True )
+		self.assertEqual( len( l ), 1 )
+
+		sequence, modificationTimes, sizes = l[0]
+		self.assertEqual( sequence, IECore.FileSequence( "sub/a.#.tif", IECore.FrameRange( 1, 3 ) ) )
+		self.assertEqual( sizes, IECore.UInt64VectorData( [ 0, 1, 2 ] ) )
+		self.assertEqual(
+			list( modificationTimes ),
+			[ int( os.stat( f ).st_mtime ) for f in s.fileNames() ]
+		)
+
 	def testAmbiguousPaddingNonContiguous( self ):
 
 		self.tearDown()
@@ -493,6 +571,22 @@ class testMv( unittest.TestCase ) :
 		self.assertEqual( len( l ), 1 )
 		self.assertEqual( l[0], IECore.FileSequence( "s.####.tif", IECore.FrameRange( 50, 150 ) ) )
 
+	def testThreaded( self ) :
+
+		for dst in ( "s2.####.tif", "s.####.tif" ) :
+
+			self.tearDown()
+			os.system( "mkdir -p test/sequences/mvTest" )
+			s = IECore.FileSequence( "test/sequences/mvTest/s.####.tif", IECore.FrameRange( 0, 100 ) )
+			for f in s.fileNames() :
+				os.system( "touch '" + f + "'" )
+
+			s2 = IECore.FileSequence( "test/sequences/mvTest/" + dst, IECore.FrameRange( 50, 150 ) )
+			IECore.mv( s, s2, numThreads = 8 )
+			l = IECore.ls( "test/sequences/mvTest" )
+			self.assertEqual( len( l ), 1 )
+			self.assertEqual( l[0], IECore.FileSequence( dst, IECore.FrameRange( 50, 150 ) ) )
+
 	def tearDown( self ) :
 
 		if os.path.exists( "test/sequences" ) :
@@ -524,11 +618,67 @@ class testCp( unittest.TestCase ) :
 		self.assertEqual( len( l ), 1 )
 		self.assertEqual( l[0], IECore.FileSequence( "t.####.tif", IECore.FrameRange( 50, 150 ) ) )
 
+	def testThreaded( self ) :
+
+		self.tearDown()
+		os.system( "mkdir -p test/sequences/cpTest" )
+
+		s = IECore.FileSequence( "test/sequences/cpTest/s.####.tif", IECore.FrameRange( 0, 100 ) )
+		for f in s.fileNames() :
+			with open( f, "w" ) as fh :
+				fh.write( f )
+
+		s2 = IECore.FileSequence( "test/sequences/cpTest/t.####.tif", IECore.FrameRange( 50, 150 ) )
+		IECore.cp( s, s2, numThreads = 8 )
+
+		for src, dst in s.mapTo( s2, True ) :
+			self.assertEqual( open( dst ).read(), src )
+
+		l = IECore.ls( "test/sequences/cpTest" )
+		self.assertEqual( len( l ), 2 )
+
 	def tearDown( self ) :
 
 		if os.path.exists( "test/sequences" ) :
 			shutil.rmtree( "test/sequences" )
 
+class testForEachParallel( unittest.TestCase ) :
+
+	def test( self ) :
+
+		for numThreads in ( 1, 4 ) :
+
+			visited = set()
+			progress = []
+			IECore.forEachParallel( visited.add, range( 0, 100 ), numThreads, lambda done, total : progress.append( ( done, total ) ) )
+			self.assertEqual( visited, set( range( 0, 100 ) ) )
+			self.assertEqual( sorted( progress ), [ ( i, 100 ) for i in range( 1, 101 ) ] )
+
+	def testErrorOrder( self ) :
+
+		def f( i ) :
+			if i in ( 40, 20, 60 ) :
+				raise ValueError( "Failed %d" % i )
+
+		for numThreads in ( 1, 4 ) :
+			self.assertRaisesRegexp( ValueError, "Failed 20", IECore.forEachParallel, f, range( 0, 100 ), numThreads )
+
+	def testStopsAfterError( self ) :
+
+		# Every item from 10 onwards fails, and a thread stops as soon as it
+		# has seen a failure, so each thread can attempt at most one of them.
+		# Items are claimed in order, so all those before 10 are visited.
+
+		visited = []
+		def f( i ) :
+			visited.append( i )
+			if i >= 10 :
+				raise ValueError( "Failed %d" % i )
+
+		self.assertRaisesRegexp( ValueError, "Failed 10", IECore.forEachParallel, f, range( 0, 1000 ), 4 )
+		self.assertEqual( sorted( i for i in visited if i < 10 ), range( 0, 10 ) )
+		self.assertLessEqual( len( [ i for i in visited if i >= 10 ] ), 4 )
+
 class testBigNumbers( unittest.TestCase ) :
 
 	def test( self ) :
@@ -575,6 +575,204 @@ class TestFileIndexedIO(unittest.TestCase):
 		self.failIf(fv is gv)
 		self.assertEqual(fv, gv)
 
+	def testCodecs( self ) :
+		"""Test FileIndexedIO compression codecs"""
+
+		Codec = IECore.StreamIndexedIO.Codec
+
+		self.assertEqual( IECore.StreamIndexedIO.defaultIndexCodec(), Codec.Gzip )
+		self.assertEqual( IECore.StreamIndexedIO.defaultDataCodec(), Codec.Uncompressed )
+		self.assertTrue( IECore.StreamIndexedIO.codecAvailable( Codec.Uncompressed ) )
+		self.assertTrue( IECore.StreamIndexedIO.codecAvailable( Codec.Gzip ) )
+
+		codecs = [ c for c in ( Codec.Uncompressed, Codec.Gzip, Codec.LZ4, Codec.Zstd ) if IECore.StreamIndexedIO.codecAvailable( c ) ]
+
+		floats = IECore.FloatVectorData( [ i % 10 for i in range( 0, 10000 ) ] )
+		strings = IECore.StringVectorData( [ "a", "bb", "ccc" ] * 100 )
+		names = IECore.InternedStringVectorData( [ "x", "y", "z" ] * 100 )
+
+		sizes = {}
+		for indexCodec in codecs :
+			for dataCodec in codecs :
+
+				f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Write, indexCodec = indexCodec, dataCodec = dataCodec )
+				self.assertEqual( f.indexCodec(), indexCodec )
+				self.assertEqual( f.dataCodec(), dataCodec )
+
+				for i in range( 0, 10 ) :
+					g = f.subdirectory( "dir%d" % i, IECore.IndexedIO.MissingBehaviour.CreateIfMissing )
+					g.write( "floats", floats )
+					g.write( "strings", strings )
+					g.write( "names", names )
+					g.write( "int", i )
+					g.write( "string", "value%d" % i )
+					g.commit()
+
+				f.write( "floats", floats )
+				del f, g
+
+				sizes[dataCodec] = os.path.getsize( "./test/FileIndexedIO.fio" )
+
+				f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Read )
+				self.assertEqual( f.indexCodec(), indexCodec )
+				self.assertEqual( f.dataCodec(), dataCodec )
+				self.assertEqual( f.read( "floats" ), floats )
+				for i in range( 0, 10 ) :
+					g = f.subdirectory( "dir%d" % i )
+					self.assertEqual( g.read( "floats" ), floats )
+					self.assertEqual( g.read( "strings" ), strings )
+					self.assertEqual( g.read( "names" ), names )
+					self.assertEqual( g.read( "int" ), IECore.IntData( i ) )
+					self.assertEqual( g.read( "string" ), IECore.StringData( "value%d" % i ) )
+				del f, g
+
+				# appending must preserve the codecs of the file, regardless of what we ask for
+
+				f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Append, indexCodec = Codec.Gzip, dataCodec = Codec.Uncompressed )
+				self.assertEqual( f.indexCodec(), indexCodec )
+				self.assertEqual( f.dataCodec(), dataCodec )
+				f.write( "appended", strings )
+				del f
+
+				f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Read )
+				self.assertEqual( f.read( "appended" ), strings )
+				self.assertEqual( f.subdirectory( "dir3" ).read( "floats" ), floats )
+				del f
+
+		for dataCodec in codecs :
+			if dataCodec != Codec.Uncompressed :
+				self.assertLess( sizes[dataCodec], sizes[Codec.Uncompressed] )
+
+	def testDefaultCodecs( self ) :
+		"""Test FileIndexedIO default compression codecs"""
+
+		Codec = IECore.StreamIndexedIO.Codec
+
+		try :
+			IECore.StreamIndexedIO.setDefaultCodecs( Codec.Gzip, Codec.Gzip )
+			f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Write )
+			self.assertEqual( f.indexCodec(), Codec.Gzip )
+			self.assertEqual( f.dataCodec(), Codec.Gzip )
+			f.write( "a", IECore.IntVectorData( range( 0, 1000 ) ) )
+			del f
+		finally :
+			IECore.StreamIndexedIO.setDefaultCodecs( Codec.Gzip, Codec.Uncompressed )
+
+		f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Read )
+		self.assertEqual( f.dataCodec(), Codec.Gzip )
+		self.assertEqual( f.read( "a" ), IECore.IntVectorData( range( 0, 1000 ) ) )
+
+	def testUnavailableCodecs( self ) :
+		"""Test FileIndexedIO falls back to Gzip for unavailable codecs"""
+
+		Codec = IECore.StreamIndexedIO.Codec
+
+		for codec in ( Codec.LZ4, Codec.Zstd ) :
+
+			if IECore.StreamIndexedIO.codecAvailable( codec ) :
+				continue
+
+			try :
+				with IECore.CapturingMessageHandler() as mh :
+					IECore.StreamIndexedIO.setDefaultCodecs( codec, codec )
+				self.assertEqual( len( mh.messages ), 2 )
+				self.assertEqual( mh.messages[0].level, IECore.Msg.Level.Warning )
+				self.assertEqual( IECore.StreamIndexedIO.defaultIndexCodec(), Codec.Gzip )
+				self.assertEqual( IECore.StreamIndexedIO.defaultDataCodec(), Codec.Gzip )
+			finally :
+				IECore.StreamIndexedIO.setDefaultCodecs( Codec.Gzip, Codec.Uncompressed )
+
+			with IECore.CapturingMessageHandler() as mh :
+				f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Write, indexCodec = codec, dataCodec = codec )
+			self.assertEqual( len( mh.messages ), 2 )
+			self.assertEqual( f.indexCodec(), Codec.Gzip )
+			self.assertEqual( f.dataCodec(), Codec.Gzip )
+			f.write( "a", IECore.IntVectorData( range( 0, 1000 ) ) )
+			del f
+
+			f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Read )
+			self.assertEqual( f.read( "a" ), IECore.IntVectorData( range( 0, 1000 ) ) )
+
+	def testMapped( self ) :
+		"""Test FileIndexedIO memory mapped reading"""
+
+		Codec = IECore.StreamIndexedIO.Codec
+
+		floats = IECore.FloatVectorData( [ i % 10 for i in range( 0, 10000 ) ] )
+		strings = IECore.StringVectorData( [ "a", "bb", "ccc" ] * 100 )
+
+		for dataCodec in ( Codec.Uncompressed, Codec.Gzip ) :
+
+			f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Write, indexCodec = Codec.Gzip, dataCodec = dataCodec )
+			for i in range( 0, 10 ) :
+				g = f.subdirectory( "dir%d" % i, IECore.IndexedIO.MissingBehaviour.CreateIfMissing )
+				g.write( "floats", floats )
+				g.write( "strings", strings )
+				g.write( "int", i )
+				g.commit()
+			del f, g
+
+			f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Read | IECore.IndexedIO.OpenMode.Mapped )
+			self.assertEqual( f.dataCodec(), dataCodec )
+			for i in range( 0, 10 ) :
+				g = f.subdirectory( "dir%d" % i )
+				self.assertEqual( g.read( "floats" ), floats )
+				self.assertEqual( g.read( "strings" ), strings )
+				self.assertEqual( g.read( "int" ), IECore.IntData( i ) )
+			del f, g
+
+		self.assertRaises( RuntimeError, IECore.FileIndexedIO, "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Write | IECore.IndexedIO.OpenMode.Mapped )
+		self.assertRaises( RuntimeError, IECore.FileIndexedIO, "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Append | IECore.IndexedIO.OpenMode.Mapped )
+
+	def testParallelReads( self ) :
+		"""Test FileIndexedIO concurrent reading"""
+
+		f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Write )
+		for i in range( 0, 100 ) :
+			f.write( "floats%d" % i, IECore.FloatVectorData( [ i ] * 10000 ) )
+		del f
+
+		expectedBytes = 100 * 10000 * 4 * 10
+
+		for mode in ( IECore.IndexedIO.OpenMode.Read, IECore.IndexedIO.OpenMode.Read | IECore.IndexedIO.OpenMode.Mapped ) :
+			f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], mode )
+			for numThreads in ( 1, 2, 4, 8 ) :
+				bytesRead = IECore.testIndexedIOParallelReads( f, numThreads, 10 )
+				self.assertEqual( bytesRead, expectedBytes )
+
+			for i in range( 0, 100 ) :
+				self.assertEqual( f.read( "floats%d" % i ), IECore.FloatVectorData( [ i ] * 10000 ) )
+
+	def testReadPreviousVersions( self ) :
+		"""Test FileIndexedIO reading of files written before the introduction of codecs"""
+
+		f = IECore.FileIndexedIO( "test/IECore/data/sccFiles/animatedSpheres.scc", [], IECore.IndexedIO.OpenMode.Read )
+		self.assertEqual( f.indexCodec(), IECore.StreamIndexedIO.Codec.Gzip )
+		self.assertEqual( f.dataCodec(), IECore.StreamIndexedIO.Codec.Uncompressed )
+		self.assertTrue( len( f.entryIds() ) > 0 )
+
+	def testMemoryUsage( self ) :
+		"""Test FileIndexedIO memory usage of the index"""
+
+		f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Write )
+		f.write( "a", 1 )
+		del f
+
+		f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Read )
+		memoryUsage = f.memoryUsage()
+		self.assertGreater( memoryUsage, 0 )
+		del f
+
+		f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Write )
+		for i in range( 0, 100 ) :
+			f.subdirectory( "sub%d" % i, IECore.IndexedIO.MissingBehaviour.CreateIfMissing ).write( "a", i )
+		del f
+
+		f = IECore.FileIndexedIO( "./test/FileIndexedIO.fio", [], IECore.IndexedIO.OpenMode.Read )
+		self.assertGreater( f.memoryUsage(), memoryUsage )
+		# The index is shared by all the directories in the file.
+		self.assertEqual( f.subdirectory( "sub0" ).memoryUsage(), f.memoryUsage() )
+
 	def setUp( self ):
 
 		if os.path.isfile("./test/FileIndexedIO.fio") :
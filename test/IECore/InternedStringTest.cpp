@@ -80,6 +80,83 @@ struct InternedStringTest
 		parallel_for( blocked_range<size_t>( 0, numIterations ), Constructor() );
 	}
 
+	struct Lookup
+	{
+		public :
+
+			Lookup( const std::vector<std::string> &strings, std::vector<InternedString> &results )
+				:	m_strings( strings ), m_results( results )
+			{
+			}
+
+			void operator()( const blocked_range<size_t> &r ) const
+			{
+				for( size_t i=r.begin(); i!=r.end(); ++i )
+				{
+					m_results[i] = InternedString( m_strings[i % m_strings.size()] );
+				}
+			}
+
+		private :
+
+			const std::vector<std::string> &m_strings;
+			std::vector<InternedString> &m_results;
+
+	};
+
+	// Many threads interning the same names, some of which exist
+	// already and some of which don't, must all get the same string.
+	void testConcurrentLookup()
+	{
+		std::vector<std::string> strings;
+		for( size_t i = 0; i < 1000; ++i )
+		{
+			strings.push_back( "concurrentLookup" + lexical_cast<std::string>( i ) );
+		}
+
+		std::vector<InternedString> existing;
+		InternedString::intern( std::vector<std::string>( strings.begin(), strings.begin() + 500 ), existing );
+
+		std::vector<InternedString> results( 100000 );
+		parallel_for( blocked_range<size_t>( 0, results.size() ), Lookup( strings, results ) );
+
+		for( size_t i = 0; i < results.size(); ++i )
+		{
+			const InternedString &expected = i % 1000 < 500 ? existing[i % 1000] : results[i % 1000];
+			BOOST_CHECK_EQUAL( results[i].string(), strings[i % 1000] );
+			// Compare addresses, so we know the string was only stored once.
+			BOOST_CHECK( results[i].c_str() == expected.c_str() );
+		}
+	}
+
+	void testBulkConstruction()
+	{
+		std::vector<std::string> strings;
+		for( size_t i = 0; i < 100000; ++i )
+		{
+			// Include duplicates, and strings which
+			// are already interned.
+			strings.push_back( "bulk" + lexical_cast<std::string>( i % 50000 ) );
+		}
+		const InternedString existing( strings[10] );
+
+		std::vector<InternedString> interned;
+		InternedString::intern( strings, interned );
+
+		BOOST_CHECK_EQUAL( interned.size(), strings.size() );
+		for( size_t i = 0; i < strings.size(); ++i )
+		{
+			BOOST_CHECK_EQUAL( interned[i].string(), strings[i] );
+			BOOST_CHECK( interned[i] == InternedString( strings[i] ) );
+			BOOST_CHECK( interned[i] == interned[i % 50000] );
+		}
+		BOOST_CHECK( interned[10] == existing );
+
+		std::vector<std::string> empty;
+		InternedString::intern( empty, interned );
+		BOOST_CHECK( interned.empty() );
+	}
+
 	void testRangeConstruction()
 	{
 
@@ -107,6 +184,8 @@ struct InternedStringTestSuite : public boost::unit_test::test_suite
 
 		add( BOOST_CLASS_TEST_CASE( &InternedStringTest::testConcurrentConstruction, instance ) );
 		add( BOOST_CLASS_TEST_CASE( &InternedStringTest::testRangeConstruction, instance ) );
+		add( BOOST_CLASS_TEST_CASE( &InternedStringTest::testConcurrentLookup, instance ) );
+		add( BOOST_CLASS_TEST_CASE( &InternedStringTest::testBulkConstruction, instance ) );
 
 	}
 };
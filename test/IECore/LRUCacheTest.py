@@ -351,5 +351,77 @@ class LRUCacheTest( unittest.TestCase ) :
 		c.set( "d", "d", 1 )
 		self.assertEqual( c.currentCost(), 2 )
 
+	def testStatistics( self ) :
+
+		c = IECore.LRUCache( lambda key : ( key, 1 ), 10 )
+
+		s = c.statistics()
+		self.assertEqual( s.hits, 0 )
+		self.assertEqual( s.misses, 0 )
+		self.assertEqual( s.evictions, 0 )
+		self.assertEqual( s.currentCost, 0 )
+		self.assertEqual( s.maxCost, 10 )
+
+		for i in range( 0, 10 ) :
+			c.get( i )
+			c.get( i )
+
+		s = c.statistics()
+		self.assertEqual( s.hits, 10 )
+		self.assertEqual( s.misses, 10 )
+		self.assertEqual( s.evictions, 0 )
+		self.assertEqual( s.currentCost, 10 )
+
+		for i in range( 10, 15 ) :
+			c.get( i )
+
+		s = c.statistics()
+		self.assertEqual( s.hits, 10 )
+		self.assertEqual( s.misses, 15 )
+		self.assertEqual( s.evictions, 5 )
+		self.assertEqual( s.currentCost, 10 )
+
+		c.resetStatistics()
+
+		s = c.statistics()
+		self.assertEqual( s.hits, 0 )
+		self.assertEqual( s.misses, 0 )
+		self.assertEqual( s.evictions, 0 )
+		self.assertEqual( s.currentCost, 10 )
+
+	def testEvictionPolicy( self ) :
+
+		c = IECore.LRUCache( lambda key : ( key, 1 ), 100 )
+		self.assertEqual( c.getEvictionPolicy(), IECore.LRUCache.EvictionPolicy.LRU )
+
+		c.setEvictionPolicy( IECore.LRUCache.EvictionPolicy.LFU )
+		self.assertEqual( c.getEvictionPolicy(), IECore.LRUCache.EvictionPolicy.LFU )
+
+		# Access a working set several times, then
+		# scan through values which are only used once.
+
+		for r in range( 0, 3 ) :
+			for i in range( 0, 50 ) :
+				c.get( i )
+
+		for i in range( 1000, 1100 ) :
+			c.get( i )
+
+		# LFU should have protected the working set.
+
+		for i in range( 0, 50 ) :
+			self.assertTrue( c.cached( i ) )
+
+		self.assertEqual( c.currentCost(), 100 )
+		self.assertEqual( c.statistics().evictions, 50 )
+
+	def testSerialScanResistance( self ) :
+
+		IECore.testSerialLRUCacheScanResistance()
+
+	def testSerialReadmission( self ) :
+
+		IECore.testSerialLRUCacheReadmission()
+
 if __name__ == "__main__":
     unittest.main()
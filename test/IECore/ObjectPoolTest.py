@@ -112,5 +112,78 @@ class ObjectPoolTest( unittest.TestCase ) :
 			p.contains( b.hash() )
 		)
 
+	def testStatistics( self ) :
+
+		p = IECore.ObjectPool( 500 )
+
+		s = p.statistics()
+		self.assertEqual( s.hits, 0 )
+		self.assertEqual( s.misses, 0 )
+		self.assertEqual( s.evictions, 0 )
+		self.assertEqual( s.maxMemoryUsage, 500 )
+
+		# Storing a new object is not a lookup, so isn't counted.
+		a = p.store( IECore.IntData( 1 ), IECore.ObjectPool.StoreReference )
+		self.assertEqual( p.statistics().misses, 0 )
+		self.assertEqual( p.statistics().hits, 0 )
+
+		p.retrieve( a.hash() )
+		self.assertEqual( p.statistics().hits, 1 )
+
+		# Storing an identical object finds the existing one.
+		self.assertTrue( p.store( IECore.IntData( 1 ), IECore.ObjectPool.StoreReference ).isSame( a ) )
+		self.assertEqual( p.statistics().hits, 2 )
+
+		# A missed retrieve() followed by store() is counted once.
+		b = IECore.IntData( 2 )
+		self.assertEqual( p.retrieve( b.hash() ), None )
+		p.store( b, IECore.ObjectPool.StoreReference )
+		self.assertEqual( p.statistics().misses, 1 )
+		self.assertEqual( p.statistics().hits, 2 )
+		self.assertEqual( p.statistics().memoryUsage, a.memoryUsage() + b.memoryUsage() )
+
+		p.resetStatistics()
+		self.assertEqual( p.statistics().hits, 0 )
+		self.assertEqual( p.statistics().misses, 0 )
+
+	def testEvictionPolicy( self ) :
+
+		p = IECore.ObjectPool( 500 )
+		self.assertEqual( p.getEvictionPolicy(), IECore.ObjectPool.EvictionPolicy.LRU )
+
+		p.setEvictionPolicy( IECore.ObjectPool.EvictionPolicy.LFU )
+		self.assertEqual( p.getEvictionPolicy(), IECore.ObjectPool.EvictionPolicy.LFU )
+
+	def testScanResistance( self ) :
+
+		objects = [ IECore.IntData( i ) for i in range( 0, 150 ) ]
+		p = IECore.ObjectPool( objects[0].memoryUsage() * 100 )
+		p.setEvictionPolicy( IECore.ObjectPool.EvictionPolicy.LFU )
+
+		# Use a working set a few times, in the same way that
+		# CachedReader does, retrieving before storing.
+
+		def use( o ) :
+			if p.retrieve( o.hash() ) is None :
+				p.store( o, IECore.ObjectPool.StoreReference )
+
+		for r in range( 0, 3 ) :
+			for o in objects[:50] :
+				use( o )
+
+		# Then scan through objects which are only used once.
+		# They should only evict each other.
+
+		for o in objects[50:] :
+			use( o )
+
+		for o in objects[:50] :
+			self.assertTrue( p.contains( o.hash() ) )
+
+		self.assertEqual( p.memoryUsage(), objects[0].memoryUsage() * 100 )
+		self.assertEqual( p.statistics().misses, 150 )
+		self.assertEqual( p.statistics().hits, 100 )
+		self.assertEqual( p.statistics().evictions, 50 )
+
 if __name__ == "__main__":
     unittest.main()
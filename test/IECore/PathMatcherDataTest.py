@@ -130,5 +130,21 @@ class PathMatcherDataTest( unittest.TestCase ) :
 
 		self.assertEqual( d, d2 )
 
+	def testSaveAndLoadEmpty( self ) :
+
+		for d in [
+			IECore.PathMatcherData(),
+			IECore.PathMatcherData( IECore.PathMatcher( [ "/" ] ) ),
+		] :
+
+			saveIO = IECore.MemoryIndexedIO( IECore.CharVectorData(), IECore.IndexedIO.OpenMode.Write )
+			d.save( saveIO, "d" )
+
+			loadIO = IECore.MemoryIndexedIO( saveIO.buffer(), IECore.IndexedIO.OpenMode.Read )
+			d2 = IECore.Object.load( loadIO, "d" )
+
+			self.assertEqual( d, d2 )
+			self.assertEqual( d.hash(), d2.hash() )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -959,5 +959,95 @@ class PathMatcherTest( unittest.TestCase ) :
 
 		self.assertEqual( m3.paths(), [ "/a/b/c/d/myTest" ] )
 
+	def testIntersectionWithSharedSubtrees( self ) :
+
+		m1 = IECore.PathMatcher( [ "/a/b/c", "/a/b/d", "/a/e", "/f" ] )
+		m2 = IECore.PathMatcher( m1 )
+		m2.addPath( "/g" )
+		m2.removePath( "/a/e" )
+
+		self.assertEqual( set( m1.intersection( m2 ).paths() ), { "/a/b/c", "/a/b/d", "/f" } )
+		self.assertEqual( set( m2.intersection( m1 ).paths() ), { "/a/b/c", "/a/b/d", "/f" } )
+		self.assertEqual( m1.intersection( m1 ), m1 )
+
+		# Check that editing the intersection doesn't edit the originals.
+		m3 = m1.intersection( m2 )
+		m3.addPath( "/a/b/c/x" )
+		m3.removePath( "/a/b/d" )
+		self.assertEqual( set( m1.paths() ), { "/a/b/c", "/a/b/d", "/a/e", "/f" } )
+		self.assertEqual( set( m2.paths() ), { "/a/b/c", "/a/b/d", "/f", "/g" } )
+
+	def testIntersectionWithAncestors( self ) :
+
+		m1 = IECore.PathMatcher( [ "/", "/a", "/a/b" ] )
+		m2 = IECore.PathMatcher( [ "/", "/a/b", "/a/b/c" ] )
+
+		self.assertEqual( set( m1.intersection( m2 ).paths() ), { "/", "/a/b" } )
+		self.assertTrue( m1.intersection( IECore.PathMatcher() ).isEmpty() )
+		self.assertTrue( m1.intersection( IECore.PathMatcher( [ "/x" ] ) ).isEmpty() )
+
+	def testRemovePathsWithSharedSubtrees( self ) :
+
+		m1 = IECore.PathMatcher( [ "/a/b/c", "/a/b/d", "/a/e" ] )
+		m2 = IECore.PathMatcher( m1 )
+		m2.addPath( "/f" )
+
+		self.assertTrue( m2.removePaths( m1 ) )
+		self.assertEqual( m2.paths(), [ "/f" ] )
+		self.assertEqual( set( m1.paths() ), { "/a/b/c", "/a/b/d", "/a/e" } )
+
+		m3 = IECore.PathMatcher( m1 )
+		self.assertTrue( m3.removePaths( m1 ) )
+		self.assertTrue( m3.isEmpty() )
+		self.assertFalse( m3.removePaths( m1 ) )
+
+	def testSaveAndLoad( self ) :
+
+		for paths in [
+			[],
+			[ "/" ],
+			[ "/", "/a/b" ],
+			[ "/a/b/c", "/a/b/d", "/a", "/e/f/g", "/a/e" ],
+			[ "/a/*/c", "/a/.../d", "/b/x*" ],
+		] :
+
+			m = IECore.PathMatcher( paths )
+
+			saveIO = IECore.MemoryIndexedIO( IECore.CharVectorData(), IECore.IndexedIO.OpenMode.Write )
+			m.save( saveIO )
+
+			loadIO = IECore.MemoryIndexedIO( saveIO.buffer(), IECore.IndexedIO.OpenMode.Read )
+			m2 = IECore.PathMatcher( [ "/z" ] )
+			m2.load( loadIO )
+
+			self.assertEqual( m2, m )
+			self.assertEqual( set( m2.paths() ), set( m.paths() ) )
+
+		self.assertTrue( m2.match( "/a/x/c" ) & IECore.PathMatcher.Result.ExactMatch )
+		self.assertTrue( m2.match( "/a/x/y/d" ) & IECore.PathMatcher.Result.ExactMatch )
+		self.assertTrue( m2.match( "/b/xyz" ) & IECore.PathMatcher.Result.ExactMatch )
+
+		# Loaded matchers must remain editable.
+		m2.addPath( "/a/x" )
+		m2.removePath( "/b/x*" )
+		self.assertEqual( set( m2.paths() ), { "/a/*/c", "/a/.../d", "/a/x" } )
+
+	def testSaveAndLoadPerformance( self ) :
+
+		m = IECore.PathMatcher()
+		for i in range( 0, 100 ) :
+			for j in range( 0, 100 ) :
+				for k in range( 0, 10 ) :
+					m.addPath( [ str( i ), str( j ), str( k ) ] )
+
+		saveIO = IECore.MemoryIndexedIO( IECore.CharVectorData(), IECore.IndexedIO.OpenMode.Write )
+		m.save( saveIO )
+
+		loadIO = IECore.MemoryIndexedIO( saveIO.buffer(), IECore.IndexedIO.OpenMode.Read )
+		m2 = IECore.PathMatcher()
+		m2.load( loadIO )
+
+		self.assertEqual( m, m2 )
+
 if __name__ == "__main__":
 	unittest.main()
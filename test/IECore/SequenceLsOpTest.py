@@ -72,6 +72,45 @@ class SequenceLsOpTest( unittest.TestCase ) :
 		self.assertEqual( len(sequences), 1 )
 		self.assertEqual( str( sequences[0] ), "test/IECore/sequences/sequenceLsTest/s.#.tif 1-10" )
 
+	def testRecurse( self ) :
+
+		for fileName in [
+			"test/IECore/sequences/sequenceLsTest/s.#.tif",
+			"test/IECore/sequences/sequenceLsTest/a/s.#.tif",
+			"test/IECore/sequences/sequenceLsTest/a/b/s.#.tif",
+		] :
+			s = IECore.FileSequence( fileName, IECore.FrameRange( 1, 10 ) )
+			os.system( "mkdir -p " + os.path.dirname( fileName ) )
+			for f in s.fileNames() :
+				os.system( "touch '" + f + "'" )
+
+		op = IECore.SequenceLsOp()
+		op['dir'] = IECore.StringData( "test/IECore/sequences/sequenceLsTest/" )
+		op['resultType'] = IECore.StringData( "stringVector" )
+
+		self.assertEqual(
+			list( op() ),
+			[ "test/IECore/sequences/sequenceLsTest/s.#.tif 1-10" ]
+		)
+
+		op['recurse'] = True
+		self.assertEqual(
+			list( op() ),
+			[
+				"test/IECore/sequences/sequenceLsTest/s.#.tif 1-10",
+				"test/IECore/sequences/sequenceLsTest/a/s.#.tif 1-10",
+				"test/IECore/sequences/sequenceLsTest/a/b/s.#.tif 1-10",
+			]
+		)
+
+		op['maxDepth'] = 1
+		self.assertEqual(
+			list( op() ),
+			[
+				"test/IECore/sequences/sequenceLsTest/s.#.tif 1-10",
+				"test/IECore/sequences/sequenceLsTest/a/s.#.tif 1-10",
+			]
+		)
 
 	def setUp( self ) :
 
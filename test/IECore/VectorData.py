@@ -1207,6 +1207,110 @@ class TestVectorDataToString( unittest.TestCase ) :
 		for i in range( 0, 255 ) :
 			self.assertEqual( s[i], chr( i ) )
 
+class TestVectorDataBuffer( unittest.TestCase ) :
+
+	def testReadOnly( self ) :
+
+		d = IECore.FloatVectorData( [ 1, 2, 3 ] )
+		b = d.toBuffer()
+		self.assertFalse( b.isWritable() )
+		self.assertTrue( b.asData().isSame( d ) )
+
+		m = memoryview( b )
+		self.assertTrue( m.readonly )
+		self.assertEqual( m.format, "f" )
+		self.assertEqual( m.itemsize, 4 )
+		self.assertEqual( m.shape, ( 3, ) )
+		self.assertEqual( m.tobytes(), d.toString() )
+
+	def testWritable( self ) :
+
+		d = IECore.IntVectorData( [ 1, 2, 3 ] )
+		m = memoryview( d.toBuffer( writable = True ) )
+		self.assertFalse( m.readonly )
+
+		m[0:1] = IECore.IntVectorData( [ 10 ] ).toString()
+		self.assertEqual( d, IECore.IntVectorData( [ 10, 2, 3 ] ) )
+
+	def testWritableHonoursCopyOnWrite( self ) :
+
+		d = IECore.IntVectorData( [ 1, 2, 3 ] )
+		d2 = d.copy()
+
+		m = memoryview( d.toBuffer( writable = True ) )
+		m[0:1] = IECore.IntVectorData( [ 10 ] ).toString()
+
+		self.assertEqual( d, IECore.IntVectorData( [ 10, 2, 3 ] ) )
+		self.assertEqual( d2, IECore.IntVectorData( [ 1, 2, 3 ] ) )
+
+	def testReadOnlyOutlivesModification( self ) :
+
+		d = IECore.IntVectorData( [ 1, 2, 3 ] )
+		m = memoryview( d.toBuffer() )
+
+		d[0] = 10
+		d.extend( IECore.IntVectorData( range( 0, 10000 ) ) )
+		self.assertEqual( m.tobytes(), IECore.IntVectorData( [ 1, 2, 3 ] ).toString() )
+
+		del d
+		self.assertEqual( m.tobytes(), IECore.IntVectorData( [ 1, 2, 3 ] ).toString() )
+
+	def testWritableOutlivesModification( self ) :
+
+		d = IECore.IntVectorData( [ 1, 2, 3 ] )
+		m = memoryview( d.toBuffer( writable = True ) )
+
+		# Resizing gives `d` new memory, leaving the view
+		# referring to the memory it was created from.
+		d.resize( 10000 )
+		m[0:1] = IECore.IntVectorData( [ 10 ] ).toString()
+		self.assertEqual( m.tobytes(), IECore.IntVectorData( [ 10, 2, 3 ] ).toString() )
+		self.assertEqual( d[0], 1 )
+
+		del d
+		self.assertEqual( m.tobytes(), IECore.IntVectorData( [ 10, 2, 3 ] ).toString() )
+
+	def testReadOnlyRejectsWrites( self ) :
+
+		d = IECore.IntVectorData( [ 1, 2, 3 ] )
+		m = memoryview( d.toBuffer() )
+		self.assertRaises( TypeError, m.__setitem__, slice( 0, 1 ), "abcd" )
+
+	def testGeometricShape( self ) :
+
+		d = IECore.V3fVectorData( [ imath.V3f( 1, 2, 3 ), imath.V3f( 4, 5, 6 ) ] )
+		m = memoryview( d.toBuffer() )
+		self.assertEqual( m.format, "f" )
+		self.assertEqual( m.ndim, 2 )
+		self.assertEqual( m.shape, ( 2, 3 ) )
+		self.assertEqual( m.strides, ( 12, 4 ) )
+
+	def testConstructFromBuffer( self ) :
+
+		for d in [
+			IECore.FloatVectorData( [ 1, 2, 3 ] ),
+			IECore.Int64VectorData( [ 1, 2, 3 ] ),
+			IECore.HalfVectorData( [ 1, 2, 3 ] ),
+			IECore.V3fVectorData( [ imath.V3f( 1, 2, 3 ), imath.V3f( 4, 5, 6 ) ] ),
+			IECore.Color3fVectorData( [ imath.Color3f( 1, 2, 3 ) ] ),
+		] :
+			d2 = d.__class__( d.toBuffer() )
+			self.assertEqual( d2, d )
+			self.assertFalse( d2.isSame( d ) )
+
+		d = IECore.V3fVectorData( IECore.FloatVectorData( range( 0, 6 ) ).toBuffer() )
+		self.assertEqual( d, IECore.V3fVectorData( [ imath.V3f( 0, 1, 2 ), imath.V3f( 3, 4, 5 ) ] ) )
+
+		self.assertRaises( TypeError, IECore.FloatVectorData, IECore.IntVectorData( [ 1 ] ).toBuffer() )
+		self.assertRaises( ValueError, IECore.V3fVectorData, IECore.FloatVectorData( [ 1 ] ).toBuffer() )
+
+	def testEmpty( self ) :
+
+		d = IECore.FloatVectorData()
+		m = memoryview( d.toBuffer() )
+		self.assertEqual( len( m ), 0 )
+		self.assertEqual( IECore.FloatVectorData( d.toBuffer() ), d )
+
 class TestVectorDataHashOptimisation( unittest.TestCase ) :
 
 	def test( self ) :
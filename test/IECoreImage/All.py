@@ -57,6 +57,7 @@ from LuminanceOpTest import LuminanceOpTest
 from MedianCutSamplerTest import MedianCutSamplerTest
 from SplineToImageTest import SplineToImageTest
 from SummedAreaOpTest import SummedAreaOpTest
+from TiledChannelTest import TiledChannelTest
 from ImageDisplayDriverTest import *
 
 unittest.TestProgram(
@@ -38,6 +38,7 @@ import os
 import gc
 import glob
 import sys
+import threading
 import time
 import imath
 import IECore
@@ -138,6 +139,102 @@ class ImageDisplayDriverTest(unittest.TestCase):
 		i = dd.image()
 		self.assertEqual( i["Y"], y )
 
+	def testConcurrentBuckets( self ) :
+
+		window = imath.Box2i( imath.V2i( 0 ), imath.V2i( 639, 479 ) )
+		channelNames = [ "R", "G", "B", "A", "Z" ]
+		bucketSize = 64
+
+		buckets = []
+		for y in range( window.min().y, window.max().y + 1, bucketSize ) :
+			for x in range( window.min().x, window.max().x + 1, bucketSize ) :
+				box = imath.Box2i(
+					imath.V2i( x, y ),
+					imath.V2i( min( x + bucketSize - 1, window.max().x ), min( y + bucketSize - 1, window.max().y ) )
+				)
+				data = IECore.FloatVectorData( [
+					px + py * 1000 + c * 1000000
+					for py in range( box.min().y, box.max().y + 1 )
+					for px in range( box.min().x, box.max().x + 1 )
+					for c in range( 0, len( channelNames ) )
+				] )
+				buckets.append( ( box, data ) )
+
+		dd = IECoreImage.ImageDisplayDriver( window, window, channelNames, IECore.CompoundData() )
+
+		def writeBuckets( threadIndex, numThreads ) :
+			for box, data in buckets[threadIndex::numThreads] :
+				dd.imageData( box, data )
+
+		threads = []
+		for i in range( 0, 8 ) :
+			thread = threading.Thread( target = writeBuckets, args = ( i, 8 ) )
+			threads.append( thread )
+			thread.start()
+
+		for thread in threads :
+			thread.join()
+
+		dd.imageClose()
+
+		image = dd.image()
+		self.assertTrue( image.channelsValid() )
+		width = window.size().x + 1
+		for c, name in enumerate( channelNames ) :
+			channel = image[name]
+			for px, py in [ ( 0, 0 ), ( 63, 0 ), ( 64, 1 ), ( 639, 479 ), ( 300, 200 ), ( 575, 447 ) ] :
+				self.assertEqual( channel[py*width+px], px + py * 1000 + c * 1000000 )
+
+	def testCopyDuringRender( self ) :
+
+		window = imath.Box2i( imath.V2i( 0 ), imath.V2i( 255 ) )
+		dd = IECoreImage.ImageDisplayDriver( window, window, [ "R", "G", "B" ], IECore.CompoundData() )
+
+		boxes = [ imath.Box2i( imath.V2i( x, y ), imath.V2i( x + 15, y + 15 ) ) for y in range( 0, 256, 16 ) for x in range( 0, 256, 16 ) ]
+		data = IECore.FloatVectorData( [ 1 ] * 16 * 16 * 3 )
+
+		for box in boxes[:128] :
+			dd.imageData( box, data )
+
+		# Writing the remaining buckets must not modify the copy, and
+		# no bucket may be lost when the channels are detached from it.
+		copy = dd.image().copy()
+
+		def writeBuckets( threadIndex, numThreads ) :
+			for box in boxes[128+threadIndex::numThreads] :
+				dd.imageData( box, data )
+
+		threads = [ threading.Thread( target = writeBuckets, args = ( i, 4 ) ) for i in range( 0, 4 ) ]
+		for thread in threads :
+			thread.start()
+		for thread in threads :
+			thread.join()
+
+		dd.imageClose()
+
+		for c in [ "R", "G", "B" ] :
+			self.assertEqual( dd.image()[c], IECore.FloatVectorData( [ 1 ] * 256 * 256 ) )
+			self.assertEqual( copy[c], IECore.FloatVectorData( [ 1 ] * 256 * 128 + [ 0 ] * 256 * 128 ) )
+
+	def testCopyStoredImageDuringRender( self ) :
+
+		window = imath.Box2i( imath.V2i( 0 ), imath.V2i( 15, 31 ) )
+		dd = IECoreImage.ImageDisplayDriver( window, window, [ "Y" ], IECore.CompoundData( { "handle" : IECore.StringData( "copyDuringRender" ) } ) )
+
+		data = IECore.FloatVectorData( [ 1 ] * 16 * 16 )
+		dd.imageData( imath.Box2i( imath.V2i( 0 ), imath.V2i( 15 ) ), data )
+
+		copy = IECoreImage.ImageDisplayDriver.storedImage( "copyDuringRender" ).copy()
+		dd.imageData( imath.Box2i( imath.V2i( 0, 16 ), imath.V2i( 15, 31 ) ), data )
+
+		copy2 = IECoreImage.ImageDisplayDriver.removeStoredImage( "copyDuringRender" ).copy()
+		dd.imageData( imath.Box2i( imath.V2i( 0 ), imath.V2i( 15 ) ), IECore.FloatVectorData( [ 2 ] * 16 * 16 ) )
+		dd.imageClose()
+
+		self.assertEqual( copy["Y"], IECore.FloatVectorData( [ 1 ] * 256 + [ 0 ] * 256 ) )
+		self.assertEqual( copy2["Y"], IECore.FloatVectorData( [ 1 ] * 512 ) )
+		self.assertEqual( dd.image()["Y"], IECore.FloatVectorData( [ 2 ] * 256 + [ 1 ] * 256 ) )
+
 class ClientServerDisplayDriverTest(unittest.TestCase):
 
 	def setUp( self ):
@@ -262,6 +359,134 @@ class ClientServerDisplayDriverTest(unittest.TestCase):
 		i = IECoreImage.ImageDisplayDriver.removeStoredImage( "myHandle" )
 		self.assertEqual( i["Y"], y )
 
+	def testConcurrentCompressedSessions( self ) :
+
+		window = imath.Box2i( imath.V2i( 0 ), imath.V2i( 63 ) )
+		bucketSize = 16
+
+		def render( handle, compression ) :
+
+			dd = IECoreImage.ClientDisplayDriver(
+				window, window,
+				[ "Y" ],
+				IECore.CompoundData( {
+					"displayHost" : "localhost",
+					"displayPort" : "1559",
+					"displayCompression" : IECore.BoolData( compression ),
+					"remoteDisplayType" : "ImageDisplayDriver",
+					"handle" : handle,
+				} )
+			)
+
+			for y in range( 0, 64, bucketSize ) :
+				for x in range( 0, 64, bucketSize ) :
+					data = IECore.FloatVectorData( [ float( x + y ) ] * bucketSize * bucketSize )
+					dd.imageData( imath.Box2i( imath.V2i( x, y ), imath.V2i( x + bucketSize - 1, y + bucketSize - 1 ) ), data )
+
+			dd.imageClose()
+
+		self.server.resetStatistics()
+
+		handles = [ "session%d" % i for i in range( 0, 4 ) ]
+		threads = [ threading.Thread( target = render, args = ( h, i % 2 == 0 ) ) for i, h in enumerate( handles ) ]
+		for t in threads :
+			t.start()
+		for t in threads :
+			t.join()
+
+		expected = IECore.FloatVectorData( [ float( ( x // bucketSize + y // bucketSize ) * bucketSize ) for y in range( 0, 64 ) for x in range( 0, 64 ) ] )
+		for h in handles :
+			image = IECoreImage.ImageDisplayDriver.removeStoredImage( h )
+			self.assertEqual( image["Y"], expected )
+
+		statistics = self.server.statistics()
+		self.assertEqual( statistics.sessions, 4 )
+		self.assertEqual( statistics.bucketsReceived, 4 * 16 )
+		self.assertTrue( statistics.imageDataCalls <= statistics.bucketsReceived )
+		self.assertTrue( statistics.bytesReceived < statistics.uncompressedBytesReceived )
+
+	def testCoalescing( self ) :
+
+		def box( x, y, w, h ) :
+			return imath.Box2i( imath.V2i( x, y ), imath.V2i( x + w - 1, y + h - 1 ) )
+
+		# A row of buckets.
+		self.assertEqual(
+			IECoreImage.testDisplayDriverServerCoalescing( [ box( 0, 0, 16, 16 ), box( 16, 0, 16, 16 ), box( 32, 0, 8, 16 ) ], [ 4, 4, 4 ] ),
+			[ box( 0, 0, 40, 16 ) ]
+		)
+
+		# A column of buckets.
+		self.assertEqual(
+			IECoreImage.testDisplayDriverServerCoalescing( [ box( 0, 0, 16, 16 ), box( 0, 16, 16, 4 ) ], [ 3, 3 ] ),
+			[ box( 0, 0, 16, 20 ) ]
+		)
+
+		# A row followed by a bucket which is below the first bucket
+		# but not the whole row, so it starts a new run.
+		self.assertEqual(
+			IECoreImage.testDisplayDriverServerCoalescing( [ box( 0, 0, 16, 16 ), box( 16, 0, 16, 16 ), box( 0, 16, 16, 16 ) ], [ 1, 1, 1 ] ),
+			[ box( 0, 0, 32, 16 ), box( 0, 16, 16, 16 ) ]
+		)
+
+		# Buckets which don't touch, or have different heights.
+		self.assertEqual(
+			IECoreImage.testDisplayDriverServerCoalescing( [ box( 0, 0, 16, 16 ), box( 17, 0, 16, 16 ), box( 33, 0, 16, 8 ) ], [ 1, 1, 1 ] ),
+			[ box( 0, 0, 16, 16 ), box( 17, 0, 16, 16 ), box( 33, 0, 16, 8 ) ]
+		)
+
+		# Buckets with different numbers of channels.
+		self.assertEqual(
+			IECoreImage.testDisplayDriverServerCoalescing( [ box( 0, 0, 16, 16 ), box( 16, 0, 16, 16 ) ], [ 4, 3 ] ),
+			[ box( 0, 0, 16, 16 ), box( 16, 0, 16, 16 ) ]
+		)
+
+	def testCoalescedBuckets( self ) :
+
+		# A server with several threads, so that buckets may be received
+		# while others are being processed, and then coalesced.
+		server = IECoreImage.DisplayDriverServer( 1560, 4 )
+
+		window = imath.Box2i( imath.V2i( 0 ), imath.V2i( 1023 ) )
+		dd = IECoreImage.ClientDisplayDriver(
+			window, window,
+			[ "R", "G", "B", "A" ],
+			IECore.CompoundData( {
+				"displayHost" : "localhost",
+				"displayPort" : "1560",
+				"displayCompression" : IECore.BoolData( True ),
+				"remoteDisplayType" : "ImageDisplayDriver",
+				"handle" : "coalesced",
+			} )
+		)
+
+		# Decompressing and storing this large bucket keeps the session busy
+		# while the small buckets below arrive, so some of them are typically
+		# queued and coalesced. How many depends on timing, so we only check
+		# the pixels here, and the coalescing itself in testCoalescing().
+		dd.imageData( window, IECore.FloatVectorData( [ 0.5 ] * 1024 * 1024 * 4 ) )
+
+		bucketSize = 16
+		numBuckets = 0
+		for y in range( 0, 64, bucketSize ) :
+			for x in range( 0, 1024, bucketSize ) :
+				box = imath.Box2i( imath.V2i( x, y ), imath.V2i( x + bucketSize - 1, y + bucketSize - 1 ) )
+				dd.imageData( box, IECore.FloatVectorData( [ float( x + y ) ] * bucketSize * bucketSize * 4 ) )
+				numBuckets += 1
+
+		dd.imageClose()
+
+		image = IECoreImage.ImageDisplayDriver.removeStoredImage( "coalesced" )
+		for x, y, value in [ ( 0, 0, 0 ), ( 17, 0, 16 ), ( 40, 20, 48 ), ( 1023, 63, 1008 + 48 ), ( 0, 64, 0.5 ), ( 1023, 1023, 0.5 ) ] :
+			for c in [ "R", "G", "B", "A" ] :
+				self.assertEqual( image[c][y*1024+x], value )
+
+		statistics = server.statistics()
+		self.assertEqual( statistics.bucketsReceived, numBuckets + 1 )
+		self.assertLessEqual( statistics.imageDataCalls, statistics.bucketsReceived )
+
+		del dd, image, server
+
 	def tearDown( self ):
 
 		self.server = None
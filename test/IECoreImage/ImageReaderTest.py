@@ -330,6 +330,70 @@ class ImageReaderTest( unittest.TestCase ) :
 		self.assertEqual( type(r), IECoreImage.ImageReader )
 		self.assertFalse( r.isComplete() )
 
+	def testReadRegion( self ) :
+
+		r = IECoreImage.ImageReader( "test/IECoreImage/data/exr/uvMapWithDataWindow.100x100.exr" )
+		full = r.read()
+
+		region = imath.Box2i( imath.V2i( 20, 30 ), imath.V2i( 40, 35 ) )
+		r["dataWindow"].setTypedValue( region )
+		cropped = r.read()
+
+		self.assertTrue( cropped.channelsValid() )
+		self.assertEqual( cropped.dataWindow, imath.Box2i( imath.V2i( 25, 30 ), imath.V2i( 40, 35 ) ) )
+		self.assertEqual( cropped.displayWindow, full.displayWindow )
+
+		for c in [ "R", "G", "B" ] :
+			self.assertEqual( r.readChannel( c ), cropped[c] )
+			for y in range( 30, 36 ) :
+				for x in range( 25, 41 ) :
+					self.assertEqual(
+						cropped[c][(y-30)*16 + x - 25],
+						full[c][(y-25)*25 + x - 25]
+					)
+
+		r["dataWindow"].setTypedValue( imath.Box2i( imath.V2i( 0 ), imath.V2i( 10 ) ) )
+		empty = r.read()
+		self.assertTrue( empty.dataWindow.isEmpty() )
+		self.assertTrue( empty.channelsValid() )
+
+	def testReadChannels( self ) :
+
+		r = IECoreImage.ImageReader( "test/IECoreImage/data/exr/manyChannels.exr" )
+		names = r.channelNames()
+
+		for raw in ( False, True ) :
+			channels = r.readChannels( [ names[-1], names[0], names[0] ], raw )
+			self.assertEqual( len( channels ), 3 )
+			self.assertEqual( channels[0], r.readChannel( names[-1], raw ) )
+			self.assertEqual( channels[1], r.readChannel( names[0], raw ) )
+			self.assertEqual( channels[2], channels[1] )
+
+			# Several runs of contiguous channels, out of order and with repeats.
+			requested = [ names[3], names[1], names[2], names[-1], names[3], names[5] ]
+			channels = r.readChannels( requested, raw )
+			self.assertEqual( len( channels ), len( requested ) )
+			for name, channel in zip( requested, channels ) :
+				self.assertEqual( channel, r.readChannel( name, raw ) )
+
+		self.assertRaises( Exception, r.readChannels, [ "R", "notAChannel" ] )
+
+		r["channels"].setValue( IECore.StringVectorData( [ names[1], names[-2] ] ) )
+		i = r.read()
+		self.assertEqual( set( i.keys() ), set( [ names[1], names[-2] ] ) )
+		self.assertEqual( i[names[1]], r.readChannel( names[1] ) )
+		self.assertEqual( i[names[-2]], r.readChannel( names[-2] ) )
+
+	def testMipLevels( self ) :
+
+		r = IECoreImage.ImageReader( "test/IECoreImage/data/exr/uvMap.256x256.exr" )
+		self.assertEqual( r.numMipLevels(), 1 )
+		self.assertEqual( r.dataWindow( 0 ), r.dataWindow() )
+
+		r["mipLevel"].setNumericValue( 1 )
+		self.assertRaises( Exception, r.read )
+		self.assertRaises( Exception, r.dataWindow, 1 )
+
 	def setUp( self ) :
 
 		if os.path.isfile( "test/IECoreImage/data/exr/output.exr") :
@@ -33,6 +33,7 @@
 ##########################################################################
 
 import unittest
+import imath
 import IECore
 import IECoreImage
 
@@ -53,6 +54,47 @@ class ImageThinnerTest( unittest.TestCase ) :
 
 		self.failUnless( i==ii )
 
+	def testShapesTouchingBottomEdge( self ) :
+
+		# These images used to cause an infinite loop, because pixels
+		# on the bottom scanline were counted as deleted even when they
+		# had already been removed.
+
+		for size, pixels, expected in [
+			(
+				imath.V2i( 3, 3 ),
+				[
+					1, 0, 1,
+					0, 1, 0,
+					0, 1, 0,
+				],
+				[
+					1, 0, 1,
+					0, 1, 0,
+					0, 1, 0,
+				],
+			),
+			(
+				imath.V2i( 4, 2 ),
+				[
+					1, 1, 0, 1,
+					1, 0, 1, 0,
+				],
+				[
+					0, 1, 0, 1,
+					1, 0, 1, 0,
+				],
+			),
+		] :
+
+			window = imath.Box2i( imath.V2i( 0 ), size - imath.V2i( 1 ) )
+			i = IECoreImage.ImagePrimitive( window, window )
+			i["R"] = IECore.FloatVectorData( pixels )
+
+			IECoreImage.ImageThinner()( input = i, copyInput = False, channels = IECore.StringVectorData( [ "R" ] ) )
+
+			self.assertEqual( i["R"], IECore.FloatVectorData( expected ) )
+
 if __name__ == "__main__":
 	unittest.main()
 
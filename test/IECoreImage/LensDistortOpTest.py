@@ -34,6 +34,7 @@
 
 import sys
 import unittest
+import imath
 import IECore
 import IECoreImage
 
@@ -68,3 +69,47 @@ class LensDistortOpTest(unittest.TestCase):
 
 		self.assertEqual( img.displayWindow, img2.displayWindow )
 
+	def __lensModel( self ) :
+
+		o = IECore.CompoundObject()
+		o["lensModel"] = IECore.StringData( "StandardRadialLensModel" )
+		o["distortion"] = IECore.DoubleData( 0.2 )
+		o["anamorphicSqueeze"] = IECore.DoubleData( 1. )
+		o["curvatureX"] = IECore.DoubleData( 0.2 )
+		o["curvatureY"] = IECore.DoubleData( 0.5 )
+		o["quarticDistortion"] = IECore.DoubleData( .1 )
+
+		return o
+
+	def testRepeatable( self ) :
+
+		img = IECore.Reader.create( "test/IECoreImage/data/exr/uvMapWithDataWindow.100x100.exr" ).read()
+
+		op = IECoreImage.LensDistortOp()
+		op["mode"] = IECore.LensModel.Undistort
+		op["lensModel"].setValue( self.__lensModel() )
+
+		out = op( input = img )
+		self.assertTrue( out.channelsValid() )
+
+		# Results must not depend on how the work was scheduled.
+		self.assertEqual( op( input = img ), out )
+
+	@unittest.skipIf( IECore.isDebug(), "Skip performance testing in debug builds" )
+	def testPerformance( self ) :
+
+		window = imath.Box2i( imath.V2i( 0 ), imath.V2i( 3839, 2159 ) )
+		img = IECoreImage.ImagePrimitive( window, window )
+		numPixels = img.channelSize()
+		for i, c in enumerate( [ "R", "G", "B", "A" ] ) :
+			img[c] = IECore.FloatVectorData( [ 0.25 * ( i + 1 ) ] * numPixels )
+
+		op = IECoreImage.LensDistortOp()
+		op["mode"] = IECore.LensModel.Undistort
+		op["lensModel"].setValue( self.__lensModel() )
+
+		out = op( input = img )
+
+		self.assertTrue( out.channelsValid() )
+		self.assertEqual( out.displayWindow, window )
+
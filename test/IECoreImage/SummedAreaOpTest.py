@@ -54,5 +54,26 @@ class SummedAreaOpTest( unittest.TestCase ) :
 		self.assertEqual( yy[2], 4 )
 		self.assertEqual( yy[3], 10 )
 
+	def testLarge( self ) :
+
+		width = 317
+		height = 211
+
+		b = imath.Box2i( imath.V2i( 0 ), imath.V2i( width - 1, height - 1 ) )
+		i = IECoreImage.ImagePrimitive( b, b )
+		i["R"] = IECore.FloatVectorData( [ x % 7 for x in range( 0, width * height ) ] )
+		i["G"] = IECore.FloatVectorData( [ x % 5 for x in range( 0, width * height ) ] )
+
+		ii = IECoreImage.SummedAreaOp()( input=i, channels=IECore.StringVectorData( [ "R", "G" ] ) )
+
+		for c in ( "R", "G" ) :
+			expected = list( i[c] )
+			for y in range( 0, height ) :
+				rowSum = 0
+				for x in range( 0, width ) :
+					rowSum += expected[y*width+x]
+					expected[y*width+x] = rowSum + ( expected[(y-1)*width+x] if y else 0 )
+			self.assertEqual( list( ii[c] ), expected )
+
 if __name__ == "__main__":
     unittest.main()
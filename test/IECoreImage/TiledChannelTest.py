@@ -0,0 +1,283 @@
+##########################################################################
+#
+#  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import os
+import unittest
+import imath
+
+import IECore
+import IECoreImage
+
+class TiledChannelTest( unittest.TestCase ) :
+
+	def __pixels( self, dataWindow ) :
+
+		size = dataWindow.size() + imath.V2i( 1 )
+		return IECore.FloatVectorData( [ float( ( x * 7 + y * 13 ) % 17 ) for y in range( 0, size.y ) for x in range( 0, size.x ) ] )
+
+	def testConstant( self ) :
+
+		w = imath.Box2i( imath.V2i( 0 ), imath.V2i( 199, 99 ) )
+		c = IECoreImage.TiledChannel( w, 0.5 )
+
+		self.assertEqual( c.dataWindow(), w )
+		self.assertEqual( c.numTiles(), imath.V2i( 4, 2 ) )
+		self.assertEqual( c.numStoredTiles(), 0 )
+		self.assertEqual( c.tile( imath.V2i( 3, 1 ) ), 0.5 )
+		self.assertEqual( c.pixels(), IECore.FloatVectorData( [ 0.5 ] * 200 * 100 ) )
+
+	def testTileBounds( self ) :
+
+		w = imath.Box2i( imath.V2i( -10, 5 ), imath.V2i( 89, 74 ) )
+		c = IECoreImage.TiledChannel( w )
+
+		t = IECoreImage.TiledChannel.tileSize
+		self.assertEqual( c.numTiles(), imath.V2i( 2, 2 ) )
+		self.assertEqual( c.tileBound( imath.V2i( 0, 0 ) ), imath.Box2i( imath.V2i( -10, 5 ), imath.V2i( -10 + t - 1, 5 + t - 1 ) ) )
+		self.assertEqual( c.tileBound( imath.V2i( 1, 1 ) ), imath.Box2i( imath.V2i( -10 + t, 5 + t ), imath.V2i( 89, 74 ) ) )
+
+		self.assertRaises( Exception, c.tile, imath.V2i( 2, 0 ) )
+		self.assertRaises( Exception, c.tile, imath.V2i( -1, 0 ) )
+
+		self.assertEqual( IECoreImage.TiledChannel().numTiles(), imath.V2i( 0 ) )
+
+	def testPixels( self ) :
+
+		w = imath.Box2i( imath.V2i( 3, 4 ), imath.V2i( 202, 103 ) )
+		pixels = self.__pixels( w )
+		c = IECoreImage.TiledChannel( w, pixels )
+
+		self.assertEqual( c.pixels(), pixels )
+		self.assertEqual( c.numStoredTiles(), c.numTiles().x * c.numTiles().y )
+
+		r = imath.Box2i( imath.V2i( 0, 10 ), imath.V2i( 9, 12 ) )
+		p = c.readPixels( r )
+		self.assertEqual( len( p ), 30 )
+		for y in range( r.min().y, r.max().y + 1 ) :
+			for x in range( r.min().x, r.max().x + 1 ) :
+				i = ( y - r.min().y ) * 10 + x - r.min().x
+				if x < w.min().x :
+					self.assertEqual( p[i], 0 )
+				else :
+					self.assertEqual( p[i], pixels[(y-w.min().y) * 200 + x - w.min().x] )
+
+		self.assertRaises( Exception, IECoreImage.TiledChannel, w, IECore.FloatVectorData( [ 1 ] ) )
+
+	def testConstantTilesNotStored( self ) :
+
+		w = imath.Box2i( imath.V2i( 0 ), imath.V2i( 127, 63 ) )
+		pixels = IECore.FloatVectorData( [ 1 ] * 128 * 64 )
+		pixels[100] = 2
+
+		c = IECoreImage.TiledChannel( w, pixels )
+		self.assertEqual( c.numStoredTiles(), 1 )
+		self.assertEqual( c.tile( imath.V2i( 1, 0 ) ), 1 )
+		self.assertTrue( isinstance( c.tile( imath.V2i( 0, 0 ) ), IECore.FloatVectorData ) )
+		self.assertEqual( c.pixels(), pixels )
+
+		c.setTile( imath.V2i( 0, 0 ), IECore.FloatVectorData( [ 1 ] * 64 * 64 ) )
+		self.assertEqual( c.numStoredTiles(), 0 )
+		self.assertEqual( c, IECoreImage.TiledChannel( w, 1 ) )
+
+		c.setTile( imath.V2i( 1, 0 ), 3 )
+		self.assertEqual( c.tile( imath.V2i( 1, 0 ) ), 3 )
+		self.assertNotEqual( c, IECoreImage.TiledChannel( w, 1 ) )
+
+		self.assertRaises( Exception, c.setTile, imath.V2i( 0, 0 ), IECore.FloatVectorData( [ 1 ] ) )
+
+	def testCrop( self ) :
+
+		w = imath.Box2i( imath.V2i( 0 ), imath.V2i( 299, 199 ) )
+		pixels = self.__pixels( w )
+		c = IECoreImage.TiledChannel( w, pixels )
+
+		for window in [
+			imath.Box2i( imath.V2i( 64, 64 ), imath.V2i( 299, 199 ) ),
+			imath.Box2i( imath.V2i( 10, 20 ), imath.V2i( 100, 150 ) ),
+			imath.Box2i( imath.V2i( -20, -30 ), imath.V2i( 400, 230 ) ),
+		] :
+			cropped = c.crop( window )
+			self.assertEqual( cropped.dataWindow(), window )
+			self.assertEqual( cropped.pixels(), c.readPixels( window ) )
+
+		# Aligned crops share the original tiles rather than
+		# copying them.
+		cropped = c.crop( imath.Box2i( imath.V2i( 64, 64 ), imath.V2i( 299, 199 ) ) )
+		self.assertEqual( cropped.numStoredTiles(), 12 )
+
+	def testSetOrigin( self ) :
+
+		w = imath.Box2i( imath.V2i( 5, 6 ), imath.V2i( 104, 105 ) )
+		pixels = self.__pixels( w )
+		c = IECoreImage.TiledChannel( w, pixels ).crop( imath.Box2i( imath.V2i( 10, 10 ), imath.V2i( 99, 99 ) ) )
+		expected = c.pixels()
+
+		c = IECoreImage.TiledChannel( w, pixels ).crop( imath.Box2i( imath.V2i( 10, 10 ), imath.V2i( 99, 99 ) ) )
+		c.setOrigin( imath.V2i( 0 ) )
+		self.assertEqual( c.dataWindow(), imath.Box2i( imath.V2i( 0 ), imath.V2i( 89 ) ) )
+		self.assertEqual( c.pixels(), expected )
+
+	def testData( self ) :
+
+		w = imath.Box2i( imath.V2i( 0 ), imath.V2i( 99 ) )
+		d = IECoreImage.TiledChannelData( IECoreImage.TiledChannel( w, self.__pixels( w ) ) )
+		self.assertEqual( d.value.dataWindow(), w )
+		self.assertEqual( d, d.copy() )
+		self.assertEqual( d.hash(), d.copy().hash() )
+
+		d2 = d.copy()
+		d2.value.setTile( imath.V2i( 0 ), 1 )
+		self.assertNotEqual( d, d2 )
+		self.assertNotEqual( d.hash(), d2.hash() )
+
+		image = IECoreImage.ImagePrimitive( w, w )
+		self.assertTrue( image.channelValid( d ) )
+		self.assertFalse( image.channelValid( IECoreImage.TiledChannelData( IECoreImage.TiledChannel( imath.Box2i( imath.V2i( 0 ), imath.V2i( 10 ) ) ) ) ) )
+
+		image["R"] = d
+		image["G"] = IECoreImage.TiledChannelData( IECoreImage.TiledChannel( w, 0.25 ) )
+		self.assertTrue( image.channelsValid() )
+
+		IECore.ObjectWriter( image, "test/IECoreImage/tiledChannel.cob" ).write()
+		image2 = IECore.ObjectReader( "test/IECoreImage/tiledChannel.cob" ).read()
+		self.assertEqual( image2, image )
+		self.assertEqual( image2["G"].value.numStoredTiles(), 0 )
+
+	def testReader( self ) :
+
+		fileName = "test/IECoreImage/data/exr/uvMapWithDataWindow.100x100.exr"
+		expected = IECoreImage.ImageReader( fileName ).read()
+
+		reader = IECoreImage.ImageReader( fileName )
+		reader["tiled"].setTypedValue( True )
+		image = reader.read()
+
+		self.assertTrue( image.channelsValid() )
+		self.assertEqual( image.keys(), expected.keys() )
+		for name in image.keys() :
+			self.assertTrue( isinstance( image[name], IECoreImage.TiledChannelData ) )
+			self.assertEqual( image[name].value.numStoredTiles(), 0 )
+			self.assertEqual( image[name].value.pixels(), expected[name] )
+
+		reader["rawChannels"].setTypedValue( True )
+		self.assertRaises( RuntimeError, reader.read )
+
+	def testReaderAfterFileModification( self ) :
+
+		w = imath.Box2i( imath.V2i( 0 ), imath.V2i( 99 ) )
+		for value in ( 0.25, 0.75 ) :
+
+			image = IECoreImage.ImagePrimitive( w, w )
+			image["R"] = IECore.FloatVectorData( [ value ] * 100 * 100 )
+			IECoreImage.ImageWriter( image, "test/IECoreImage/tiledChannel.exr" ).write()
+
+			reader = IECoreImage.ImageReader( "test/IECoreImage/tiledChannel.exr" )
+			reader["tiled"].setTypedValue( True )
+			tiledImage = reader.read()
+			del reader
+
+			self.assertEqual( tiledImage["R"].value.pixels(), image["R"] )
+
+	def testWriter( self ) :
+
+		fileName = "test/IECoreImage/data/exr/uvMapWithDataWindow.100x100.exr"
+		expected = IECoreImage.ImageReader( fileName ).read()
+
+		reader = IECoreImage.ImageReader( fileName )
+		reader["tiled"].setTypedValue( True )
+		image = reader.read()
+
+		self.assertTrue( IECoreImage.ImageWriter.canWrite( image, "test/IECoreImage/tiledChannel.exr" ) )
+		IECoreImage.ImageWriter( image, "test/IECoreImage/tiledChannel.exr" ).write()
+
+		written = IECoreImage.ImageReader( "test/IECoreImage/tiledChannel.exr" ).read()
+		written.blindData().clear()
+		expected.blindData().clear()
+		self.assertEqual( written, expected )
+
+	def testCropOp( self ) :
+
+		fileName = "test/IECoreImage/data/exr/colorBarsWithDataWindow.exr"
+		image = IECoreImage.ImageReader( fileName ).read()
+
+		tiledImage = image.copy()
+		for name in tiledImage.keys() :
+			tiledImage[name] = IECoreImage.TiledChannelData( IECoreImage.TiledChannel( tiledImage.dataWindow, tiledImage[name] ) )
+
+		for cropBox in [
+			imath.Box2i( imath.V2i( 855, 170 ), imath.V2i( 1460, 1465 ) ),
+			imath.Box2i( imath.V2i( -10, -10 ), imath.V2i( 3000, 3000 ) ),
+		] :
+			for resetOrigin in ( True, False ) :
+				for matchDataWindow in ( True, False ) :
+
+					op = IECoreImage.ImageCropOp()
+					op["cropBox"].setTypedValue( cropBox )
+					op["resetOrigin"].setTypedValue( resetOrigin )
+					op["matchDataWindow"].setTypedValue( matchDataWindow )
+
+					expected = op( input = image )
+					cropped = op( input = tiledImage )
+
+					self.assertTrue( cropped.channelsValid() )
+					self.assertEqual( cropped.dataWindow, expected.dataWindow )
+					self.assertEqual( cropped.displayWindow, expected.displayWindow )
+					for name in expected.keys() :
+						self.assertTrue( isinstance( cropped[name], IECoreImage.TiledChannelData ) )
+						self.assertEqual( cropped[name].value.pixels(), expected[name] )
+
+	def testChannelOp( self ) :
+
+		w = imath.Box2i( imath.V2i( 0 ), imath.V2i( 99 ) )
+		image = IECoreImage.ImagePrimitive( w, w )
+		image["R"] = IECore.FloatVectorData( [ float( i % 5 ) for i in range( 0, 100 * 100 ) ] )
+		tiledImage = image.copy()
+		tiledImage["R"] = IECoreImage.TiledChannelData( IECoreImage.TiledChannel( w, image["R"] ) )
+
+		op = IECoreImage.ClampOp()
+		expected = op( input = image, channels = IECore.StringVectorData( [ "R" ] ), min = 1, max = 3 )
+		clamped = op( input = tiledImage, channels = IECore.StringVectorData( [ "R" ] ), min = 1, max = 3 )
+
+		self.assertTrue( isinstance( clamped["R"], IECoreImage.TiledChannelData ) )
+		self.assertEqual( clamped["R"].value.pixels(), expected["R"] )
+
+	def tearDown( self ) :
+
+		for f in [ "test/IECoreImage/tiledChannel.cob", "test/IECoreImage/tiledChannel.exr" ] :
+			if os.path.exists( f ) :
+				os.remove( f )
+
+if __name__ == "__main__":
+	unittest.main()
@@ -105,6 +105,7 @@ from ClippingPlaneTest import ClippingPlaneTest
 from MeshAlgoTest import *
 from CurvesAlgoTest import *
 from PointsAlgoTest import *
+from SceneAlgoTest import SceneAlgoTest
 from ObjectInterpolationTest import ObjectInterpolationTest
 
 if IECore.withFreeType() :
@@ -1246,6 +1246,32 @@ class CurvesPrimitiveEvaluatorTest( unittest.TestCase ) :
 
 		IECoreScene.testCurvesPrimitiveEvaluatorParallelClosestPoint()
 
+	def testBatchClosestPoint( self ) :
+
+		c = IECoreScene.CurvesPrimitive(
+			IECore.IntVectorData( [ 2, 2 ] ),
+			IECore.CubicBasisf.linear(),
+			False,
+			IECore.V3fVectorData( [ imath.V3f( 0, 0, 0 ), imath.V3f( 0, 2, 0 ), imath.V3f( 1, 0, 0 ), imath.V3f( 1, 2, 0 ) ] )
+		)
+		e = IECoreScene.CurvesPrimitiveEvaluator( c )
+		r = e.createResult()
+
+		points = IECore.V3fVectorData( [ imath.V3f( -1, 0.5, 0 ), imath.V3f( 2, 1.5, 1 ), imath.V3f( 0.25, 3, 0 ) ] )
+		results = e.batchClosestPoint( points )
+
+		self.assertEqual( results["success"], IECore.BoolVectorData( [ True ] * 3 ) )
+		self.assertEqual( results["elementIndex"], IECore.IntVectorData( [ 0, 1, 0 ] ) )
+		for i, p in enumerate( points ) :
+			self.assertTrue( e.closestPoint( p, r ) )
+			self.assertTrue( results["point"][i].equalWithAbsError( r.point(), 1e-6 ) )
+			self.assertTrue( results["uv"][i].equalWithAbsError( r.uv(), 1e-6 ) )
+			self.assertAlmostEqual( results["distance"][i], ( r.point() - p ).length(), 5 )
+
+		# Curves don't provide normals.
+		self.assertEqual( results["normal"], IECore.V3fVectorData( [ imath.V3f( 0 ) ] * 3 ) )
+		self.assertRaises( RuntimeError, e.batchSignedDistance, points )
+
 if __name__ == "__main__":
 	unittest.main()
 
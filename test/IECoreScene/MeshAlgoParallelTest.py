@@ -0,0 +1,98 @@
+##########################################################################
+#
+#  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import unittest
+import imath
+
+import IECore
+import IECoreScene
+
+class MeshAlgoParallelTest( unittest.TestCase ) :
+
+	resolutions = [ 50 ]
+
+	def __meshes( self ) :
+
+		for resolution in self.resolutions :
+
+			mesh = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( resolution ) )
+			mesh["Pref"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex, mesh["P"].data.copy() )
+			p = mesh["P"].data
+			for i in range( 0, len( p ), 7 ) :
+				p[i] += imath.V3f( 0, 0, 0.001 * ( i % 13 ) )
+
+			yield mesh
+
+	def __assertRepeatable( self, f ) :
+
+		# Results must not depend on how the work was scheduled.
+		result = f()
+		self.assertEqual( f(), result )
+
+		return result
+
+	def test( self ) :
+
+		for mesh in self.__meshes() :
+
+			self.__assertRepeatable( lambda : IECoreScene.MeshAlgo.calculateFaceArea( mesh ) )
+			self.__assertRepeatable( lambda : IECoreScene.MeshAlgo.calculateFaceTextureArea( mesh ) )
+			self.__assertRepeatable( lambda : IECoreScene.MeshAlgo.calculateDistortion( mesh ) )
+
+			for interpolation in ( IECoreScene.PrimitiveVariable.Interpolation.Uniform, IECoreScene.PrimitiveVariable.Interpolation.Vertex ) :
+				def resample() :
+					primitiveVariable = IECoreScene.PrimitiveVariable( mesh["uv"] )
+					IECoreScene.MeshAlgo.resamplePrimitiveVariable( mesh, primitiveVariable, interpolation )
+					return primitiveVariable
+				self.__assertRepeatable( resample )
+
+			def reverseWinding() :
+				m = mesh.copy()
+				IECoreScene.MeshAlgo.reverseWinding( m )
+				return m
+			reversedMesh = self.__assertRepeatable( reverseWinding )
+			IECoreScene.MeshAlgo.reverseWinding( reversedMesh )
+			self.assertEqual( reversedMesh, mesh )
+
+			triangulated = IECoreScene.TriangulateOp()( input = mesh )
+			self.__assertRepeatable( lambda : IECoreScene.MeshAlgo.calculateTangents( triangulated ) )
+
+@unittest.skipIf( IECore.isDebug(), "Skip performance testing in debug builds" )
+class MeshAlgoPerformanceTest( MeshAlgoParallelTest ) :
+
+	resolutions = [ 1000 ]
+
+if __name__ == "__main__":
+	unittest.main()
@@ -370,6 +370,131 @@ class TestMeshPrimitiveEvaluator( unittest.TestCase ) :
 					hits = mpe.intersectionPoints( origin, direction )
 					self.failIf( hits )
 
+	def testBVH( self ) :
+
+		random.seed( 2 )
+
+		P = IECore.V3fVectorData( [ imath.V3f( random.uniform( -10, 10 ), random.uniform( -10, 10 ), random.uniform( -10, 10 ) ) for i in range( 0, 3000 ) ] )
+		m = IECoreScene.MeshPrimitive( IECore.IntVectorData( [ 3 ] * 1000 ), IECore.IntVectorData( range( 0, 3000 ) ) )
+		m["P"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex, P )
+
+		kdTree = IECoreScene.MeshPrimitiveEvaluator( m )
+		bvh = IECoreScene.MeshPrimitiveEvaluator( m, IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.BVH )
+
+		self.assertEqual( kdTree.accelerationStructure(), IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.KDTree )
+		self.assertEqual( bvh.accelerationStructure(), IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.BVH )
+
+		r1 = kdTree.createResult()
+		r2 = bvh.createResult()
+
+		for i in range( 0, 500 ) :
+
+			p = imath.V3f( random.uniform( -12, 12 ), random.uniform( -12, 12 ), random.uniform( -12, 12 ) )
+			self.assertTrue( kdTree.closestPoint( p, r1 ) )
+			self.assertTrue( bvh.closestPoint( p, r2 ) )
+			self.assertAlmostEqual( ( r1.point() - p ).length(), ( r2.point() - p ).length(), 4 )
+
+			d = imath.V3f( random.uniform( -1, 1 ), random.uniform( -1, 1 ), random.uniform( -1, 1 ) )
+			hit = kdTree.intersectionPoint( p, d, r1 )
+			self.assertEqual( bvh.intersectionPoint( p, d, r2 ), hit )
+			if hit :
+				self.assertTrue( r1.point().equalWithAbsError( r2.point(), 1e-4 ) )
+
+			self.assertEqual(
+				sorted( x.triangleIndex() for x in kdTree.intersectionPoints( p, d, 5 ) ),
+				sorted( x.triangleIndex() for x in bvh.intersectionPoints( p, d, 5 ) ),
+			)
+
+		empty = IECoreScene.MeshPrimitive()
+		empty["P"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex, IECore.V3fVectorData() )
+		e = IECoreScene.MeshPrimitiveEvaluator( empty, IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.BVH )
+		r = e.createResult()
+		self.assertFalse( e.closestPoint( imath.V3f( 0 ), r ) )
+		self.assertFalse( e.intersectionPoint( imath.V3f( 0 ), imath.V3f( 1, 0, 0 ), r ) )
+
+	def __compareBatchQueries( self, resolution, numPoints ) :
+
+		mesh = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( resolution ) )
+		mesh = IECoreScene.TriangulateOp()( input = mesh )
+		p = mesh["P"].data
+		for i in range( 0, len( p ), 7 ) :
+			p[i] += imath.V3f( 0, 0, 0.01 * ( i % 13 ) )
+
+		random.seed( 0 )
+		points = IECore.V3fVectorData( [ imath.V3f( random.uniform( -1, 1 ), random.uniform( -1, 1 ), random.uniform( -1, 1 ) ) for i in range( 0, numPoints ) ] )
+		directions = IECore.V3fVectorData( [ imath.V3f( 0, 0, -1 ) ] * numPoints )
+
+		results = {}
+		for accelerationStructure in IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.values.values() :
+
+			evaluator = IECoreScene.MeshPrimitiveEvaluator( mesh, accelerationStructure )
+			closest = evaluator.batchClosestPoint( points )
+			intersections = evaluator.batchIntersectionPoint( points, directions )
+
+			results[accelerationStructure] = ( closest, intersections )
+
+		kdTree = results[IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.KDTree]
+		bvh = results[IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.BVH]
+
+		self.assertEqual( kdTree[0]["success"], bvh[0]["success"] )
+		self.assertEqual( kdTree[1]["success"], bvh[1]["success"] )
+		for i in range( 0, 2 ) :
+			for a, b in zip( kdTree[i]["distance"], bvh[i]["distance"] ) :
+				self.assertAlmostEqual( a, b, 4 )
+
+	def testBVHBatchQueries( self ) :
+
+		self.__compareBatchQueries( resolution = 20, numPoints = 1000 )
+
+	@unittest.skipIf( IECore.isDebug(), "Skip performance testing in debug builds" )
+	def testBVHPerformance( self ) :
+
+		self.__compareBatchQueries( resolution = 316, numPoints = 100000 )
+
+	def testBatchQueries( self ) :
+
+		m = IECore.Reader.create( "test/IECore/data/cobFiles/pSphereShape1.cob" ).read()
+		mpe = IECoreScene.PrimitiveEvaluator.create( m )
+		r = mpe.createResult()
+
+		random.seed( 1 )
+		points = IECore.V3fVectorData( [ 3 * imath.V3f( random.uniform( -1, 1 ), random.uniform( -1, 1 ), random.uniform( -1, 1 ) ) for i in range( 0, 1000 ) ] )
+		directions = IECore.V3fVectorData( [ -p.normalized() for p in points ] )
+
+		closest = mpe.batchClosestPoint( points )
+		signed = mpe.batchSignedDistance( points )
+		intersections = mpe.batchIntersectionPoint( points, directions )
+
+		for i, p in enumerate( points ) :
+
+			self.assertEqual( closest["success"][i], mpe.closestPoint( p, r ) )
+			self.assertEqual( closest["point"][i], r.point() )
+			self.assertEqual( closest["normal"][i], r.normal() )
+			self.assertEqual( closest["elementIndex"][i], r.triangleIndex() )
+			self.assertAlmostEqual( closest["distance"][i], ( r.point() - p ).length(), 5 )
+
+			self.assertAlmostEqual( signed["distance"][i], mpe.signedDistance( p, r ), 5 )
+
+			self.assertEqual( intersections["success"][i], mpe.intersectionPoint( p, directions[i], r ) )
+			if intersections["success"][i] :
+				self.assertEqual( intersections["point"][i], r.point() )
+				self.assertEqual( intersections["elementIndex"][i], r.triangleIndex() )
+			else :
+				self.assertEqual( intersections["elementIndex"][i], -1 )
+
+		m = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 10 ) )
+		mpe = IECoreScene.PrimitiveEvaluator.create( m )
+		uvs = IECore.V2fVectorData( [ imath.V2f( random.uniform( -0.5, 1.5 ), random.uniform( -0.5, 1.5 ) ) for i in range( 0, 1000 ) ] )
+
+		results = mpe.batchPointAtUV( uvs )
+		for i, uv in enumerate( uvs ) :
+			self.assertEqual( results["success"][i], mpe.pointAtUV( uv, r ) )
+			if results["success"][i] :
+				self.assertTrue( results["point"][i].equalWithAbsError( r.point(), 1e-6 ) )
+				self.assertTrue( results["uv"][i].equalWithAbsError( uv, 1e-5 ) )
+
+		self.assertRaises( RuntimeError, mpe.batchIntersectionPoint, points, IECore.V3fVectorData() )
+
 if __name__ == "__main__":
 	unittest.main()
 
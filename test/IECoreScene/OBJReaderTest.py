@@ -34,6 +34,8 @@
 
 import unittest
 import sys
+import os
+import imath
 import IECore
 import IECoreScene
 
@@ -67,8 +69,17 @@ class TestOBJReader( unittest.TestCase ) :
 		self.assertEqual( len( mesh ), 4 )
 		self.failUnless( "P" in mesh )
 		self.failUnless( "N" in mesh )
-		self.failUnless( "s" in mesh )
-		self.failUnless( "t" in mesh )
+		self.failUnless( "uv" in mesh )
+
+		self.assertEqual( mesh["uv"].interpolation, IECoreScene.PrimitiveVariable.Interpolation.FaceVarying )
+		self.assertEqual( mesh["uv"].data.getInterpretation(), IECore.GeometricData.Interpretation.UV )
+		self.assertEqual( mesh["uv"].data, IECore.V2fVectorData( [ imath.V2f( 0 ), imath.V2f( 1, 0 ), imath.V2f( 1 ) ], IECore.GeometricData.Interpretation.UV ) )
+		self.assertEqual( mesh["uv"].indices, IECore.IntVectorData( [ 0, 1, 2 ] ) )
+
+		self.assertEqual( mesh["N"].interpolation, IECoreScene.PrimitiveVariable.Interpolation.FaceVarying )
+		self.assertEqual( mesh["N"].data.getInterpretation(), IECore.GeometricData.Interpretation.Normal )
+		self.assertEqual( mesh["N"].data, IECore.V3fVectorData( [ imath.V3f( 1, 0, 0 ), imath.V3f( 0, 1, 0 ) ], IECore.GeometricData.Interpretation.Normal ) )
+		self.assertEqual( mesh["N"].indices, IECore.IntVectorData( [ 0, 1, 1 ] ) )
 
 	def testReadNoTexture( self ) :
 
@@ -97,6 +108,99 @@ class TestOBJReader( unittest.TestCase ) :
 		self.failUnless( mesh.isInstanceOf( IECoreScene.MeshPrimitive.staticTypeId() ) )
 		self.failUnless( mesh.arePrimitiveVariablesValid() )
 
+		# Faces use negative indices, relative to the vertices read so far.
+		self.assertEqual( mesh.verticesPerFace, IECore.IntVectorData( [ 3, 3, 3 ] ) )
+		self.assertEqual( mesh.vertexIds, IECore.IntVectorData( range( 0, 9 ) ) )
+
+	def testPrimVarNames( self ) :
+
+		r = IECore.Reader.create( "test/IECore/data/obj/triangle_normals.obj" )
+		r["primVarNames"].setValue( IECore.StringVectorData( [ "uv" ] ) )
+
+		mesh = r.read()
+		self.failUnless( mesh.arePrimitiveVariablesValid() )
+		self.assertEqual( set( mesh.keys() ), { "P", "uv" } )
+
+		r["primVarNames"].setValue( IECore.StringVectorData() )
+		mesh = r.read()
+		self.assertEqual( mesh.keys(), [ "P" ] )
+		self.assertEqual( mesh.vertexIds, IECore.IntVectorData( [ 0, 1, 2 ] ) )
+
+	def testPartialNormals( self ) :
+
+		with open( self.__fileName, "w" ) as f :
+			f.write(
+				"v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\n"
+				"vn 0 0 1\n"
+				"f 1//1 2//1 3//1\n"
+				"f 1 3 4\n"
+			)
+
+		mesh = IECoreScene.OBJReader( self.__fileName ).read()
+		self.failUnless( mesh.arePrimitiveVariablesValid() )
+		self.failIf( "uv" in mesh )
+
+		# Vertices without normals get a zero normal.
+		self.assertEqual( mesh["N"].data, IECore.V3fVectorData( [ imath.V3f( 0, 0, 1 ), imath.V3f( 0 ) ], IECore.GeometricData.Interpretation.Normal ) )
+		self.assertEqual( mesh["N"].indices, IECore.IntVectorData( [ 0, 0, 0, 1, 1, 1 ] ) )
+
+	def testInvalidFaces( self ) :
+
+		for face in [ "f 1 2", "f 1 2 4", "f 1/1 2 3", "f 0 1 2", "f 1 2 3x" ] :
+			with open( self.__fileName, "w" ) as f :
+				f.write( "v 0 0 0\nv 1 0 0\nv 1 1 0\nvt 0 0\n" + face + "\n" )
+			self.assertRaises( RuntimeError, IECoreScene.OBJReader( self.__fileName ).read )
+
+	def testMissingFile( self ) :
+
+		self.assertRaises( RuntimeError, IECoreScene.OBJReader( "/tmp/iDontExist.obj" ).read )
+
+	def testLargeFile( self ) :
+
+		# A grid of quads, large enough to be split into several chunks,
+		# and written with a mixture of absolute and relative indices.
+
+		size = 400
+		lines = []
+		for y in range( 0, size + 1 ) :
+			for x in range( 0, size + 1 ) :
+				lines.append( "v %f %f 0.5e-1" % ( x, y ) )
+				lines.append( "vt %f %f" % ( x / float( size ), y / float( size ) ) )
+		lines.append( "vn 0 0 1" )
+		for y in range( 0, size ) :
+			for x in range( 0, size ) :
+				i = y * ( size + 1 ) + x + 1
+				lines.append( "f %d/%d/1 %d/%d/1 %d/%d/-1 %d/%d/-1" % ( i, i, i + 1, i + 1, i + size + 2, i + size + 2, i + size + 1, i + size + 1 ) )
+			# Repeat the last face using relative indices.
+			lines.append( "f -%d/-%d/1 -1/-1/1 -%d/-%d/1" % ( ( size + 1 ) ** 2, ( size + 1 ) ** 2, size + 1, size + 1 ) )
+
+		with open( self.__fileName, "w" ) as f :
+			f.write( "\n".join( lines ) + "\n" )
+
+		mesh = IECoreScene.OBJReader( self.__fileName ).read()
+
+		self.failUnless( mesh.arePrimitiveVariablesValid() )
+		self.assertEqual( mesh.numFaces(), size * size + size )
+		self.assertEqual( mesh.variableSize( IECoreScene.PrimitiveVariable.Interpolation.Vertex ), ( size + 1 ) ** 2 )
+		self.assertEqual( mesh["P"].data[size+2], imath.V3f( 1, 1, 0.05 ) )
+		self.assertEqual( mesh["uv"].indices, mesh.vertexIds )
+		self.assertEqual( mesh["N"].data, IECore.V3fVectorData( [ imath.V3f( 0, 0, 1 ) ], IECore.GeometricData.Interpretation.Normal ) )
+
+		# The relative indices are resolved against the vertices read
+		# so far, so the extra faces are all identical.
+		vertexIds = list( mesh.vertexIds )
+		self.assertEqual( vertexIds[-3:], [ 0, ( size + 1 ) ** 2 - 1, ( size + 1 ) ** 2 - size - 1 ] )
+		self.assertEqual( vertexIds[4*size:4*size+3], vertexIds[-3:] )
+
+	def setUp( self ) :
+
+		self.__fileName = "/tmp/objReaderTest.obj"
+
+	def tearDown( self ) :
+
+		if os.path.exists( self.__fileName ) :
+			os.remove( self.__fileName )
+
 if __name__ == "__main__":
 
 	unittest.main()
@@ -77,6 +77,21 @@ class PointsPrimitiveEvaluatorTest( unittest.TestCase ) :
 		self.assertEqual( r.colorPrimVar( p["Cs"] ), imath.Color3f( 5, 0, 0 ) )
 		self.assertEqual( r.stringPrimVar( p["names"] ), "a" )
 
+	def testBatchClosestPoint( self ) :
+
+		p = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( x, 0, 0 ) for x in range( 0, 5 ) ] ) )
+		e = IECoreScene.PointsPrimitiveEvaluator( p )
+
+		results = e.batchClosestPoint( IECore.V3fVectorData( [ imath.V3f( -1, -1, 0 ), imath.V3f( 3.2, 1, 0 ) ] ) )
+		self.assertEqual( results["success"], IECore.BoolVectorData( [ True, True ] ) )
+		self.assertEqual( results["elementIndex"], IECore.IntVectorData( [ 0, 3 ] ) )
+		self.assertEqual( results["point"], IECore.V3fVectorData( [ imath.V3f( 0 ), imath.V3f( 3, 0, 0 ) ] ) )
+		# Points don't provide normals or uvs.
+		self.assertEqual( results["normal"], IECore.V3fVectorData( [ imath.V3f( 0 ) ] * 2 ) )
+		self.assertEqual( results["uv"], IECore.V2fVectorData( [ imath.V2f( 0 ) ] * 2 ) )
+
+		self.assertRaises( RuntimeError, e.batchSignedDistance, IECore.V3fVectorData( [ imath.V3f( 0 ) ] ) )
+
 if __name__ == "__main__":
 	unittest.main()
 
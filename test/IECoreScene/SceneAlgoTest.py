@@ -0,0 +1,129 @@
+##########################################################################
+#
+#  Copyright (c) 2018, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the following disclaimer.
+#
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#     * Neither the name of Image Engine Design nor the names of any
+#       other contributors to this software may be used to endorse or
+#       promote products derived from this software without specific prior
+#       written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+
+import os
+import unittest
+import imath
+
+import IECore
+import IECoreScene
+
+class SceneAlgoTest( unittest.TestCase ) :
+
+	def writeScene( self ) :
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		for i in range( 0, 3 ) :
+			a = m.createChild( "a%d" % i )
+			a.writeAttribute( "w", IECore.BoolData( True ), 0 )
+			for j in range( 0, 4 ) :
+				b = a.createChild( "b%d" % j )
+				for time in ( 0, 1 ) :
+					b.writeObject( IECoreScene.SpherePrimitive( i + j + time ), time )
+					b.writeTransform( IECore.M44dData( imath.M44d().translate( imath.V3d( j, time, 0 ) ) ), time )
+
+	def testReadAll( self ) :
+
+		self.writeScene()
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		self.assertEqual( IECoreScene.SceneAlgo.parallelReadAll( m, [ 0, 0.5, 1 ] ), 16 )
+		self.assertEqual( IECoreScene.SceneAlgo.parallelReadAll( m.child( "a1" ), [ 0 ] ), 5 )
+
+	def testFilter( self ) :
+
+		self.writeScene()
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+
+		f = IECore.PathMatcher( [ "/a0/b1", "/a2/..." ] )
+		self.assertEqual( IECoreScene.SceneAlgo.parallelReadAll( m, [ 0 ], filter = f ), 6 )
+
+		f = IECore.PathMatcher( [ "/a1/*" ] )
+		self.assertEqual( IECoreScene.SceneAlgo.parallelReadAll( m.child( "a1" ), [ 0 ], filter = f ), 4 )
+
+		self.assertEqual( IECoreScene.SceneAlgo.parallelReadAll( m, [ 0 ], filter = IECore.PathMatcher() ), 0 )
+
+	def testPrefetch( self ) :
+
+		self.writeScene()
+
+		pool = IECore.ObjectPool.defaultObjectPool()
+		pool.clear()
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		IECoreScene.SceneAlgo.parallelReadAll( m, [ 0, 1 ], IECoreScene.SceneAlgo.ProcessFlags.Objects )
+		memoryUsage = pool.memoryUsage()
+		self.assertGreater( memoryUsage, 0 )
+
+		# Reading the prefetched objects should be served from the pool.
+		self.assertEqual( m.scene( [ "a1", "b2" ] ).readObject( 1 ), IECoreScene.SpherePrimitive( 4 ) )
+		self.assertEqual( pool.memoryUsage(), memoryUsage )
+
+	def testMatchingPaths( self ) :
+
+		self.writeScene()
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+
+		f = IECore.PathMatcher( [ "/a0/b1", "/a2/*", "/a1/b9" ] )
+		self.assertEqual(
+			IECoreScene.SceneAlgo.matchingPaths( f, m ),
+			IECore.PathMatcher( [ "/a0/b1", "/a2/b0", "/a2/b1", "/a2/b2", "/a2/b3" ] )
+		)
+
+		f = IECore.PathMatcher( [ "/.../b3" ] )
+		self.assertEqual(
+			IECoreScene.SceneAlgo.matchingPaths( f, m ),
+			IECore.PathMatcher( [ "/a0/b3", "/a1/b3", "/a2/b3" ] )
+		)
+
+		self.assertEqual( IECoreScene.SceneAlgo.matchingPaths( f, m.child( "a1" ) ), IECore.PathMatcher( [ "/a1/b3" ] ) )
+		self.assertTrue( IECoreScene.SceneAlgo.matchingPaths( IECore.PathMatcher(), m ).isEmpty() )
+
+	def testExceptions( self ) :
+
+		self.writeScene()
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		self.assertRaises( RuntimeError, IECoreScene.SceneAlgo.parallelReadAll, m, [ 0 ] )
+
+	def tearDown( self ) :
+
+		if os.path.exists( "/tmp/test.scc" ) :
+			os.remove( "/tmp/test.scc" )
+
+if __name__ == "__main__":
+	unittest.main()
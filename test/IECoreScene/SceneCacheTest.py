@@ -33,8 +33,10 @@
 ##########################################################################
 
 import gc
+import os
 import sys
 import math
+import threading
 import unittest
 import imath
 
@@ -916,6 +918,203 @@ class SceneCacheTest( unittest.TestCase ) :
 
 		IECoreScene.testSceneCacheParallelFakeAttributeRead()
 
+	def testThreadedPythonReads( self ) :
+
+		# The SceneInterface bindings release the GIL, so reads from
+		# several Python threads must match the same reads made serially.
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		for i in range( 0, 16 ) :
+			c = m.createChild( str( i ) )
+			plane = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 200 ) )
+			plane["P"].data[0] = imath.V3f( i )
+			c.writeObject( plane, 0 )
+			c.writeTransform( IECore.M44dData( imath.M44d().translate( imath.V3d( i, 0, 0 ) ) ), 0 )
+		del m, c
+
+		def read( scene, names, results ) :
+			for name in names :
+				c = scene.child( name )
+				results[name] = ( c.readObject( 0 ), c.readTransformAsMatrix( 0 ), c.readBound( 0 ) )
+
+		names = [ str( i ) for i in range( 0, 16 ) ]
+
+		# Both passes start from cold caches, so that the threaded pass
+		# actually loads the objects rather than retrieving the ones
+		# loaded by the serial pass from the ObjectPool.
+
+		IECore.ObjectPool.defaultObjectPool().clear()
+		IECoreScene.SharedSceneInterfaces.clear()
+		m = IECoreScene.SharedSceneInterfaces.get( "/tmp/test.scc" )
+		serialResults = {}
+		read( m, names, serialResults )
+
+		IECore.ObjectPool.defaultObjectPool().clear()
+		IECoreScene.SharedSceneInterfaces.clear()
+		m = IECoreScene.SharedSceneInterfaces.get( "/tmp/test.scc" )
+		threadedResults = {}
+		threads = [
+			threading.Thread( target = read, args = ( m, names[i::4], threadedResults ) )
+			for i in range( 0, 4 )
+		]
+		for thread in threads :
+			thread.start()
+		for thread in threads :
+			thread.join()
+
+		self.assertEqual( sorted( threadedResults.keys() ), sorted( names ) )
+		for name in names :
+			self.assertEqual( threadedResults[name], serialResults[name] )
+
+	def testThreadedPythonWrites( self ) :
+
+		def write( scene, names ) :
+			for name in names :
+				i = int( name )
+				c = scene.createChild( name )
+				plane = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 50 ) )
+				plane["P"].data[0] = imath.V3f( i )
+				for t in range( 0, 3 ) :
+					c.writeObject( plane, t )
+					c.writeTransform( IECore.M44dData( imath.M44d().translate( imath.V3d( i, t, 0 ) ) ), t )
+				c.writeTags( [ "tag%d" % ( i % 3 ) ] )
+				gc = c.createChild( "child" )
+				gc.writeObject( IECoreScene.SpherePrimitive( 1 ), 0 )
+
+		names = [ str( i ) for i in range( 0, 16 ) ]
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		threads = [
+			threading.Thread( target = write, args = ( m, names[i::4] ) )
+			for i in range( 0, 4 )
+		]
+		for thread in threads :
+			thread.start()
+		for thread in threads :
+			thread.join()
+		del m, threads
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		self.assertEqual( sorted( m.childNames() ), sorted( names ) )
+		self.assertEqual(
+			set( m.readTags( IECoreScene.SceneInterface.TagFilter.DescendantTag ) ),
+			set( [ IECore.InternedString( t ) for t in [ "tag0", "tag1", "tag2", "ObjectType:MeshPrimitive", "ObjectType:SpherePrimitive" ] ] )
+		)
+
+		rootBound = m.readBound( 0 )
+		for name in names :
+			i = int( name )
+			c = m.child( name )
+			self.assertEqual( c.readObject( 0 )["P"].data[0], imath.V3f( i ) )
+			self.assertEqual( c.readTransformAsMatrix( 2 ), imath.M44d().translate( imath.V3d( i, 2, 0 ) ) )
+			self.assertEqual( set( c.readTags( IECoreScene.SceneInterface.TagFilter.LocalTag ) ), set( [ IECore.InternedString( "tag%d" % ( i % 3 ) ), IECore.InternedString( "ObjectType:MeshPrimitive" ) ] ) )
+			self.assertTrue( isinstance( c.child( "child" ).readObject( 0 ), IECoreScene.SpherePrimitive ) )
+			self.assertTrue( rootBound.intersects( imath.V3d( i, 0, 0 ) ) )
+
+	def testInterpolationCache( self ) :
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		c = m.createChild( "a" )
+		for t in range( 0, 2 ) :
+			plane = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 100 ) )
+			plane["P"] = IECoreScene.PrimitiveVariable( plane["P"].interpolation, IECore.V3fVectorData( [ p + imath.V3f( 0, 0, t ) for p in plane["P"].data ] ) )
+			c.writeObject( plane, t )
+			c.writeTransform( IECore.M44dData( imath.M44d().translate( imath.V3d( t, 0, 0 ) ) ), t )
+		del m, c
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		c = m.child( "a" )
+		uncachedObject = c.readObject( 0.5 )
+		self.assertEqual( uncachedObject["P"].data[0], imath.V3f( -1, -1, 0.5 ) )
+
+		cache = IECoreScene.SampledSceneInterface.interpolationCache()
+		self.assertEqual( cache.getMaxMemoryUsage(), 0 )
+		cache.setMaxMemoryUsage( 100 * 1024 * 1024 )
+		try :
+			cache.resetStatistics()
+			self.assertEqual( c.readObject( 0.5 ), uncachedObject )
+			self.assertEqual( c.readObject( 0.5 ), uncachedObject )
+			self.assertEqual( c.readTransformAsMatrix( 0.5 ), imath.M44d().translate( imath.V3d( 0.5, 0, 0 ) ) )
+			self.assertEqual( c.readTransformAsMatrix( 0.5 ), imath.M44d().translate( imath.V3d( 0.5, 0, 0 ) ) )
+			self.assertEqual( c.readObject( 0.25 )["P"].data[0], imath.V3f( -1, -1, 0.25 ) )
+			self.assertEqual( cache.statistics().hits, 2 )
+		finally :
+			cache.clear()
+			cache.setMaxMemoryUsage( 0 )
+
+	def testSingleThreadedWritesAreReproducible( self ) :
+
+		def write( fileName ) :
+			m = IECoreScene.SceneCache( fileName, IECore.IndexedIO.OpenMode.Write )
+			for i in range( 0, 32 ) :
+				c = m.createChild( str( i ) )
+				# Distinct sample times for each location, so that the indices
+				# of the shared sample times depend on the order of the flush.
+				for t in ( i, i + 0.5 ) :
+					c.writeObject( IECoreScene.SpherePrimitive( 1 + t ), t )
+					c.writeTransform( IECore.M44dData( imath.M44d().translate( imath.V3d( t ) ) ), t )
+
+		def assertEntriesEqual( io1, io2 ) :
+			self.assertEqual( io1.entryIds(), io2.entryIds() )
+			for entryId in io1.entryIds() :
+				if io1.entry( entryId ).entryType() == IECore.IndexedIO.EntryType.Directory :
+					assertEntriesEqual( io1.subdirectory( entryId ), io2.subdirectory( entryId ) )
+				elif entryId != "timeStamp" :
+					self.assertEqual( io1.read( entryId ), io2.read( entryId ) )
+
+		write( "/tmp/test.scc" )
+		write( "/tmp/test2.scc" )
+
+		assertEntriesEqual(
+			IECore.FileIndexedIO( "/tmp/test.scc", [], IECore.IndexedIO.OpenMode.Read ),
+			IECore.FileIndexedIO( "/tmp/test2.scc", [], IECore.IndexedIO.OpenMode.Read )
+		)
+
+	def testDuplicateSamples( self ) :
+
+		plane = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 10 ) )
+		transform = IECore.M44dData( imath.M44d().translate( imath.V3d( 1, 0, 0 ) ) )
+		attribute = IECore.StringData( "static" )
+
+		def write() :
+			m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+			for i in range( 0, 10 ) :
+				c = m.createChild( str( i ) )
+				for t in range( 0, 3 ) :
+					c.writeObject( plane, t )
+					c.writeTransform( transform, t )
+					c.writeAttribute( "a", attribute, t )
+
+		def entryType( path ) :
+			io = IECore.FileIndexedIO( "/tmp/test.scc", [], IECore.IndexedIO.OpenMode.Read )
+			return io.directory( [ "root", "children", "5" ] + path[:-1] ).entry( path[-1] ).entryType()
+
+		# Deduplication is off by default, so that the files remain
+		# readable by older versions.
+		write()
+		for path in ( [ "object", "1" ], [ "transform", "1" ], [ "attributes", "a", "1" ] ) :
+			self.assertEqual( entryType( path ), IECore.IndexedIO.EntryType.Directory )
+
+		os.environ["IECORESCENE_SCENECACHE_DEDUPLICATESAMPLES"] = "1"
+		try :
+			write()
+		finally :
+			del os.environ["IECORESCENE_SCENECACHE_DEDUPLICATESAMPLES"]
+
+		# Only the first sample of each type should have been saved in full,
+		# with all others referencing it.
+		for path in ( [ "object", "1" ], [ "transform", "1" ], [ "attributes", "a", "1" ] ) :
+			self.assertEqual( entryType( path ), IECore.IndexedIO.EntryType.File )
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		for i in range( 0, 10 ) :
+			c = m.child( str( i ) )
+			for t in range( 0, 3 ) :
+				self.assertEqual( c.readObjectAtSample( t ), plane )
+				self.assertEqual( c.readTransformAtSample( t ), transform )
+				self.assertEqual( c.readAttributeAtSample( "a", t ), attribute )
+			self.assertEqual( c.readObjectPrimitiveVariables( [ "P" ], 1 )["P"], plane["P"] )
+
 if __name__ == "__main__":
 	unittest.main()
 
@@ -32,6 +32,7 @@
 #
 ##########################################################################
 
+import os
 import gc
 import sys
 import math
@@ -108,6 +109,131 @@ class SceneInterfaceTest( unittest.TestCase ) :
 		self.assertFalse( instance4.isSame( instance1 ) )
 		self.assertTrue( instance4.isSame( instance3 ) )
 
+	def testStatistics( self ) :
+
+		self.writeSCC()
+		IECoreScene.SharedSceneInterfaces.clear()
+		IECoreScene.SharedSceneInterfaces.resetStatistics()
+
+		s = IECoreScene.SharedSceneInterfaces.statistics()
+		self.assertEqual( s.hits, 0 )
+		self.assertEqual( s.misses, 0 )
+		self.assertEqual( s.memoryUsage, 0 )
+		self.assertEqual( s.maxMemoryUsage, IECoreScene.SharedSceneInterfaces.getMaxMemoryUsage() )
+
+		IECoreScene.SharedSceneInterfaces.get( SceneInterfaceTest.__testFile )
+		IECoreScene.SharedSceneInterfaces.get( SceneInterfaceTest.__testFile )
+
+		s = IECoreScene.SharedSceneInterfaces.statistics()
+		self.assertEqual( s.hits, 1 )
+		self.assertEqual( s.misses, 1 )
+		# Small files are counted as 10 megabytes, to limit the number of open files.
+		self.assertEqual( s.memoryUsage, 10 * 1024 * 1024 )
+		self.assertEqual( s.memoryUsage, IECoreScene.SharedSceneInterfaces.memoryUsage() )
+
+		IECoreScene.SharedSceneInterfaces.resetStatistics()
+		s = IECoreScene.SharedSceneInterfaces.statistics()
+		self.assertEqual( s.hits, 0 )
+		self.assertEqual( s.misses, 0 )
+
+	def testMaxMemoryUsage( self ) :
+
+		self.writeSCC()
+		IECoreScene.SharedSceneInterfaces.clear()
+
+		originalMaxMemoryUsage = IECoreScene.SharedSceneInterfaces.getMaxMemoryUsage()
+		try :
+
+			IECoreScene.SharedSceneInterfaces.setMaxMemoryUsage( 10 * 1024 * 1024 )
+			self.assertEqual( IECoreScene.SharedSceneInterfaces.getMaxMemoryUsage(), 10 * 1024 * 1024 )
+
+			instance1 = IECoreScene.SharedSceneInterfaces.get( SceneInterfaceTest.__testFile )
+			instance2 = IECoreScene.SharedSceneInterfaces.get( SceneInterfaceTest.__testFile )
+			self.assertTrue( instance1.isSame( instance2 ) )
+			self.assertEqual( IECoreScene.SharedSceneInterfaces.memoryUsage(), 10 * 1024 * 1024 )
+
+			# Files using more than the limit are not cached.
+			IECoreScene.SharedSceneInterfaces.setMaxMemoryUsage( 10 * 1024 * 1024 - 1 )
+			self.assertEqual( IECoreScene.SharedSceneInterfaces.memoryUsage(), 0 )
+			instance3 = IECoreScene.SharedSceneInterfaces.get( SceneInterfaceTest.__testFile )
+			instance4 = IECoreScene.SharedSceneInterfaces.get( SceneInterfaceTest.__testFile )
+			self.assertFalse( instance3.isSame( instance4 ) )
+			self.assertEqual( IECoreScene.SharedSceneInterfaces.memoryUsage(), 0 )
+
+			IECoreScene.SharedSceneInterfaces.setMaxMemoryUsage( 0 )
+			self.assertEqual( IECoreScene.SharedSceneInterfaces.memoryUsage(), 0 )
+
+		finally :
+
+			IECoreScene.SharedSceneInterfaces.setMaxMemoryUsage( originalMaxMemoryUsage )
+
+	def testMemoryUsage( self ) :
+
+		self.writeSCC()
+
+		m = IECoreScene.SceneCache( SceneInterfaceTest.__testFile, IECore.IndexedIO.OpenMode.Read )
+		memoryUsage = m.memoryUsage()
+		self.assertGreater( memoryUsage, 0 )
+		# The index is shared by all locations in the file.
+		self.assertEqual( m.scene( [ "t", "s" ] ).memoryUsage(), memoryUsage )
+
+		# An index with more entries uses more memory.
+		m = IECoreScene.SceneCache( SceneInterfaceTest.__testFile, IECore.IndexedIO.OpenMode.Write )
+		for i in range( 0, 100 ) :
+			m.createChild( str( i ) ).writeAttribute( "a", IECore.BoolData( True ), 1.0 )
+		del m
+
+		m = IECoreScene.SceneCache( SceneInterfaceTest.__testFile, IECore.IndexedIO.OpenMode.Read )
+		self.assertGreater( m.memoryUsage(), memoryUsage )
+
+	def testPin( self ) :
+
+		self.writeSCC()
+		IECoreScene.SharedSceneInterfaces.clear()
+
+		originalMaxMemoryUsage = IECoreScene.SharedSceneInterfaces.getMaxMemoryUsage()
+		try :
+
+			IECoreScene.SharedSceneInterfaces.pin( SceneInterfaceTest.__testFile )
+			self.assertEqual( IECoreScene.SharedSceneInterfaces.statistics().pinned, 1 )
+			self.assertEqual( IECoreScene.SharedSceneInterfaces.memoryUsage(), 0 )
+
+			# Pinned files survive even when the cache is emptied.
+			instance1 = IECoreScene.SharedSceneInterfaces.get( SceneInterfaceTest.__testFile )
+			IECoreScene.SharedSceneInterfaces.setMaxMemoryUsage( 0 )
+			instance2 = IECoreScene.SharedSceneInterfaces.get( SceneInterfaceTest.__testFile )
+			self.assertTrue( instance1.isSame( instance2 ) )
+
+			IECoreScene.SharedSceneInterfaces.setMaxMemoryUsage( originalMaxMemoryUsage )
+			IECoreScene.SharedSceneInterfaces.unpin( SceneInterfaceTest.__testFile )
+			self.assertEqual( IECoreScene.SharedSceneInterfaces.statistics().pinned, 0 )
+
+			# And remain shared after they are unpinned.
+			instance3 = IECoreScene.SharedSceneInterfaces.get( SceneInterfaceTest.__testFile )
+			self.assertTrue( instance3.isSame( instance1 ) )
+
+			IECoreScene.SharedSceneInterfaces.pin( SceneInterfaceTest.__testFile )
+			IECoreScene.SharedSceneInterfaces.clear()
+			self.assertEqual( IECoreScene.SharedSceneInterfaces.statistics().pinned, 0 )
+
+		finally :
+
+			IECoreScene.SharedSceneInterfaces.setMaxMemoryUsage( originalMaxMemoryUsage )
+
+	def testPrefetch( self ) :
+
+		self.writeSCC()
+		IECoreScene.SharedSceneInterfaces.clear()
+		IECoreScene.SharedSceneInterfaces.resetStatistics()
+
+		IECoreScene.SharedSceneInterfaces.prefetch( [ SceneInterfaceTest.__testFile, "/tmp/nonExistent.scc" ] )
+		self.assertEqual( IECoreScene.SharedSceneInterfaces.statistics().misses, 2 )
+
+		IECoreScene.SharedSceneInterfaces.get( SceneInterfaceTest.__testFile )
+		self.assertEqual( IECoreScene.SharedSceneInterfaces.statistics().hits, 1 )
+
+		self.assertRaises( RuntimeError, IECoreScene.SharedSceneInterfaces.get, "/tmp/nonExistent.scc" )
+
 	def testVisibilityName( self ) :
 		self.assertEqual( IECoreScene.SceneInterface.visibilityName, "scene:visible" )
 
@@ -147,6 +147,23 @@ class TestSpherePrimitiveEvaluator( unittest.TestCase ) :
 
 
 
+	def testBatchQueries( self ) :
+
+		e = IECoreScene.SpherePrimitiveEvaluator( IECoreScene.SpherePrimitive( 2 ) )
+		r = e.createResult()
+
+		random.seed( 2 )
+		points = IECore.V3fVectorData( [ imath.V3f( random.uniform( -10, 10 ), random.uniform( -10, 10 ), random.uniform( -10, 10 ) ) for i in range( 0, 100 ) ] )
+
+		closest = e.batchClosestPoint( points )
+		signed = e.batchSignedDistance( points )
+		for i, p in enumerate( points ) :
+			self.assertEqual( closest["success"][i], e.closestPoint( p, r ) )
+			self.assertTrue( closest["point"][i].equalWithAbsError( r.point(), 1e-5 ) )
+			self.assertTrue( closest["normal"][i].equalWithAbsError( r.normal(), 1e-5 ) )
+			self.assertTrue( closest["uv"][i].equalWithAbsError( r.uv(), 1e-5 ) )
+			self.assertEqual( closest["elementIndex"][i], -1 )
+			self.assertAlmostEqual( signed["distance"][i], e.signedDistance( p, r ), 4 )
 
 if __name__ == "__main__":
 	unittest.main()